@@ -1,5 +1,20 @@
 """Exports sub-package interface"""
 
 # Local
+from . import arrow
+from . import checkpoint
+from . import chunking
+from . import dedup
+from . import excel
 from . import mapper
+from . import memory
+from . import observer
+from . import preflight
+from . import profiling
+from . import resources
+from . import session
+from . import source
+from . import stream
+from . import timing
 from . import types
+from . import validation
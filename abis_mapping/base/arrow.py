@@ -0,0 +1,297 @@
+"""Provides columnar input of template data from Apache Arrow tables and Parquet files"""
+
+# Standard
+import datetime
+import functools
+import os
+import random
+
+# Third-Party
+import frictionless
+
+# Local
+from abis_mapping import models
+
+# Typing
+from collections.abc import Callable, Iterator
+from typing import IO, Any, Final
+
+# Optional Third-Party
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+
+# Constants
+# Parquet files start (and end) with this magic number
+PARQUET_SIGNATURE: Final[bytes] = b"PAR1"
+# Default number of rows per record batch read from Parquet files
+DEFAULT_BATCH_SIZE: Final[int] = 10_000
+
+
+class ArrowSource:
+    """Template data from an Arrow table, or from the record batches of a Parquet file.
+
+    An `ArrowSource` can be passed as the data to validate and map, in place of
+    CSV data. The rows are streamed to frictionless one record batch at a time,
+    with the native values of the columns rather than text, so a Parquet file
+    of any size is read in constant memory, and once per pass of the data.
+
+    Columns are matched to the template's fields by name, so the columns can
+    be in any order. Values are converted to the type of their field where
+    the field can not read the native value (e.g. dates for timestamp fields,
+    or numbers for string fields). Numbers, decimals and integers are read as
+    they are by number and integer fields.
+
+    Attributes:
+        source: The Arrow table, or the path or binary file object of the Parquet file.
+        batch_size: Number of rows per record batch.
+    """
+
+    def __init__(
+        self,
+        source: "pyarrow.Table | str | os.PathLike[str] | IO[bytes]",
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """ArrowSource constructor.
+
+        Args:
+            source: An Arrow table, or the path or binary file object of a Parquet file.
+            batch_size: Number of rows per record batch.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        if pyarrow is None:
+            raise ImportError("pyarrow is required for Arrow and Parquet input, install it with `pip install pyarrow`")
+        self.source = source
+        self.batch_size = batch_size
+
+    @property
+    def column_names(self) -> list[str]:
+        """Names of the columns, in the order of the data."""
+        if isinstance(self.source, pyarrow.Table):
+            return list(self.source.column_names)
+        with pyarrow.parquet.ParquetFile(self.source) as parquet:
+            return list(parquet.schema_arrow.names)
+
+    def batches(self) -> Iterator["pyarrow.RecordBatch"]:
+        """Reads the data one record batch at a time.
+
+        Yields:
+            Each record batch.
+        """
+        if isinstance(self.source, pyarrow.Table):
+            yield from self.source.to_batches(max_chunksize=self.batch_size)
+            return
+        with pyarrow.parquet.ParquetFile(self.source) as parquet:
+            yield from parquet.iter_batches(batch_size=self.batch_size)
+
+    def rows(self, schema: frictionless.Schema | None = None) -> Iterator[list[Any]]:
+        """Reads the header and the rows, with the columns in the order of a schema.
+
+        Args:
+            schema: Schema of the template, whose fields are matched to the
+                columns by name. Columns without a field follow the fields'
+                columns, in the order of the data. Without a schema, the columns
+                are in the order of the data and their values are not converted.
+
+        Yields:
+            The header, and then the cells of each row.
+        """
+        names = self.column_names
+        fields = schema.fields if schema is not None else []
+
+        # Match each field to the first unmatched column of its name
+        order: list[int] = []
+        for field in fields:
+            index = next((i for i, name in enumerate(names) if name == field.name and i not in order), None)
+            if index is not None:
+                order.append(index)
+        order.extend(i for i in range(len(names)) if i not in order)
+        yield [names[i] for i in order]
+
+        # Stream the rows of each batch, converting the columns whose fields can not read their values
+        for batch in self.batches():
+            columns: list[list[Any]] = []
+            for position, index in enumerate(order):
+                column = batch.column(index)
+                values = column.to_pylist()
+                if position < len(fields) and (convert := _converter(fields[position].type, column.type)) is not None:
+                    values = [convert(value) if value is not None else None for value in values]
+                columns.append(values)
+            for row in zip(*columns, strict=True):
+                yield list(row)
+
+    def resource(self, schema: frictionless.Schema | None = None, **options: Any) -> frictionless.Resource:
+        """Creates the frictionless resource of the data.
+
+        The rows are read again for each pass of the resource, e.g. to infer
+        and then validate.
+
+        Args:
+            schema: Schema of the template, its fields are matched to the columns by name.
+            **options: Other options of the resource, e.g. the detector.
+
+        Returns:
+            The resource, of inline data.
+        """
+        if schema is not None:
+            options["schema"] = schema
+        return frictionless.Resource(data=functools.partial(self.rows, schema), format="inline", **options)
+
+    def sample(self, *, head_rows: int, sample_rows: int, seed: int) -> tuple["ArrowSource", int, int]:
+        """Takes the first rows and a random sample of the other rows.
+
+        Only the record batches (of Parquet files, its row groups) holding the
+        sampled rows are read.
+
+        Args:
+            head_rows: Number of rows to take from the start.
+            sample_rows: Number of rows to sample from the rest.
+            seed: Seed for the random sample.
+
+        Returns:
+            The sample, and its number of head rows and sampled rows.
+        """
+        rng = random.Random(seed)  # noqa: S311
+        if isinstance(self.source, pyarrow.Table):
+            head = self.source.slice(0, head_rows)
+            rest = range(head.num_rows, self.source.num_rows)
+            picked = sorted(rng.sample(rest, min(sample_rows, len(rest))))
+            sampled = self.source.take(picked)
+        else:
+            with pyarrow.parquet.ParquetFile(self.source) as parquet:
+                schema = parquet.schema_arrow
+                batch = next(parquet.iter_batches(batch_size=head_rows), None) if head_rows else None
+                head = pyarrow.Table.from_batches([batch] if batch is not None else [], schema=schema)
+                rest = range(head.num_rows, parquet.metadata.num_rows)
+                picked = sorted(rng.sample(rest, min(sample_rows, len(rest))))
+                # Read only the row groups of the sampled rows
+                tables = [schema.empty_table()]
+                start = 0
+                for group in range(parquet.num_row_groups):
+                    end = start + parquet.metadata.row_group(group).num_rows
+                    if rows := [row - start for row in picked if start <= row < end]:
+                        tables.append(parquet.read_row_group(group).take(rows))
+                    start = end
+                sampled = pyarrow.concat_tables(tables)
+        table = pyarrow.concat_tables([head, sampled])
+        return ArrowSource(table, batch_size=self.batch_size), head.num_rows, sampled.num_rows
+
+    def fragments(self, rows: int) -> Iterator["ArrowSource"]:
+        """Splits the data into fragments of rows, e.g. to map in worker processes.
+
+        Args:
+            rows: Number of rows per fragment.
+
+        Yields:
+            Each fragment, of an Arrow table (which can be pickled).
+        """
+        batches: list[pyarrow.RecordBatch] = []
+        count = 0
+        for batch in ArrowSource(self.source, batch_size=rows).batches():
+            batches.append(batch)
+            count += batch.num_rows
+            if count >= rows:
+                yield ArrowSource(pyarrow.Table.from_batches(batches), batch_size=self.batch_size)
+                batches, count = [], 0
+        if batches:
+            yield ArrowSource(pyarrow.Table.from_batches(batches), batch_size=self.batch_size)
+
+
+def is_parquet(data: "str | os.PathLike[str] | IO[bytes]") -> bool:
+    """Determines whether the data is a Parquet file, from its first bytes.
+
+    File objects are left at the position they were at, and are not Parquet
+    files if they are not seekable.
+
+    Args:
+        data: Path or binary file object.
+
+    Returns:
+        Whether the data starts with the Parquet magic number.
+    """
+    if isinstance(data, (str, os.PathLike)):
+        with open(data, "rb") as file:
+            return file.read(len(PARQUET_SIGNATURE)) == PARQUET_SIGNATURE
+    if not data.seekable():
+        return False
+    position = data.tell()
+    try:
+        return data.read(len(PARQUET_SIGNATURE)) == PARQUET_SIGNATURE
+    finally:
+        data.seek(position)
+
+
+def _converter(field_type: str, arrow_type: "pyarrow.DataType") -> Callable[[Any], Any] | None:
+    """Gets the conversion of the values of a column, for its field to read.
+
+    Args:
+        field_type: Type of the field.
+        arrow_type: Type of the column.
+
+    Returns:
+        The conversion of a (not null) value, None if the field reads the values as they are.
+    """
+    if pyarrow.types.is_string(arrow_type) or pyarrow.types.is_large_string(arrow_type):
+        return None
+    if field_type == "timestamp":
+        return _to_timestamp
+    if field_type == "list":
+        return _to_list
+    if field_type in ("string", "wkt"):
+        return _to_text
+    return None
+
+
+def _to_timestamp(value: Any) -> Any:
+    """Converts a value for a timestamp field, as it would be parsed from text.
+
+    Args:
+        value: The value.
+
+    Returns:
+        The timestamp of a datetime or date, otherwise the value as text.
+    """
+    if isinstance(value, datetime.datetime):
+        return models.temporal.Datetime.fromtimestamp(value.timestamp(), tz=value.tzinfo)
+    if isinstance(value, datetime.date):
+        return models.temporal.Date(value.year, value.month, value.day)
+    return _to_text(value)
+
+
+def _to_list(value: Any) -> Any:
+    """Converts a value for a list field, as it would be parsed from text.
+
+    Args:
+        value: The value.
+
+    Returns:
+        A list of the non-empty items as text, None for an empty list,
+            otherwise the value as text.
+    """
+    if isinstance(value, list):
+        return [text for item in value if item is not None and (text := _to_text(item).strip())] or None
+    return _to_text(value)
+
+
+def _to_text(value: Any) -> str:
+    """Converts a value to its text, as it would be written in CSV.
+
+    Args:
+        value: The value.
+
+    Returns:
+        The text.
+    """
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    return str(value)
@@ -0,0 +1,293 @@
+"""Provides Checkpoint Stores for resumable mapping"""
+
+# Standard
+import abc
+import dataclasses
+import json
+import os
+import pathlib
+import tempfile
+
+# Typing
+from typing import Any
+
+
+@dataclasses.dataclass
+class Checkpoint:
+    """Progress of an `apply_mapping()` run, recorded after each committed chunk.
+
+    A chunk is committed once the consumer of `apply_mapping()` requests the next
+    chunk, i.e. once it has finished processing the chunk that was yielded.
+
+    Attributes:
+        template_id: ID of the template being mapped.
+        dataset_iri: IRI of the Dataset being mapped.
+        chunk_size: The chunk size of the run, resuming requires the same chunk size.
+        max_triples_per_chunk: The triple budget of the run, resuming requires the same budget.
+        max_chunk_bytes: The byte budget of the run, resuming requires the same budget.
+        row_number: Number of data rows mapped into committed chunks.
+        chunk_number: Number of committed chunks.
+        complete: Whether the final chunk has been committed.
+        state: Any additional state required to resume with consistent output.
+    """
+
+    template_id: str
+    dataset_iri: str
+    chunk_size: int | None
+    max_triples_per_chunk: int | None = None
+    max_chunk_bytes: int | None = None
+    row_number: int = 0
+    chunk_number: int = 0
+    complete: bool = False
+    state: dict[str, Any] = dataclasses.field(default_factory=dict)
+
+    def check_resumable(
+        self,
+        *,
+        template_id: str,
+        dataset_iri: str,
+        chunk_size: int | None,
+        max_triples_per_chunk: int | None = None,
+        max_chunk_bytes: int | None = None,
+    ) -> None:
+        """Checks that this checkpoint was recorded by an equivalent mapping run.
+
+        Args:
+            template_id: ID of the template being mapped.
+            dataset_iri: IRI of the Dataset being mapped.
+            chunk_size: The chunk size of the run being resumed.
+            max_triples_per_chunk: The triple budget of the run being resumed.
+            max_chunk_bytes: The byte budget of the run being resumed.
+
+        Raises:
+            ValueError: If the checkpoint was recorded by a different mapping run.
+        """
+        expected = (
+            self.template_id,
+            self.dataset_iri,
+            self.chunk_size,
+            self.max_triples_per_chunk,
+            self.max_chunk_bytes,
+        )
+        actual = (template_id, dataset_iri, chunk_size, max_triples_per_chunk, max_chunk_bytes)
+        if expected != actual:
+            raise ValueError(
+                "Checkpoint (template_id, dataset_iri, chunk_size, max_triples_per_chunk, "
+                f"max_chunk_bytes)={expected} "
+                f"cannot be used to resume mapping with {actual}"
+            )
+
+
+class CheckpointStore(abc.ABC):
+    """Base class for persisting the latest Checkpoint of a mapping run."""
+
+    @abc.abstractmethod
+    def load(self) -> Checkpoint | None:
+        """Loads the latest committed Checkpoint.
+
+        Returns:
+            The latest Checkpoint, or None if nothing has been committed yet.
+        """
+
+    @abc.abstractmethod
+    def save(self, checkpoint: Checkpoint) -> None:
+        """Persists a committed Checkpoint, replacing any previous one.
+
+        Args:
+            checkpoint: The Checkpoint to persist.
+        """
+
+    @abc.abstractmethod
+    def append_entries(self, key: str, entries: list[Any]) -> int:
+        """Appends a batch of entries to an append-only log kept alongside the Checkpoint.
+
+        Used for state that only grows during a run, e.g. the shared node registry,
+        so each save only persists what was added since the last one. The returned
+        number of batches is recorded in the Checkpoint's state, to know which
+        batches were committed.
+
+        Args:
+            key: Name of the log.
+            entries: JSON serializable entries to append.
+
+        Returns:
+            Number of batches in the log, including this one.
+        """
+
+    @abc.abstractmethod
+    def load_entries(self, key: str, batches: int) -> list[Any]:
+        """Loads the entries of the first batches of an append-only log.
+
+        Any later batches, appended but never committed by a Checkpoint, are
+        discarded, so the next batch is appended after the last committed one.
+
+        Args:
+            key: Name of the log.
+            batches: Number of committed batches, as recorded in the Checkpoint.
+
+        Returns:
+            The entries of the committed batches, in the order appended.
+
+        Raises:
+            ValueError: If the log has fewer than the committed batches.
+        """
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """Checkpoint store kept in memory, useful when retrying within one process."""
+
+    def __init__(self) -> None:
+        """Memory Checkpoint Store constructor."""
+        self._checkpoint: Checkpoint | None = None
+        self._logs: dict[str, list[list[Any]]] = {}
+
+    def load(self) -> Checkpoint | None:
+        """Loads the latest committed Checkpoint.
+
+        Returns:
+            The latest Checkpoint, or None if nothing has been committed yet.
+        """
+        return self._checkpoint
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        """Stores a committed Checkpoint, replacing any previous one.
+
+        Args:
+            checkpoint: The Checkpoint to store.
+        """
+        # Copy so later mutation by the caller does not change the stored checkpoint
+        self._checkpoint = dataclasses.replace(checkpoint, state=dict(checkpoint.state))
+
+    def append_entries(self, key: str, entries: list[Any]) -> int:
+        """Appends a batch of entries to an append-only log.
+
+        Args:
+            key: Name of the log.
+            entries: Entries to append.
+
+        Returns:
+            Number of batches in the log, including this one.
+        """
+        log = self._logs.setdefault(key, [])
+        log.append(list(entries))
+        return len(log)
+
+    def load_entries(self, key: str, batches: int) -> list[Any]:
+        """Loads the entries of the first batches of an append-only log.
+
+        Args:
+            key: Name of the log.
+            batches: Number of committed batches.
+
+        Returns:
+            The entries of the committed batches, in the order appended.
+
+        Raises:
+            ValueError: If the log has fewer than the committed batches.
+        """
+        log = self._logs.setdefault(key, [])
+        if len(log) < batches:
+            raise ValueError(f"Log {key!r} has {len(log)} batches, fewer than the {batches} committed")
+        del log[batches:]
+        return [entry for batch in log for entry in batch]
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Checkpoint store persisted as a JSON file, surviving worker restarts.
+
+    Append-only logs are kept in JSON lines files next to the Checkpoint file,
+    named after the Checkpoint file and the log, with one line per batch.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """File Checkpoint Store constructor.
+
+        Args:
+            path: Path of the JSON file to persist the Checkpoint to.
+        """
+        self.path = pathlib.Path(path)
+        # Number of batches in each log file, once known
+        self._batches: dict[str, int] = {}
+
+    def load(self) -> Checkpoint | None:
+        """Loads the latest committed Checkpoint from the file.
+
+        Returns:
+            The latest Checkpoint, or None if the file does not exist.
+        """
+        if not self.path.exists():
+            return None
+        return Checkpoint(**json.loads(self.path.read_text()))
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        """Writes a committed Checkpoint to the file.
+
+        The file is replaced atomically, so a crash while saving leaves the
+        previous Checkpoint intact.
+
+        Args:
+            checkpoint: The Checkpoint to persist.
+        """
+        content = json.dumps(dataclasses.asdict(checkpoint))
+        with tempfile.NamedTemporaryFile(
+            "w",
+            dir=self.path.parent,
+            prefix=f".{self.path.name}.",
+            delete=False,
+        ) as f:
+            f.write(content)
+        os.replace(f.name, self.path)
+
+    def append_entries(self, key: str, entries: list[Any]) -> int:
+        """Appends a batch of entries to an append-only log file.
+
+        Args:
+            key: Name of the log.
+            entries: JSON serializable entries to append.
+
+        Returns:
+            Number of batches in the log, including this one.
+        """
+        path = self._log_path(key)
+        if key not in self._batches:
+            self._batches[key] = len(path.read_bytes().splitlines()) if path.exists() else 0
+        with path.open("a") as f:
+            f.write(json.dumps(entries) + "\n")
+        self._batches[key] += 1
+        return self._batches[key]
+
+    def load_entries(self, key: str, batches: int) -> list[Any]:
+        """Loads the entries of the first batches of an append-only log file.
+
+        Batches after them, e.g. appended just before a crash, are truncated
+        from the file.
+
+        Args:
+            key: Name of the log.
+            batches: Number of committed batches.
+
+        Returns:
+            The entries of the committed batches, in the order appended.
+
+        Raises:
+            ValueError: If the log has fewer than the committed batches.
+        """
+        path = self._log_path(key)
+        lines = path.read_bytes().splitlines(keepends=True) if path.exists() else []
+        if len(lines) < batches:
+            raise ValueError(f"Log {path} has {len(lines)} batches, fewer than the {batches} committed")
+        if len(lines) > batches:
+            path.write_bytes(b"".join(lines[:batches]))
+        self._batches[key] = batches
+        return [entry for line in lines[:batches] for entry in json.loads(line)]
+
+    def _log_path(self, key: str) -> pathlib.Path:
+        """Path of the file of an append-only log.
+
+        Args:
+            key: Name of the log.
+
+        Returns:
+            Path of the JSON lines file.
+        """
+        return self.path.with_name(f"{self.path.name}.{key}.jsonl")
@@ -0,0 +1,176 @@
+"""Provides adaptive chunking by row count, triple count and estimated size"""
+
+# Standard
+import dataclasses
+import itertools
+import sys
+
+# Third-Party
+import rdflib
+
+# Local
+from abis_mapping import utils
+
+# Typing
+from typing import Final
+
+
+# Constants
+# Approximate memory used per triple by the indexes of rdflib's Memory store,
+# and by the AppendOnlyStore, in addition to the size of the terms themselves.
+_TRIPLE_INDEX_BYTES: Final[int] = 1300
+_APPEND_ONLY_TRIPLE_BYTES: Final[int] = 120
+# Number of triples sampled when estimating the size of a triple.
+_SAMPLE_SIZE: Final[int] = 256
+
+
+@dataclasses.dataclass
+class ChunkStats:
+    """Statistics for a chunk yielded by `apply_mapping()`.
+
+    Attributes:
+        chunk_number: Number of the chunk, starting at 1.
+        first_row: Number of the first data row in the chunk.
+        last_row: Number of the last data row in the chunk.
+        rows: Number of data rows in the chunk.
+        triples: Number of triples in the chunk graph.
+        estimated_bytes: Estimated memory size of the chunk graph.
+    """
+
+    chunk_number: int
+    first_row: int
+    last_row: int
+    rows: int
+    triples: int
+    estimated_bytes: int
+
+
+class ChunkBudget:
+    """Decides when a chunk is full, by any combination of limits.
+
+    The estimated size of a chunk is the number of triples multiplied by the
+    average size of a triple, sampled from the chunk graph itself. The sample
+    is retaken whenever the graph doubles in size, so the estimate only depends
+    on the chunk's own rows and chunk boundaries are the same on every run.
+    """
+
+    def __init__(
+        self,
+        *,
+        chunk_size: int | None = None,
+        max_triples: int | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        """Chunk Budget constructor.
+
+        Args:
+            chunk_size: Maximum number of rows per chunk.
+            max_triples: Maximum number of triples per chunk.
+            max_bytes: Maximum estimated memory size per chunk.
+
+        Raises:
+            ValueError: If any of the limits are not greater than zero.
+        """
+        for name, limit in (
+            ("chunk_size", chunk_size),
+            ("max_triples_per_chunk", max_triples),
+            ("max_chunk_bytes", max_bytes),
+        ):
+            if limit is not None and limit <= 0:
+                raise ValueError(f"{name} must be greater than zero")
+
+        self.chunk_size = chunk_size
+        self.max_triples = max_triples
+        self.max_bytes = max_bytes
+        self.start()
+
+    @property
+    def unbounded(self) -> bool:
+        """Whether there are no limits, i.e. chunking is disabled."""
+        return self.chunk_size is None and self.max_triples is None and self.max_bytes is None
+
+    def start(self) -> None:
+        """Resets the budget for a new chunk."""
+        self.rows = 0
+        self._bytes_per_triple: float | None = None
+        self._sampled_at = 0
+
+    def add_row(self, graph: rdflib.Graph) -> bool:
+        """Records a row mapped into the chunk graph.
+
+        Args:
+            graph: The chunk graph, after mapping the row.
+
+        Returns:
+            Whether the chunk is full and should be yielded.
+        """
+        self.rows += 1
+        if self.chunk_size is not None and self.rows >= self.chunk_size:
+            return True
+        if self.max_triples is not None and len(graph) >= self.max_triples:
+            return True
+        if self.max_bytes is not None and self.estimated_bytes(graph) >= self.max_bytes:
+            return True
+        return False
+
+    def estimated_bytes(self, graph: rdflib.Graph) -> int:
+        """Estimates the memory size of the chunk graph.
+
+        Args:
+            graph: The chunk graph.
+
+        Returns:
+            Estimated size of the graph in bytes.
+        """
+        triples = len(graph)
+        # Resample once the graph has doubled in size since the last sample
+        if self._bytes_per_triple is None or triples >= 2 * self._sampled_at:
+            self._bytes_per_triple = _sample_bytes_per_triple(graph)
+            self._sampled_at = triples
+        return int(triples * self._bytes_per_triple)
+
+    def stats(
+        self,
+        graph: rdflib.Graph,
+        *,
+        chunk_number: int,
+        last_row: int,
+    ) -> ChunkStats:
+        """Reports the statistics of the chunk.
+
+        Args:
+            graph: The chunk graph.
+            chunk_number: Number of the chunk, starting at 1.
+            last_row: Number of the last data row in the chunk.
+
+        Returns:
+            Statistics for the chunk.
+        """
+        return ChunkStats(
+            chunk_number=chunk_number,
+            first_row=last_row - self.rows + 1,
+            last_row=last_row,
+            rows=self.rows,
+            triples=len(graph),
+            estimated_bytes=self.estimated_bytes(graph),
+        )
+
+
+def _sample_bytes_per_triple(graph: rdflib.Graph) -> float:
+    """Estimates the average memory size of a triple in the graph.
+
+    Args:
+        graph: Graph to sample evenly spaced triples from.
+
+    Returns:
+        Average estimated size of a triple in bytes.
+    """
+    if isinstance(graph.store, utils.stores.AppendOnlyStore):
+        overhead = _APPEND_ONLY_TRIPLE_BYTES
+    else:
+        overhead = _TRIPLE_INDEX_BYTES
+    step = max(1, len(graph) // _SAMPLE_SIZE)
+    sizes = [
+        overhead + sum(sys.getsizeof(term) for term in triple) for triple in itertools.islice(graph, 0, None, step)
+    ]
+    return sum(sizes) / len(sizes) if sizes else float(overhead)
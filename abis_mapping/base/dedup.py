@@ -0,0 +1,152 @@
+"""Provides a registry of shared nodes already emitted during a submission"""
+
+# Standard
+import hashlib
+
+# Third-Party
+import rdflib
+
+# Local
+from abis_mapping import utils
+
+# Typing
+from collections.abc import Iterable
+from typing import Final
+
+
+# Constants
+a = rdflib.RDF.type
+
+# Types of nodes that are referenced by many rows, and so are re-emitted in every
+# chunk that references them. The per-chunk Dataset and Submission triples added by
+# `ABISMapper.apply_mapping_chunk()` are intentionally not included, since those are
+# expected to be present in every chunk.
+SHARED_NODE_TYPES: Final[frozenset[rdflib.URIRef]] = frozenset(
+    {
+        # On-the-fly FlexibleVocabulary concepts
+        rdflib.SKOS.Concept,
+        # Agents, datatypes and attributions
+        rdflib.PROV.Agent,
+        rdflib.PROV.Person,
+        rdflib.PROV.Organization,
+        rdflib.PROV.Attribution,
+        rdflib.RDFS.Datatype,
+        # Attributes, values and collections
+        utils.namespaces.TERN.Attribute,
+        utils.namespaces.TERN.Value,
+        utils.namespaces.TERN.IRI,
+        utils.namespaces.TERN.Text,
+        utils.namespaces.TERN.Float,
+        utils.namespaces.TERN.Integer,
+        rdflib.SDO.Collection,
+        # Surveys, Sites and Site Visits referenced by occurrences
+        utils.namespaces.TERN.Survey,
+        utils.namespaces.TERN.Site,
+        utils.namespaces.TERN.SiteVisit,
+    }
+)
+
+
+class SharedNodeRegistry:
+    """Submission-wide registry of the shared node triples already emitted.
+
+    Only a fixed size hash of each triple is kept, so memory use is bounded by
+    `max_entries`. Once full, further triples are emitted again rather than
+    recorded, which is always safe since re-emitting a triple does not change
+    the union of the chunk graphs.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1_000_000,
+        node_types: Iterable[rdflib.URIRef] = SHARED_NODE_TYPES,
+    ) -> None:
+        """Shared Node Registry constructor.
+
+        Args:
+            max_entries: Maximum number of triple hashes to keep.
+            node_types: rdf:types of the nodes to deduplicate.
+        """
+        self.max_entries = max_entries
+        self.node_types = frozenset(node_types)
+        self._emitted: set[int] = set()
+
+    def __len__(self) -> int:
+        """Number of triple hashes held by the registry."""
+        return len(self._emitted)
+
+    @property
+    def full(self) -> bool:
+        """Whether the registry has reached max_entries."""
+        return len(self._emitted) >= self.max_entries
+
+    def deduplicate(self, graph: rdflib.Graph, added: list[int] | None = None) -> int:
+        """Removes shared node triples already emitted in a previous chunk.
+
+        The remaining shared node triples are recorded as emitted.
+
+        Args:
+            graph: Chunk graph, modified in place.
+            added: Optional list to append the hashes newly recorded to, e.g. to
+                persist only what changed with `CheckpointStore.append_entries()`.
+
+        Returns:
+            Number of triples removed from the graph.
+        """
+        # Find the shared nodes in this chunk, the helpers that add shared nodes
+        # always add their type triple alongside their other triples.
+        subjects = {
+            s for node_type in self.node_types for s in graph.subjects(a, node_type) if isinstance(s, rdflib.URIRef)
+        }
+
+        removed = 0
+        for subject in subjects:
+            for triple in list(graph.triples((subject, None, None))):
+                # Blank nodes are unique per chunk, so these triples never repeat.
+                if isinstance(triple[2], rdflib.BNode):
+                    continue
+                key = _triple_key(triple)
+                if key in self._emitted:
+                    graph.remove(triple)
+                    removed += 1
+                elif not self.full:
+                    self._emitted.add(key)
+                    if added is not None:
+                        added.append(key)
+        return removed
+
+    def state(self) -> list[int]:
+        """Returns the registry contents, e.g. to be saved between submissions.
+
+        Returns:
+            Serializable contents of the registry.
+        """
+        return sorted(self._emitted)
+
+    def restore(self, state: Iterable[int]) -> None:
+        """Replaces the registry contents with previously saved state.
+
+        Args:
+            state: Contents previously returned by `state()`, or the hashes
+                collected by `deduplicate()` in each chunk.
+        """
+        self._emitted = set(state)
+
+
+def _triple_key(triple: tuple[rdflib.term.Node, rdflib.term.Node, rdflib.term.Node]) -> int:
+    """Stable hash of a triple, the same in every process.
+
+    Args:
+        triple: Triple with no blank nodes.
+
+    Returns:
+        64 bit hash of the triple.
+    """
+    s, p, o = triple
+    if isinstance(o, rdflib.Literal):
+        o_key = f"L{o}\x1e{o.datatype or ''}\x1e{o.language or ''}"
+    else:
+        o_key = f"U{o}"
+    digest = hashlib.blake2b(f"{s}\x1f{p}\x1f{o_key}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
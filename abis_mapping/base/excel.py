@@ -0,0 +1,232 @@
+"""Provides streaming input of template data from Excel (XLSX) workbooks"""
+
+# Standard
+import contextlib
+import csv
+import datetime
+import io
+import os
+import tempfile
+import zipfile
+
+# Third-Party
+import openpyxl
+import openpyxl.utils.exceptions
+
+# Local
+from . import arrow as base_arrow
+from . import source as base_source
+from . import stream as base_stream
+from . import types as base_types
+
+# Typing
+from collections.abc import Iterable, Iterator
+from typing import IO, Final, TypeVar
+
+
+# Constants
+# XLSX workbooks are zip archives, which start with a local file header
+XLSX_SIGNATURE: Final[bytes] = b"PK\x03\x04"
+# Floats of at most this magnitude that are whole numbers are written without a decimal point
+MAX_WHOLE_FLOAT: Final[float] = 1e15
+
+# Type of the data provided as CSV
+ReadableT = TypeVar("ReadableT", bound=base_types.ReadableType)
+
+
+def is_xlsx(data: base_types.ReadableType) -> bool:
+    """Determines whether the data is an XLSX workbook, from its first bytes.
+
+    File objects are left at the position they were at. Text data, and file
+    objects that are not seekable, can not be sniffed so are not workbooks.
+
+    Args:
+        data: Raw data.
+
+    Returns:
+        Whether the data starts with the XLSX (zip) signature.
+    """
+    if isinstance(data, base_arrow.ArrowSource):
+        return False
+    if isinstance(data, bytes):
+        return data.startswith(XLSX_SIGNATURE)
+    if isinstance(data, base_source.SourceHandle):
+        return data.buffer[: len(XLSX_SIGNATURE)] == XLSX_SIGNATURE
+    if isinstance(data, base_stream.StreamSource):
+        return data.header.startswith(XLSX_SIGNATURE)
+    if isinstance(data, (str, os.PathLike)):
+        with open(data, "rb") as file:
+            return file.read(len(XLSX_SIGNATURE)) == XLSX_SIGNATURE
+    if isinstance(data, io.TextIOBase) or not data.seekable():
+        return False
+    position = data.tell()
+    try:
+        return data.read(len(XLSX_SIGNATURE)) == XLSX_SIGNATURE
+    finally:
+        data.seek(position)
+
+
+def cell_to_text(value: object) -> str:
+    """Converts the value of a workbook cell to its CSV text.
+
+    Values are written as they would be typed in a CSV file, so that they are
+    parsed by the template's fields as they would be from CSV.
+
+    Args:
+        value: Value of the cell, as read by openpyxl.
+
+    Returns:
+        The text of the value, empty for an empty cell.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, float):
+        if value.is_integer() and abs(value) <= MAX_WHOLE_FLOAT:
+            return str(int(value))
+        return format(value, ".15g")
+    if isinstance(value, datetime.datetime):
+        # Dates are stored as datetimes at midnight
+        return (
+            value.date().isoformat() if value.time() == datetime.time() and value.tzinfo is None else value.isoformat()
+        )
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return str(value)
+
+
+def write_csv(
+    data: base_types.ReadableType,
+    output: IO[str],
+    *,
+    sheet: str | None = None,
+) -> int:
+    """Writes a sheet of an XLSX workbook as CSV, one row at a time.
+
+    The workbook is read with openpyxl's read-only reader, which parses the
+    sheet's XML as it is iterated, so memory use does not grow with the number
+    of rows. The first row is the header. Rows are padded to the width of the
+    header, and non-empty cells beyond it are kept so they are reported by
+    validation as extra cells. Blank rows are kept, so row numbers are the
+    same as in the sheet, other than trailing blank rows (e.g. formatted but
+    empty rows), which are dropped.
+
+    Args:
+        data: Raw workbook data, bytes and source handles are read from memory.
+        output: Text file object to write the CSV to, opened with `newline=""`.
+        sheet: Name of the sheet to read, defaults to the active sheet.
+
+    Returns:
+        Number of rows written, not including the header.
+
+    Raises:
+        ValueError: If the data is not an XLSX workbook, has no such sheet, or
+            is a `stream.StreamSource`.
+    """
+    if isinstance(data, io.TextIOBase):
+        raise ValueError("Data is text, not an XLSX workbook")
+    if isinstance(data, base_source.SourceHandle):
+        with data.open() as stream:
+            return write_csv(stream, output, sheet=sheet)
+    if isinstance(data, base_stream.StreamSource):
+        raise ValueError("XLSX workbooks can not be read from a stream, their contents are listed at the end")
+    source = io.BytesIO(data) if isinstance(data, bytes) else data
+    try:
+        # Text file objects are rejected above
+        workbook = openpyxl.load_workbook(source, read_only=True, data_only=True)  # type: ignore[arg-type]
+    except (KeyError, zipfile.BadZipFile, openpyxl.utils.exceptions.InvalidFileException) as exc:
+        raise ValueError(f"Data is not an XLSX workbook: {exc}") from exc
+    try:
+        if sheet is None:
+            worksheet = workbook.active
+        elif sheet in workbook.sheetnames:
+            worksheet = workbook[sheet]
+        else:
+            raise ValueError(f"Workbook has no sheet {sheet!r}, only {', '.join(workbook.sheetnames)}")
+        # Workbooks written by other applications may have missing or wrong dimensions
+        worksheet.reset_dimensions()  # type: ignore[union-attr]
+        return _write_rows(worksheet.iter_rows(values_only=True), output)  # type: ignore[union-attr]
+    finally:
+        workbook.close()
+
+
+def _write_rows(rows: Iterable[tuple[object, ...]], output: IO[str]) -> int:
+    """Writes the rows of a sheet as CSV, shaped to the width of its header.
+
+    Args:
+        rows: Values of the cells of each row, the first row being the header.
+        output: Text file object to write to.
+
+    Returns:
+        Number of rows written, not including the header.
+    """
+    rows = iter(rows)
+    header = [cell_to_text(value) for value in next(rows, ())]
+    while header and not header[-1]:
+        header.pop()
+    if not header:
+        return 0
+    writer = csv.writer(output, lineterminator="\n")
+    writer.writerow(header)
+    width = len(header)
+    empty = [""] * width
+    written = 0
+    # Blank rows are counted, and only written once followed by a non-blank row
+    blank = 0
+    for values in rows:
+        cells = [cell_to_text(value) for value in values]
+        while len(cells) > width and not cells[-1]:
+            cells.pop()
+        if not any(cells):
+            blank += 1
+            continue
+        for _ in range(blank):
+            writer.writerow(empty)
+        written += blank + 1
+        blank = 0
+        cells.extend(empty[len(cells) :])
+        writer.writerow(cells)
+    return written
+
+
+@contextlib.contextmanager
+def as_csv(
+    data: ReadableT,
+    *,
+    sheet: str | None = None,
+) -> Iterator[ReadableT | IO[bytes]]:
+    """Provides the data as CSV, converting an XLSX workbook.
+
+    A workbook is converted once to a temporary CSV file, streaming its rows,
+    so validation and mapping read it with the same checks and in constant
+    memory as CSV data. Other data is provided unchanged.
+
+    Args:
+        data: Raw CSV or XLSX data.
+        sheet: Name of the workbook's sheet to read, defaults to the active sheet.
+
+    Yields:
+        The CSV data, a binary file object for a converted workbook, which is
+            deleted at the end of the context.
+
+    Raises:
+        ValueError: If the data is a zip archive that is not an XLSX workbook,
+            or has no such sheet.
+    """
+    if not is_xlsx(data):
+        yield data
+        return
+    # frictionless only reads streams backed by a local file
+    with tempfile.NamedTemporaryFile(prefix="abis-mapping-", suffix=".csv") as spool:
+        text = io.TextIOWrapper(spool, encoding="utf-8", newline="")
+        try:
+            write_csv(data, text, sheet=sheet)
+            text.flush()
+        finally:
+            # Leave closing the spool to its owner
+            text.detach()
+        with open(spool.name, "rb") as f:
+            yield f
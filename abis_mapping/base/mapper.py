@@ -2,12 +2,19 @@
 
 # Standard
 import abc
+import asyncio
+import concurrent.futures
+import contextlib
+import contextvars
+import dataclasses
 import datetime
 import functools
 import gc
 import inspect
 import json
 import pathlib
+import threading
+import time
 import types
 import warnings
 import weakref
@@ -19,23 +26,66 @@ import rdflib
 import rdflib.term
 
 # Local
+from . import checkpoint as base_checkpoint
+from . import chunking as base_chunking
+from . import dedup as base_dedup
+from . import memory as base_memory
+from . import observer as base_observer
+from . import preflight as base_preflight
+from . import profiling as base_profiling
+from . import resources as base_resources
+from . import source as base_source
+from . import stream as base_stream
+from . import timing as base_timing
 from . import types as base_types
+from . import validation as base_validation
 from abis_mapping import models
+from abis_mapping import settings
 from abis_mapping import utils
 
 
 # Typing
-from collections.abc import Iterator, Set, Mapping
-from typing import Any, Final, Optional, final
+from collections.abc import AsyncIterator, Callable, Hashable, Iterable, Iterator, Set, Mapping
+from typing import IO, Any, Final, Optional, final
 
 
 # Constants
 a = rdflib.RDF.type
+LITERAL_SUPPLIED_AS = rdflib.Literal("supplied as")
+# Key of the append-only log of the shared node registry hashes added by each committed
+# chunk, and of its number of committed batches within the Checkpoint state
+_REGISTRY_STATE_KEY = "shared_node_registry"
+# Schema descriptor of each mapper that has been validated by frictionless
+_validated_descriptors: Final[dict[type["ABISMapper"], dict[str, Any]]] = {}
+# Callback for each validation error, when streaming validation errors
+_on_validation_error: contextvars.ContextVar[Callable[[frictionless.Error], None] | None] = contextvars.ContextVar(
+    "on_validation_error", default=None
+)
+# Timer of the checks and field parsers, when timing validation
+_validation_timer: contextvars.ContextVar[base_timing.ValidationTimer | None] = contextvars.ContextVar(
+    "validation_timer", default=None
+)
+# Types of the template checks to run, when running preflight validation
+_preflight_check_types: contextvars.ContextVar[frozenset[str] | None] = contextvars.ContextVar(
+    "preflight_check_types", default=None
+)
+# Resources and checklists of validations, captured rather than run, for a single pass
+_captured_validations: contextvars.ContextVar[list[tuple[frictionless.Resource, frictionless.Checklist]] | None] = (
+    contextvars.ContextVar("captured_validations", default=None)
+)
+# Whether chunks are expected to outlive the mapping of the next chunk, as when pipelined
+_chunks_pipelined: contextvars.ContextVar[bool] = contextvars.ContextVar("chunks_pipelined", default=False)
 
 
 class ABISMapper(abc.ABC):
     """ABIS Mapper Base Class"""
 
+    def __init__(self) -> None:
+        """ABIS Mapper constructor."""
+        # Memo of the shared nodes already added to the current chunk graph.
+        # Kept per thread, so that an instance can map submissions concurrently.
+        self._chunk_memo = threading.local()
+
     @abc.abstractmethod
     def apply_validation(
         self,
@@ -52,6 +102,222 @@ class ABISMapper(abc.ABC):
             frictionless.Report: Validation report for the data.
         """
 
+    def validate_resource(
+        self,
+        resource: frictionless.Resource,
+        checklist: frictionless.Checklist,
+    ) -> frictionless.Report:
+        """Validates a resource, for use by `apply_validation()` implementations.
+
+        Validation errors are passed on as they are found when called within
+        `stream_validation()`, only some checks are run when called within
+        `preflight()`, and the checks and field parsers are timed when called
+        within `timed_validation()`. The rows and errors are reported to the
+        observer of an `observer.observe()` block. Within `apply_single_pass()`,
+        the resource is not validated yet, but validated as it is mapped.
+
+        Args:
+            resource: Resource to validate.
+            checklist: Checks to validate with.
+
+        Returns:
+            frictionless.Report: Validation report for the resource.
+        """
+        captured = _captured_validations.get()
+        if captured is not None:
+            captured.append((resource, checklist))
+            placeholder: frictionless.Report = frictionless.Report.from_validation(errors=[])
+            return placeholder
+
+        check_types = _preflight_check_types.get()
+        if check_types is not None:
+            checklist = frictionless.Checklist(
+                checks=[check for check in checklist.checks if check.type in check_types]
+            )
+        timer = _validation_timer.get()
+        with timer.instrument(resource, checklist) if timer is not None else contextlib.nullcontext():
+            observer = base_observer.current()
+            if observer is not None:
+                counter = base_observer.RowCounter(observer)
+                checklist = frictionless.Checklist(
+                    checks=[*checklist.checks, base_observer.RowCounterCheck(counter=counter)]
+                )
+            on_error = _on_validation_error.get()
+            if on_error is None:
+                report: frictionless.Report = resource.validate(checklist=checklist)
+                if observer is not None:
+                    for error in [*report.errors, *(error for task in report.tasks for error in task.errors)]:
+                        observer.on_error(base_validation.ValidationIssue.from_error(self.template_id, error))
+                return report
+            if observer is not None:
+                on_error = self._observed_on_error(on_error, observer)
+            return base_validation.validate_streaming(resource, checklist, on_error)
+
+    def _observed_on_error(
+        self,
+        on_error: Callable[[frictionless.Error], None],
+        observer: base_observer.MappingObserver,
+    ) -> Callable[[frictionless.Error], None]:
+        """Wraps a callback for streamed validation errors, to also report them to an observer.
+
+        Args:
+            on_error: Callback for each validation error.
+            observer: Observer to report the errors to.
+
+        Returns:
+            The wrapped callback.
+        """
+
+        def observed(error: frictionless.Error) -> None:
+            on_error(error)
+            observer.on_error(base_validation.ValidationIssue.from_error(self.template_id, error))
+
+        return observed
+
+    def stream_validation(
+        self,
+        data: base_types.ReadableType,
+        *,
+        on_error: Callable[[base_validation.ValidationIssue], None],
+        **kwargs: Any,
+    ) -> frictionless.Report:
+        """Applies validation, passing each error to a callback as soon as each row is checked.
+
+        Unlike `apply_validation()`, errors are not collected in the report, so
+        memory use does not grow with the number of errors, and the number of
+        errors is not limited.
+
+        Args:
+            data: Readable raw data.
+            on_error: Callback for each validation error.
+            **kwargs: Additional keyword arguments for `apply_validation()`.
+
+        Returns:
+            frictionless.Report: Validation report, holding only the first error
+                of each validated resource, so that `report.valid` is still correct.
+        """
+
+        def on_frictionless_error(error: frictionless.Error) -> None:
+            on_error(base_validation.ValidationIssue.from_error(self.template_id, error))
+
+        token = _on_validation_error.set(on_frictionless_error)
+        try:
+            return self.apply_validation(data, **kwargs)
+        finally:
+            _on_validation_error.reset(token)
+
+    def timed_validation(
+        self,
+        data: base_types.ReadableType,
+        *,
+        on_stats: Callable[[list[base_timing.TimingStats]], None] | None = None,
+        **kwargs: Any,
+    ) -> frictionless.Report:
+        """Applies validation, timing each check and field parser.
+
+        The call count, cumulative time and 99th percentile time of each
+        check's `validate_row()` and each field's cell parser are added to the
+        report's stats as "timings", slowest first. Timing adds about a
+        microsecond per check per row and per cell.
+
+        Args:
+            data: Readable raw data.
+            on_stats: Optional callback for the timing statistics, e.g. to
+                record them as metrics.
+            **kwargs: Additional keyword arguments for `apply_validation()`.
+
+        Returns:
+            frictionless.Report: Validation report, with the timings in its stats.
+        """
+        timer = base_timing.ValidationTimer()
+        token = _validation_timer.set(timer)
+        try:
+            report = self.apply_validation(data, **kwargs)
+        finally:
+            _validation_timer.reset(token)
+
+        # Attach the timings to the report
+        stats = timer.stats()
+        report.stats["timings"] = [dataclasses.asdict(stat) for stat in stats]  # type: ignore[typeddict-unknown-key]
+        if on_stats is not None:
+            on_stats(stats)
+        return report
+
+    def preflight(
+        self,
+        data: base_types.ReadableType,
+        *,
+        head_rows: int = 100,
+        sample_rows: int = 100,
+        seed: int = 0,
+    ) -> base_preflight.PreflightReport:
+        """Quickly validates a sample of the data, to catch wrong template or encoding uploads.
+
+        The data is checked to be UTF-8 encoded, and the template's validation
+        is applied to its header, first rows and a random sample of the other
+        rows, read by seeking rather than reading the whole data. Only the
+        tabular and not empty checks of the template are run, along with the
+        header, type and constraint checks of its schema. Checks that span
+        rows are not run, so valid preflight does not mean the data is valid.
+
+        Args:
+            data: Readable raw data.
+            head_rows: Number of rows to check from the start of the data.
+            sample_rows: Number of rows to sample from the rest of the data.
+                Only seekable binary data (bytes, file paths and binary file
+                objects) is sampled.
+            seed: Seed for the random sample.
+
+        Returns:
+            The preflight report.
+        """
+        start = time.perf_counter()
+        try:
+            sample = base_preflight.read_sample(data, head_rows=head_rows, sample_rows=sample_rows, seed=seed)
+        except UnicodeDecodeError as exc:
+            issue = base_validation.ValidationIssue(
+                template_id=self.template_id,
+                type="encoding-error",
+                message=f"The data is not UTF-8 encoded: {exc}",
+                note=str(exc),
+            )
+            return base_preflight.PreflightReport(
+                template_id=self.template_id,
+                issues=[issue],
+                seconds=time.perf_counter() - start,
+            )
+
+        # Validate the sample, with only the preflight checks
+        token = _preflight_check_types.set(base_preflight.PREFLIGHT_CHECK_TYPES)
+        try:
+            report = self.apply_validation(sample.data)
+        finally:
+            _preflight_check_types.reset(token)
+        return sample.to_report(self.template_id, report, time.perf_counter() - start)
+
+    def write_validation_jsonl(
+        self,
+        data: base_types.ReadableType,
+        output: IO[bytes],
+        **kwargs: Any,
+    ) -> frictionless.Report:
+        """Applies validation, writing each error to the output as a JSON line as soon as it is found.
+
+        Args:
+            data: Readable raw data.
+            output: Binary file object to write to, flushed after each error.
+            **kwargs: Additional keyword arguments for `apply_validation()`.
+
+        Returns:
+            frictionless.Report: Validation report, as for `stream_validation()`.
+        """
+
+        def write(issue: base_validation.ValidationIssue) -> None:
+            output.write(f"{issue.to_json()}\n".encode("utf-8"))
+            output.flush()
+
+        return self.stream_validation(data, on_error=write, **kwargs)
+
     def apply_mapping(
         self,
         *,
@@ -62,76 +328,196 @@ class ABISMapper(abc.ABC):
         submission_iri: rdflib.URIRef | None,
         project_iri: rdflib.URIRef | None,
         submitted_on_date: datetime.date,
+        checkpoint_store: base_checkpoint.CheckpointStore | None = None,
+        shared_node_registry: base_dedup.SharedNodeRegistry | None = None,
+        max_triples_per_chunk: int | None = None,
+        max_chunk_bytes: int | None = None,
+        on_chunk: Callable[[base_chunking.ChunkStats], None] | None = None,
+        bnode_seed: str | None = None,
+        observer: base_observer.MappingObserver | None = None,
+        rows: Iterable[frictionless.Row] | None = None,
         **kwargs: Any,
     ) -> Iterator[rdflib.Graph]:
         """Applies Mapping from Raw Data to ABIS conformant RDF.
 
         Args:
             data: Readable raw data.
-            chunk_size: Size of chunks to split raw data into. None to disabled chunking.
+            chunk_size: Maximum number of rows per chunk. None for no row limit.
             dataset_iri: IRI of the Dataset this raw data is part of.
             base_iri: Namespace to use when generating new IRIs as part of this mapping.
             submission_iri: Optional submission IRI
             project_iri: The abis:Project IRI if there is one.
             submitted_on_date: The date the data was submitted.
+            checkpoint_store: Optional store to record a Checkpoint in after each
+                committed chunk. If the store already holds a Checkpoint, mapping
+                resumes after the last committed chunk.
+            shared_node_registry: Optional submission-wide registry, when provided
+                the triples of shared nodes (vocabulary concepts, agents, datatypes,
+                attributes etc.) are only emitted in the first chunk that has them.
+                With a checkpoint store, the hashes added by each committed chunk are
+                appended to a log in the store, and replayed into the registry when resuming.
+            max_triples_per_chunk: Optional maximum number of triples per chunk, a
+                chunk is yielded once a row takes it to this many triples.
+            max_chunk_bytes: Optional maximum estimated memory size of a chunk
+                graph, a chunk is yielded once a row takes it to this size.
+                Chunking is disabled when none of chunk_size, max_triples_per_chunk
+                and max_chunk_bytes are provided.
+            on_chunk: Optional callback, called with the statistics of each chunk
+                before it is yielded.
+            bnode_seed: Optional seed for deterministic blank node identifiers,
+                e.g. the submission IRI. When provided, blank node identifiers
+                are derived from the seed and the row, so the output is the
+                same on every run. Otherwise identifiers are random.
+            observer: Optional observer to report the rows, chunks, created
+                vocabulary terms, cache statistics and errors to. Defaults to
+                the observer of an `observer.observe()` block, if any.
+            rows: Optional rows of the data already being read, e.g. by the
+                validation of `apply_single_pass()`, to map rather than reading
+                the data again. The data is then only used for its field names.
             **kwargs: Additional keyword arguments.
 
         Yields:
             rdflib.Graph: ABIS Conformant RDF Sub-Graph from Raw Data Chunk.
         """
-        # Check chunk size
-        if chunk_size is not None and chunk_size <= 0:
-            raise ValueError("chunk_size must be greater than zero")
+        # Check chunk limits
+        budget = base_chunking.ChunkBudget(
+            chunk_size=chunk_size,
+            max_triples=max_triples_per_chunk,
+            max_bytes=max_chunk_bytes,
+        )
+
+        # Load checkpoint to resume from, if any
+        checkpoint = checkpoint_store.load() if checkpoint_store is not None else None
+        if checkpoint is not None:
+            checkpoint.check_resumable(
+                template_id=self.template_id,
+                dataset_iri=str(dataset_iri),
+                chunk_size=chunk_size,
+                max_triples_per_chunk=max_triples_per_chunk,
+                max_chunk_bytes=max_chunk_bytes,
+            )
+            # Nothing left to map
+            if checkpoint.complete:
+                return
+            # Restore the registry to what was emitted in committed chunks only
+            if checkpoint_store is not None and shared_node_registry is not None:
+                shared_node_registry.restore(
+                    checkpoint_store.load_entries(_REGISTRY_STATE_KEY, checkpoint.state.get(_REGISTRY_STATE_KEY, 0))
+                )
+        else:
+            checkpoint = base_checkpoint.Checkpoint(
+                template_id=self.template_id,
+                dataset_iri=str(dataset_iri),
+                chunk_size=chunk_size,
+                max_triples_per_chunk=max_triples_per_chunk,
+                max_chunk_bytes=max_chunk_bytes,
+            )
+            # Discard the registry log of any previous run
+            if checkpoint_store is not None and shared_node_registry is not None:
+                checkpoint_store.load_entries(_REGISTRY_STATE_KEY, 0)
+        # Hashes recorded by the registry in the current chunk, persisted once it is committed
+        registry_added: list[int] = []
+        # Rows up to this number were mapped into already committed chunks
+        resume_after_row = checkpoint.row_number
 
         # Construct Schema and extra fields schema
         schema = self.extra_fields_schema(
             data=data,
             full_schema=True,
         )
-        extra_schema = self.extra_fields_schema(
-            data=data,
-            full_schema=False,
-        )
-
-        # Construct Resource
-        resource = frictionless.Resource(
-            source=data,
-            format="csv",  # TODO -> Hardcoded to csv for now
-            schema=schema,
-            encoding="utf-8",
-        )
+        # The extra fields are appended to the regular fields, so take them
+        # from the full schema rather than inferring the data again.
+        extra_schema = frictionless.Schema(fields=[field.to_copy() for field in schema.fields[len(self.fields()) :]])
+
+        # Blank node identifiers, random unless seeded
+        bnode_ids = utils.bnodes.DeterministicIds(bnode_seed) if bnode_seed is not None else None
+
+        # Observer to report to, if any
+        observer = observer if observer is not None else base_observer.current()
+        row_counter = base_observer.RowCounter(observer) if observer is not None else None
+        on_vocab_created = observer.on_vocab_created if observer is not None else None
+        chunk_start = time.perf_counter()
+        # Memory diagnostics to record each chunk to, if any
+        memory = base_memory.current()
+        if memory is not None:
+            memory.start()
 
         # Initialise Graph
-        graph = utils.rdf.create_graph()
+        graph = utils.rdf.create_graph(store=settings.SETTINGS.CHUNK_GRAPH_STORE)
         graph_has_rows: bool = False
         # Add per-chunk mapping for first chunk
-        self.apply_mapping_chunk(
+        self._apply_mapping_chunk_with_ids(
+            bnode_ids,
             dataset=dataset_iri,
             submission_iri=submission_iri,
             graph=graph,
         )
 
-        # Open the Resource to allow row streaming
-        with resource.open() as r:
+        # Open the Resource to allow row streaming, and profile the rows if enabled
+        row_num = 0
+        with (
+            contextlib.ExitStack() as stack,
+            base_profiling.profile_rows(self) as apply_mapping_row,
+            base_observer.reporting_errors(observer),
+        ):
+            # Construct Resource, unless the rows are already being read
+            if rows is None:
+                rows = stack.enter_context(base_resources.create_resource(data, schema=schema).open()).row_stream
+
             # Loop through rows
-            for row_num, row in enumerate(r.row_stream, start=1):
+            for row_num, row in enumerate(rows, start=1):
+                # Skip rows already mapped into committed chunks.
+                # Since resuming requires the same chunk limits, and chunk
+                # boundaries only depend on the rows within each chunk, the
+                # boundaries below stay aligned with the original run.
+                if row_num <= resume_after_row:
+                    continue
+
                 # Map row
-                self.apply_mapping_row(
-                    row=row,
-                    dataset=dataset_iri,
-                    graph=graph,
-                    extra_schema=extra_schema,
-                    base_iri=base_iri,
-                    submission_iri=submission_iri,
-                    project_iri=project_iri,
-                    submitted_on_date=submitted_on_date,
-                    **kwargs,
-                )
+                if bnode_ids is not None:
+                    bnode_ids.start_row(row_num)
+                with utils.bnodes.deterministic(bnode_ids), utils.vocabs.on_created(on_vocab_created):
+                    apply_mapping_row(
+                        row=row,
+                        dataset=dataset_iri,
+                        graph=graph,
+                        extra_schema=extra_schema,
+                        base_iri=base_iri,
+                        submission_iri=submission_iri,
+                        project_iri=project_iri,
+                        submitted_on_date=submitted_on_date,
+                        **kwargs,
+                    )
                 graph_has_rows = True
+                if row_counter is not None:
+                    row_counter.add()
 
                 # yield chunk if required
-                if chunk_size is not None and row_num % chunk_size == 0:
+                if budget.add_row(graph):
+                    if shared_node_registry is not None:
+                        shared_node_registry.deduplicate(graph, registry_added)
+                    self._report_chunk(
+                        budget.stats(graph, chunk_number=checkpoint.chunk_number + 1, last_row=row_num),
+                        on_chunk=on_chunk,
+                        observer=observer,
+                        row_counter=row_counter,
+                        seconds=time.perf_counter() - chunk_start,
+                        memory=memory,
+                    )
                     yield graph
+                    chunk_start = time.perf_counter()
+
+                    # The consumer has asked for the next chunk, so this one is committed.
+                    checkpoint.row_number = row_num
+                    checkpoint.chunk_number += 1
+                    if checkpoint_store is not None:
+                        # Only persist the registry hashes added by this chunk
+                        if registry_added:
+                            checkpoint.state[_REGISTRY_STATE_KEY] = checkpoint_store.append_entries(
+                                _REGISTRY_STATE_KEY, registry_added
+                            )
+                        checkpoint_store.save(checkpoint)
+                    registry_added.clear()
 
                     # Get weakref to graph so we can detect if it has been garbage collected.
                     graph_weakref = weakref.ref(graph)
@@ -139,7 +525,7 @@ class ABISMapper(abc.ABC):
                     del graph
                     gc.collect()
                     # If graph has not been garbage collected, warn the user.
-                    if graph_weakref() is not None:
+                    if graph_weakref() is not None and not _chunks_pipelined.get():
                         warnings.warn(
                             (
                                 "apply_mapping() chunk graph was not garbage collected "
@@ -151,20 +537,287 @@ class ABISMapper(abc.ABC):
                     del graph_weakref
 
                     # Initialise New Graph for next chunk
-                    graph = utils.rdf.create_graph()
+                    graph = utils.rdf.create_graph(store=settings.SETTINGS.CHUNK_GRAPH_STORE)
                     graph_has_rows = False
-                    self.apply_mapping_chunk(
+                    budget.start()
+                    self._apply_mapping_chunk_with_ids(
+                        bnode_ids,
                         dataset=dataset_iri,
                         submission_iri=submission_iri,
                         graph=graph,
                     )
 
             # yield final chunk, or whole graph if not chunking.
-            if graph_has_rows or chunk_size is None:
+            if graph_has_rows or budget.unbounded:
+                if shared_node_registry is not None:
+                    shared_node_registry.deduplicate(graph, registry_added)
+                self._report_chunk(
+                    budget.stats(graph, chunk_number=checkpoint.chunk_number + 1, last_row=row_num),
+                    on_chunk=on_chunk,
+                    observer=observer,
+                    row_counter=row_counter,
+                    seconds=time.perf_counter() - chunk_start,
+                    memory=memory,
+                )
                 yield graph
                 # Try to garbage collect graph before continuing
                 del graph
                 gc.collect()
+                checkpoint.chunk_number += 1
+
+            # Final chunk committed, mark the mapping as complete.
+            checkpoint.row_number = max(row_num, checkpoint.row_number)
+            checkpoint.complete = True
+            if checkpoint_store is not None:
+                if registry_added:
+                    checkpoint.state[_REGISTRY_STATE_KEY] = checkpoint_store.append_entries(
+                        _REGISTRY_STATE_KEY, registry_added
+                    )
+                checkpoint_store.save(checkpoint)
+
+    @staticmethod
+    def _report_chunk(
+        stats: base_chunking.ChunkStats,
+        *,
+        on_chunk: Callable[[base_chunking.ChunkStats], None] | None,
+        observer: base_observer.MappingObserver | None,
+        row_counter: base_observer.RowCounter | None,
+        seconds: float,
+        memory: base_memory.MemoryDiagnostics | None,
+    ) -> None:
+        """Reports a chunk about to be yielded by `apply_mapping()`.
+
+        Args:
+            stats: Statistics of the chunk.
+            on_chunk: Optional callback for the statistics.
+            observer: Optional observer to report the chunk to.
+            row_counter: Row counter of the observer, flushed before the chunk is reported.
+            seconds: Time taken to map the chunk.
+            memory: Optional memory diagnostics to record the chunk to.
+        """
+        if on_chunk is not None:
+            on_chunk(stats)
+        if memory is not None:
+            memory.record(stats)
+        if observer is not None and row_counter is not None:
+            row_counter.flush()
+            observer.on_chunk(stats, seconds, base_observer.rss_bytes())
+            observer.on_cache_stats(base_observer.cache_stats())
+
+    async def apply_mapping_async(
+        self,
+        *,
+        max_queued_chunks: int = 2,
+        serialize_format: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[rdflib.Graph | bytes]:
+        """Applies Mapping from Raw Data to ABIS conformant RDF, for asyncio applications.
+
+        `apply_mapping()` runs in a worker thread, which puts each chunk in a
+        queue of at most `max_queued_chunks` chunks. So reading and mapping the
+        data overlaps with the consumer writing out the previous chunks, and
+        the worker waits while the queue is full. Mapping and serializing run
+        outside the event loop, which keeps getting the interpreter at the
+        thread switch interval, so it stays responsive during large mappings.
+
+        If the consumer stops early, the worker stops after its current chunk.
+
+        Args:
+            max_queued_chunks: Maximum number of chunks mapped ahead of the consumer.
+            serialize_format: Optional rdflib serialization format. When provided,
+                each chunk is serialized in the worker thread, and yielded as
+                UTF-8 encoded bytes. Each chunk is a complete document, so only
+                line based formats (e.g. "nt") can be concatenated as is.
+            **kwargs: Keyword arguments for `apply_mapping()`.
+
+        Yields:
+            rdflib.Graph | bytes: Each chunk, as a graph or serialized.
+
+        Raises:
+            ValueError: If max_queued_chunks is not greater than zero.
+        """
+        if max_queued_chunks <= 0:
+            raise ValueError("max_queued_chunks must be greater than zero")
+        loop = asyncio.get_running_loop()
+        # Each item is a chunk, or None with the error if any when the mapping is finished
+        queue: asyncio.Queue[tuple[rdflib.Graph | bytes | None, BaseException | None]] = asyncio.Queue(
+            maxsize=max_queued_chunks
+        )
+        stop = threading.Event()
+
+        def put(item: tuple[rdflib.Graph | bytes | None, BaseException | None]) -> bool:
+            """Puts an item in the queue, waiting while it is full. Returns False if stopped."""
+            future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+            while True:
+                try:
+                    future.result(timeout=0.1)
+                    return True
+                except concurrent.futures.TimeoutError:
+                    if stop.is_set():
+                        future.cancel()
+                        return False
+
+        def produce() -> None:
+            """Maps the chunks into the queue, in the worker thread."""
+            # Queued graphs are still referenced when the next chunk is mapped
+            _chunks_pipelined.set(serialize_format is None)
+            chunks = self.apply_mapping(**kwargs)
+            try:
+                for chunk in chunks:
+                    if serialize_format is None:
+                        item: rdflib.Graph | bytes = chunk
+                    else:
+                        item = chunk.serialize(format=serialize_format, encoding="utf-8")
+                    del chunk
+                    if not put((item, None)) or stop.is_set():
+                        return
+                    del item
+                put((None, None))
+            except Exception as exc:
+                put((None, exc))
+            finally:
+                # Close the mapping generator, to release the data
+                if (close := getattr(chunks, "close", None)) is not None:
+                    close()
+
+        # Run the worker, in a copy of the current context
+        worker = asyncio.ensure_future(asyncio.to_thread(produce))
+        try:
+            while True:
+                item, error = await queue.get()
+                if error is not None:
+                    raise error
+                if item is None:
+                    return
+                yield item
+                del item
+        finally:
+            # Stop the worker, and wait for it to close the mapping
+            stop.set()
+            while not queue.empty():
+                queue.get_nowait()
+            await worker
+
+    def apply_single_pass(
+        self,
+        *,
+        data: base_types.ReadableType,
+        result: base_stream.SinglePassResult,
+        validation_kwargs: Mapping[str, Any] | None = None,
+        extractors: Mapping[str, base_stream.KeyExtractor] | None = None,
+        on_error: Callable[[base_validation.ValidationIssue], None] | None = None,
+        **kwargs: Any,
+    ) -> Iterator[rdflib.Graph]:
+        """Validates, extracts keys for other templates and maps the data, reading it once.
+
+        This is for data that can only be read once, e.g. a `stream.StreamSource`
+        of an upload, so that chunks are mapped while the rest of the data is
+        still arriving. Otherwise the data is read for each of validation,
+        extracting keys and mapping. The rows are validated by the checks of
+        `apply_validation()`, and then passed to the key extractors and
+        mapped. Checks that need the rest of the data (e.g. references to
+        later rows) keep what they need, and report their errors at the end.
+
+        So chunks are yielded before the data is known to be valid, and must
+        be discarded if the report is not valid (e.g. written to a staging
+        graph). Once a row has an error, mapping stops, while the rest of the
+        rows are still validated and their keys extracted.
+
+        Args:
+            data: Readable raw data.
+            result: Result to hold the validation report and extracted keys,
+                complete once all the chunks are consumed.
+            validation_kwargs: Keyword arguments for `apply_validation()`.
+            extractors: Functions to extract keys and values from each row, by
+                name, e.g. `{"site_identifiers": mapper.site_identifier_key}`.
+                The keys of each are held in `result.keys` by the same name.
+            on_error: Optional callback for each validation error, as soon as
+                it is found. Errors are then not collected in the report, as
+                for `stream_validation()`.
+            **kwargs: Keyword arguments for `apply_mapping()`.
+
+        Yields:
+            rdflib.Graph: ABIS Conformant RDF Sub-Graph from Raw Data Chunk.
+        """
+        # Get the resource and checks of the template's validation, without validating
+        captured: list[tuple[frictionless.Resource, frictionless.Checklist]] = []
+        token = _captured_validations.set(captured)
+        try:
+            self.apply_validation(data, **(validation_kwargs or {}))
+        finally:
+            _captured_validations.reset(token)
+        ((resource, checklist),) = captured
+
+        # Collect or pass on errors, reporting them to the observer if any
+        start = time.perf_counter()
+        labels: list[str] = []
+        errors: list[frictionless.Error] = []
+        observer = kwargs.get("observer") or base_observer.current()
+
+        def emit(error: frictionless.Error) -> None:
+            if on_error is not None:
+                on_error(base_validation.ValidationIssue.from_error(self.template_id, error))
+            if on_error is None or not errors:
+                errors.append(error)
+            if observer is not None:
+                observer.on_error(base_validation.ValidationIssue.from_error(self.template_id, error))
+
+        # Extract keys from all the rows, and pass the rows up to the first error on to be mapped
+        result.keys = {name: {} for name in extractors or {}}
+
+        def rows() -> Iterator[frictionless.Row]:
+            for row in base_validation.validate_rows(resource, checklist, emit, labels=labels):
+                result.rows += 1
+                for name, extract in (extractors or {}).items():
+                    if (item := extract(row)) is not None:
+                        result.keys[name][item[0]] = item[1]
+                if not errors:
+                    result.mapped_rows += 1
+                    yield row
+
+        # Map, and then report
+        yield from self.apply_mapping(data=data, rows=rows(), **kwargs)
+        result.report = base_validation.create_report(resource, start=start, labels=labels, errors=errors)
+
+    def extract_keys(
+        self,
+        data: base_types.ReadableType,
+        extractor: base_stream.KeyExtractor,
+    ) -> dict[Any, Any]:
+        """Extracts keys for other templates from all the rows of the data.
+
+        Args:
+            data: Readable raw data.
+            extractor: Function to extract the key and value of each row, or None to skip the row.
+
+        Returns:
+            The keys and values, the value of the last row for repeated keys.
+        """
+        # Construct schema
+        schema = self.regular_fields_schema()
+
+        # Construct resource
+        resource = base_resources.create_resource(data, schema=schema)
+
+        # Iterate over rows to extract values
+        with resource.open() as r:
+            return dict(item for row in r.row_stream if (item := extractor(row)) is not None)
+
+    def _apply_mapping_chunk_with_ids(
+        self,
+        bnode_ids: utils.bnodes.DeterministicIds | None,
+        **kwargs: Any,
+    ) -> None:
+        """Applies the per-chunk mapping, with the blank node identifiers of row 0.
+
+        Args:
+            bnode_ids: Deterministic blank node identifiers, if any.
+            **kwargs: Keyword arguments for `apply_mapping_chunk()`.
+        """
+        if bnode_ids is not None:
+            bnode_ids.start_row(0)
+        with utils.bnodes.deterministic(bnode_ids):
+            self.apply_mapping_chunk(**kwargs)
 
     def apply_mapping_chunk(
         self,
@@ -217,6 +870,44 @@ class ABISMapper(abc.ABC):
             submitted_on_date: The date the data was submitted.
         """
 
+    def added_in_chunk(
+        self,
+        graph: rdflib.Graph,
+        *key: Hashable,
+    ) -> bool:
+        """Checks whether a shared node has already been added to the graph.
+
+        Nodes such as Sites, Surveys, Datatypes and Collections are shared by
+        many rows, so `add_*` helpers can consult this to build them once per
+        chunk rather than re-adding identical triples for every row. The memo
+        is reset whenever a different graph (i.e. the next chunk) is passed,
+        and is separate for each thread.
+
+        Args:
+            graph: Graph the node is being added to.
+            *key: Identifies the node and the values its triples depend on,
+                typically the helper name, the node IRI and the raw values.
+                Values that are the same for the whole mapping, such as the
+                dataset, do not need to be included.
+
+        Returns:
+            True if the key was already recorded for this graph, otherwise
+                records the key and returns False.
+        """
+        # Reset the memo for a new chunk graph
+        memo = self._chunk_memo
+        memo_graph: weakref.ref[rdflib.Graph] | None = getattr(memo, "graph", None)
+        if memo_graph is None or memo_graph() is not graph:
+            memo.graph = weakref.ref(graph)
+            memo.keys = set()
+
+        # Check and record the key
+        keys: set[tuple[Hashable, ...]] = memo.keys
+        if key in keys:
+            return True
+        keys.add(key)
+        return False
+
     def add_geometry_supplied_as(
         self,
         subj: rdflib.term.Node,
@@ -238,17 +929,17 @@ class ABISMapper(abc.ABC):
             spatial_accuracy: Tolerance of the supplied geometry.
         """
         # Create top blank node to hold statement
-        top_node = rdflib.BNode()
+        top_node = utils.bnodes.bnode("supplied_as_statement")
 
         # Add details of the already created geometry
         graph.add((top_node, a, rdflib.RDF.Statement))
         graph.add((top_node, rdflib.RDF.subject, subj))
         graph.add((top_node, rdflib.RDF.predicate, pred))
         graph.add((top_node, rdflib.RDF.object, obj))
-        graph.add((top_node, rdflib.RDFS.comment, rdflib.Literal("supplied as")))
+        graph.add((top_node, rdflib.RDFS.comment, LITERAL_SUPPLIED_AS))
 
         # Add the supplied as geometry from raw data
-        supplied_as = rdflib.BNode()
+        supplied_as = utils.bnodes.bnode("supplied_as_geometry")
         graph.add((supplied_as, a, utils.namespaces.GEO.Geometry))
         graph.add((supplied_as, utils.namespaces.GEO.asWKT, geom.to_rdf_literal()))
         if spatial_accuracy is not None:
@@ -308,7 +999,8 @@ class ABISMapper(abc.ABC):
         """Construct a frictionless.Schema for the regular fields in this Template.
 
         i.e. not including any extra fields.
-        Not cached, since the frictionless.Schema class is mutable.
+        Not cached, since the frictionless.Schema class is mutable. The
+        descriptor is only validated the first time it is constructed from.
 
         NOTE: different to the schema() method, which returns our internal
         abis_mapping.models.schema.Schema class.
@@ -316,7 +1008,15 @@ class ABISMapper(abc.ABC):
         Returns:
             The frictionless.Schema for this Template.
         """
-        return frictionless.Schema.from_descriptor(cls.schema())
+        # Skip validating the (cached) descriptor if it has already been validated
+        descriptor = cls.schema()
+        if _validated_descriptors.get(cls) is descriptor:
+            return frictionless.Schema.from_descriptor(descriptor, allow_invalid=True)
+
+        # Construct and validate
+        schema = frictionless.Schema.from_descriptor(descriptor)
+        _validated_descriptors[cls] = descriptor
+        return schema
 
     @final
     @classmethod
@@ -350,17 +1050,16 @@ class ABISMapper(abc.ABC):
             # Get list of fieldnames of row
             actual_fieldnames = data.field_names
 
-        else:
-            # Create resource and infer
-            resource = frictionless.Resource(
-                source=data,
-                format="csv",
-                encoding="utf-8",
-            )
-            resource.infer()
+        elif isinstance(data, base_source.SourceHandle):
+            # The field names of a handle are inferred once, for all passes
+            actual_fieldnames = data.cached("field_names", functools.partial(_infer_field_names, data))
+
+        elif isinstance(data, base_stream.StreamSource):
+            # A stream can only be read once, so the field names are inferred from its header
+            actual_fieldnames = data.cached("field_names", functools.partial(_infer_field_names, data.header))
 
-            # Get list of actual fieldnames
-            actual_fieldnames = resource.schema.field_names
+        else:
+            actual_fieldnames = _infer_field_names(data)
 
         # Find list of extra fieldnames
         existing_fieldnames = existing_schema.field_names
@@ -534,3 +1233,24 @@ def registered_ids() -> Set[str]:
     # Return the set of template IDs.
     # Do not return the _registry dict itself to reduce chance it is mutated outside this module.
     return _registry.keys()
+
+
+def _infer_field_names(data: base_types.ReadableType) -> list[str]:
+    """Infers the field names of data from its header.
+
+    Args:
+        data: Raw data.
+
+    Returns:
+        The field names, in the order of the data.
+    """
+    # Create resource and infer.
+    # Only the field names are needed, so skip inferring the field types.
+    resource = base_resources.create_resource(
+        data,
+        detector=frictionless.Detector(field_type="string"),
+    )
+    resource.infer()
+
+    # Get list of actual fieldnames
+    return resource.schema.field_names
@@ -0,0 +1,224 @@
+"""Provides memory diagnostics of mapping, attributing memory per chunk to subsystems"""
+
+# Standard
+import contextlib
+import contextvars
+import dataclasses
+import tracemalloc
+
+# Local
+from . import chunking as base_chunking
+from abis_mapping import utils
+
+# Typing
+from collections.abc import Iterator
+from typing import Final
+
+
+# Constants
+# Subsystems, and the path fragments of the source files allocating their memory.
+# Traced memory is attributed to the subsystem of the innermost matching frame.
+SUBSYSTEMS: Final[tuple[tuple[str, tuple[str, ...]], ...]] = (
+    ("vocabularies", ("/abis_mapping/vocabs/", "/abis_mapping/utils/vocabs.py")),
+    ("geometry", ("/shapely/", "/pyproj/", "/abis_mapping/models/spatial.py", "/abis_mapping/utils/coords.py")),
+    ("frictionless", ("/frictionless/",)),
+    ("rdflib", ("/rdflib/", "/abis_mapping/utils/stores.py")),
+)
+# Subsystem of the functions cached by the IRI caches
+IRI_CACHES_SUBSYSTEM: Final[str] = "iri-caches"
+# Subsystem of memory not allocated by the other subsystems
+OTHER_SUBSYSTEM: Final[str] = "other"
+
+
+@dataclasses.dataclass
+class ChunkMemory:
+    """Memory traced when a chunk was yielded by `apply_mapping()`.
+
+    Attributes:
+        stats: Statistics of the chunk.
+        traced_bytes: Memory traced, in bytes.
+        growth_bytes: Growth of the memory traced since the previous chunk,
+            or since the start of mapping for the first chunk.
+        subsystem_bytes: Memory traced by subsystem.
+        subsystem_growth_bytes: Growth of the memory traced by subsystem.
+    """
+
+    stats: base_chunking.ChunkStats
+    traced_bytes: int
+    growth_bytes: int
+    subsystem_bytes: dict[str, int]
+    subsystem_growth_bytes: dict[str, int]
+
+
+class MemoryDiagnostics:
+    """Memory diagnostics of mappings, from a tracemalloc snapshot per chunk.
+
+    Memory is traced while diagnosing, which slows mapping. The memory of
+    each snapshot is attributed to the subsystem (e.g. the rdflib store,
+    frictionless rows or the IRI caches) of the innermost frame of its
+    allocation that is in a subsystem. Only memory allocated by Python is
+    traced, not memory allocated by C libraries such as GEOS and PROJ.
+
+    Attributes:
+        reports: Report of each chunk, in the order they were yielded.
+    """
+
+    def __init__(self) -> None:
+        """MemoryDiagnostics constructor."""
+        self.reports: list[ChunkMemory] = []
+        self._previous: dict[str, int] = {}
+        # Subsystem by allocation traceback, and by source file and line
+        self._tracebacks: dict[tracemalloc.Traceback, str] = {}
+        self._lines: dict[tuple[str, int], str | None] = {}
+        # Source file and lines of the functions cached by the IRI caches
+        self._cached_lines: dict[str, list[range]] = {}
+        for cache in utils.iri_patterns.IRI_CACHES.values():
+            code = cache.__wrapped__.__code__
+            last_line = max(line for _, _, line in code.co_lines() if line is not None)
+            self._cached_lines.setdefault(code.co_filename, []).append(range(code.co_firstlineno, last_line + 1))
+
+    def start(self) -> None:
+        """Takes the snapshot to compare the first chunk of a mapping to."""
+        self._previous = self._subsystem_bytes()
+
+    def record(self, stats: base_chunking.ChunkStats) -> ChunkMemory:
+        """Takes the snapshot of a chunk, and reports it.
+
+        Args:
+            stats: Statistics of the chunk.
+
+        Returns:
+            The report of the chunk.
+        """
+        subsystem_bytes = self._subsystem_bytes()
+        report = ChunkMemory(
+            stats=stats,
+            traced_bytes=sum(subsystem_bytes.values()),
+            growth_bytes=sum(subsystem_bytes.values()) - sum(self._previous.values()),
+            subsystem_bytes=subsystem_bytes,
+            subsystem_growth_bytes={
+                subsystem: size - self._previous.get(subsystem, 0) for subsystem, size in subsystem_bytes.items()
+            },
+        )
+        self._previous = subsystem_bytes
+        self.reports.append(report)
+        return report
+
+    def format(self) -> str:
+        """Formats the reports as a table, with the growth by subsystem.
+
+        Returns:
+            The table, with a line per chunk.
+        """
+        subsystems = [name for name, _ in SUBSYSTEMS] + [IRI_CACHES_SUBSYSTEM, OTHER_SUBSYSTEM]
+        lines = [
+            " ".join(
+                [f"{'chunk':>6} {'rows':>8} {'triples':>10} {'traced MB':>10} {'growth MB':>10}"]
+                + [f"{name:>13}" for name in subsystems]
+            )
+        ]
+        for report in self.reports:
+            lines.append(
+                " ".join(
+                    [
+                        f"{report.stats.chunk_number:6d} {report.stats.rows:8d} {report.stats.triples:10d}"
+                        f" {report.traced_bytes / 1e6:10.2f} {report.growth_bytes / 1e6:+10.2f}"
+                    ]
+                    + [f"{report.subsystem_growth_bytes.get(name, 0) / 1e6:+13.2f}" for name in subsystems]
+                )
+            )
+        return "\n".join(lines) + "\n"
+
+    def _subsystem_bytes(self) -> dict[str, int]:
+        """Takes a snapshot, and totals the memory of each subsystem.
+
+        Returns:
+            Memory traced by subsystem, in bytes.
+        """
+        snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+        totals = dict.fromkeys([name for name, _ in SUBSYSTEMS] + [IRI_CACHES_SUBSYSTEM, OTHER_SUBSYSTEM], 0)
+        for statistic in snapshot.statistics("traceback"):
+            subsystem = self._tracebacks.get(statistic.traceback)
+            if subsystem is None:
+                subsystem = self._tracebacks[statistic.traceback] = self._classify(statistic.traceback)
+            totals[subsystem] += statistic.size
+        return totals
+
+    def _classify(self, traceback: tracemalloc.Traceback) -> str:
+        """Attributes an allocation to a subsystem.
+
+        Args:
+            traceback: Traceback of the allocation, most recent frame first.
+
+        Returns:
+            The subsystem of the innermost frame in a subsystem, otherwise "other".
+        """
+        for frame in traceback:
+            key = (frame.filename, frame.lineno)
+            if key not in self._lines:
+                self._lines[key] = self._frame_subsystem(*key)
+            if (subsystem := self._lines[key]) is not None:
+                return subsystem
+        return OTHER_SUBSYSTEM
+
+    def _frame_subsystem(self, filename: str, lineno: int) -> str | None:
+        """Gets the subsystem of a frame.
+
+        Args:
+            filename: Source file of the frame.
+            lineno: Line of the frame.
+
+        Returns:
+            The subsystem, None if the frame is not in a subsystem.
+        """
+        if any(lineno in lines for lines in self._cached_lines.get(filename, ())):
+            return IRI_CACHES_SUBSYSTEM
+        path = filename.replace("\\", "/")
+        for subsystem, fragments in SUBSYSTEMS:
+            if any(fragment in path for fragment in fragments):
+                return subsystem
+        return None
+
+
+# Memory diagnostics of the mappings in the current context
+_DIAGNOSTICS: contextvars.ContextVar[MemoryDiagnostics | None] = contextvars.ContextVar(
+    "memory_diagnostics", default=None
+)
+
+
+@contextlib.contextmanager
+def diagnose_memory(frames: int = 1) -> Iterator[MemoryDiagnostics]:
+    """Diagnoses the memory of the mappings applied in the block.
+
+    tracemalloc is started if it is not already tracing, and stopped afterwards.
+
+    Args:
+        frames: Number of frames to trace of each allocation. With one frame
+            memory is attributed by where it was allocated, and mapping is
+            about 5 times slower. More frames also attribute memory allocated
+            by the standard library to its callers, but slow mapping much more.
+
+    Yields:
+        The diagnostics, with a report of each chunk yielded by `apply_mapping()`
+            in the block.
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start(frames)
+    diagnostics = MemoryDiagnostics()
+    token = _DIAGNOSTICS.set(diagnostics)
+    try:
+        yield diagnostics
+    finally:
+        _DIAGNOSTICS.reset(token)
+        if started:
+            tracemalloc.stop()
+
+
+def current() -> MemoryDiagnostics | None:
+    """Gets the memory diagnostics of the current context.
+
+    Returns:
+        The diagnostics, if in a `diagnose_memory()` block.
+    """
+    return _DIAGNOSTICS.get()
@@ -0,0 +1,205 @@
+"""Provides observers of mapping and validation, for metrics while they run"""
+
+# Standard
+import contextlib
+import contextvars
+import functools
+import os
+
+# Third-Party
+import attrs
+import frictionless
+
+# Local
+from . import chunking as base_chunking
+from . import validation as base_validation
+from abis_mapping import utils
+
+# Typing
+from collections.abc import Iterator, Mapping
+
+
+class MappingObserver:
+    """Observer of mapping and validation, e.g. to export metrics while they run.
+
+    The hooks do nothing, subclasses override the hooks they need. The hooks
+    are called at low frequency (every `rows_interval` rows, once per chunk,
+    and for each created vocabulary term and error), so the overhead is
+    negligible. They are called in the thread mapping or validating.
+
+    Attributes:
+        rows_interval: Number of rows between calls of `on_rows()`.
+    """
+
+    rows_interval: int = 1000
+
+    def on_rows(self, rows: int) -> None:
+        """Called as rows are mapped or validated.
+
+        Args:
+            rows: Number of rows since the last call. Called every
+                `rows_interval` rows, and for the remaining rows at the end of
+                each chunk and validation.
+        """
+
+    def on_chunk(self, stats: base_chunking.ChunkStats, seconds: float, rss_bytes: int | None) -> None:
+        """Called as each chunk is yielded by `apply_mapping()`.
+
+        Args:
+            stats: Statistics of the chunk.
+            seconds: Time taken to map the chunk, not including the time the
+                consumer held the previous chunk.
+            rss_bytes: Resident memory size of the process, None if unknown.
+        """
+
+    def on_vocab_created(self, vocab_id: str, value: str) -> None:
+        """Called as a flexible vocabulary creates a term for a value not in the vocabulary.
+
+        Args:
+            vocab_id: ID of the vocabulary.
+            value: Value the term was created for.
+        """
+
+    def on_cache_stats(self, stats: Mapping[str, "functools._CacheInfo"]) -> None:
+        """Called with the statistics of the IRI caches, after each chunk.
+
+        Args:
+            stats: Hits, misses, maximum size and current size of each cache.
+        """
+
+    def on_error(self, error: base_validation.ValidationIssue | Exception) -> None:
+        """Called for each validation error, and for an exception raised while mapping.
+
+        Args:
+            error: The validation error, or the exception (which is then
+                raised by `apply_mapping()`).
+        """
+
+
+# Observer of the mappings and validations in the current context
+_OBSERVER: contextvars.ContextVar[MappingObserver | None] = contextvars.ContextVar("observer", default=None)
+
+
+@contextlib.contextmanager
+def observe(observer: MappingObserver | None) -> Iterator[None]:
+    """Observes the mappings and validations in the block.
+
+    Args:
+        observer: Observer to call the hooks of, None for no observer.
+
+    Yields:
+        None.
+    """
+    token = _OBSERVER.set(observer)
+    try:
+        yield
+    finally:
+        _OBSERVER.reset(token)
+
+
+def current() -> MappingObserver | None:
+    """Gets the observer of the current context.
+
+    Returns:
+        The observer, if in an `observe()` block.
+    """
+    return _OBSERVER.get()
+
+
+@contextlib.contextmanager
+def reporting_errors(observer: MappingObserver | None) -> Iterator[None]:
+    """Reports an exception raised in the block to an observer, before raising it.
+
+    Args:
+        observer: Observer to report to, None to not report.
+
+    Yields:
+        None.
+    """
+    try:
+        yield
+    except Exception as exc:
+        if observer is not None:
+            observer.on_error(exc)
+        raise
+
+
+class RowCounter:
+    """Counts rows for an observer, calling `on_rows()` every `rows_interval` rows."""
+
+    def __init__(self, observer: MappingObserver) -> None:
+        """RowCounter constructor.
+
+        Args:
+            observer: Observer to call.
+        """
+        self.observer = observer
+        self.rows = 0
+
+    def add(self) -> None:
+        """Counts a row."""
+        self.rows += 1
+        if self.rows >= self.observer.rows_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Calls `on_rows()` for the rows counted since the last call, if any."""
+        if self.rows:
+            self.observer.on_rows(self.rows)
+            self.rows = 0
+
+
+@attrs.define(kw_only=True, repr=False)
+class RowCounterCheck(frictionless.Check):
+    """Counts the validated rows for an observer, finding no errors."""
+
+    # Check Attributes
+    type = "row-counter"
+    Errors = []
+
+    # Attributes specific to this check
+    counter: RowCounter
+
+    def validate_row(self, row: frictionless.Row) -> Iterator[frictionless.Error]:
+        """Called to validate the given row (on every row).
+
+        Args:
+            row (frictionless.Row): The row, which is counted.
+
+        Yields:
+            Nothing.
+        """
+        self.counter.add()
+        yield from ()
+
+    def validate_end(self) -> Iterator[frictionless.Error]:
+        """Called to validate the resource after all rows.
+
+        Yields:
+            Nothing.
+        """
+        self.counter.flush()
+        yield from ()
+
+
+def cache_stats() -> dict[str, "functools._CacheInfo"]:
+    """Gets the statistics of the IRI caches.
+
+    Returns:
+        Statistics of each cache, by name.
+    """
+    return {name: cache.cache_info() for name, cache in utils.iri_patterns.IRI_CACHES.items()}
+
+
+def rss_bytes() -> int | None:
+    """Gets the resident memory size of the process.
+
+    Returns:
+        The size in bytes, read from /proc so None other than on Linux.
+    """
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            pages = int(statm.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE")
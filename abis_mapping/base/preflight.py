@@ -0,0 +1,224 @@
+"""Provides fast preflight validation of a sample of the data"""
+
+# Standard
+import contextlib
+import csv
+import dataclasses
+import io
+import itertools
+import os
+import random
+
+# Third-Party
+import frictionless
+
+# Local
+from . import arrow as base_arrow
+from . import source as base_source
+from . import stream as base_stream
+from . import types as base_types
+from . import validation as base_validation
+
+# Typing
+from collections.abc import Iterator
+from typing import IO, Final
+
+
+# Constants
+# Types of the template checks that are run by preflight validation, in addition to
+# frictionless's header, type and constraint checks. Other checks can span rows,
+# and would give false errors for a sample of the rows.
+PREFLIGHT_CHECK_TYPES: Final[frozenset[str]] = frozenset({"is-tabular", "not-empty"})
+
+
+@dataclasses.dataclass
+class PreflightReport:
+    """Report of preflight validation.
+
+    Attributes:
+        template_id: ID of the template.
+        issues: Errors found. Errors in sampled rows have no row number,
+            since the position of the sampled rows is not known.
+        head_rows: Number of rows checked from the start of the data.
+        sampled_rows: Number of rows sampled from the rest of the data.
+        seconds: Time taken.
+    """
+
+    template_id: str
+    issues: list[base_validation.ValidationIssue]
+    head_rows: int = 0
+    sampled_rows: int = 0
+    seconds: float = 0.0
+
+    @property
+    def valid(self) -> bool:
+        """Whether no errors were found."""
+        return not self.issues
+
+
+@dataclasses.dataclass
+class Sample:
+    """Sample of the rows of the data.
+
+    Attributes:
+        data: CSV data with the header, head rows and then sampled rows, or
+            the head rows and then sampled rows of Arrow data.
+        head_rows: Number of rows from the start of the data.
+        sampled_rows: Number of rows sampled from the rest of the data.
+    """
+
+    data: bytes | base_arrow.ArrowSource
+    head_rows: int
+    sampled_rows: int
+
+    def to_report(
+        self,
+        template_id: str,
+        report: frictionless.Report,
+        seconds: float,
+    ) -> PreflightReport:
+        """Creates the preflight report from the validation report of the sample.
+
+        Args:
+            template_id: ID of the template.
+            report: Validation report of the sample data.
+            seconds: Time taken.
+
+        Returns:
+            The preflight report.
+        """
+        issues: list[base_validation.ValidationIssue] = []
+        for error in [*report.errors, *(error for task in report.tasks for error in task.errors)]:
+            issue = base_validation.ValidationIssue.from_error(template_id, error)
+            # Row numbers of the head rows are the same as in the data, but not of the sampled rows
+            if issue.row_number is not None and issue.row_number > self.head_rows + 1:
+                issue = dataclasses.replace(issue, row_number=None, message=f"{issue.note} (in a sampled row)")
+            issues.append(issue)
+        return PreflightReport(
+            template_id=template_id,
+            issues=issues,
+            head_rows=self.head_rows,
+            sampled_rows=self.sampled_rows,
+            seconds=seconds,
+        )
+
+
+def read_sample(
+    data: base_types.ReadableType,
+    *,
+    head_rows: int,
+    sample_rows: int,
+    seed: int,
+) -> Sample:
+    """Reads the header and a sample of the rows of the data.
+
+    The first `head_rows` rows are read in order. Then for seekable binary
+    data, `sample_rows` rows are sampled by seeking to random positions in the
+    rest of the data, and reading the next whole line. So only a small part of
+    the data is read, however large it is. Sampled lines that are not a whole
+    row (e.g. part of a quoted value with line breaks) are skipped.
+
+    File objects are left at the position they were at. Arrow data is sampled
+    by taking rows, see `arrow.ArrowSource.sample()`. Only the rows read ahead
+    from a `stream.StreamSource` are read, so it can still be read afterwards.
+
+    Args:
+        data: Raw data.
+        head_rows: Number of rows to read from the start.
+        sample_rows: Number of rows to sample from the rest of the data.
+        seed: Seed for the random sample.
+
+    Returns:
+        The sample.
+
+    Raises:
+        UnicodeDecodeError: If the data read is not UTF-8 encoded.
+    """
+    if isinstance(data, base_arrow.ArrowSource):
+        arrow_sample, head_count, sampled_count = data.sample(head_rows=head_rows, sample_rows=sample_rows, seed=seed)
+        return Sample(data=arrow_sample, head_rows=head_count, sampled_rows=sampled_count)
+
+    with _open(data) as stream:
+        reader = csv.reader(_lines(stream))
+        header = next(reader, None)
+        if header is None:
+            return Sample(data=b"", head_rows=0, sampled_rows=0)
+        head = list(itertools.islice(reader, head_rows))
+        sampled: list[list[str]] = []
+
+        # Sample lines from the rest of binary data by seeking
+        if sample_rows > 0 and not isinstance(stream, io.TextIOBase) and stream.seekable():
+            head_end = stream.tell()
+            size = stream.seek(0, io.SEEK_END)
+            rng = random.Random(seed)  # noqa: S311
+            line_starts: set[int] = set()
+            for offset in sorted(rng.randrange(head_end, size) for _ in range(sample_rows if size > head_end else 0)):
+                # Skip to the start of the next line, keeping a line that starts at the offset
+                stream.seek(offset - 1)
+                stream.readline()
+                line_start = stream.tell()
+                if line_start in line_starts or line_start >= size:
+                    continue
+                line_starts.add(line_start)
+                line = stream.readline()
+                row = next(csv.reader([line.decode("utf-8") if isinstance(line, bytes) else line]), [])
+                if len(row) == len(header):
+                    sampled.append(row)
+
+    # Write the sample as CSV
+    output = io.StringIO()
+    writer = csv.writer(output, lineterminator="\n")
+    writer.writerow(header)
+    writer.writerows(head)
+    writer.writerows(sampled)
+    return Sample(data=output.getvalue().encode("utf-8"), head_rows=len(head), sampled_rows=len(sampled))
+
+
+@contextlib.contextmanager
+def _open(data: base_types.ReadableType) -> Iterator[IO[bytes] | IO[str]]:
+    """Opens the data for reading, restoring the position of file objects afterwards.
+
+    Args:
+        data: Raw data, a file path is opened in binary mode.
+
+    Yields:
+        File object for the data.
+    """
+    if isinstance(data, bytes):
+        yield io.BytesIO(data)
+    elif isinstance(data, base_source.SourceHandle):
+        with data.open() as stream:
+            yield stream
+    elif isinstance(data, base_stream.StreamSource):
+        # Only the rows read ahead are checked, so the stream can still be read once
+        yield io.BytesIO(data.head)
+    elif isinstance(data, base_arrow.ArrowSource):
+        raise TypeError("Arrow data is sampled by its rows, not read as raw data")
+    elif isinstance(data, (str, os.PathLike)):
+        with open(data, "rb") as file:
+            yield file
+    else:
+        position = data.tell() if data.seekable() else None
+        try:
+            yield data
+        finally:
+            if position is not None:
+                data.seek(position)
+
+
+def _lines(stream: IO[bytes] | IO[str]) -> Iterator[str]:
+    """Reads the lines of the data one at a time, as text.
+
+    Args:
+        stream: File object to read.
+
+    Yields:
+        Each line, decoded as UTF-8 with any byte order mark removed.
+
+    Raises:
+        UnicodeDecodeError: If a line is not UTF-8 encoded.
+    """
+    encoding = "utf-8-sig"
+    while line := stream.readline():
+        yield line.decode(encoding) if isinstance(line, bytes) else line
+        encoding = "utf-8"
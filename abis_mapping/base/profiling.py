@@ -0,0 +1,301 @@
+"""Provides profiling of row mapping, by add method, IRI pattern and vocabulary"""
+
+# Standard
+import contextlib
+import contextvars
+import datetime
+import inspect
+import pathlib
+import threading
+import time
+
+# Third-Party
+import rdflib
+
+# Local
+from abis_mapping import settings
+from abis_mapping import utils
+
+# Typing
+from collections.abc import Callable, Iterator
+from typing import IO, Any, Final
+
+
+# Profile of the mappings in the current context, when profiling with `profile_mapping()`
+_active_profile: contextvars.ContextVar["MappingProfile | None"] = contextvars.ContextVar(
+    "active_profile", default=None
+)
+# Profile and graph of the row being mapped by each thread
+_recording = threading.local()
+
+# Patched functions, by their owner (class or module) and name, with their
+# original attribute (if not inherited) and the number of profiled mappings using them.
+_patches: dict[tuple[object, str], tuple[object, int]] = {}
+_patches_lock = threading.Lock()
+_MISSING: Final = object()
+
+
+class MappingProfile:
+    """Profile of mapping rows.
+
+    The time and triples added by each call of a mapper's `add_*` methods, the
+    `utils.iri_patterns` functions and the vocabularies' `get()` are recorded by
+    call stack, below the row's `apply_mapping_row()`. So the self time (not
+    including the calls profiled within) of each can be summarised, and written
+    as collapsed stacks for flame graphs.
+
+    Attributes:
+        output_dir: Optional directory the profile is written to at the end of
+            each `apply_mapping()`.
+    """
+
+    def __init__(self, output_dir: pathlib.Path | None = None) -> None:
+        """MappingProfile constructor.
+
+        Args:
+            output_dir: Optional directory to write the profile to at the end
+                of each `apply_mapping()`.
+        """
+        self.output_dir = output_dir
+        # Calls, inclusive nanoseconds and inclusive triples by call stack
+        self._stacks: dict[tuple[str, ...], list[int]] = {}
+        self._lock = threading.Lock()
+
+    def call(self, name: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Calls and records a profiled function.
+
+        Args:
+            name: Name of the function in the profile.
+            func: The function.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            The result of the function.
+        """
+        stack: list[str] = _recording.stack
+        graph: rdflib.Graph = _recording.graph
+        # Recursive calls (e.g. to a super() method) are recorded as the one call
+        if stack and stack[-1] == name:
+            return func(*args, **kwargs)
+        stack.append(name)
+        path = tuple(stack)
+        triples = len(graph)
+        start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            stack.pop()
+            with self._lock:
+                totals = self._stacks.setdefault(path, [0, 0, 0])
+                totals[0] += 1
+                totals[1] += elapsed
+                totals[2] += len(graph) - triples
+
+    def self_totals(self) -> dict[tuple[str, ...], tuple[int, int, int, int]]:
+        """Calculates the totals of each call stack.
+
+        Returns:
+            Calls, self nanoseconds, self triples and inclusive nanoseconds by
+                call stack. Self totals exclude the profiled calls within.
+        """
+        with self._lock:
+            stacks = {path: tuple(totals) for path, totals in self._stacks.items()}
+        totals = {path: [calls, ns, triples, ns] for path, (calls, ns, triples) in stacks.items()}
+        for path, (_, ns, triples) in stacks.items():
+            if (parent := totals.get(path[:-1])) is not None:
+                parent[1] -= ns
+                parent[2] -= triples
+        return {path: (calls, ns, triples, total) for path, (calls, ns, triples, total) in totals.items()}
+
+    def summary(self) -> str:
+        """Summarises the profile by function, in order of self time.
+
+        Returns:
+            The summary table.
+        """
+        functions: dict[str, list[int]] = {}
+        for path, (calls, self_ns, self_triples, total_ns) in self.self_totals().items():
+            totals = functions.setdefault(path[-1], [0, 0, 0, 0])
+            totals[0] += calls
+            totals[1] += self_ns
+            totals[2] += self_triples
+            # Only count the inclusive time of the outermost call of a function
+            if path.index(path[-1]) == len(path) - 1:
+                totals[3] += total_ns
+        lines = [f"{'self (s)':>10} {'total (s)':>10} {'calls':>10} {'triples':>10}  name"]
+        for name, (calls, self_ns, triples, total_ns) in sorted(functions.items(), key=lambda item: -item[1][1]):
+            lines.append(f"{self_ns / 1e9:10.4f} {total_ns / 1e9:10.4f} {calls:10d} {triples:10d}  {name}")
+        return "\n".join(lines) + "\n"
+
+    def write_collapsed(self, output: IO[str]) -> None:
+        """Writes the profile as collapsed stacks, for flame graph tools.
+
+        Each line is a call stack, separated by semicolons, and its self time
+        in microseconds.
+
+        Args:
+            output: Text file object to write to.
+        """
+        for path, (_, self_ns, _, _) in sorted(self.self_totals().items()):
+            output.write(f"{';'.join(path)} {self_ns // 1000}\n")
+
+    def dump(self, directory: pathlib.Path, name: str) -> tuple[pathlib.Path, pathlib.Path]:
+        """Writes the summary and collapsed stacks to a directory.
+
+        Args:
+            directory: Directory to write to, created if needed.
+            name: Name of the files, without suffix.
+
+        Returns:
+            Paths of the summary and collapsed stacks files.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        summary_path = directory / f"{name}.txt"
+        summary_path.write_text(self.summary(), encoding="utf-8")
+        collapsed_path = directory / f"{name}.collapsed"
+        with collapsed_path.open("w", encoding="utf-8") as output:
+            self.write_collapsed(output)
+        return summary_path, collapsed_path
+
+
+@contextlib.contextmanager
+def profile_mapping(output_dir: pathlib.Path | None = None) -> Iterator[MappingProfile]:
+    """Profiles the mappings applied within the context, in this thread.
+
+    Chunks mapped in other processes (e.g. by the `--workers` command line
+    option) are not profiled.
+
+    Args:
+        output_dir: Optional directory to write the profile to at the end of
+            each `apply_mapping()`.
+
+    Yields:
+        The profile, recorded to by each `apply_mapping()` started within the context.
+    """
+    profile = MappingProfile(output_dir=output_dir)
+    token = _active_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _active_profile.reset(token)
+
+
+@contextlib.contextmanager
+def profile_rows(mapper: Any) -> Iterator[Callable[..., None]]:
+    """Provides the function to map rows with, profiled if profiling is enabled.
+
+    Profiling is enabled within `profile_mapping()`, or by the
+    `MAPPING_PROFILE_DIR` setting. The profile is written to its output
+    directory, if any, at the end of the context.
+
+    Args:
+        mapper: The mapper applying the mapping.
+
+    Yields:
+        The mapper's `apply_mapping_row()`, recording to the profile if enabled.
+    """
+    profile = _active_profile.get()
+    if profile is None and settings.SETTINGS.MAPPING_PROFILE_DIR is not None:
+        profile = MappingProfile(output_dir=settings.SETTINGS.MAPPING_PROFILE_DIR)
+    if profile is None:
+        yield mapper.apply_mapping_row
+        return
+
+    def apply_mapping_row(*, graph: rdflib.Graph, **kwargs: Any) -> None:
+        _recording.profile = profile
+        _recording.graph = graph
+        _recording.stack = []
+        try:
+            profile.call("apply_mapping_row", mapper.apply_mapping_row, graph=graph, **kwargs)
+        finally:
+            _recording.profile = None
+            _recording.graph = None
+
+    # Patch the functions to profile while mapping
+    targets = _targets(type(mapper))
+    for owner, name, label in targets:
+        _patch(owner, name, label)
+    try:
+        yield apply_mapping_row
+    finally:
+        for owner, name, _ in targets:
+            _unpatch(owner, name)
+        if profile.output_dir is not None:
+            timestamp = datetime.datetime.now().strftime("%Y%m%dT%H%M%S%f")
+            profile.dump(profile.output_dir, f"{mapper.template_id}-{timestamp}")
+
+
+def _targets(mapper_class: type) -> list[tuple[object, str, str]]:
+    """Lists the functions to profile for a mapper.
+
+    Args:
+        mapper_class: Class of the mapper.
+
+    Returns:
+        The owner (class or module), attribute name and profile name of each function.
+    """
+    targets: list[tuple[object, str, str]] = []
+    # The mapper's add methods
+    for name in dir(mapper_class):
+        if name.startswith("add_") and inspect.isfunction(inspect.getattr_static(mapper_class, name)):
+            targets.append((mapper_class, name, name))
+    # The IRI patterns
+    for name, function in vars(utils.iri_patterns).items():
+        if (
+            not name.startswith("_")
+            and inspect.isfunction(function)
+            and function.__module__ == utils.iri_patterns.__name__
+        ):
+            targets.append((utils.iri_patterns, name, f"iri:{name}"))
+    # The vocabularies' get(), where it is defined
+    owners = {owner for vocab in utils.vocabs.registered_vocabs() for owner in vocab.__mro__ if "get" in vars(owner)}
+    for owner in owners:
+        targets.append((owner, "get", "vocab"))
+    return targets
+
+
+def _patch(owner: object, name: str, label: str) -> None:
+    """Patches a function to be profiled, while mapping rows with a profile.
+
+    Args:
+        owner: Class or module of the function.
+        name: Attribute name of the function.
+        label: Name of the function in the profile, for vocabularies the
+            vocabulary ID is appended.
+    """
+    with _patches_lock:
+        if (key := (owner, name)) in _patches:
+            original, count = _patches[key]
+            _patches[key] = (original, count + 1)
+            return
+        _patches[key] = (vars(owner).get(name, _MISSING), 1)
+        func = getattr(owner, name)
+
+        def profiled(*args: Any, **kwargs: Any) -> Any:
+            profile: MappingProfile | None = getattr(_recording, "profile", None)
+            if profile is None:
+                return func(*args, **kwargs)
+            # Vocabularies are profiled by vocabulary
+            profile_name = f"vocab:{args[0].vocab_id}" if label == "vocab" else label
+            return profile.call(profile_name, func, *args, **kwargs)
+
+        setattr(owner, name, profiled)
+
+
+def _unpatch(owner: object, name: str) -> None:
+    """Restores a patched function, once no profiled mappings are using it.
+
+    Args:
+        owner: Class or module of the function.
+        name: Attribute name of the function.
+    """
+    with _patches_lock:
+        original, count = _patches.pop((owner, name))
+        if count > 1:
+            _patches[(owner, name)] = (original, count - 1)
+        elif original is _MISSING:
+            delattr(owner, name)
+        else:
+            setattr(owner, name, original)
@@ -0,0 +1,45 @@
+"""Provides the frictionless resources of template data"""
+
+# Third-Party
+import frictionless
+
+# Local
+from . import arrow as base_arrow
+from . import source as base_source
+from . import stream as base_stream
+from . import types as base_types
+
+# Typing
+from typing import Any
+
+
+def create_resource(
+    data: base_types.ReadableType,
+    schema: frictionless.Schema | None = None,
+    **options: Any,
+) -> frictionless.Resource:
+    """Creates the frictionless resource of template data.
+
+    Args:
+        data: Raw CSV data, a `source.SourceHandle` or `stream.StreamSource`
+            of CSV data, or an `arrow.ArrowSource` of Arrow or Parquet data.
+        schema: Schema of the resource, inferred when not supplied.
+        **options: Other options of the resource, e.g. the detector.
+
+    Returns:
+        The resource.
+    """
+    # Arrow data is read by column name with its native values
+    if isinstance(data, base_arrow.ArrowSource):
+        return data.resource(schema, **options)
+
+    # Source handles are read zero-copy, and stream sources once, by their loaders
+    if isinstance(data, base_source.SourceHandle):
+        options["scheme"] = base_source.SCHEME
+    elif isinstance(data, base_stream.StreamSource):
+        options["scheme"] = base_stream.SCHEME
+
+    # Otherwise the data is read as UTF-8 encoded CSV
+    if schema is not None:
+        options["schema"] = schema
+    return frictionless.Resource(source=data, format="csv", encoding="utf-8", **options)
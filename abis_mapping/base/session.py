@@ -0,0 +1,277 @@
+"""Provides a long-lived mapping session, for mapping many submissions in a row"""
+
+# Standard
+import dataclasses
+import datetime
+import threading
+import time
+
+# Third-Party
+import frictionless
+import rdflib
+
+# Local
+from . import mapper as base_mapper
+from . import types as base_types
+from abis_mapping import models
+from abis_mapping import utils
+
+# Typing
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+
+@dataclasses.dataclass
+class SessionStats:
+    """Statistics of a `MappingSession`.
+
+    Attributes:
+        validations: Number of submissions validated.
+        mappings: Number of submissions mapped.
+        validation_seconds: Total time spent validating.
+        mapping_seconds: Total time spent mapping, including consuming the chunks.
+        mappers: Template IDs of the mappers held by the session.
+        cache_entries: Number of entries in each of the IRI caches.
+        cache_hits: Number of hits of each of the IRI caches.
+        cache_misses: Number of misses of each of the IRI caches.
+        cache_clears: Number of times the IRI caches were cleared to stay within the cap.
+    """
+
+    validations: int
+    mappings: int
+    validation_seconds: float
+    mapping_seconds: float
+    mappers: list[str]
+    cache_entries: dict[str, int]
+    cache_hits: dict[str, int]
+    cache_misses: dict[str, int]
+    cache_clears: int
+
+
+class MappingSession:
+    """Long-lived session for validating and mapping many submissions in a row.
+
+    The session holds a mapper instance per template, and warms the caches that
+    are otherwise built by the first submission (template schemas and metadata,
+    vocabulary indexes and CRS transformers), so that small submissions do not
+    pay for them. The IRI caches are shared by the whole process, the session
+    clears them when they hold more than `max_cache_entries` in total.
+
+    A session can be shared by threads mapping submissions concurrently. CRS
+    transformers are cached per thread, so they are warmed for the thread that
+    creates the session, and for each other thread on its first submission.
+    """
+
+    def __init__(
+        self,
+        *,
+        template_ids: Iterable[str] | None = None,
+        max_cache_entries: int | None = None,
+    ) -> None:
+        """Mapping Session constructor.
+
+        Args:
+            template_ids: Templates to warm the caches for, defaults to all
+                the registered templates.
+            max_cache_entries: Optional maximum total number of entries in the
+                IRI caches, checked after each submission. Defaults to no cap
+                beyond the size of each cache (the IRI_CACHE_SIZE and
+                SLUGIFY_CACHE_SIZE settings).
+
+        Raises:
+            ValueError: If a template is not registered, or the cap is not
+                greater than zero.
+        """
+        if max_cache_entries is not None and max_cache_entries <= 0:
+            raise ValueError("max_cache_entries must be greater than zero")
+        self.max_cache_entries = max_cache_entries
+        self._mappers: dict[str, base_mapper.ABISMapper] = {}
+        # Lock for the mappers and statistics, when used from several threads
+        self._lock = threading.RLock()
+        self._validations = 0
+        self._mappings = 0
+        self._validation_seconds = 0.0
+        self._mapping_seconds = 0.0
+        self._cache_clears = 0
+        # Threads whose caches have been warmed
+        self._warmed = threading.local()
+
+        # Warm the caches
+        for template_id in base_mapper.registered_ids() if template_ids is None else template_ids:
+            self.mapper(template_id)
+        for vocab in utils.vocabs.registered_vocabs():
+            vocab.index()
+        self._warm_thread()
+
+    def mapper(self, template_id: str) -> base_mapper.ABISMapper:
+        """Gets the session's mapper for a template, creating it if required.
+
+        Args:
+            template_id: ID of the template.
+
+        Returns:
+            The mapper instance.
+
+        Raises:
+            ValueError: If the template is not registered.
+        """
+        if (mapper := self._mappers.get(template_id)) is not None:
+            return mapper
+
+        with self._lock:
+            # Check again, another thread may have created it
+            if (mapper := self._mappers.get(template_id)) is not None:
+                return mapper
+
+            # Create the mapper, and warm its cached metadata and schemas
+            mapper_class = base_mapper.get_mapper(template_id)
+            if mapper_class is None:
+                raise ValueError(f"Template {template_id} not found")
+            mapper_class.template()
+            mapper_class.fields()
+            mapper_class.regular_fields_schema()
+            mapper = self._mappers[template_id] = mapper_class()
+            return mapper
+
+    def validate(
+        self,
+        template_id: str,
+        data: base_types.ReadableType,
+        **kwargs: Any,
+    ) -> frictionless.Report:
+        """Validates a submission.
+
+        Args:
+            template_id: ID of the template.
+            data: Raw data to be validated.
+            **kwargs: Additional keyword arguments for `apply_validation()`.
+
+        Returns:
+            Validation report for the data.
+        """
+        self._warm_thread()
+        start = time.perf_counter()
+        try:
+            return self.mapper(template_id).apply_validation(data, **kwargs)
+        finally:
+            with self._lock:
+                self._validations += 1
+                self._validation_seconds += time.perf_counter() - start
+                self._cap_caches()
+
+    def map(
+        self,
+        template_id: str,
+        *,
+        data: base_types.ReadableType,
+        chunk_size: int | None,
+        dataset_iri: rdflib.URIRef,
+        base_iri: rdflib.Namespace,
+        submission_iri: rdflib.URIRef | None,
+        project_iri: rdflib.URIRef | None,
+        submitted_on_date: datetime.date,
+        **kwargs: Any,
+    ) -> Iterator[rdflib.Graph]:
+        """Maps a submission.
+
+        Args:
+            template_id: ID of the template.
+            data: Readable raw data.
+            chunk_size: Maximum number of rows per chunk. None for no row limit.
+            dataset_iri: IRI of the Dataset this raw data is part of.
+            base_iri: Namespace to use when generating new IRIs as part of this mapping.
+            submission_iri: Optional submission IRI
+            project_iri: The abis:Project IRI if there is one.
+            submitted_on_date: The date the data was submitted.
+            **kwargs: Additional keyword arguments for `apply_mapping()`.
+
+        Yields:
+            rdflib.Graph: ABIS Conformant RDF Sub-Graph from Raw Data Chunk.
+        """
+        # Mapping starts when the first chunk is requested, in the consumer's thread
+        self._warm_thread()
+        chunks = self.mapper(template_id).apply_mapping(
+            data=data,
+            chunk_size=chunk_size,
+            dataset_iri=dataset_iri,
+            base_iri=base_iri,
+            submission_iri=submission_iri,
+            project_iri=project_iri,
+            submitted_on_date=submitted_on_date,
+            **kwargs,
+        )
+        yield from self._timed(chunks)
+
+    def stats(self) -> SessionStats:
+        """Reports the statistics of the session.
+
+        Returns:
+            Statistics of the session.
+        """
+        cache_info = {name: cache.cache_info() for name, cache in utils.iri_patterns.IRI_CACHES.items()}
+        with self._lock:
+            return SessionStats(
+                validations=self._validations,
+                mappings=self._mappings,
+                validation_seconds=self._validation_seconds,
+                mapping_seconds=self._mapping_seconds,
+                mappers=sorted(self._mappers),
+                cache_entries={name: info.currsize for name, info in cache_info.items()},
+                cache_hits={name: info.hits for name, info in cache_info.items()},
+                cache_misses={name: info.misses for name, info in cache_info.items()},
+                cache_clears=self._cache_clears,
+            )
+
+    def clear_caches(self) -> None:
+        """Clears the IRI caches."""
+        with self._lock:
+            for cache in utils.iri_patterns.IRI_CACHES.values():
+                cache.cache_clear()
+            self._cache_clears += 1
+
+    def _warm_thread(self) -> None:
+        """Warms the caches held per thread (CRS transformers), once for each thread."""
+        if getattr(self._warmed, "warm", False):
+            return
+        for term in utils.vocabs.get_vocab("GEODETIC_DATUM").terms:
+            for label in term.labels:
+                models.spatial.Geometry(raw=models.spatial.LatLong(0, 0), datum=label)
+        self._warmed.warm = True
+
+    def _timed(self, chunks: Iterator[rdflib.Graph]) -> Iterator[rdflib.Graph]:
+        """Times mapping a submission, excluding the time the consumer holds each chunk.
+
+        Args:
+            chunks: The chunks from `apply_mapping()`.
+
+        Yields:
+            rdflib.Graph: Each chunk.
+        """
+        next_chunk: Callable[[], rdflib.Graph] = chunks.__next__
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    chunk = next_chunk()
+                except StopIteration:
+                    return
+                finally:
+                    with self._lock:
+                        self._mapping_seconds += time.perf_counter() - start
+                yield chunk
+                # Release the chunk before the next one is mapped
+                del chunk
+        finally:
+            with self._lock:
+                self._mappings += 1
+                self._cap_caches()
+
+    def _cap_caches(self) -> None:
+        """Clears the IRI caches if they hold more than the maximum total number of entries."""
+        if self.max_cache_entries is None:
+            return
+        if (
+            sum(cache.cache_info().currsize for cache in utils.iri_patterns.IRI_CACHES.values())
+            > self.max_cache_entries
+        ):
+            self.clear_caches()
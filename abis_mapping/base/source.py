@@ -0,0 +1,280 @@
+"""Provides a shared input buffer, read zero-copy by each pass over template data"""
+
+# Standard
+import array
+import io
+import mmap
+import os
+import re
+
+# Third-Party
+import frictionless
+
+# Typing
+from collections.abc import Callable, Iterator
+from typing import Any, BinaryIO, Final, TypeVar
+
+
+# Constants
+# frictionless scheme of the resources of source handles
+SCHEME: Final[str] = "source-handle"
+# A CSV row: unquoted text and quoted values (which can hold line breaks), up to a line break
+CSV_ROW: Final[re.Pattern[bytes]] = re.compile(rb'[^"\n]*(?:"[^"]*"[^"\n]*)*\n')
+
+# Type of cached state
+T = TypeVar("T")
+
+
+class SourceHandle:
+    """Template data in one buffer, shared by the passes over the data.
+
+    Validation, extracting the keys used by other templates and mapping each
+    read the data in a separate pass, and frictionless copies raw bytes data
+    for each pass. Instead, a handle gives each pass a zero-copy view of one
+    buffer, which is the bytes object or a memory map of a file. State decoded
+    from the data (e.g. its field names and row offsets) is cached, so it is
+    only decoded once for all the passes.
+
+    The handle can be closed (or used as a context manager) to unmap the
+    file, once all the passes are finished.
+    """
+
+    def __init__(self, data: bytes | mmap.mmap) -> None:
+        """SourceHandle constructor.
+
+        Args:
+            data: Raw CSV data, or a memory map of it, which is not copied.
+        """
+        self._buffer: bytes | mmap.mmap = data
+        self._view = memoryview(data)
+        self._cache: dict[str, Any] = {}
+
+    @classmethod
+    def from_path(cls, path: str | os.PathLike[str]) -> "SourceHandle":
+        """Creates a handle of a file, memory mapped rather than read.
+
+        Args:
+            path: Path of the file.
+
+        Returns:
+            The handle.
+        """
+        with open(path, "rb") as file:
+            # Empty files can not be mapped
+            if os.fstat(file.fileno()).st_size == 0:
+                return cls(b"")
+            return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __enter__(self) -> "SourceHandle":
+        """Enters the context of the handle.
+
+        Returns:
+            The handle.
+        """
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Closes the handle at the end of its context.
+
+        Args:
+            *args: Exception details, if any.
+        """
+        self.close()
+
+    def __len__(self) -> int:
+        """Size of the data, in bytes."""
+        return len(self._view)
+
+    @property
+    def buffer(self) -> memoryview:
+        """Zero-copy, read only view of the data."""
+        return self._view.toreadonly()
+
+    def close(self) -> None:
+        """Releases the buffer, unmapping a memory mapped file.
+
+        Raises:
+            BufferError: If a memory mapped file has a pass still open.
+        """
+        self._view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def open(self) -> BinaryIO:
+        """Opens a pass over the data.
+
+        Returns:
+            Binary file object, reading zero-copy from the buffer.
+        """
+        return io.BufferedReader(_BufferReader(self._view))
+
+    def cached(self, key: str, decode: Callable[[], T]) -> T:
+        """Gets state decoded from the data, decoding it only once.
+
+        Args:
+            key: Name of the state.
+            decode: Function to decode the state, called the first time.
+
+        Returns:
+            The state.
+        """
+        if key not in self._cache:
+            self._cache[key] = decode()
+        return self._cache[key]  # type: ignore[no-any-return]
+
+    def row_offsets(self) -> array.array:  # type: ignore[type-arg]
+        """Gets the byte offset of the start of each CSV row, indexing the data.
+
+        The header is the first row, and the size of the data is appended.
+        Line breaks within quoted values do not start rows. The index is
+        built by a scan of the data, and cached.
+
+        Returns:
+            The offsets, 8 bytes each.
+        """
+        return self.cached("row_offsets", self._index_rows)
+
+    def fragments(self, rows: int) -> Iterator[bytes]:
+        """Splits the data into fragments of rows, each with the header row.
+
+        Args:
+            rows: Number of rows per fragment.
+
+        Yields:
+            CSV data of each fragment, e.g. to map in worker processes.
+        """
+        offsets = self.row_offsets()
+        if len(offsets) < 3:
+            return
+        header = self._view[: offsets[1]]
+        for start in range(1, len(offsets) - 1, rows):
+            end = min(start + rows, len(offsets) - 1)
+            yield b"".join([header, self._view[offsets[start] : offsets[end]]])
+
+    def _index_rows(self) -> array.array:  # type: ignore[type-arg]
+        """Scans the data for the offset of the start of each row.
+
+        Returns:
+            The offsets, with the size of the data appended.
+        """
+        offsets = array.array("q")
+        size = len(self._view)
+        position = 0
+        while position < size:
+            offsets.append(position)
+            match = CSV_ROW.match(self._buffer, position)
+            # The last row has no line break, or an unterminated quoted value
+            position = match.end() if match is not None else size
+        offsets.append(size)
+        return offsets
+
+
+class _BufferReader(io.RawIOBase):
+    """Raw binary reader of a buffer, copying only what is read."""
+
+    def __init__(self, view: memoryview) -> None:
+        """_BufferReader constructor.
+
+        Args:
+            view: The buffer.
+        """
+        super().__init__()
+        self._view = view[:]
+        self._position = 0
+
+    def readable(self) -> bool:
+        """Whether the reader can be read from, which it can."""
+        return True
+
+    def seekable(self) -> bool:
+        """Whether the reader can seek, which it can."""
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """Reads into a buffer.
+
+        Args:
+            buffer: Writable buffer to read into.
+
+        Returns:
+            Number of bytes read, 0 at the end of the data.
+        """
+        size = min(len(buffer), len(self._view) - self._position)
+        buffer[:size] = self._view[self._position : self._position + size]
+        self._position += size
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Moves to a position in the buffer.
+
+        Args:
+            offset: Offset to move by.
+            whence: What the offset is relative to, the start, current position or end.
+
+        Returns:
+            The new position.
+        """
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._position, io.SEEK_END: len(self._view)}[whence]
+        self._position = max(base + offset, 0)
+        return self._position
+
+    def tell(self) -> int:
+        """Gets the position in the buffer.
+
+        Returns:
+            The position.
+        """
+        return self._position
+
+    def close(self) -> None:
+        """Closes the reader, releasing its view of the buffer."""
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+
+class SourceHandleLoader(frictionless.Loader):
+    """frictionless loader of the data of a source handle."""
+
+    def read_byte_stream_create(self) -> BinaryIO:
+        """Opens a pass over the data.
+
+        Returns:
+            Binary file object, reading zero-copy from the handle's buffer.
+        """
+        # The loader is only created for resources of source handles
+        handle: SourceHandle = self.resource.data  # type: ignore[assignment]
+        return handle.open()
+
+
+class SourceHandlePlugin(frictionless.Plugin):
+    """frictionless plugin for resources of source handles."""
+
+    def create_loader(self, resource: frictionless.Resource) -> frictionless.Loader | None:
+        """Creates the loader of the resource of a source handle.
+
+        Args:
+            resource: The resource.
+
+        Returns:
+            The loader, None for other resources.
+        """
+        if resource.scheme == SCHEME:
+            return SourceHandleLoader(resource)
+        return None
+
+    def detect_resource(self, resource: frictionless.Resource) -> None:
+        """Detects the scheme of the resource of a source handle.
+
+        Args:
+            resource: The resource.
+        """
+        if isinstance(resource.data, SourceHandle):
+            resource.scheme = SCHEME
+
+
+# Register Plugin
+frictionless.system.register(
+    name=SCHEME,
+    plugin=SourceHandlePlugin(),
+)
@@ -0,0 +1,243 @@
+"""Provides single-pass input of template data from streams that can only be read once"""
+
+# Standard
+import dataclasses
+import io
+
+# Third-Party
+import frictionless
+
+# Local
+from . import source as base_source
+
+# Typing
+from collections.abc import Callable, Hashable
+from typing import IO, Any, BinaryIO, Final, TypeVar
+
+
+# Constants
+# frictionless scheme of the resources of stream sources
+SCHEME: Final[str] = "stream-source"
+# Number of bytes read ahead from the start of a stream, which can be read again.
+# frictionless reads a buffer from the start of the data to detect its encoding and
+# dialect and then seeks back, so this must be more than its buffer size (plus the
+# read ahead of a buffered reader).
+PREFIX_SIZE: Final[int] = 64 * 1024
+
+# Type of cached state
+T = TypeVar("T")
+
+# Function to extract a key and value from a row, e.g. `SurveySiteMapper.site_identifier_key()`,
+# or None to skip the row
+KeyExtractor = Callable[[frictionless.Row], tuple[Hashable, Any] | None]
+
+
+class StreamSource:
+    """Template data from a binary stream which can only be read once.
+
+    A stream source can be passed as the data to validate or map, e.g. the
+    body of a chunked HTTP upload, which does not need to be seekable and is
+    never buffered in full. Only its first bytes are read ahead, to infer its
+    fields from the header row. Since it can only be read once, it is either
+    validated or mapped, or passed to `ABISMapper.apply_single_pass()` to
+    validate, extract the keys used by other templates and map in one pass.
+
+    Attributes:
+        header: The header row, as raw bytes.
+    """
+
+    def __init__(self, stream: IO[bytes] | io.RawIOBase) -> None:
+        """StreamSource constructor.
+
+        Reads ahead the first bytes of the stream, up to the end of the header
+        row if that is further.
+
+        Args:
+            stream: Binary stream of raw CSV data, which need not be seekable, left open.
+        """
+        self._stream = stream
+        self._prefix = b""
+        # Streams can return less than asked for, so read until enough is read ahead
+        # and the header row is complete, or the end of the stream
+        while (len(self._prefix) < PREFIX_SIZE or base_source.CSV_ROW.match(self._prefix) is None) and (
+            more := stream.read(PREFIX_SIZE)
+        ):
+            self._prefix += more
+        match = base_source.CSV_ROW.match(self._prefix)
+        self.header = self._prefix[: match.end()] if match is not None else self._prefix
+        self._opened = False
+        self._cache: dict[str, Any] = {}
+
+    @property
+    def head(self) -> bytes:
+        """The complete rows read ahead, including the header row, as raw bytes."""
+        position = 0
+        while (match := base_source.CSV_ROW.match(self._prefix, position)) is not None:
+            position = match.end()
+        return self._prefix[:position] if position else self.header
+
+    def open(self) -> BinaryIO:
+        """Opens the one pass over the data.
+
+        Returns:
+            Binary file object, reading the stream.
+
+        Raises:
+            RuntimeError: If the stream has already been opened.
+        """
+        if self._opened:
+            raise RuntimeError("The stream has already been read, a StreamSource can only be read once")
+        self._opened = True
+        return io.BufferedReader(_PrefixReader(self._prefix, self._stream))
+
+    def cached(self, key: str, decode: Callable[[], T]) -> T:
+        """Gets state decoded from the header, decoding it only once.
+
+        Args:
+            key: Name of the state.
+            decode: Function to decode the state, called the first time.
+
+        Returns:
+            The state.
+        """
+        if key not in self._cache:
+            self._cache[key] = decode()
+        return self._cache[key]  # type: ignore[no-any-return]
+
+
+class _PrefixReader(io.RawIOBase):
+    """Raw binary reader of a stream, which can seek back within the bytes read ahead."""
+
+    def __init__(self, prefix: bytes, stream: IO[bytes] | io.RawIOBase) -> None:
+        """_PrefixReader constructor.
+
+        Args:
+            prefix: Bytes already read from the start of the stream.
+            stream: The rest of the stream.
+        """
+        super().__init__()
+        self._prefix = prefix
+        self._stream = stream
+        self._position = 0
+
+    def readable(self) -> bool:
+        """Whether the reader can be read from, which it can."""
+        return True
+
+    def seekable(self) -> bool:
+        """Whether the reader can seek, which it can within the bytes read ahead."""
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """Reads into a buffer, from the bytes read ahead and then from the stream.
+
+        Args:
+            buffer: Writable buffer to read into.
+
+        Returns:
+            Number of bytes read, 0 at the end of the stream.
+        """
+        if self._position < len(self._prefix):
+            size = min(len(buffer), len(self._prefix) - self._position)
+            buffer[:size] = self._prefix[self._position : self._position + size]
+        else:
+            data = self._stream.read(len(buffer)) or b""
+            size = len(data)
+            buffer[:size] = data
+        self._position += size
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Moves to a position, within the bytes read ahead.
+
+        Args:
+            offset: Offset to move by.
+            whence: What the offset is relative to, the start or current position.
+
+        Returns:
+            The new position.
+
+        Raises:
+            io.UnsupportedOperation: If the position can not be read again.
+        """
+        if whence not in (io.SEEK_SET, io.SEEK_CUR):
+            raise io.UnsupportedOperation("The end of a stream can not be sought")
+        position = offset if whence == io.SEEK_SET else self._position + offset
+        if position != self._position and max(position, self._position) > len(self._prefix):
+            raise io.UnsupportedOperation("A stream can only be read once, beyond its first bytes")
+        self._position = max(position, 0)
+        return self._position
+
+    def tell(self) -> int:
+        """Gets the position in the stream.
+
+        Returns:
+            The position.
+        """
+        return self._position
+
+
+@dataclasses.dataclass
+class SinglePassResult:
+    """Result of `ABISMapper.apply_single_pass()`, complete once all its chunks are consumed.
+
+    Attributes:
+        report: Validation report, None until the pass is complete.
+        keys: Keys and values extracted for other templates, by the name of their extractor.
+        rows: Number of rows read.
+        mapped_rows: Number of rows mapped. Mapping stops at the first error,
+            since the mapped chunks are then to be discarded, while the rest of
+            the rows are still validated and their keys extracted.
+    """
+
+    report: frictionless.Report | None = None
+    keys: dict[str, dict[Any, Any]] = dataclasses.field(default_factory=dict)
+    rows: int = 0
+    mapped_rows: int = 0
+
+
+class StreamSourceLoader(frictionless.Loader):
+    """frictionless loader of the data of a stream source."""
+
+    def read_byte_stream_create(self) -> BinaryIO:
+        """Opens the one pass over the data.
+
+        Returns:
+            Binary file object, reading the stream.
+        """
+        # The loader is only created for resources of stream sources
+        source: StreamSource = self.resource.data  # type: ignore[assignment]
+        return source.open()
+
+
+class StreamSourcePlugin(frictionless.Plugin):
+    """frictionless plugin for resources of stream sources."""
+
+    def create_loader(self, resource: frictionless.Resource) -> frictionless.Loader | None:
+        """Creates the loader of the resource of a stream source.
+
+        Args:
+            resource: The resource.
+
+        Returns:
+            The loader, None for other resources.
+        """
+        if resource.scheme == SCHEME:
+            return StreamSourceLoader(resource)
+        return None
+
+    def detect_resource(self, resource: frictionless.Resource) -> None:
+        """Detects the scheme of the resource of a stream source.
+
+        Args:
+            resource: The resource.
+        """
+        if isinstance(resource.data, StreamSource):
+            resource.scheme = SCHEME
+
+
+# Register Plugin
+frictionless.system.register(
+    name=SCHEME,
+    plugin=StreamSourcePlugin(),
+)
@@ -0,0 +1,234 @@
+"""Provides timing of the checks and field parsers of validation"""
+
+# Standard
+import collections
+import contextlib
+import dataclasses
+import time
+
+# Third-Party
+import frictionless
+
+# Typing
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, Literal
+
+
+@dataclasses.dataclass(frozen=True)
+class TimingStats:
+    """Timing statistics of a check or field parser.
+
+    Attributes:
+        name: Name of the check (its type, with its fields if any), or of the field.
+        kind: Whether a check's `validate_row()` or a field's cell parser was timed.
+        calls: Number of calls, i.e. rows for checks and cells for field parsers.
+        total_seconds: Cumulative time of the calls.
+        p99_seconds: 99th percentile time of a call, accurate to about 12%.
+    """
+
+    name: str
+    kind: Literal["check", "field"]
+    calls: int
+    total_seconds: float
+    p99_seconds: float
+
+
+class _Histogram:
+    """Histogram of durations, in buckets of about 12% width.
+
+    A histogram rather than the durations is kept, so that memory use does not
+    grow with the number of rows.
+    """
+
+    def __init__(self) -> None:
+        """Histogram constructor."""
+        self.calls = 0
+        self.total_ns = 0
+        self.buckets: collections.Counter[int] = collections.Counter()
+
+    def add(self, ns: int) -> None:
+        """Adds a duration.
+
+        Args:
+            ns: Duration in nanoseconds.
+        """
+        self.calls += 1
+        self.total_ns += ns
+        # Bucket by the position of the highest bit, and the next 3 bits
+        bits = ns.bit_length()
+        self.buckets[(bits << 3) | ((ns >> max(bits - 4, 0)) & 7)] += 1
+
+    def percentile_ns(self, percentile: float) -> int:
+        """Calculates a percentile of the durations.
+
+        Args:
+            percentile: Percentile to calculate, between 0 and 100.
+
+        Returns:
+            The upper bound of the bucket holding the percentile.
+        """
+        rank = self.calls * percentile / 100
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                bits, fraction = bucket >> 3, bucket & 7
+                if bits < 4:
+                    return fraction + 1
+                return ((8 | fraction) + 1) << (bits - 4)
+        return 0
+
+
+class ValidationTimer:
+    """Times the checks and field parsers of validations.
+
+    The `validate_row()` of every check in the checklist, and the cell parser
+    of every field in the schema, are timed while instrumented. frictionless
+    parses all of a row's cells in its baseline check, which is run before the
+    other checks, so the times of the checks do not include the parsing.
+    Timings accumulate across the validations instrumented.
+    """
+
+    def __init__(self) -> None:
+        """ValidationTimer constructor."""
+        self._histograms: dict[tuple[str, str], _Histogram] = {}
+
+    @contextlib.contextmanager
+    def instrument(
+        self,
+        resource: frictionless.Resource,
+        checklist: frictionless.Checklist,
+    ) -> Iterator[None]:
+        """Times the checks and field parsers while validating a resource.
+
+        Args:
+            resource: Resource to be validated.
+            checklist: Checks to be validated with.
+
+        Yields:
+            None, the checks and fields are restored afterwards.
+        """
+        # Wrap the methods of the checks and fields
+        wrappers: list[tuple[Any, str, Callable[..., Any]]] = []
+        names: collections.Counter[str] = collections.Counter()
+        for check in checklist.checks:
+            name = _check_name(check)
+            names[name] += 1
+            if names[name] > 1:
+                name = f"{name}#{names[name]}"
+            wrappers.append(
+                (check, "validate_row", self._timed_check(check.validate_row, self._histogram(name, "check")))
+            )
+        for field in resource.schema.fields:
+            wrappers.append(
+                (
+                    field,
+                    "create_cell_reader",
+                    self._timed_field(field.create_cell_reader, self._histogram(field.name, "field")),
+                )
+            )
+
+        # Set the wrappers as instance attributes while instrumented
+        for obj, attribute, wrapper in wrappers:
+            setattr(obj, attribute, wrapper)
+        try:
+            yield
+        finally:
+            for obj, attribute, _ in wrappers:
+                delattr(obj, attribute)
+
+    def stats(self) -> list[TimingStats]:
+        """Gets the timing statistics, slowest first.
+
+        Returns:
+            Statistics of each check and field parser.
+        """
+        stats = [
+            TimingStats(
+                name=name,
+                kind=kind,  # type: ignore[arg-type]
+                calls=histogram.calls,
+                total_seconds=histogram.total_ns / 1e9,
+                p99_seconds=histogram.percentile_ns(99) / 1e9,
+            )
+            for (name, kind), histogram in self._histograms.items()
+        ]
+        return sorted(stats, key=lambda stat: stat.total_seconds, reverse=True)
+
+    def _histogram(self, name: str, kind: str) -> _Histogram:
+        """Gets the histogram of a check or field parser.
+
+        Args:
+            name: Name of the check or field.
+            kind: "check" or "field".
+
+        Returns:
+            The histogram, created if needed.
+        """
+        return self._histograms.setdefault((name, kind), _Histogram())
+
+    @staticmethod
+    def _timed_check(
+        validate_row: Callable[[frictionless.Row], Iterable[frictionless.Error]],
+        histogram: _Histogram,
+    ) -> Callable[[frictionless.Row], Iterator[frictionless.Error]]:
+        """Wraps a check's `validate_row()` to time it.
+
+        Args:
+            validate_row: The check's method.
+            histogram: Histogram to add the times to.
+
+        Returns:
+            The wrapped method.
+        """
+
+        def timed(row: frictionless.Row) -> Iterator[frictionless.Error]:
+            # Errors are generated lazily, so are collected while timing
+            start = time.perf_counter_ns()
+            errors = list(validate_row(row))
+            histogram.add(time.perf_counter_ns() - start)
+            return iter(errors)
+
+        return timed
+
+    @staticmethod
+    def _timed_field(
+        create_cell_reader: Callable[[], Callable[[Any], Any]],
+        histogram: _Histogram,
+    ) -> Callable[[], Callable[[Any], Any]]:
+        """Wraps a field's `create_cell_reader()` to time the cell reader created.
+
+        Args:
+            create_cell_reader: The field's method.
+            histogram: Histogram to add the times to.
+
+        Returns:
+            The wrapped method.
+        """
+
+        def create_timed_cell_reader() -> Callable[[Any], Any]:
+            cell_reader = create_cell_reader()
+
+            def timed(cell: Any) -> Any:
+                start = time.perf_counter_ns()
+                result = cell_reader(cell)
+                histogram.add(time.perf_counter_ns() - start)
+                return result
+
+            return timed
+
+        return create_timed_cell_reader
+
+
+def _check_name(check: frictionless.Check) -> str:
+    """Names a check by its type, and its fields if any.
+
+    Args:
+        check: Check to name.
+
+    Returns:
+        The name, e.g. "mutually-inclusive(threatStatus,conservationAuthority)".
+    """
+    fields = getattr(check, "field_names", None) or [getattr(check, "field_name", None)]
+    fields = [field for field in fields if isinstance(field, str)]
+    return f"{check.type}({','.join(fields)})" if fields else check.type
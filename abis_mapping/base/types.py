@@ -2,7 +2,12 @@
 
 # Typing
 from os import PathLike
-from typing import IO, Union
+from typing import IO, TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from .arrow import ArrowSource
+    from .source import SourceHandle
+    from .stream import StreamSource
 
 
 # Define Readable Filepath and IO Type
@@ -12,4 +17,7 @@ ReadableType = Union[
     Union[str, PathLike[str]],
     IO[bytes],
     IO[str],
+    "ArrowSource",
+    "SourceHandle",
+    "StreamSource",
 ]
@@ -0,0 +1,198 @@
+"""Provides streaming of validation errors and rows, as each row is checked"""
+
+# Standard
+import dataclasses
+import json
+import time
+
+# Third-Party
+import frictionless
+
+# Typing
+from collections.abc import Callable, Iterator
+from typing import Self
+
+
+@dataclasses.dataclass(frozen=True)
+class ValidationIssue:
+    """A validation error, in a form that can be written as a JSON line.
+
+    Attributes:
+        template_id: ID of the template being validated.
+        type: Type of the error, i.e. the frictionless error or check type.
+        message: Full message of the error.
+        note: Note of the error, the message without the row and field context.
+        row_number: Row number of the error, if applicable. The header is row 1.
+        field_name: Field of the error, if applicable.
+    """
+
+    template_id: str
+    type: str
+    message: str
+    note: str
+    row_number: int | None = None
+    field_name: str | None = None
+
+    @classmethod
+    def from_error(cls, template_id: str, error: frictionless.Error) -> Self:
+        """Creates an issue from a frictionless error.
+
+        Args:
+            template_id: ID of the template being validated.
+            error: The frictionless error.
+
+        Returns:
+            The issue.
+        """
+        return cls(
+            template_id=template_id,
+            type=error.type,
+            message=error.message,
+            note=error.note,
+            row_number=getattr(error, "row_number", None),
+            field_name=getattr(error, "field_name", None),
+        )
+
+    def to_json(self) -> str:
+        """Serializes the issue as a single line of JSON.
+
+        Returns:
+            The JSON object.
+        """
+        return json.dumps(dataclasses.asdict(self), ensure_ascii=False)
+
+
+def validate_streaming(
+    resource: frictionless.Resource,
+    checklist: frictionless.Checklist,
+    on_error: Callable[[frictionless.Error], None],
+) -> frictionless.Report:
+    """Validates a resource, passing each error to a callback as soon as it is found.
+
+    This follows `frictionless.Resource.validate()`, except that errors are
+    not collected. So memory use does not grow with the number of errors, and
+    there is no limit on the number of errors.
+
+    Args:
+        resource: Resource to validate.
+        checklist: Checks to validate with.
+        on_error: Callback for each error.
+
+    Returns:
+        Validation report, holding only the first error if any, so that
+            `report.valid` is still correct.
+    """
+    start = time.perf_counter()
+    labels: list[str] = []
+    first_errors: list[frictionless.Error] = []
+
+    def emit(error: frictionless.Error) -> None:
+        on_error(error)
+        if not first_errors:
+            first_errors.append(error)
+
+    # Validate all the rows
+    for _row in validate_rows(resource, checklist, emit, labels=labels):
+        pass
+
+    # Return report
+    return create_report(resource, start=start, labels=labels, errors=first_errors)
+
+
+def validate_rows(
+    resource: frictionless.Resource,
+    checklist: frictionless.Checklist,
+    on_error: Callable[[frictionless.Error], None],
+    *,
+    labels: list[str] | None = None,
+) -> Iterator[frictionless.Row]:
+    """Validates a resource, yielding each row once it has been checked.
+
+    Errors are passed to the callback as they are found, as for
+    `validate_streaming()`. Each row is yielded after its errors, so that
+    other work with the rows (e.g. mapping them) can be done in the same pass
+    of the data as their validation.
+
+    Args:
+        resource: Resource to validate.
+        checklist: Checks to validate with.
+        on_error: Callback for each error.
+        labels: Optional list to add the labels of the resource to, once it is opened.
+
+    Yields:
+        Each row of the resource.
+    """
+    # Prepare checklist
+    checks = checklist.connect(resource)
+
+    # Validate metadata, and open the resource
+    try:
+        resource.to_descriptor(validate=True)
+        if resource.closed:
+            resource.open()
+    except frictionless.FrictionlessException as exception:
+        resource.close()
+        for error in exception.to_errors():
+            on_error(error)
+        return
+
+    # Validate data
+    with resource:
+        # Validate start, dropping checks that cannot run
+        for check in list(checks):
+            for error in check.validate_start():
+                if error.type == "check-error" and check in checks:
+                    checks.remove(check)
+                if checklist.match(error):
+                    on_error(error)
+
+        # Validate rows
+        if labels is not None:
+            labels.extend(resource.labels)  # type: ignore[attr-defined]
+        row_stream = resource.row_stream  # type: ignore[attr-defined]
+        while True:
+            try:
+                row = next(row_stream)
+            except frictionless.FrictionlessException as exception:
+                on_error(exception.error)
+                continue
+            except StopIteration:
+                break
+            for check in checks:
+                for error in check.validate_row(row):
+                    if checklist.match(error):
+                        on_error(error)
+            yield row
+
+        # Validate end
+        for check in checks:
+            for error in check.validate_end():
+                if checklist.match(error):
+                    on_error(error)
+
+
+def create_report(
+    resource: frictionless.Resource,
+    *,
+    start: float,
+    labels: list[str],
+    errors: list[frictionless.Error],
+) -> frictionless.Report:
+    """Creates the validation report of a resource, validated by `validate_rows()`.
+
+    Args:
+        resource: The validated resource.
+        start: Performance counter at the start of validation.
+        labels: Labels of the resource.
+        errors: Errors to hold in the report.
+
+    Returns:
+        The report.
+    """
+    report: frictionless.Report = frictionless.Report.from_validation_task(
+        resource,
+        time=time.perf_counter() - start,
+        labels=labels,
+        errors=errors,
+    )
+    return report
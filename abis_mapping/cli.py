@@ -0,0 +1,515 @@
+"""Command line interface for validating and mapping template data.
+
+Usage:
+    abis-mapping validate <template_id> [input] [--max-errors N]
+    abis-mapping map <template_id> [input] --dataset-iri IRI --base-iri IRI [-o output] [-f nt|nq|ttl]
+
+Input is read from a CSV, XLSX or Parquet file path, or stdin when omitted or "-". Output is written
+to a file, or stdout when omitted or "-". Mapped output is written chunk by
+chunk, so memory use is bounded by the chunk size rather than the input size.
+With `map --single-pass`, CSV input is validated while it is mapped and read once,
+so stdin is not spooled and output starts before the input has all arrived.
+"""
+
+# Standard
+import argparse
+import collections
+import concurrent.futures
+import contextlib
+import cProfile
+import datetime
+import io
+import itertools
+import pathlib
+import pstats
+import shutil
+import sys
+import tempfile
+
+# Third-Party
+import rdflib
+
+# Local
+import abis_mapping
+
+# Typing
+from collections.abc import Iterator, Sequence
+from typing import IO, Any
+
+
+# Constants
+# Output formats, mapped to the corresponding rdflib serializer
+FORMATS = {
+    "nt": "nt",
+    "nq": "nquads",
+    "ttl": "turtle",
+}
+# Default number of rows per chunk
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Entry point for the `abis-mapping` console script.
+
+    Args:
+        argv: Command line arguments, defaults to sys.argv.
+
+    Returns:
+        Exit status, 0 for success and 1 if the data is invalid.
+    """
+    # Parse supplied command line arguments
+    args = _parser().parse_args(argv)
+
+    # Run the subcommand, profiling if requested
+    if not args.profile:
+        status: int = args.command(args)
+        return status
+    profiler = cProfile.Profile()
+    try:
+        status = profiler.runcall(args.command, args)
+    finally:
+        pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(30)
+    return status
+
+
+def _parser() -> argparse.ArgumentParser:
+    """Constructs the command line argument parser.
+
+    Returns:
+        The argument parser.
+    """
+    parser = argparse.ArgumentParser(prog="abis-mapping", description="Validate and map ABIS template data to RDF.")
+    subparsers = parser.add_subparsers(required=True)
+
+    # Arguments common to all subcommands
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "template_id",
+        choices=sorted(abis_mapping.registered_ids()),
+        metavar="template_id",
+        help="ID of the template, one of: %(choices)s.",
+    )
+    common.add_argument(
+        "input",
+        nargs="?",
+        default="-",
+        help="Path of the CSV, XLSX or Parquet file to read. Default is stdin.",
+    )
+    common.add_argument(
+        "--sheet",
+        default=None,
+        help="Name of the sheet to read from XLSX input. Default is the active sheet.",
+    )
+    common.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the command and print the statistics to stderr.",
+    )
+
+    # Validate subcommand
+    validate = subparsers.add_parser("validate", parents=[common], help="Validate template data.")
+    validate.add_argument(
+        "--max-errors",
+        type=_positive_int,
+        default=None,
+        help="Maximum number of errors to report. Default is all errors.",
+    )
+    validate.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Print each error as a JSON line as soon as it is found.",
+    )
+    validate.add_argument(
+        "--preflight",
+        action="store_true",
+        help="Only quickly check the encoding, header and a sample of the rows.",
+    )
+    validate.add_argument(
+        "--timings",
+        action="store_true",
+        help="Time each check and field parser, and print the statistics to stderr.",
+    )
+    validate.set_defaults(command=validate_command)
+
+    # Map subcommand
+    map_ = subparsers.add_parser("map", parents=[common], help="Map template data to RDF.")
+    map_.add_argument("--dataset-iri", required=True, type=rdflib.URIRef, help="IRI of the Dataset.")
+    map_.add_argument(
+        "--base-iri",
+        required=True,
+        type=rdflib.Namespace,
+        help="Namespace to use when generating new IRIs.",
+    )
+    map_.add_argument("--submission-iri", type=rdflib.URIRef, default=None, help="IRI of the Submission.")
+    map_.add_argument("--project-iri", type=rdflib.URIRef, default=None, help="IRI of the Project.")
+    map_.add_argument(
+        "--submitted-on",
+        type=datetime.date.fromisoformat,
+        default=datetime.date.today(),
+        help="Date the data was submitted, as YYYY-MM-DD. Default is today.",
+    )
+    map_.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="Path of the file to write. Default is stdout.",
+    )
+    map_.add_argument(
+        "-f",
+        "--format",
+        choices=sorted(FORMATS),
+        default=None,
+        help="Output format. Default is inferred from the output file extension, otherwise nt.",
+    )
+    map_.add_argument(
+        "--graph-iri",
+        type=rdflib.URIRef,
+        default=None,
+        help="Named graph to write nq output to. Default is the default graph.",
+    )
+    map_.add_argument(
+        "--chunk-size",
+        type=_positive_int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Number of rows to map per chunk. Default is %(default)s.",
+    )
+    map_.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=1,
+        help="Number of worker processes to map chunks in parallel. Default is %(default)s.",
+    )
+    map_.add_argument(
+        "--serialize-in-background",
+        action="store_true",
+        help="Serialize each chunk in a background process while the next chunk is mapped.",
+    )
+    map_.add_argument(
+        "--single-pass",
+        action="store_true",
+        help=(
+            "Validate the CSV input while mapping it, reading it once without spooling stdin. "
+            "Errors are printed to stderr, and the output must be discarded if the data is invalid."
+        ),
+    )
+    map_.set_defaults(command=map_command)
+
+    # Return
+    return parser
+
+
+def validate_command(args: argparse.Namespace) -> int:
+    """Validates the input, printing errors to stdout.
+
+    Args:
+        args: Parsed command line arguments.
+
+    Returns:
+        Exit status, 0 if the data is valid otherwise 1.
+    """
+    mapper = _mapper(args.template_id)
+
+    if args.preflight:
+        # Check a sample of the data
+        with _open_input(args.input, args.sheet) as data:
+            preflight = mapper.preflight(data)
+        issues = preflight.issues[: args.max_errors]
+        for issue in issues:
+            print(issue.to_json() if args.jsonl else f"{issue.type}: {issue.message}")
+        if preflight.valid:
+            print(f"Valid sample: {preflight.head_rows + preflight.sampled_rows} row(s)", file=sys.stderr)
+            return 0
+        print(f"Invalid: {len(preflight.issues)} error(s)", file=sys.stderr)
+        return 1
+
+    if args.jsonl:
+        # Print errors as they are found, only counting those beyond the maximum
+        error_count = 0
+
+        def print_issue(issue: abis_mapping.base.validation.ValidationIssue) -> None:
+            nonlocal error_count
+            error_count += 1
+            if args.max_errors is None or error_count <= args.max_errors:
+                print(issue.to_json(), flush=True)
+
+        with _open_input(args.input, args.sheet) as data:
+            report = mapper.stream_validation(data, on_error=print_issue)
+    else:
+        with _open_input(args.input, args.sheet) as data:
+            report = (
+                mapper.timed_validation(data, on_stats=_print_timings)
+                if args.timings
+                else mapper.apply_validation(data)
+            )
+
+        # Print errors
+        errors = [*report.errors, *(error for task in report.tasks for error in task.errors)]
+        error_count = len(errors)
+        for error in itertools.islice(errors, args.max_errors):
+            print(f"{error.type}: {error.message}")
+
+    # Print summary
+    if report.valid:
+        print("Valid", file=sys.stderr)
+        return 0
+    print(f"Invalid: {error_count} error(s)", file=sys.stderr)
+    return 1
+
+
+def _print_timings(stats: list[abis_mapping.base.timing.TimingStats]) -> None:
+    """Prints validation timing statistics to stderr, slowest first.
+
+    Args:
+        stats: Timing statistics of the checks and field parsers.
+    """
+    print(f"{'total (s)':>10} {'p99 (ms)':>10} {'calls':>10}  name", file=sys.stderr)
+    for stat in stats:
+        print(
+            f"{stat.total_seconds:10.4f} {stat.p99_seconds * 1000:10.4f} {stat.calls:10d}  {stat.kind} {stat.name}",
+            file=sys.stderr,
+        )
+
+
+def map_command(args: argparse.Namespace) -> int:
+    """Maps the input to RDF, writing each chunk to the output as it is mapped.
+
+    Args:
+        args: Parsed command line arguments.
+
+    Returns:
+        Exit status, 0 for success.
+    """
+    # Determine output format
+    output_format = args.format
+    if output_format is None:
+        suffix = pathlib.Path(args.output).suffix.lstrip(".")
+        output_format = suffix if suffix in FORMATS else "nt"
+
+    mapping_kwargs: dict[str, Any] = dict(
+        dataset_iri=args.dataset_iri,
+        base_iri=args.base_iri,
+        submission_iri=args.submission_iri,
+        project_iri=args.project_iri,
+        submitted_on_date=args.submitted_on,
+    )
+
+    if args.single_pass:
+        if args.workers != 1:
+            print("--single-pass maps in one process, it can not be used with --workers", file=sys.stderr)
+            return 2
+        return _map_single_pass(args, output_format, mapping_kwargs)
+
+    with _open_input(args.input, args.sheet) as data, _open_output(args.output) as output:
+        if args.workers == 1:
+            mapper = _mapper(args.template_id)
+            chunks = mapper.apply_mapping(data=data, chunk_size=args.chunk_size, **mapping_kwargs)
+            _write_chunks(chunks, output, output_format, args)
+        else:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=args.workers) as executor:
+                # Bound the fragments in flight, so memory use does not grow with the input
+                in_flight: collections.deque[concurrent.futures.Future[bytes]] = collections.deque()
+                fragments: Iterator[bytes | abis_mapping.base.arrow.ArrowSource] = data.fragments(args.chunk_size)
+                for fragment in fragments:
+                    if len(in_flight) >= 2 * args.workers:
+                        output.write(in_flight.popleft().result())
+                    in_flight.append(
+                        executor.submit(
+                            _map_fragment,
+                            args.template_id,
+                            fragment,
+                            output_format,
+                            args.graph_iri,
+                            mapping_kwargs,
+                        )
+                    )
+                # Write remaining fragments in order
+                while in_flight:
+                    output.write(in_flight.popleft().result())
+
+    # Return
+    return 0
+
+
+def _map_single_pass(args: argparse.Namespace, output_format: str, mapping_kwargs: dict[str, Any]) -> int:
+    """Maps the input while validating it, reading it once, writing each chunk as it is mapped.
+
+    Args:
+        args: Parsed command line arguments.
+        output_format: Output format.
+        mapping_kwargs: Keyword arguments for apply_mapping.
+
+    Returns:
+        Exit status, 0 if the data is valid otherwise 1.
+    """
+    mapper = _mapper(args.template_id)
+    result = abis_mapping.base.stream.SinglePassResult()
+    error_count = 0
+
+    def print_issue(issue: abis_mapping.base.validation.ValidationIssue) -> None:
+        nonlocal error_count
+        error_count += 1
+        print(f"{issue.type}: {issue.message}", file=sys.stderr)
+
+    with contextlib.ExitStack() as stack, _open_output(args.output) as output:
+        stream = sys.stdin.buffer if args.input == "-" else stack.enter_context(open(args.input, "rb"))
+        chunks = mapper.apply_single_pass(
+            data=abis_mapping.base.stream.StreamSource(stream),
+            result=result,
+            on_error=print_issue,
+            chunk_size=args.chunk_size,
+            **mapping_kwargs,
+        )
+        _write_chunks(chunks, output, output_format, args)
+
+    # Print summary
+    if result.report is not None and result.report.valid:
+        print("Valid", file=sys.stderr)
+        return 0
+    print(f"Invalid: {error_count} error(s), the output must be discarded", file=sys.stderr)
+    return 1
+
+
+def _write_chunks(
+    chunks: Iterator[rdflib.Graph],
+    output: IO[bytes],
+    output_format: str,
+    args: argparse.Namespace,
+) -> None:
+    """Serializes each chunk to the output, as it is mapped.
+
+    Args:
+        chunks: The mapped chunks.
+        output: Binary file object to write to.
+        output_format: Output format.
+        args: Parsed command line arguments.
+    """
+    if args.serialize_in_background:
+        for serialized in abis_mapping.utils.serialization.serialize_chunks(
+            chunks,
+            output_format=FORMATS[output_format],
+            graph_iri=args.graph_iri,
+        ):
+            output.write(serialized)
+    else:
+        for chunk in chunks:
+            output.write(abis_mapping.utils.serialization.serialize(chunk, FORMATS[output_format], args.graph_iri))
+            # Release the chunk before the next one is mapped
+            del chunk
+
+
+def _map_fragment(
+    template_id: str,
+    fragment: bytes | abis_mapping.base.arrow.ArrowSource,
+    output_format: str,
+    graph_iri: rdflib.URIRef | None,
+    mapping_kwargs: dict[str, Any],
+) -> bytes:
+    """Maps a fragment of the input in a worker process.
+
+    Args:
+        template_id: ID of the template.
+        fragment: CSV data with the header and a chunk of rows, or Arrow data of a chunk of rows.
+        output_format: Output format.
+        graph_iri: Named graph for nq output.
+        mapping_kwargs: Keyword arguments for apply_mapping.
+
+    Returns:
+        The serialized RDF for the fragment.
+    """
+    mapper = _mapper(template_id)
+    output = io.BytesIO()
+    for chunk in mapper.apply_mapping(data=fragment, chunk_size=None, **mapping_kwargs):
+        output.write(abis_mapping.utils.serialization.serialize(chunk, FORMATS[output_format], graph_iri))
+        del chunk
+    return output.getvalue()
+
+
+def _mapper(template_id: str) -> abis_mapping.base.mapper.ABISMapper:
+    """Gets a mapper instance for the template.
+
+    Args:
+        template_id: ID of the template.
+
+    Returns:
+        Mapper for the template.
+    """
+    mapper = abis_mapping.get_mapper(template_id)
+    if mapper is None:
+        raise ValueError(f"Template {template_id} not found")
+    return mapper()
+
+
+@contextlib.contextmanager
+def _open_input(
+    path: str,
+    sheet: str | None = None,
+) -> Iterator[abis_mapping.base.source.SourceHandle | abis_mapping.base.arrow.ArrowSource]:
+    """Opens the input file, spooling stdin to a temporary file.
+
+    The data is read more than once (to detect the fields, then to map the
+    rows), so stdin is first spooled to disk rather than held in memory. CSV
+    input is memory mapped, and each pass reads the mapped file zero-copy.
+    XLSX input is detected by its signature, and converted to CSV once.
+    Parquet input is detected by its signature, and read with its native types.
+
+    Args:
+        path: Path of the input file, or "-" for stdin.
+        sheet: Name of the sheet to read from XLSX input, defaults to the active sheet.
+
+    Yields:
+        Handle of the CSV input, or the Arrow data of Parquet input.
+    """
+    with contextlib.ExitStack() as stack:
+        if path != "-":
+            f = stack.enter_context(open(path, "rb"))
+        else:
+            # frictionless only reads streams backed by a local file
+            spool = stack.enter_context(tempfile.NamedTemporaryFile(prefix="abis-mapping-", suffix=".csv"))
+            shutil.copyfileobj(sys.stdin.buffer, spool)
+            spool.flush()
+            f = stack.enter_context(open(spool.name, "rb"))
+        if abis_mapping.base.arrow.is_parquet(f):
+            yield abis_mapping.base.arrow.ArrowSource(f)
+        else:
+            csv_file = stack.enter_context(abis_mapping.base.excel.as_csv(f, sheet=sheet))
+            yield stack.enter_context(abis_mapping.base.source.SourceHandle.from_path(csv_file.name))
+
+
+@contextlib.contextmanager
+def _open_output(path: str) -> Iterator[IO[bytes]]:
+    """Opens the output file.
+
+    Args:
+        path: Path of the output file, or "-" for stdout.
+
+    Yields:
+        Binary file object for the output.
+    """
+    if path == "-":
+        yield sys.stdout.buffer
+        sys.stdout.buffer.flush()
+        return
+    with open(path, "wb") as f:
+        yield f
+
+
+def _positive_int(value: str) -> int:
+    """Parses a positive integer command line argument.
+
+    Args:
+        value: Value of the argument.
+
+    Returns:
+        The parsed integer.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive integer.
+    """
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"{value} must be greater than zero")
+    return number
+
+
+if __name__ == "__main__":
+    sys.exit(main())
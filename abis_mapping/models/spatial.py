@@ -4,6 +4,7 @@
 import decimal
 import functools
 import re
+import threading
 
 # Third-party
 import shapely
@@ -23,8 +24,33 @@ from typing import NamedTuple
 
 # Create cached lookup functions for pyproj.CRS and pyproj.Transformer objects,
 # to avoid the cost of repeatedly creating them when mapping.
+# pyproj.CRS objects are thread-safe, so are shared by all threads.
 _CRS_cached = functools.cache(pyproj.CRS)
-_transformer_from_crs_cached = functools.cache(pyproj.Transformer.from_crs)
+# pyproj.Transformer objects are not guaranteed to be thread-safe, so are cached per thread.
+_thread_local = threading.local()
+
+
+def _transformer_from_crs_cached(crs_from: str, crs_to: str) -> pyproj.Transformer:
+    """Gets a cached always_xy pyproj.Transformer, for use by the current thread only.
+
+    Args:
+        crs_from: CRS to transform from.
+        crs_to: CRS to transform to.
+
+    Returns:
+        The transformer.
+    """
+    transformers: dict[tuple[str, str], pyproj.Transformer] | None = getattr(_thread_local, "transformers", None)
+    if transformers is None:
+        transformers = _thread_local.transformers = {}
+    transformer = transformers.get((crs_from, crs_to))
+    if transformer is None:
+        transformer = transformers[crs_from, crs_to] = pyproj.Transformer.from_crs(
+            crs_from=crs_from,
+            crs_to=crs_to,
+            always_xy=True,
+        )
+    return transformer
 
 
 class LatLong(NamedTuple):
@@ -80,11 +106,7 @@ class Geometry:
             self._crs = _CRS_cached(datum)
 
             # Create a default CRS transformer
-            self._transformer = _transformer_from_crs_cached(
-                crs_from=datum,
-                crs_to=settings.SETTINGS.DEFAULT_TARGET_CRS,
-                always_xy=True,
-            )
+            self._transformer = _transformer_from_crs_cached(datum, settings.SETTINGS.DEFAULT_TARGET_CRS)
         except pyproj.ProjError as exc:
             # Reraise as a GeometryError.
             raise GeometryError from exc
@@ -213,10 +235,7 @@ class Geometry:
             rounding_precision=settings.SETTINGS.DEFAULT_WKT_ROUNDING_PRECISION,
         )
 
-        return rdflib.Literal(
-            lexical_or_value=datum_string + wkt_string,
-            datatype=namespaces.GEO.wktLiteral,
-        )
+        return utils.rdf.literal(datum_string + wkt_string, datatype=namespaces.GEO.wktLiteral)
 
     def to_transformed_crs_rdf_literal(self) -> rdflib.Literal:
         """Generates a literal WKT representation converted to another CRS.
@@ -237,10 +256,7 @@ class Geometry:
             geometry=geometry,
             rounding_precision=settings.SETTINGS.DEFAULT_WKT_ROUNDING_PRECISION,
         )
-        return rdflib.Literal(
-            lexical_or_value=datum_string + wkt_string,
-            datatype=namespaces.GEO.wktLiteral,
-        )
+        return utils.rdf.literal(datum_string + wkt_string, datatype=namespaces.GEO.wktLiteral)
 
 
 def _swap_coordinates(original: shapely.Geometry) -> shapely.Geometry:
@@ -11,6 +11,9 @@ import dateutil.parser
 # Third-party
 import rdflib
 
+# Local
+from abis_mapping import utils
+
 # Typing
 from typing import Tuple, Any
 
@@ -52,9 +55,9 @@ class Timestamp(abc.ABC):
         """Converts to rdf literal object.
 
         Returns:
-            rdflib.Literal: The converted literal.
+            rdflib.Literal: The converted literal, interned by its lexical form.
         """
-        return rdflib.Literal(self, datatype=self.rdf_datatype)
+        return utils.rdf.literal(str(self), datatype=self.rdf_datatype)
 
     def __le__(self, other: object) -> bool:
         """Performs less than or equal comparison
@@ -25,13 +25,25 @@ class RelatedSiteValidation(frictionless.Check):
         check that those fields match a siteID and siteIDSource in this template.
 
     Attributes:
-        site_identifiers: All SiteIdentifiers provided in the template.
+        site_identifiers: All SiteIdentifiers provided in the template, or None
+            to collect them from the rows as they are validated, e.g. when the
+            data can only be read once. Related sites not seen yet are then
+            checked at the end, against all the rows. Only the row number and
+            related site of those rows are kept, so the cells of their errors
+            are just the relatedSiteID and relatedSiteIDSource.
     """
 
+    # Check attributes
+    type = "related-site-validation"
     Errors = [frictionless.errors.RowConstraintError]
 
     # SiteIdentifiers from the template being validated.
-    site_identifiers: Collection[models.identifier.SiteIdentifier]
+    site_identifiers: Collection[models.identifier.SiteIdentifier] | None = None
+
+    # Private attributes, when collecting the SiteIdentifiers from the rows.
+    # The SiteIdentifiers seen so far, and the row numbers and related sites not seen yet.
+    _seen_identifiers: set[models.identifier.SiteIdentifier] = attrs.field(factory=set, init=False)
+    _pending_rows: list[tuple[int, models.identifier.SiteIdentifier]] = attrs.field(factory=list, init=False)
 
     def validate_row(self, row: frictionless.Row) -> Iterable[frictionless.Error]:
         """Validate a row.
@@ -42,6 +54,10 @@ class RelatedSiteValidation(frictionless.Check):
         Yields:
             Errors encountered, if any
         """
+        # Collect the row's SiteIdentifier, if not provided
+        if self.site_identifiers is None and (site_identifier := models.identifier.SiteIdentifier.from_row(row)):
+            self._seen_identifiers.add(site_identifier)
+
         related_site_id: str | None = row["relatedSiteID"]
         related_site_id_source: str | None = row["relatedSiteIDSource"]
         related_site_iri: str | None = row["relatedSiteIRI"]
@@ -69,14 +85,16 @@ class RelatedSiteValidation(frictionless.Check):
                 site_id_source=related_site_id_source,
                 existing_bdr_site_iri=None,
             )
-            if related_site_identifier not in self.site_identifiers:
-                yield frictionless.errors.RowConstraintError.from_row(
-                    row=row,
-                    note=(
-                        "relatedSiteID and relatedSiteIDSource must match the siteID "
-                        "and siteIDSource of a site in this template."
-                    ),
+            if self.site_identifiers is None:
+                # The related site can be in a later row, so check it at the end
+                if related_site_identifier not in self._seen_identifiers:
+                    self._pending_rows.append((row.row_number, related_site_identifier))
+            elif related_site_identifier not in self.site_identifiers:
+                yield self._unmatched_related_site_error(
+                    cells=[str(cell) if cell is not None else "" for cell in row.cells],
+                    row_number=row.row_number,
                 )
+
             # Also check the relationship is specified.
             if not relationship_to_related_site:
                 yield frictionless.errors.RowConstraintError.from_row(
@@ -100,3 +118,37 @@ class RelatedSiteValidation(frictionless.Check):
             )
 
         # Else, no fields provided, all valid.
+
+    def validate_end(self) -> Iterable[frictionless.Error]:
+        """Validate the related sites not seen before their rows, against all the rows.
+
+        Yields:
+            Errors encountered, if any
+        """
+        for row_number, related_site_identifier in self._pending_rows:
+            if related_site_identifier not in self._seen_identifiers:
+                yield self._unmatched_related_site_error(
+                    cells=[related_site_identifier.site_id or "", related_site_identifier.site_id_source or ""],
+                    row_number=row_number,
+                )
+
+    @staticmethod
+    def _unmatched_related_site_error(*, cells: list[str], row_number: int) -> frictionless.Error:
+        """Creates the error for a related site that does not match a site in the template.
+
+        Args:
+            cells: Cells of the row, as strings.
+            row_number: Number of the row.
+
+        Returns:
+            The error.
+        """
+        error: frictionless.Error = frictionless.errors.RowConstraintError(
+            cells=cells,
+            row_number=row_number,
+            note=(
+                "relatedSiteID and relatedSiteIDSource must match the siteID "
+                "and siteIDSource of a site in this template."
+            ),
+        )
+        return error
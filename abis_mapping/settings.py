@@ -1,8 +1,14 @@
 """All non-sensitive project-wide configuration parameters"""
 
+# Standard
+import pathlib
+
 # Third-party
 import pydantic_settings
 
+# Typing
+from typing import Literal
+
 
 class _Settings(pydantic_settings.BaseSettings):
     """Model for defining default project-wide settings."""
@@ -24,6 +30,26 @@ class _Settings(pydantic_settings.BaseSettings):
     # The version of the documents to be selected
     INSTRUCTIONS_VERSION: str = "dev"
 
+    # The rdflib store backing the chunk graphs yielded by apply_mapping().
+    # "append" uses the write-once AppendOnlyStore, which uses less memory per triple.
+    CHUNK_GRAPH_STORE: Literal["default", "append"] = "default"
+
+    # Maximum number of entries in each of the caches of quoted and hashed IRI parts.
+    # Long-lived processes mapping many submissions benefit from larger caches.
+    IRI_CACHE_SIZE: int = 128
+
+    # Maximum number of entries in the cache of slugified IRI parts, which are often
+    # high-cardinality values such as names and remarks.
+    SLUGIFY_CACHE_SIZE: int = 8192
+
+    # Maximum number of entries in the cache of interned literals of strings, such as
+    # scientific names, dates and comments repeated across rows.
+    LITERAL_CACHE_SIZE: int = 4096
+
+    # Directory to write a profile of each apply_mapping() to, by add method, IRI pattern and
+    # vocabulary, as a summary and as collapsed stacks for flame graphs. None to not profile.
+    MAPPING_PROFILE_DIR: pathlib.Path | None = None
+
 
 # If changing via environment variable or .env file prefix name with 'ABIS_MAPPING_'
 SETTINGS = _Settings(
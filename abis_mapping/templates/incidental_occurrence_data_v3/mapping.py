@@ -89,6 +89,40 @@ CONCEPT_UNSPECIFIED_METHOD = rdflib.URIRef("http://linked.data.gov.au/def/tern-c
 DATA_ROLE_RESOURCE_PROVIDER = rdflib.URIRef("https://linked.data.gov.au/def/data-roles/resourceProvider")
 DATA_ROLE_OWNER = rdflib.URIRef("https://linked.data.gov.au/def/data-roles/owner")
 
+# Literals
+LITERAL_ACCEPTED_NAME_USAGE_OBSERVATION = rdflib.Literal("acceptedNameUsage-observation")
+LITERAL_ACCEPTED_NAME_USAGE_VALUE = rdflib.Literal("acceptedNameUsage-value")
+LITERAL_CATALOG_NUMBER_DEFINITION = rdflib.Literal("A catalog number for the sample")
+LITERAL_ESTABLISHMENT_MEANS_OBSERVATION = rdflib.Literal("establishmentMeans-observation")
+LITERAL_ESTABLISHMENT_MEANS_VALUE = rdflib.Literal("establishmentMeans-value")
+LITERAL_EVENT_DATE_START_PROXY = rdflib.Literal("Date unknown, template eventDateStart used as proxy")
+LITERAL_FIELD_SAMPLING_LOCATION_PROXY = rdflib.Literal("Location unknown, location of field sampling used as proxy")
+LITERAL_INDIVIDUAL_COUNT = rdflib.Literal("individual-count")
+LITERAL_INDIVIDUAL_COUNT_OBSERVATION = rdflib.Literal("individualCount-observation")
+LITERAL_LIFE_STAGE_OBSERVATION = rdflib.Literal("lifeStage-observation")
+LITERAL_LIFE_STAGE_VALUE = rdflib.Literal("lifeStage-value")
+LITERAL_OCCURRENCE_STATUS_OBSERVATION = rdflib.Literal("occurrenceStatus-observation")
+LITERAL_ORGANISM_QUANTITY = rdflib.Literal("organism-quantity")
+LITERAL_ORGANISM_QUANTITY_OBSERVATION = rdflib.Literal("organismQuantity-observation")
+LITERAL_ORGANISM_REMARKS = rdflib.Literal("organism-remarks")
+LITERAL_ORGANISM_REMARKS_OBSERVATION = rdflib.Literal("organismRemarks-observation")
+LITERAL_RECORD_ID_DEFINITION = rdflib.Literal("An identifier for the record")
+LITERAL_RECORD_NUMBER_DEFINITION = rdflib.Literal(
+    "The record number of the original observation from the original observer of the organism"
+)
+LITERAL_REPRODUCTIVE_CONDITION_OBSERVATION = rdflib.Literal("reproductiveCondition-observation")
+LITERAL_REPRODUCTIVE_CONDITION_VALUE = rdflib.Literal("reproductiveCondition-value")
+LITERAL_SCIENTIFIC_NAME = rdflib.Literal("scientificName")
+LITERAL_SCIENTIFIC_NAME_OBSERVATION = rdflib.Literal("scientificName-observation")
+LITERAL_SEQUENCE_RESULT = rdflib.Literal("sequence-result")
+LITERAL_SEQUENCING_SAMPLING = rdflib.Literal("sequencing-sampling")
+LITERAL_SEX_OBSERVATION = rdflib.Literal("sex-observation")
+LITERAL_SEX_VALUE = rdflib.Literal("sex-value")
+LITERAL_SPECIMEN_SAMPLE = rdflib.Literal("specimen-sample")
+LITERAL_SPECIMEN_SAMPLING = rdflib.Literal("specimen-sampling")
+LITERAL_THREAT_STATUS_OBSERVATION = rdflib.Literal("threatStatus-observation")
+LITERAL_VERBATIM_ID_OBSERVATION = rdflib.Literal("verbatimID-observation")
+
 
 class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
     """ABIS Mapper for `incidental_occurrence_data.csv` - version 3"""
@@ -114,15 +148,11 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         )
 
         # Construct Resource
-        resource = frictionless.Resource(
-            source=data,
-            format="csv",  # TODO -> Hardcoded to csv for now
-            schema=schema,
-            encoding="utf-8",
-        )
+        resource = base.resources.create_resource(data, schema=schema)
 
         # Validate
-        report: frictionless.Report = resource.validate(
+        report: frictionless.Report = self.validate_resource(
+            resource,
             checklist=frictionless.Checklist(
                 checks=[
                     # Extra Custom Checks
@@ -1153,7 +1183,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
 
         # Add to Graph
         graph.add((uri, a, rdflib.PROV.Agent))
-        graph.add((uri, rdflib.SDO.name, rdflib.Literal(row["identifiedBy"])))
+        graph.add((uri, rdflib.SDO.name, utils.rdf.literal(row["identifiedBy"])))
 
     def add_observation_scientific_name(
         self,
@@ -1197,12 +1227,12 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("scientificName-observation")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_SCIENTIFIC_NAME_OBSERVATION))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, provider_record_id_occurrence))
         graph.add((uri, rdflib.SOSA.hasResult, scientific_name))
-        graph.add((uri, rdflib.SOSA.hasSimpleResult, rdflib.Literal(row["scientificName"])))
+        graph.add((uri, rdflib.SOSA.hasSimpleResult, utils.rdf.literal(row["scientificName"])))
         graph.add((uri, rdflib.SOSA.observedProperty, CONCEPT_SCIENTIFIC_NAME))
-        temporal_entity = rdflib.BNode()
+        temporal_entity = utils.bnodes.bnode("temporal_entity")
         graph.add((uri, rdflib.SDO.temporal, temporal_entity))
         graph.add((temporal_entity, a, rdflib.TIME.Instant))
         graph.add((temporal_entity, date_identified.rdf_in_xsd, date_identified.to_rdf_literal()))
@@ -1215,8 +1245,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         # Check for dateIdentified
         if not row["dateIdentified"]:
             # Add comment to temporal entity
-            comment = "Date unknown, template eventDateStart used as proxy"
-            graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+            graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_EVENT_DATE_START_PROXY))
 
     def add_observation_verbatim_id(
         self,
@@ -1271,12 +1300,12 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("verbatimID-observation")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_VERBATIM_ID_OBSERVATION))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, foi))
         graph.add((uri, rdflib.SOSA.hasResult, verbatim_id))
-        graph.add((uri, rdflib.SOSA.hasSimpleResult, rdflib.Literal(row["verbatimIdentification"])))
+        graph.add((uri, rdflib.SOSA.hasSimpleResult, utils.rdf.literal(row["verbatimIdentification"])))
         graph.add((uri, rdflib.SOSA.observedProperty, CONCEPT_TAXON))
-        temporal_entity = rdflib.BNode()
+        temporal_entity = utils.bnodes.bnode("temporal_entity")
         graph.add((uri, rdflib.SDO.temporal, temporal_entity))
         graph.add((temporal_entity, a, rdflib.TIME.Instant))
         graph.add((temporal_entity, date_identified.rdf_in_xsd, date_identified.to_rdf_literal()))
@@ -1289,8 +1318,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         # Check for dateIdentified
         if not row["dateIdentified"]:
             # Add comment to temporal entity
-            comment = "Date unknown, template eventDateStart used as proxy"
-            graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+            graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_EVENT_DATE_START_PROXY))
 
     def add_provider_recorded_by_agent(
         self,
@@ -1313,7 +1341,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((uri, a, rdflib.PROV.Agent))
 
         # Add name
-        graph.add((uri, rdflib.SDO.name, rdflib.Literal(row["recordedBy"])))
+        graph.add((uri, rdflib.SDO.name, utils.rdf.literal(row["recordedBy"])))
 
     def add_record_id_datatype(
         self,
@@ -1334,15 +1362,19 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_record_id_datatype", uri, attribution, value):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.RDFS.Datatype))
 
         # Add label
         if value is not None:
-            graph.add((uri, rdflib.SKOS.prefLabel, rdflib.Literal(f"{value} recordID")))
+            graph.add((uri, rdflib.SKOS.prefLabel, utils.rdf.literal(f"{value} recordID")))
 
         # Add definition
-        graph.add((uri, rdflib.SKOS.definition, rdflib.Literal("An identifier for the record")))
+        graph.add((uri, rdflib.SKOS.definition, LITERAL_RECORD_ID_DEFINITION))
 
         # Add attribution
         if attribution is not None:
@@ -1367,6 +1399,10 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_attribution", uri, provider, provider_role_type):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.PROV.Attribution))
 
@@ -1392,11 +1428,15 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_owner_record_id_provider", uri, row["ownerRecordIDSource"]):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.PROV.Agent))
 
         # Add name
-        graph.add((uri, rdflib.SDO.name, rdflib.Literal(row["ownerRecordIDSource"])))
+        graph.add((uri, rdflib.SDO.name, utils.rdf.literal(row["ownerRecordIDSource"])))
 
     def add_provider_record_id_agent(
         self,
@@ -1411,11 +1451,15 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
             row (frictionless.Row): Raw data.
             graph (rdflib.Graph): Graph to be modified.
         """
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_provider_record_id_agent", uri, row["providerRecordIDSource"]):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.PROV.Agent))
 
         # Add name
-        graph.add((uri, rdflib.SDO.name, rdflib.Literal(row["providerRecordIDSource"])))
+        graph.add((uri, rdflib.SDO.name, utils.rdf.literal(row["providerRecordIDSource"])))
 
     def add_id_qualifier_attribute(
         self,
@@ -1441,6 +1485,10 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_id_qualifier_attribute", uri, id_qualifier, id_qualifier_value):
+            return
+
         # Identification Qualifier Attribute
         graph.add((uri, a, utils.namespaces.TERN.Attribute))
         if submission_iri:
@@ -1449,7 +1497,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
         graph.add((uri, utils.namespaces.TERN.attribute, CONCEPT_IDENTIFICATION_QUALIFIER))
         if id_qualifier:
-            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(id_qualifier)))
+            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(id_qualifier)))
         if id_qualifier_value:
             graph.add((uri, utils.namespaces.TERN.hasValue, id_qualifier_value))
 
@@ -1475,12 +1523,16 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_id_qualifier_value", uri, id_qualifier):
+            return
+
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
 
         if id_qualifier:
             # Add label
-            graph.add((uri, rdflib.RDFS.label, rdflib.Literal(id_qualifier)))
+            graph.add((uri, rdflib.RDFS.label, utils.rdf.literal(id_qualifier)))
 
             # Retrieve vocab for field
             vocab = self.fields()["identificationQualifier"].get_flexible_vocab()
@@ -1513,6 +1565,13 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Add link to the scientific name observation node
+        graph.add((uri, rdflib.SDO.hasPart, observation_scientific_name))
+
+        # The rest of the Collection is shared by every row, so only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_id_qualifier_collection", uri, id_qualifier, id_qualifier_attribute):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.SDO.Collection))
         if submission_iri:
@@ -1524,13 +1583,11 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
                 (
                     uri,
                     rdflib.SDO.name,
-                    rdflib.Literal(f"Occurrence Collection - Identification Qualifier - {id_qualifier}"),
+                    utils.rdf.literal(f"Occurrence Collection - Identification Qualifier - {id_qualifier}"),
                 )
             )
         # Add link to dataset
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        # add link to the scientific name observation node
-        graph.add((uri, rdflib.SDO.hasPart, observation_scientific_name))
         # Add link to attribute
         if id_qualifier_attribute:
             graph.add((uri, utils.namespaces.TERN.hasAttribute, id_qualifier_attribute))
@@ -1559,6 +1616,10 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_id_remarks_attribute", uri, id_remarks, id_remarks_value):
+            return
+
         # Identification Remarks Attribute
         graph.add((uri, a, utils.namespaces.TERN.Attribute))
         if submission_iri:
@@ -1567,7 +1628,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
         graph.add((uri, utils.namespaces.TERN.attribute, CONCEPT_ID_REMARKS))
         if id_remarks:
-            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(id_remarks)))
+            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(id_remarks)))
         if id_remarks_value:
             graph.add((uri, utils.namespaces.TERN.hasValue, id_remarks_value))
 
@@ -1589,10 +1650,14 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_id_remarks_value", uri, id_remarks):
+            return
+
         # Identification Remarks Value
         graph.add((uri, a, utils.namespaces.TERN.Text))
         graph.add((uri, a, utils.namespaces.TERN.Value))
-        graph.add((uri, rdflib.RDF.value, rdflib.Literal(id_remarks)))
+        graph.add((uri, rdflib.RDF.value, utils.rdf.literal(id_remarks)))
 
     def add_id_remarks_collection(
         self,
@@ -1618,6 +1683,13 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Add link to the scientific name observation node
+        graph.add((uri, rdflib.SDO.hasPart, observation_scientific_name))
+
+        # The rest of the Collection is shared by every row, so only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_id_remarks_collection", uri, id_remarks, id_remarks_attribute):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.SDO.Collection))
         if submission_iri:
@@ -1629,13 +1701,11 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
                 (
                     uri,
                     rdflib.SDO.name,
-                    rdflib.Literal(f"Occurrence Collection - Identification Remarks - {id_remarks}"),
+                    utils.rdf.literal(f"Occurrence Collection - Identification Remarks - {id_remarks}"),
                 )
             )
         # Add link to dataset
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        # add link to the scientific name observation node
-        graph.add((uri, rdflib.SDO.hasPart, observation_scientific_name))
         # Add link to attribute
         if id_remarks_attribute:
             graph.add((uri, utils.namespaces.TERN.hasAttribute, id_remarks_attribute))
@@ -1663,9 +1733,9 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((uri, a, utils.namespaces.TERN.FeatureOfInterest))
         if submission_iri:
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal("scientificName")))
+        graph.add((uri, rdflib.RDFS.label, LITERAL_SCIENTIFIC_NAME))
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDF.value, rdflib.Literal(row["scientificName"])))
+        graph.add((uri, rdflib.RDF.value, utils.rdf.literal(row["scientificName"])))
         graph.add((uri, utils.namespaces.TERN.featureType, CONCEPT_SCIENTIFIC_NAME))
 
     def add_catalog_number_datatype(
@@ -1687,15 +1757,19 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_catalog_number_datatype", uri, provider, value):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.RDFS.Datatype))
 
         # Add label
         if value is not None:
-            graph.add((uri, rdflib.SKOS.prefLabel, rdflib.Literal(f"{value} catalogNumber")))
+            graph.add((uri, rdflib.SKOS.prefLabel, utils.rdf.literal(f"{value} catalogNumber")))
 
         # Add definition
-        graph.add((uri, rdflib.SKOS.definition, rdflib.Literal("A catalog number for the sample")))
+        graph.add((uri, rdflib.SKOS.definition, LITERAL_CATALOG_NUMBER_DEFINITION))
 
         # Add attribution
         if provider is not None:
@@ -1718,11 +1792,15 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_catalog_number_provider", uri, row["catalogNumberSource"]):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.PROV.Agent))
 
         # Add name
-        graph.add((uri, rdflib.SDO.name, rdflib.Literal(row["catalogNumberSource"])))
+        graph.add((uri, rdflib.SDO.name, utils.rdf.literal(row["catalogNumberSource"])))
 
     def add_other_catalog_numbers_provider(
         self,
@@ -1741,11 +1819,15 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_other_catalog_numbers_provider", uri, row["otherCatalogNumbersSource"]):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.PROV.Agent))
 
         # Add name
-        graph.add((uri, rdflib.SDO.name, rdflib.Literal(row["otherCatalogNumbersSource"])))
+        graph.add((uri, rdflib.SDO.name, utils.rdf.literal(row["otherCatalogNumbersSource"])))
 
     def add_sampling_specimen(
         self,
@@ -1789,22 +1871,21 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("specimen-sampling")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_SPECIMEN_SAMPLING))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, provider_record_id_occurrence))
         graph.add((uri, rdflib.SOSA.hasResult, sample_specimen))
         graph.add((uri, rdflib.SOSA.usedProcedure, CONCEPT_UNSPECIFIED_METHOD))
-        temporal_entity = rdflib.BNode()
+        temporal_entity = utils.bnodes.bnode("temporal_entity")
         graph.add((uri, rdflib.SDO.temporal, temporal_entity))
         graph.add((temporal_entity, a, rdflib.TIME.Instant))
         graph.add((temporal_entity, timestamp.rdf_in_xsd, timestamp.to_rdf_literal()))
 
         # Add geometry
-        geometry_node = rdflib.BNode()
+        geometry_node = utils.bnodes.bnode("geometry_node")
         graph.add((uri, rdflib.SDO.spatial, geometry_node))
         graph.add((geometry_node, a, utils.namespaces.GEO.Geometry))
         graph.add((geometry_node, utils.namespaces.GEO.asWKT, geometry.to_transformed_crs_rdf_literal()))
-        spatial_comment = "Location unknown, location of field sampling used as proxy"
-        graph.add((geometry_node, rdflib.RDFS.comment, rdflib.Literal(spatial_comment)))
+        graph.add((geometry_node, rdflib.RDFS.comment, LITERAL_FIELD_SAMPLING_LOCATION_PROXY))
 
         # Add 'supplied as' geometry
         self.add_geometry_supplied_as(
@@ -1818,8 +1899,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         # Check for preparedDate
         if not row["preparedDate"]:
             # Add comment to temporal entity
-            temporal_comment = "Date unknown, template eventDateStart used as proxy"
-            graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(temporal_comment)))
+            graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_EVENT_DATE_START_PROXY))
 
         # Check for coordinateUncertaintyInMeters
         if row["coordinateUncertaintyInMeters"]:
@@ -1847,7 +1927,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         # Add to Graph
         graph.add((uri, a, utils.namespaces.TERN.Text))
         graph.add((uri, a, utils.namespaces.TERN.Value))
-        graph.add((uri, rdflib.RDF.value, rdflib.Literal(row["verbatimIdentification"])))
+        graph.add((uri, rdflib.RDF.value, utils.rdf.literal(row["verbatimIdentification"])))
 
     def add_record_number_datatype(
         self,
@@ -1879,16 +1959,14 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
 
         # Add label
         if recorded_by := row["recordedBy"]:
-            graph.add((uri, rdflib.SKOS.prefLabel, rdflib.Literal(f"{recorded_by} recordNumber")))
+            graph.add((uri, rdflib.SKOS.prefLabel, utils.rdf.literal(f"{recorded_by} recordNumber")))
 
         # Add definition
         graph.add(
             (
                 uri,
                 rdflib.SKOS.definition,
-                rdflib.Literal(
-                    "The record number of the original observation from the original observer of the organism"
-                ),
+                LITERAL_RECORD_NUMBER_DEFINITION,
             ),
         )
 
@@ -1938,7 +2016,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("specimen-sample")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_SPECIMEN_SAMPLE))
         graph.add((uri, rdflib.SOSA.isResultOf, sampling_specimen))
         graph.add((uri, rdflib.SOSA.isSampleOf, provider_record_id_occurrence))
         graph.add((uri, utils.namespaces.TERN.featureType, term))
@@ -1966,6 +2044,16 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(
+            graph,
+            "add_data_generalizations_attribute",
+            uri,
+            data_generalizations,
+            data_generalizations_value,
+        ):
+            return
+
         # Data Generalizations Attribute
         graph.add((uri, a, utils.namespaces.TERN.Attribute))
         if submission_iri:
@@ -1974,7 +2062,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
         graph.add((uri, utils.namespaces.TERN.attribute, CONCEPT_DATA_GENERALIZATIONS))
         if data_generalizations:
-            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(data_generalizations)))
+            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(data_generalizations)))
         if data_generalizations_value is not None:
             graph.add((uri, utils.namespaces.TERN.hasValue, data_generalizations_value))
 
@@ -1995,10 +2083,14 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_data_generalizations_value", uri, data_generalizations):
+            return
+
         # Data Generalizations Value
         graph.add((uri, a, utils.namespaces.TERN.Text))
         graph.add((uri, a, utils.namespaces.TERN.Value))
-        graph.add((uri, rdflib.RDF.value, rdflib.Literal(data_generalizations)))
+        graph.add((uri, rdflib.RDF.value, utils.rdf.literal(data_generalizations)))
 
     def add_data_generalizations_collection(
         self,
@@ -2024,6 +2116,19 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Add link to the sample field
+        graph.add((uri, rdflib.SDO.hasPart, provider_record_id_occurrence))
+
+        # The rest of the Collection is shared by every row, so only needs adding once per chunk
+        if self.added_in_chunk(
+            graph,
+            "add_data_generalizations_collection",
+            uri,
+            data_generalizations,
+            data_generalizations_attribute,
+        ):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.SDO.Collection))
         if submission_iri:
@@ -2035,15 +2140,13 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
                 (
                     uri,
                     rdflib.SDO.name,
-                    rdflib.Literal(
+                    utils.rdf.literal(
                         f"Occurrence Collection - Data Generalizations - {data_generalizations}",
                     ),
                 )
             )
         # Add link to dataset
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        # add link to the sample field
-        graph.add((uri, rdflib.SDO.hasPart, provider_record_id_occurrence))
         # Add link to attribute
         if data_generalizations_attribute:
             graph.add((uri, utils.namespaces.TERN.hasAttribute, data_generalizations_attribute))
@@ -2072,6 +2175,10 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_taxon_rank_attribute", uri, taxon_rank, taxon_rank_value):
+            return
+
         # Taxon Rank Attribute
         graph.add((uri, a, utils.namespaces.TERN.Attribute))
         if submission_iri:
@@ -2080,7 +2187,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
         graph.add((uri, utils.namespaces.TERN.attribute, CONCEPT_TAXON_RANK))
         if taxon_rank:
-            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(taxon_rank)))
+            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(taxon_rank)))
         if taxon_rank_value:
             graph.add((uri, utils.namespaces.TERN.hasValue, taxon_rank_value))
 
@@ -2106,12 +2213,16 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_taxon_rank_value", uri, taxon_rank):
+            return
+
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
 
         if taxon_rank:
             # Add label
-            graph.add((uri, rdflib.RDFS.label, rdflib.Literal(taxon_rank)))
+            graph.add((uri, rdflib.RDFS.label, utils.rdf.literal(taxon_rank)))
 
             # Retrieve vocab for field
             vocab = self.fields()["taxonRank"].get_flexible_vocab()
@@ -2144,6 +2255,13 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Add link to the scientific name observation node
+        graph.add((uri, rdflib.SDO.hasPart, observation_scientific_name))
+
+        # The rest of the Collection is shared by every row, so only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_taxon_rank_collection", uri, taxon_rank, taxon_rank_attribute):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.SDO.Collection))
         if submission_iri:
@@ -2155,13 +2273,11 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
                 (
                     uri,
                     rdflib.SDO.name,
-                    rdflib.Literal(f"Occurrence Collection - Taxon Rank - {taxon_rank}"),
+                    utils.rdf.literal(f"Occurrence Collection - Taxon Rank - {taxon_rank}"),
                 )
             )
         # Add link to dataset
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        # add link to the scientific name observation node
-        graph.add((uri, rdflib.SDO.hasPart, observation_scientific_name))
         # Add link to attribute
         if taxon_rank_attribute:
             graph.add((uri, utils.namespaces.TERN.hasAttribute, taxon_rank_attribute))
@@ -2202,20 +2318,19 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("individualCount-observation")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_INDIVIDUAL_COUNT_OBSERVATION))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, provider_record_id_occurrence))
         graph.add((uri, rdflib.SOSA.hasResult, individual_count_value))
-        graph.add((uri, rdflib.SOSA.hasSimpleResult, rdflib.Literal(row["individualCount"])))
+        graph.add((uri, rdflib.SOSA.hasSimpleResult, utils.rdf.literal(row["individualCount"])))
         graph.add((uri, rdflib.SOSA.observedProperty, CONCEPT_INDIVIDUAL_COUNT))
         graph.add((uri, rdflib.SOSA.usedProcedure, CONCEPT_UNSPECIFIED_METHOD))
-        temporal_entity = rdflib.BNode()
+        temporal_entity = utils.bnodes.bnode("temporal_entity")
         graph.add((uri, rdflib.SDO.temporal, temporal_entity))
         graph.add((temporal_entity, a, rdflib.TIME.Instant))
         graph.add((temporal_entity, event_date.rdf_in_xsd, event_date.to_rdf_literal()))
 
         # Add comment to temporal entity
-        temporal_comment = "Date unknown, template eventDateStart used as proxy"
-        graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(temporal_comment)))
+        graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_EVENT_DATE_START_PROXY))
 
     def add_individual_count_value(
         self,
@@ -2237,8 +2352,8 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         # Individual Count Value
         graph.add((uri, a, utils.namespaces.TERN.Integer))
         graph.add((uri, a, utils.namespaces.TERN.Value))
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal("individual-count")))
-        graph.add((uri, rdflib.RDF.value, rdflib.Literal(row["individualCount"])))
+        graph.add((uri, rdflib.RDFS.label, LITERAL_INDIVIDUAL_COUNT))
+        graph.add((uri, rdflib.RDF.value, utils.rdf.literal(row["individualCount"])))
 
     def add_organism_remarks_observation(
         self,
@@ -2276,20 +2391,19 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("organismRemarks-observation")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_ORGANISM_REMARKS_OBSERVATION))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, provider_record_id_occurrence))
         graph.add((uri, rdflib.SOSA.hasResult, organism_remarks_value))
-        graph.add((uri, rdflib.SOSA.hasSimpleResult, rdflib.Literal(row["organismRemarks"])))
+        graph.add((uri, rdflib.SOSA.hasSimpleResult, utils.rdf.literal(row["organismRemarks"])))
         graph.add((uri, rdflib.SOSA.observedProperty, CONCEPT_ORGANISM_REMARKS))
         graph.add((uri, rdflib.SOSA.usedProcedure, CONCEPT_UNSPECIFIED_METHOD))
-        temporal_entity = rdflib.BNode()
+        temporal_entity = utils.bnodes.bnode("temporal_entity")
         graph.add((uri, rdflib.SDO.temporal, temporal_entity))
         graph.add((temporal_entity, a, rdflib.TIME.Instant))
         graph.add((temporal_entity, event_date.rdf_in_xsd, event_date.to_rdf_literal()))
 
         # Add comment to temporal entity
-        temporal_comment = "Date unknown, template eventDateStart used as proxy"
-        graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(temporal_comment)))
+        graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_EVENT_DATE_START_PROXY))
 
     def add_organism_remarks_value(
         self,
@@ -2311,8 +2425,8 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         # Organism Remarks Value
         graph.add((uri, a, utils.namespaces.TERN.Text))
         graph.add((uri, a, utils.namespaces.TERN.Value))
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal("organism-remarks")))
-        graph.add((uri, rdflib.RDF.value, rdflib.Literal(row["organismRemarks"])))
+        graph.add((uri, rdflib.RDFS.label, LITERAL_ORGANISM_REMARKS))
+        graph.add((uri, rdflib.RDF.value, utils.rdf.literal(row["organismRemarks"])))
 
     def add_organism_quantity_observation(
         self,
@@ -2351,10 +2465,10 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if submission_iri:
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("organismQuantity-observation")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_ORGANISM_QUANTITY_OBSERVATION))
         graph.add((uri, rdflib.SOSA.observedProperty, CONCEPT_ORGANISM_QUANTITY))
 
-        temporal_entity = rdflib.BNode()
+        temporal_entity = utils.bnodes.bnode("temporal_entity")
         graph.add((uri, rdflib.SDO.temporal, temporal_entity))
         graph.add((temporal_entity, a, rdflib.TIME.Instant))
         graph.add((temporal_entity, event_date.rdf_in_xsd, event_date.to_rdf_literal()))
@@ -2363,7 +2477,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
             (
                 temporal_entity,
                 rdflib.RDFS.comment,
-                rdflib.Literal("Date unknown, template eventDateStart used as proxy"),
+                LITERAL_EVENT_DATE_START_PROXY,
             )
         )
 
@@ -2371,7 +2485,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((uri, rdflib.SOSA.usedProcedure, CONCEPT_UNSPECIFIED_METHOD))
 
         # Add organism quantity and type values
-        graph.add((uri, rdflib.SOSA.hasSimpleResult, rdflib.Literal(f"{organism_qty} {organism_qty_type}")))
+        graph.add((uri, rdflib.SOSA.hasSimpleResult, utils.rdf.literal(f"{organism_qty} {organism_qty_type}")))
 
     def add_organism_quantity_value(
         self,
@@ -2410,7 +2524,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((organism_qty_observation, rdflib.SOSA.hasResult, uri))
         graph.add((uri, a, utils.namespaces.TERN.Value))
         graph.add((uri, a, utils.namespaces.TERN.Float))
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal("organism-quantity")))
+        graph.add((uri, rdflib.RDFS.label, LITERAL_ORGANISM_QUANTITY))
         graph.add((uri, utils.namespaces.TERN.unit, term))
         graph.add((uri, rdflib.RDF.value, rdflib.Literal(organism_qty, datatype=rdflib.XSD.float)))
 
@@ -2436,6 +2550,10 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_habitat_attribute", uri, habitat, habitat_value):
+            return
+
         # Habitat Attribute
         graph.add((uri, a, utils.namespaces.TERN.Attribute))
         if submission_iri:
@@ -2444,7 +2562,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
         graph.add((uri, utils.namespaces.TERN.attribute, CONCEPT_HABITAT))
         if habitat:
-            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(habitat)))
+            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(habitat)))
         if habitat_value is not None:
             graph.add((uri, utils.namespaces.TERN.hasValue, habitat_value))
 
@@ -2469,12 +2587,16 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_habitat_value", uri, habitat):
+            return
+
         # Habitat Value
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
         if habitat:
             # Add label
-            graph.add((uri, rdflib.RDFS.label, rdflib.Literal(habitat)))
+            graph.add((uri, rdflib.RDFS.label, utils.rdf.literal(habitat)))
 
             # Retrieve vocab for field
             vocab = self.fields()["habitat"].get_flexible_vocab()
@@ -2507,6 +2629,13 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Add link to the sample field
+        graph.add((uri, rdflib.SDO.hasPart, provider_record_id_occurrence))
+
+        # The rest of the Collection is shared by every row, so only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_habitat_collection", uri, habitat, habitat_attribute):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.SDO.Collection))
         if submission_iri:
@@ -2514,11 +2643,9 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
 
         # Add identifier
         if habitat:
-            graph.add((uri, rdflib.SDO.name, rdflib.Literal(f"Occurrence Collection - Habitat - {habitat}")))
+            graph.add((uri, rdflib.SDO.name, utils.rdf.literal(f"Occurrence Collection - Habitat - {habitat}")))
         # Add link to dataset
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        # add link to the sample field
-        graph.add((uri, rdflib.SDO.hasPart, provider_record_id_occurrence))
         # Add link to attribute
         if habitat_attribute:
             graph.add((uri, utils.namespaces.TERN.hasAttribute, habitat_attribute))
@@ -2545,6 +2672,10 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_basis_attribute", uri, basis_of_record, basis_value):
+            return
+
         # Basis of Record Attribute
         graph.add((uri, a, utils.namespaces.TERN.Attribute))
         if submission_iri:
@@ -2553,7 +2684,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
         graph.add((uri, utils.namespaces.TERN.attribute, CONCEPT_BASIS_OF_RECORD))
         if basis_of_record:
-            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(basis_of_record)))
+            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(basis_of_record)))
         if basis_value:
             graph.add((uri, utils.namespaces.TERN.hasValue, basis_value))
 
@@ -2578,12 +2709,16 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_basis_value", uri, basis_of_record):
+            return
+
         # Basis of Record Value
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
         if basis_of_record:
             # Add label
-            graph.add((uri, rdflib.RDFS.label, rdflib.Literal(basis_of_record)))
+            graph.add((uri, rdflib.RDFS.label, utils.rdf.literal(basis_of_record)))
 
             # Retrieve vocab for field
             vocab = self.fields()["basisOfRecord"].get_flexible_vocab()
@@ -2623,6 +2758,16 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Add link to the appropriate sample node
+        if has_specimen(row):
+            graph.add((uri, rdflib.SDO.hasPart, sample_specimen))
+        else:
+            graph.add((uri, rdflib.SDO.hasPart, provider_record_id_occurrence))
+
+        # The rest of the Collection is shared by every row, so only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_basis_collection", uri, basis_of_record, basis_attribute):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.SDO.Collection))
         if submission_iri:
@@ -2634,16 +2779,11 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
                 (
                     uri,
                     rdflib.SDO.name,
-                    rdflib.Literal(f"Occurrence Collection - Basis Of Record - {basis_of_record}"),
+                    utils.rdf.literal(f"Occurrence Collection - Basis Of Record - {basis_of_record}"),
                 )
             )
         # Add link to dataset
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        # add link to the appropriate sample node
-        if has_specimen(row):
-            graph.add((uri, rdflib.SDO.hasPart, sample_specimen))
-        else:
-            graph.add((uri, rdflib.SDO.hasPart, provider_record_id_occurrence))
         # Add link to attribute
         if basis_attribute:
             graph.add((uri, utils.namespaces.TERN.hasAttribute, basis_attribute))
@@ -2668,7 +2808,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
 
         # Owner Institution Provider
         graph.add((uri, a, rdflib.PROV.Agent))
-        graph.add((uri, rdflib.SDO.name, rdflib.Literal(row["ownerRecordIDSource"])))
+        graph.add((uri, rdflib.SDO.name, utils.rdf.literal(row["ownerRecordIDSource"])))
 
     def add_occurrence_status_observation(
         self,
@@ -2706,13 +2846,13 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("occurrenceStatus-observation")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_OCCURRENCE_STATUS_OBSERVATION))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, provider_record_id_occurrence))
         graph.add((uri, rdflib.SOSA.hasResult, occurrence_status_value))
-        graph.add((uri, rdflib.SOSA.hasSimpleResult, rdflib.Literal(row["occurrenceStatus"])))
+        graph.add((uri, rdflib.SOSA.hasSimpleResult, utils.rdf.literal(row["occurrenceStatus"])))
         graph.add((uri, rdflib.SOSA.observedProperty, CONCEPT_OCCURRENCE_STATUS))
         graph.add((uri, rdflib.SOSA.usedProcedure, CONCEPT_UNSPECIFIED_METHOD))
-        temporal_entity = rdflib.BNode()
+        temporal_entity = utils.bnodes.bnode("temporal_entity")
         graph.add((uri, rdflib.SDO.temporal, temporal_entity))
         graph.add((temporal_entity, a, rdflib.TIME.Instant))
         graph.add((temporal_entity, event_date.rdf_in_xsd, event_date.to_rdf_literal()))
@@ -2747,7 +2887,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         # Occurrence Status Value
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal(f"occurrenceStatus = {row['occurrenceStatus']}")))
+        graph.add((uri, rdflib.RDFS.label, utils.rdf.literal(f"occurrenceStatus = {row['occurrenceStatus']}")))
         graph.add((uri, rdflib.RDF.value, term))
 
     def add_preparations_attribute(
@@ -2772,6 +2912,10 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_preparations_attribute", uri, preparations, preparations_value):
+            return
+
         # Preparations Attribute
         graph.add((uri, a, utils.namespaces.TERN.Attribute))
         if submission_iri:
@@ -2780,7 +2924,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
         graph.add((uri, utils.namespaces.TERN.attribute, CONCEPT_PREPARATIONS))
         if preparations:
-            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(preparations)))
+            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(preparations)))
         if preparations_value:
             graph.add((uri, utils.namespaces.TERN.hasValue, preparations_value))
 
@@ -2805,12 +2949,16 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_preparations_value", uri, preparations):
+            return
+
         # Preparations Value
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
         if preparations:
             # Add label
-            graph.add((uri, rdflib.RDFS.label, rdflib.Literal(preparations)))
+            graph.add((uri, rdflib.RDFS.label, utils.rdf.literal(preparations)))
 
             # Retrieve vocab for field
             vocab = self.fields()["preparations"].get_flexible_vocab()
@@ -2843,6 +2991,13 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Add link to the sample_specimen node
+        graph.add((uri, rdflib.SDO.hasPart, sample_specimen))
+
+        # The rest of the Collection is shared by every row, so only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_preparations_collection", uri, preparations, preparations_attribute):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.SDO.Collection))
         if submission_iri:
@@ -2854,13 +3009,11 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
                 (
                     uri,
                     rdflib.SDO.name,
-                    rdflib.Literal(f"Occurrence Collection - Preparations - {preparations}"),
+                    utils.rdf.literal(f"Occurrence Collection - Preparations - {preparations}"),
                 )
             )
         # Add link to dataset
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        # add link to the sample_specimen node
-        graph.add((uri, rdflib.SDO.hasPart, sample_specimen))
         # Add link to attribute
         if preparations_attribute:
             graph.add((uri, utils.namespaces.TERN.hasAttribute, preparations_attribute))
@@ -2900,20 +3053,19 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("establishmentMeans-observation")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_ESTABLISHMENT_MEANS_OBSERVATION))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, provider_record_id_occurrence))
         graph.add((uri, rdflib.SOSA.hasResult, establishment_means_value))
-        graph.add((uri, rdflib.SOSA.hasSimpleResult, rdflib.Literal(row["establishmentMeans"])))
+        graph.add((uri, rdflib.SOSA.hasSimpleResult, utils.rdf.literal(row["establishmentMeans"])))
         graph.add((uri, rdflib.SOSA.observedProperty, CONCEPT_ESTABLISHMENT_MEANS))
         graph.add((uri, rdflib.SOSA.usedProcedure, CONCEPT_UNSPECIFIED_METHOD))
-        temporal_entity = rdflib.BNode()
+        temporal_entity = utils.bnodes.bnode("temporal_entity")
         graph.add((uri, rdflib.SDO.temporal, temporal_entity))
         graph.add((temporal_entity, a, rdflib.TIME.Instant))
         graph.add((temporal_entity, event_date.rdf_in_xsd, event_date.to_rdf_literal()))
 
         # Add comment to temporal entity
-        temporal_comment = "Date unknown, template eventDateStart used as proxy"
-        graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(temporal_comment)))
+        graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_EVENT_DATE_START_PROXY))
 
     def add_establishment_means_value(
         self,
@@ -2945,7 +3097,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         # Establishment Means Value
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal("establishmentMeans-value")))
+        graph.add((uri, rdflib.RDFS.label, LITERAL_ESTABLISHMENT_MEANS_VALUE))
         graph.add((uri, rdflib.RDF.value, term))
 
     def add_life_stage_observation(
@@ -2991,20 +3143,19 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("lifeStage-observation")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_LIFE_STAGE_OBSERVATION))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, foi))
         graph.add((uri, rdflib.SOSA.hasResult, life_stage_value))
-        graph.add((uri, rdflib.SOSA.hasSimpleResult, rdflib.Literal(row["lifeStage"])))
+        graph.add((uri, rdflib.SOSA.hasSimpleResult, utils.rdf.literal(row["lifeStage"])))
         graph.add((uri, rdflib.SOSA.observedProperty, CONCEPT_LIFE_STAGE))
         graph.add((uri, rdflib.SOSA.usedProcedure, CONCEPT_UNSPECIFIED_METHOD))
-        temporal_entity = rdflib.BNode()
+        temporal_entity = utils.bnodes.bnode("temporal_entity")
         graph.add((uri, rdflib.SDO.temporal, temporal_entity))
         graph.add((temporal_entity, a, rdflib.TIME.Instant))
         graph.add((temporal_entity, event_date.rdf_in_xsd, event_date.to_rdf_literal()))
 
         # Add comment to temporal entity
-        temporal_comment = "Date unknown, template eventDateStart used as proxy"
-        graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(temporal_comment)))
+        graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_EVENT_DATE_START_PROXY))
 
     def add_life_stage_value(
         self,
@@ -3036,7 +3187,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         # Life Stage Value
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal("lifeStage-value")))
+        graph.add((uri, rdflib.RDFS.label, LITERAL_LIFE_STAGE_VALUE))
         graph.add((uri, rdflib.RDF.value, term))
 
     def add_sex_observation(
@@ -3081,20 +3232,19 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("sex-observation")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_SEX_OBSERVATION))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, foi))
         graph.add((uri, rdflib.SOSA.hasResult, sex_value))
-        graph.add((uri, rdflib.SOSA.hasSimpleResult, rdflib.Literal(row["sex"])))
+        graph.add((uri, rdflib.SOSA.hasSimpleResult, utils.rdf.literal(row["sex"])))
         graph.add((uri, rdflib.SOSA.observedProperty, CONCEPT_SEX))
         graph.add((uri, rdflib.SOSA.usedProcedure, CONCEPT_UNSPECIFIED_METHOD))
-        temporal_entity = rdflib.BNode()
+        temporal_entity = utils.bnodes.bnode("temporal_entity")
         graph.add((uri, rdflib.SDO.temporal, temporal_entity))
         graph.add((temporal_entity, a, rdflib.TIME.Instant))
         graph.add((temporal_entity, event_date.rdf_in_xsd, event_date.to_rdf_literal()))
 
         # Add comment to temporal entity
-        temporal_comment = "Date unknown, template eventDateStart used as proxy"
-        graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(temporal_comment)))
+        graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_EVENT_DATE_START_PROXY))
 
     def add_sex_value(
         self,
@@ -3126,7 +3276,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         # Sex Value
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal("sex-value")))
+        graph.add((uri, rdflib.RDFS.label, LITERAL_SEX_VALUE))
         graph.add((uri, rdflib.RDF.value, term))
 
     def add_reproductive_condition_observation(
@@ -3172,20 +3322,19 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("reproductiveCondition-observation")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_REPRODUCTIVE_CONDITION_OBSERVATION))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, foi))
         graph.add((uri, rdflib.SOSA.hasResult, reproductive_condition_value))
-        graph.add((uri, rdflib.SOSA.hasSimpleResult, rdflib.Literal(row["reproductiveCondition"])))
+        graph.add((uri, rdflib.SOSA.hasSimpleResult, utils.rdf.literal(row["reproductiveCondition"])))
         graph.add((uri, rdflib.SOSA.observedProperty, CONCEPT_REPRODUCTIVE_CONDITION))
         graph.add((uri, rdflib.SOSA.usedProcedure, CONCEPT_UNSPECIFIED_METHOD))
-        temporal_entity = rdflib.BNode()
+        temporal_entity = utils.bnodes.bnode("temporal_entity")
         graph.add((uri, rdflib.SDO.temporal, temporal_entity))
         graph.add((temporal_entity, a, rdflib.TIME.Instant))
         graph.add((temporal_entity, event_date.rdf_in_xsd, event_date.to_rdf_literal()))
 
         # Add comment to temporal entity
-        temporal_comment = "Date unknown, template eventDateStart used as proxy"
-        graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(temporal_comment)))
+        graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_EVENT_DATE_START_PROXY))
 
     def add_reproductive_condition_value(
         self,
@@ -3217,7 +3366,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         # Reproductive Condition Value
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal("reproductiveCondition-value")))
+        graph.add((uri, rdflib.RDFS.label, LITERAL_REPRODUCTIVE_CONDITION_VALUE))
         graph.add((uri, rdflib.RDF.value, term))
 
     def add_accepted_name_usage_observation(
@@ -3255,13 +3404,13 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("acceptedNameUsage-observation")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_ACCEPTED_NAME_USAGE_OBSERVATION))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, scientific_name))
         graph.add((uri, rdflib.SOSA.hasResult, accepted_name_usage_value))
-        graph.add((uri, rdflib.SOSA.hasSimpleResult, rdflib.Literal(row["acceptedNameUsage"])))
+        graph.add((uri, rdflib.SOSA.hasSimpleResult, utils.rdf.literal(row["acceptedNameUsage"])))
         graph.add((uri, rdflib.SOSA.observedProperty, CONCEPT_ACCEPTED_NAME_USAGE))
         graph.add((uri, rdflib.SOSA.usedProcedure, CONCEPT_NAME_CHECK_METHOD))
-        temporal_entity = rdflib.BNode()
+        temporal_entity = utils.bnodes.bnode("temporal_entity")
         graph.add((uri, rdflib.SDO.temporal, temporal_entity))
         graph.add((temporal_entity, a, rdflib.TIME.Instant))
         graph.add((temporal_entity, date_identified.rdf_in_xsd, date_identified.to_rdf_literal()))
@@ -3269,8 +3418,8 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         # Add comment to temporal entity
         # Determine which field was used
         timestamp_used = "dateIdentified" if row["dateIdentified"] else "eventDateStart"
-        temporal_comment = f"Date unknown, template {timestamp_used} used as proxy"
-        graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(temporal_comment)))
+        temporal_comment = utils.rdf.literal(f"Date unknown, template {timestamp_used} used as proxy")
+        graph.add((temporal_entity, rdflib.RDFS.comment, temporal_comment))
 
     def add_accepted_name_usage_value(
         self,
@@ -3298,9 +3447,9 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((uri, a, utils.namespaces.TERN.FeatureOfInterest))
         if submission_iri:
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal("acceptedNameUsage-value")))
+        graph.add((uri, rdflib.RDFS.label, LITERAL_ACCEPTED_NAME_USAGE_VALUE))
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDF.value, rdflib.Literal(row["acceptedNameUsage"])))
+        graph.add((uri, rdflib.RDF.value, utils.rdf.literal(row["acceptedNameUsage"])))
         graph.add((uri, utils.namespaces.TERN.featureType, CONCEPT_ACCEPTED_NAME_USAGE))
 
     def add_sampling_sequencing(
@@ -3352,17 +3501,17 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("sequencing-sampling")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_SEQUENCING_SAMPLING))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, feature_of_interest))
         graph.add((uri, rdflib.SOSA.hasResult, result_sequence))
-        temporal_entity = rdflib.BNode()
+        temporal_entity = utils.bnodes.bnode("temporal_entity")
         graph.add((uri, rdflib.SDO.temporal, temporal_entity))
         graph.add((temporal_entity, a, rdflib.TIME.Instant))
         graph.add((temporal_entity, event_date.rdf_in_xsd, event_date.to_rdf_literal()))
         graph.add((uri, rdflib.SOSA.usedProcedure, term))
 
         # Add geometry
-        geometry_node = rdflib.BNode()
+        geometry_node = utils.bnodes.bnode("geometry_node")
         graph.add((uri, rdflib.SDO.spatial, geometry_node))
         graph.add((geometry_node, a, utils.namespaces.GEO.Geometry))
         graph.add((geometry_node, utils.namespaces.GEO.asWKT, geometry.to_transformed_crs_rdf_literal()))
@@ -3383,12 +3532,10 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, utils.namespaces.GEO.hasMetricSpatialAccuracy, accuracy))
 
         # Add comment to temporal entity
-        temporal_comment = "Date unknown, template eventDateStart used as proxy"
-        graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(temporal_comment)))
+        graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_EVENT_DATE_START_PROXY))
 
         # Add comment to geometry
-        spatial_comment = "Location unknown, location of field sampling used as proxy"
-        graph.add((geometry_node, rdflib.RDFS.comment, rdflib.Literal(spatial_comment)))
+        graph.add((geometry_node, rdflib.RDFS.comment, LITERAL_FIELD_SAMPLING_LOCATION_PROXY))
 
     def add_result_sequence(
         self,
@@ -3411,12 +3558,12 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((uri, a, utils.namespaces.TERN.Result))
 
         # Add label
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal("sequence-result")))
+        graph.add((uri, rdflib.RDFS.label, LITERAL_SEQUENCE_RESULT))
 
         # Loop Through Associated Sequences
         for identifier in row["associatedSequences"]:
             # Add Identifier
-            graph.add((uri, rdflib.SDO.identifier, rdflib.Literal(identifier)))
+            graph.add((uri, rdflib.SDO.identifier, utils.rdf.literal(identifier)))
 
     def add_provider_determined_by(
         self,
@@ -3437,7 +3584,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
 
         # Add to Graph
         graph.add((uri, a, rdflib.PROV.Agent))
-        graph.add((uri, rdflib.SDO.name, rdflib.Literal(row["threatStatusDeterminedBy"])))
+        graph.add((uri, rdflib.SDO.name, utils.rdf.literal(row["threatStatusDeterminedBy"])))
 
     def add_threat_status_observation(
         self,
@@ -3488,13 +3635,13 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("threatStatus-observation")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_THREAT_STATUS_OBSERVATION))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, provider_record_id_occurrence))
         graph.add((uri, rdflib.SOSA.hasResult, threat_status_value))
-        graph.add((uri, rdflib.SOSA.hasSimpleResult, rdflib.Literal(row["threatStatus"])))
+        graph.add((uri, rdflib.SOSA.hasSimpleResult, utils.rdf.literal(row["threatStatus"])))
         graph.add((uri, rdflib.SOSA.observedProperty, CONCEPT_CONSERVATION_STATUS))
         graph.add((uri, rdflib.SOSA.usedProcedure, term))
-        temporal_entity = rdflib.BNode()
+        temporal_entity = utils.bnodes.bnode("temporal_entity")
         graph.add((uri, rdflib.SDO.temporal, temporal_entity))
         graph.add((temporal_entity, a, rdflib.TIME.Instant))
         graph.add((temporal_entity, date_determined.rdf_in_xsd, date_determined.to_rdf_literal()))
@@ -3516,8 +3663,8 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
             )
 
             # Add comment to temporal entity
-            comment = f"Date unknown, template {date_used} used as proxy"
-            graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+            comment = utils.rdf.literal(f"Date unknown, template {date_used} used as proxy")
+            graph.add((temporal_entity, rdflib.RDFS.comment, comment))
 
     def add_threat_status_value(
         self,
@@ -3553,7 +3700,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         # Threat Status Value
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal(f"Conservation status = {row['threatStatus']}")))
+        graph.add((uri, rdflib.RDFS.label, utils.rdf.literal(f"Conservation status = {row['threatStatus']}")))
         graph.add((uri, rdflib.RDF.value, term))
 
     def add_conservation_authority_attribute(
@@ -3579,6 +3726,16 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(
+            graph,
+            "add_conservation_authority_attribute",
+            uri,
+            conservation_authority,
+            conservation_authority_value,
+        ):
+            return
+
         # Conservation Authority Attribute
         graph.add((uri, a, utils.namespaces.TERN.Attribute))
         if submission_iri:
@@ -3587,7 +3744,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
         graph.add((uri, utils.namespaces.TERN.attribute, CONCEPT_CONSERVATION_AUTHORITY))
         if conservation_authority:
-            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(conservation_authority)))
+            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(conservation_authority)))
         if conservation_authority_value:
             graph.add((uri, utils.namespaces.TERN.hasValue, conservation_authority_value))
 
@@ -3609,12 +3766,16 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_conservation_authority_value", uri, conservation_authority):
+            return
+
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
 
         if conservation_authority:
             # Construct Label
-            graph.add((uri, rdflib.RDFS.label, rdflib.Literal(conservation_authority)))
+            graph.add((uri, rdflib.RDFS.label, utils.rdf.literal(conservation_authority)))
 
             # Retrieve vocab for field
             vocab = self.fields()["conservationAuthority"].get_vocab()
@@ -3647,6 +3808,19 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Add link to the threat status observation node
+        graph.add((uri, rdflib.SDO.hasPart, threat_status_observation))
+
+        # The rest of the Collection is shared by every row, so only needs adding once per chunk
+        if self.added_in_chunk(
+            graph,
+            "add_conservation_authority_collection",
+            uri,
+            conservation_authority,
+            conservation_authority_attribute,
+        ):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.SDO.Collection))
         if submission_iri:
@@ -3658,13 +3832,11 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
                 (
                     uri,
                     rdflib.SDO.name,
-                    rdflib.Literal(f"Occurrence Collection - Conservation Authority - {conservation_authority}"),
+                    utils.rdf.literal(f"Occurrence Collection - Conservation Authority - {conservation_authority}"),
                 )
             )
         # Add link to dataset
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        # add link to the threat status observation node
-        graph.add((uri, rdflib.SDO.hasPart, threat_status_observation))
         # Add link to attribute
         if conservation_authority_attribute:
             graph.add((uri, utils.namespaces.TERN.hasAttribute, conservation_authority_attribute))
@@ -3691,6 +3863,17 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(
+            graph,
+            "add_sensitivity_category_attribute",
+            uri,
+            row["sensitivityCategory"],
+            row["sensitivityAuthority"],
+            sensitivity_category_value,
+        ):
+            return
+
         simple_value = f"{row['sensitivityCategory']} - {row['sensitivityAuthority']}"
 
         # Sensitivity Category Attribute
@@ -3700,7 +3883,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
         graph.add((uri, utils.namespaces.TERN.attribute, CONCEPT_SENSITIVITY_CATEGORY))
-        graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(simple_value)))
+        graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(simple_value)))
         if sensitivity_category_value:
             graph.add((uri, utils.namespaces.TERN.hasValue, sensitivity_category_value))
 
@@ -3725,6 +3908,16 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(
+            graph,
+            "add_sensitivity_category_value",
+            uri,
+            row["sensitivityCategory"],
+            row["sensitivityAuthority"],
+        ):
+            return
+
         # Retrieve vocab for field
         vocab = self.fields()["sensitivityCategory"].get_flexible_vocab()
         vocab_instance = vocab(graph=graph, source=dataset, submitted_on_date=submitted_on_date)
@@ -3733,7 +3926,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         scope_note = f"Under the authority of {row['sensitivityAuthority']}"
         if not isinstance(vocab_instance, utils.vocabs.FlexibleVocabulary):
             raise RuntimeError("sensitiveCategory vocabulary is expected to be a FlexibleVocabulary")
-        vocab_instance.scope_note = rdflib.Literal(scope_note)
+        vocab_instance.scope_note = utils.rdf.literal(scope_note)
         # This has to be done here, instead of at the Vocabulary definition,
         # because the value is computed from another field (sensitivityAuthority).
 
@@ -3746,7 +3939,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         # Conservation Authority Value
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal(label)))
+        graph.add((uri, rdflib.RDFS.label, utils.rdf.literal(label)))
         graph.add((uri, rdflib.RDF.value, term))
 
     def add_sensitivity_category_collection(
@@ -3773,6 +3966,19 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Add link to the biodiversity record
+        graph.add((uri, rdflib.SDO.hasPart, provider_record_id_biodiversity_record))
+
+        # The rest of the Collection is shared by every row, so only needs adding once per chunk
+        if self.added_in_chunk(
+            graph,
+            "add_sensitivity_category_collection",
+            uri,
+            sensitivity_category,
+            sensitivity_category_attribute,
+        ):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.SDO.Collection))
         if submission_iri:
@@ -3784,7 +3990,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
                 (
                     uri,
                     rdflib.SDO.name,
-                    rdflib.Literal(f"Occurrence Collection - Sensitivity Category - {sensitivity_category}"),
+                    utils.rdf.literal(f"Occurrence Collection - Sensitivity Category - {sensitivity_category}"),
                 )
             )
         # Add link to dataset
@@ -3792,8 +3998,6 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         # Add link to attribute
         if sensitivity_category_attribute:
             graph.add((uri, utils.namespaces.TERN.hasAttribute, sensitivity_category_attribute))
-        # Add link to the biodiversity record
-        graph.add((uri, rdflib.SDO.hasPart, provider_record_id_biodiversity_record))
 
     def add_biodiversity_record(
         self,
@@ -3891,7 +4095,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         )
 
         # Add geometry
-        geometry_node = rdflib.BNode()
+        geometry_node = utils.bnodes.bnode("geometry_node")
         graph.add((uri, rdflib.SDO.spatial, geometry_node))
         graph.add((geometry_node, a, utils.namespaces.GEO.Geometry))
         graph.add((geometry_node, utils.namespaces.GEO.asWKT, geometry.to_transformed_crs_rdf_literal()))
@@ -3916,18 +4120,18 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         # Add temporal entity
         event_date_start: models.temporal.Timestamp = row["eventDateStart"]
         event_date_end: models.temporal.Timestamp | None = row["eventDateEnd"]
-        temporal_node = rdflib.BNode()
+        temporal_node = utils.bnodes.bnode("temporal_node")
         graph.add((uri, rdflib.SDO.temporal, temporal_node))
         # When end date is provided, give temporal node a start/end
         if event_date_end is not None:
             graph.add((temporal_node, a, rdflib.TIME.TemporalEntity))
             # Start date
-            start_instant = rdflib.BNode()
+            start_instant = utils.bnodes.bnode("start_instant")
             graph.add((start_instant, a, rdflib.TIME.Instant))
             graph.add((start_instant, event_date_start.rdf_in_xsd, event_date_start.to_rdf_literal()))
             graph.add((temporal_node, rdflib.TIME.hasBeginning, start_instant))
             # End date
-            end_instant = rdflib.BNode()
+            end_instant = utils.bnodes.bnode("end_instant")
             graph.add((end_instant, a, rdflib.TIME.Instant))
             graph.add((end_instant, event_date_end.rdf_in_xsd, event_date_end.to_rdf_literal()))
             graph.add((temporal_node, rdflib.TIME.hasEnd, end_instant))
@@ -3945,7 +4149,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
 
         # Add location description if provided
         if locality := row["locality"]:
-            graph.add((uri, utils.namespaces.TERN.locationDescription, rdflib.Literal(locality)))
+            graph.add((uri, utils.namespaces.TERN.locationDescription, utils.rdf.literal(locality)))
 
         # Add associated with agents if provided
         if provider_recorded_by is not None:
@@ -3965,7 +4169,7 @@ class IncidentalOccurrenceMapper(base.mapper.ABISMapper):
         # Check for collectionCode
         if row["collectionCode"]:
             # Add to Graph
-            graph.add((uri, utils.namespaces.DWC.collectionCode, rdflib.Literal(row["collectionCode"])))
+            graph.add((uri, utils.namespaces.DWC.collectionCode, utils.rdf.literal(row["collectionCode"])))
 
 
 # Helper Functions
@@ -1,7 +1,11 @@
 """Mapper implementation for the incidental occurrence delete v1 template."""
 
 # Standard library
+import csv
+import dataclasses
 import datetime
+import io
+import itertools
 
 # Third-Party
 import frictionless
@@ -13,13 +17,41 @@ from abis_mapping import plugins
 from abis_mapping import utils
 
 # Typing
-from typing import Any
+from typing import IO, Any, Literal
 
 
 # Constants and Shortcuts
 # These constants are specific to this template, and as such are defined here
 # rather than in a common `utils` module.
 a = rdflib.RDF.type
+# Number of records per SPARQL Update DELETE operation when streaming deletions
+SPARQL_BATCH_SIZE = 1000
+
+# Literals
+LITERAL_TO_BE_DELETED = rdflib.Literal("to be deleted")
+
+
+@dataclasses.dataclass
+class DeletionReport:
+    """Report of the rows streamed by `stream_deletions()`.
+
+    Row numbers are the same as in frictionless reports, i.e. the header is row 1.
+
+    Attributes:
+        records: Number of records written to the output.
+        blank_rows: Row numbers with a blank providerRecordID, including
+            completely blank rows.
+        duplicate_rows: Row numbers with a providerRecordID already seen in a previous row.
+    """
+
+    records: int = 0
+    blank_rows: list[int] = dataclasses.field(default_factory=list)
+    duplicate_rows: list[int] = dataclasses.field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        """Whether there were no blank or duplicate providerRecordIDs."""
+        return not self.blank_rows and not self.duplicate_rows
 
 
 class IncidentalOccurrenceDeleteMapper(base.mapper.ABISMapper):
@@ -43,15 +75,11 @@ class IncidentalOccurrenceDeleteMapper(base.mapper.ABISMapper):
         schema = self.regular_fields_schema()
 
         # Construct Resource
-        resource = frictionless.Resource(
-            source=data,
-            format="csv",  # TODO -> Hardcoded to csv for now
-            schema=schema,
-            encoding="utf-8",
-        )
+        resource = base.resources.create_resource(data, schema=schema)
 
         # Validate
-        report: frictionless.Report = resource.validate(
+        report: frictionless.Report = self.validate_resource(
+            resource,
             checklist=frictionless.Checklist(
                 checks=[
                     # Extra Custom Checks
@@ -115,7 +143,106 @@ class IncidentalOccurrenceDeleteMapper(base.mapper.ABISMapper):
         # Add to graph
         graph.add((biodiversity_record_iri, a, utils.namespaces.ABIS.BiodiversityRecord))
         graph.add((biodiversity_record_iri, rdflib.SDO.isPartOf, dataset))
-        graph.add((biodiversity_record_iri, rdflib.RDFS.comment, rdflib.Literal("to be deleted")))
+        graph.add((biodiversity_record_iri, rdflib.RDFS.comment, LITERAL_TO_BE_DELETED))
+
+    def stream_deletions(
+        self,
+        *,
+        data: bytes | IO[bytes],
+        output: IO[bytes],
+        dataset_iri: rdflib.URIRef,
+        base_iri: rdflib.Namespace,
+        output_format: Literal["nt", "sparql"] = "nt",
+    ) -> DeletionReport:
+        """Streams the records to be deleted from raw data straight to the output.
+
+        This is a fast path for large deletion files, which bypasses frictionless
+        and rdflib. Only the providerRecordID column is read, rows are checked for
+        blank and duplicate IDs in the same pass, and the output is written without
+        building a graph.
+
+        With the "nt" format, the output is the same triples as `apply_mapping()`
+        without a submission IRI, as N-Triples. With the "sparql" format, the output is SPARQL Update operations
+        that delete all the triples of the records in the dataset, in batches of
+        `SPARQL_BATCH_SIZE` records.
+
+        Args:
+            data: Raw CSV data.
+            output: Binary file object to write to.
+            dataset_iri: IRI of the Dataset the records are part of.
+            base_iri: Namespace used to generate the record IRIs.
+            output_format: Output format, "nt" or "sparql".
+
+        Returns:
+            Report of the records written, and the rows with blank or duplicate IDs,
+                which are not written.
+
+        Raises:
+            ValueError: If the data has no providerRecordID column.
+        """
+        # Records IRIs are the prefix followed by the url-quoted providerRecordID
+        record_prefix = str(utils.iri_patterns.biodiversity_record_iri(base_iri, ""))
+        dataset_nt = dataset_iri.n3()
+        report = DeletionReport()
+
+        # The output for each record is these pieces joined by its quoted providerRecordID.
+        # N-Triples of each record, or one IRI per record for SPARQL.
+        if output_format == "nt":
+            output.write(f"{dataset_nt} {a.n3()} {rdflib.SDO.Dataset.n3()} .\n".encode("utf-8"))
+            record_pieces = [
+                f"<{record_prefix}",
+                f"> {a.n3()} {utils.namespaces.ABIS.BiodiversityRecord.n3()} .\n<{record_prefix}",
+                f"> {rdflib.SDO.isPartOf.n3()} {dataset_nt} .\n<{record_prefix}",
+                f"> {rdflib.RDFS.comment.n3()} {LITERAL_TO_BE_DELETED.n3()} .\n",
+            ]
+        else:
+            record_pieces = [f"    <{record_prefix}", ">\n"]
+
+        # Read the providerRecordID column as text
+        stream = io.BytesIO(data) if isinstance(data, bytes) else data
+        text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+        try:
+            reader = csv.reader(text)
+            header = next(reader, [])
+            try:
+                column = header.index("providerRecordID")
+            except ValueError:
+                raise ValueError("Data has no providerRecordID column") from None
+
+            # Write the records in batches
+            seen: set[str] = set()
+            rows = enumerate(reader, start=2)
+            while batch := list(itertools.islice(rows, SPARQL_BATCH_SIZE)):
+                lines: list[str] = []
+                for row_number, row in batch:
+                    # Completely blank rows are errors in frictionless too, so are reported as blank IDs
+                    provider_record_id = row[column] if column < len(row) else ""
+                    if not provider_record_id:
+                        report.blank_rows.append(row_number)
+                        continue
+                    if provider_record_id in seen:
+                        report.duplicate_rows.append(row_number)
+                        continue
+                    seen.add(provider_record_id)
+                    # Skip the (cached) quoting function for the common case of IDs that are unchanged by it
+                    if provider_record_id.rstrip(utils.rdf.UNRESERVED_CHARS):
+                        provider_record_id = utils.rdf.quote_for_uri(provider_record_id)
+                    lines.append(provider_record_id.join(record_pieces))
+                if not lines:
+                    continue
+                report.records += len(lines)
+                if output_format == "sparql":
+                    lines.insert(0, "DELETE { ?record ?p ?o }\nWHERE {\n  VALUES ?record {\n")
+                    lines.append(
+                        f"  }}\n  ?record {rdflib.SDO.isPartOf.n3()} {dataset_nt} .\n  ?record ?p ?o .\n}} ;\n"
+                    )
+                output.write("".join(lines).encode("utf-8"))
+        finally:
+            # Leave closing the data to its owner
+            text.detach()
+
+        # Return
+        return report
 
 
 # Register mapper
@@ -29,6 +29,9 @@ CONCEPT_TARGET_TAXONOMIC_SCOPE = rdflib.URIRef(
     "https://linked.data.gov.au/def/nrm/7ea12fed-6b87-4c20-9ab4-600b32ce15ec",
 )
 
+# Literals
+LITERAL_SURVEY_ID_SOURCE = rdflib.Literal("surveyID source")
+
 
 # Dataclass used in mapping
 @dataclasses.dataclass
@@ -71,15 +74,11 @@ class SurveyMetadataMapper(base.mapper.ABISMapper):
         )
 
         # Construct Resource
-        resource = frictionless.Resource(
-            source=data,
-            format="csv",  # TODO -> Hardcoded to csv for now
-            schema=schema,
-            encoding="utf-8",
-        )
+        resource = base.resources.create_resource(data, schema=schema)
 
         # Validate
-        report: frictionless.Report = resource.validate(
+        report: frictionless.Report = self.validate_resource(
+            resource,
             checklist=frictionless.Checklist(
                 checks=[
                     # Extra Custom Checks
@@ -116,27 +115,22 @@ class SurveyMetadataMapper(base.mapper.ABISMapper):
         Returns:
             The set of surveyID values, as a dict.
         """
-        # Construct schema
-        schema = self.regular_fields_schema()
-
-        # Construct resource
-        resource = frictionless.Resource(
-            source=data,
-            format="csv",
-            schema=schema,
-            encoding="utf-8",
-        )
+        return self.extract_keys(data, self.survey_id_key)
 
-        survey_ids: dict[str, Literal[True]] = {}
+    def survey_id_key(
+        self,
+        row: frictionless.Row,
+    ) -> tuple[str, Literal[True]] | None:
+        """Extracts the surveyID of a row, for `extract_survey_id_set()`.
 
-        # Iterate over rows to extract values
-        with resource.open() as r:
-            for row in r.row_stream:
-                survey_id: str | None = row["surveyID"]
-                if survey_id:
-                    survey_ids[survey_id] = True
+        Args:
+            row: Row of the data.
 
-        return survey_ids
+        Returns:
+            The surveyID, or None if the row has none.
+        """
+        survey_id: str | None = row["surveyID"]
+        return (survey_id, True) if survey_id else None
 
     def apply_mapping_row(
         self,
@@ -455,8 +449,8 @@ class SurveyMetadataMapper(base.mapper.ABISMapper):
             # Attach to dataset
             graph.add((uri, rdflib.SDO.isPartOf, dataset))
             # Add project name and identifier
-            graph.add((uri, rdflib.SDO.name, rdflib.Literal(project_name)))
-            graph.add((uri, rdflib.SDO.identifier, rdflib.Literal(project_id)))
+            graph.add((uri, rdflib.SDO.name, utils.rdf.literal(project_name)))
+            graph.add((uri, rdflib.SDO.identifier, utils.rdf.literal(project_id)))
 
     def add_survey(
         self,
@@ -486,7 +480,7 @@ class SurveyMetadataMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         # Add survey name
-        graph.add((uri, rdflib.SDO.name, rdflib.Literal(row["surveyName"])))
+        graph.add((uri, rdflib.SDO.name, utils.rdf.literal(row["surveyName"])))
 
         # Add survey ID
         survey_id: str = row["surveyID"]
@@ -497,17 +491,17 @@ class SurveyMetadataMapper(base.mapper.ABISMapper):
 
         # Add survey id as type string if no organisation provided
         if len(survey_org_objects) == 0:
-            id_literal = rdflib.Literal(survey_id)
+            id_literal = utils.rdf.literal(survey_id)
             graph.add((uri, rdflib.SDO.identifier, id_literal))
 
         # Add taxonomic coverage
         if taxonomic_coverage := row["targetTaxonomicScope"]:
             for taxa in taxonomic_coverage:
-                graph.add((uri, utils.namespaces.BDR.target, rdflib.Literal(taxa)))
+                graph.add((uri, utils.namespaces.BDR.target, utils.rdf.literal(taxa)))
 
         # Add purpose
         if purpose := row["surveyPurpose"]:
-            graph.add((uri, utils.namespaces.BDR.purpose, rdflib.Literal(purpose)))
+            graph.add((uri, utils.namespaces.BDR.purpose, utils.rdf.literal(purpose)))
 
         # Add plan
         if survey_plan:
@@ -516,7 +510,7 @@ class SurveyMetadataMapper(base.mapper.ABISMapper):
         # Add keywords
         if keywords := row["keywords"]:
             for keyword in keywords:
-                graph.add((uri, rdflib.SDO.keywords, rdflib.Literal(keyword)))
+                graph.add((uri, rdflib.SDO.keywords, utils.rdf.literal(keyword)))
 
     def add_spatial_coverage(
         self,
@@ -545,7 +539,7 @@ class SurveyMetadataMapper(base.mapper.ABISMapper):
         )
 
         # Add spatial coverage
-        geometry_node = rdflib.BNode()
+        geometry_node = utils.bnodes.bnode("geometry_node")
         graph.add((uri, rdflib.SDO.spatial, geometry_node))
         graph.add((geometry_node, a, utils.namespaces.GEO.Geometry))
         graph.add((geometry_node, utils.namespaces.GEO.asWKT, geometry.to_transformed_crs_rdf_literal()))
@@ -576,17 +570,17 @@ class SurveyMetadataMapper(base.mapper.ABISMapper):
         end_date: models.temporal.Timestamp | None = row["surveyEnd"]
 
         # Create temporal coverage node
-        temporal_coverage = rdflib.BNode()
+        temporal_coverage = utils.bnodes.bnode("temporal_coverage")
         # If both dates supplied, use an TemporalEntity with start/end
         if end_date is not None:
             graph.add((temporal_coverage, a, rdflib.TIME.TemporalEntity))
             # Start instant
-            begin = rdflib.BNode()
+            begin = utils.bnodes.bnode("begin")
             graph.add((temporal_coverage, rdflib.TIME.hasBeginning, begin))
             graph.add((begin, a, rdflib.TIME.Instant))
             graph.add((begin, start_date.rdf_in_xsd, start_date.to_rdf_literal()))
             # End instant
-            end = rdflib.BNode()
+            end = utils.bnodes.bnode("end")
             graph.add((temporal_coverage, rdflib.TIME.hasEnd, end))
             graph.add((end, a, rdflib.TIME.Instant))
             graph.add((end, end_date.rdf_in_xsd, end_date.to_rdf_literal()))
@@ -615,7 +609,7 @@ class SurveyMetadataMapper(base.mapper.ABISMapper):
         graph.add((uri, a, rdflib.RDFS.Datatype))
 
         # Add label
-        graph.add((uri, rdflib.SKOS.prefLabel, rdflib.Literal("surveyID source")))
+        graph.add((uri, rdflib.SKOS.prefLabel, LITERAL_SURVEY_ID_SOURCE))
         # Add attribution
         graph.add((uri, rdflib.PROV.qualifiedAttribution, attribution))
 
@@ -676,11 +670,11 @@ class SurveyMetadataMapper(base.mapper.ABISMapper):
         # Add citation(s)
         if citations := row["surveyMethodCitation"]:
             for citation in citations:
-                graph.add((uri, rdflib.SDO.citation, rdflib.Literal(citation)))
+                graph.add((uri, rdflib.SDO.citation, utils.rdf.literal(citation)))
 
         # Add description
         if description := row["surveyMethodDescription"]:
-            graph.add((uri, rdflib.SDO.description, rdflib.Literal(description)))
+            graph.add((uri, rdflib.SDO.description, utils.rdf.literal(description)))
 
         # Add method url(s)
         if method_urls := row["surveyMethodURL"]:
@@ -725,7 +719,7 @@ class SurveyMetadataMapper(base.mapper.ABISMapper):
 
         # Add value
         if row_survey_type:
-            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(row_survey_type)))
+            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(row_survey_type)))
         if survey_type_value:
             graph.add((uri, utils.namespaces.TERN.hasValue, survey_type_value))
 
@@ -756,7 +750,7 @@ class SurveyMetadataMapper(base.mapper.ABISMapper):
 
         if row_survey_type:
             # Add label
-            graph.add((uri, rdflib.RDFS.label, rdflib.Literal(row_survey_type)))
+            graph.add((uri, rdflib.RDFS.label, utils.rdf.literal(row_survey_type)))
 
             # Retrieve vocab for field
             vocab = self.fields()["surveyType"].get_flexible_vocab()
@@ -799,7 +793,7 @@ class SurveyMetadataMapper(base.mapper.ABISMapper):
                 (
                     uri,
                     rdflib.SDO.name,
-                    rdflib.Literal(f"Survey Collection - Survey Type - {row_survey_type}"),
+                    utils.rdf.literal(f"Survey Collection - Survey Type - {row_survey_type}"),
                 )
             )
         # Add link to dataset
@@ -846,7 +840,7 @@ class SurveyMetadataMapper(base.mapper.ABISMapper):
         graph.add((uri, utils.namespaces.TERN.attribute, CONCEPT_TARGET_HABITAT_SCOPE))
 
         # Add value
-        graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(raw_value)))
+        graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(raw_value)))
         graph.add((uri, utils.namespaces.TERN.hasValue, target_habitat_value))
 
     def add_target_habitat_value(
@@ -871,7 +865,7 @@ class SurveyMetadataMapper(base.mapper.ABISMapper):
         graph.add((uri, a, utils.namespaces.TERN.Value))
 
         # Add label
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal(raw_value)))
+        graph.add((uri, rdflib.RDFS.label, utils.rdf.literal(raw_value)))
 
         # Retrieve vocab for field
         vocab = self.fields()["targetHabitatScope"].get_flexible_vocab()
@@ -909,7 +903,7 @@ class SurveyMetadataMapper(base.mapper.ABISMapper):
             (
                 uri,
                 rdflib.SDO.name,
-                rdflib.Literal(f"Survey Collection - Target Habitat Scope - {raw_value}"),
+                utils.rdf.literal(f"Survey Collection - Target Habitat Scope - {raw_value}"),
             )
         )
         # Add link to dataset
@@ -956,7 +950,7 @@ class SurveyMetadataMapper(base.mapper.ABISMapper):
         graph.add((uri, utils.namespaces.TERN.attribute, CONCEPT_TARGET_TAXONOMIC_SCOPE))
 
         # Add values
-        graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(raw_value)))
+        graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(raw_value)))
         graph.add((uri, utils.namespaces.TERN.hasValue, target_taxon_value))
 
     def add_target_taxonomic_value(
@@ -981,7 +975,7 @@ class SurveyMetadataMapper(base.mapper.ABISMapper):
         graph.add((uri, a, utils.namespaces.TERN.Value))
 
         # Add label
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal(raw_value)))
+        graph.add((uri, rdflib.RDFS.label, utils.rdf.literal(raw_value)))
 
         # Retrieve vocab for field
         vocab = self.fields()["targetTaxonomicScope"].get_flexible_vocab()
@@ -1019,7 +1013,7 @@ class SurveyMetadataMapper(base.mapper.ABISMapper):
             (
                 uri,
                 rdflib.SDO.name,
-                rdflib.Literal(f"Survey Collection - Target Taxonomic Scope - {raw_value}"),
+                utils.rdf.literal(f"Survey Collection - Target Taxonomic Scope - {raw_value}"),
             )
         )
         # Add link to dataset
@@ -87,6 +87,42 @@ CONCEPT_UNSPECIFIED_METHOD = rdflib.URIRef("http://linked.data.gov.au/def/tern-c
 DATA_ROLE_RESOURCE_PROVIDER = rdflib.URIRef("https://linked.data.gov.au/def/data-roles/resourceProvider")
 DATA_ROLE_OWNER = rdflib.URIRef("https://linked.data.gov.au/def/data-roles/owner")
 
+# Literals
+LITERAL_ACCEPTED_NAME_USAGE_OBSERVATION = rdflib.Literal("acceptedNameUsage-observation")
+LITERAL_ACCEPTED_NAME_USAGE_VALUE = rdflib.Literal("acceptedNameUsage-value")
+LITERAL_CATALOG_NUMBER_DEFINITION = rdflib.Literal("A catalog number for the sample")
+LITERAL_ESTABLISHMENT_MEANS_OBSERVATION = rdflib.Literal("establishmentMeans-observation")
+LITERAL_ESTABLISHMENT_MEANS_VALUE = rdflib.Literal("establishmentMeans-value")
+LITERAL_EVENT_DATE_START_PROXY = rdflib.Literal("Date unknown, template eventDateStart used as proxy")
+LITERAL_FIELD_SAMPLING_LOCATION_PROXY = rdflib.Literal("Location unknown, location of field sampling used as proxy")
+LITERAL_INDIVIDUAL_COUNT = rdflib.Literal("individual-count")
+LITERAL_INDIVIDUAL_COUNT_OBSERVATION = rdflib.Literal("individualCount-observation")
+LITERAL_LIFE_STAGE_OBSERVATION = rdflib.Literal("lifeStage-observation")
+LITERAL_LIFE_STAGE_VALUE = rdflib.Literal("lifeStage-value")
+LITERAL_OCCURRENCE_STATUS_OBSERVATION = rdflib.Literal("occurrenceStatus-observation")
+LITERAL_ORGANISM_QUANTITY = rdflib.Literal("organism-quantity")
+LITERAL_ORGANISM_QUANTITY_OBSERVATION = rdflib.Literal("organismQuantity-observation")
+LITERAL_ORGANISM_REMARKS = rdflib.Literal("organism-remarks")
+LITERAL_ORGANISM_REMARKS_OBSERVATION = rdflib.Literal("organismRemarks-observation")
+LITERAL_RECORD_ID_DEFINITION = rdflib.Literal("An identifier for the record")
+LITERAL_RECORD_NUMBER_DEFINITION = rdflib.Literal(
+    "The record number of the original observation from the original observer of the organism"
+)
+LITERAL_REPRODUCTIVE_CONDITION_OBSERVATION = rdflib.Literal("reproductiveCondition-observation")
+LITERAL_REPRODUCTIVE_CONDITION_VALUE = rdflib.Literal("reproductiveCondition-value")
+LITERAL_SCIENTIFIC_NAME = rdflib.Literal("scientificName")
+LITERAL_SCIENTIFIC_NAME_OBSERVATION = rdflib.Literal("scientificName-observation")
+LITERAL_SEQUENCE_RESULT = rdflib.Literal("sequence-result")
+LITERAL_SEQUENCING_SAMPLING = rdflib.Literal("sequencing-sampling")
+LITERAL_SEX_OBSERVATION = rdflib.Literal("sex-observation")
+LITERAL_SEX_VALUE = rdflib.Literal("sex-value")
+LITERAL_SITE_ID_DEFINITION = rdflib.Literal("An identifier for the site")
+LITERAL_SITE_VISIT_DATES_PROXY = rdflib.Literal("Date unknown, site visit dates used as proxy.")
+LITERAL_SPECIMEN_SAMPLE = rdflib.Literal("specimen-sample")
+LITERAL_SPECIMEN_SAMPLING = rdflib.Literal("specimen-sampling")
+LITERAL_THREAT_STATUS_OBSERVATION = rdflib.Literal("threatStatus-observation")
+LITERAL_VERBATIM_ID_OBSERVATION = rdflib.Literal("verbatimID-observation")
+
 
 class SurveyOccurrenceMapper(base.mapper.ABISMapper):
     """ABIS Mapper for `survey_occurrence_data.csv` v3"""
@@ -216,15 +252,10 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             )
 
         # Construct Resource (Table with Schema)
-        resource = frictionless.Resource(
-            source=data,
-            format="csv",  # TODO -> Hardcoded to csv for now
-            schema=schema,
-            encoding="utf-8",
-        )
+        resource = base.resources.create_resource(data, schema=schema)
 
         # Validate
-        report: frictionless.Report = resource.validate(checklist=checklist)
+        report: frictionless.Report = self.validate_resource(resource, checklist=checklist)
 
         # Return Validation Report
         return report
@@ -242,25 +273,22 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             dict[models.identifier.SiteIdentifier, bool]: Keys are the site id values encountered
                 in the data, values are all 'True',
         """
-        # Construct schema
-        schema = self.regular_fields_schema()
-
-        # Construct resource
-        resource = frictionless.Resource(
-            source=data,
-            format="csv",
-            schema=schema,
-            encoding="utf-8",
-        )
+        return self.extract_keys(data, self.site_id_key)
+
+    def site_id_key(
+        self,
+        row: frictionless.Row,
+    ) -> tuple[models.identifier.SiteIdentifier, bool] | None:
+        """Extracts the site id of a row, for `extract_site_id_keys()`.
+
+        Args:
+            row: Row of the data.
 
-        result: dict[models.identifier.SiteIdentifier, bool] = {}
-        # Iterate over rows to extract values
-        with resource.open() as r:
-            for row in r.row_stream:
-                site_identifier = models.identifier.SiteIdentifier.from_row(row)
-                if site_identifier:
-                    result[site_identifier] = True
-        return result
+        Returns:
+            The SiteIdentifier, or None if the row has none.
+        """
+        site_identifier = models.identifier.SiteIdentifier.from_row(row)
+        return (site_identifier, True) if site_identifier else None
 
     def extract_site_visit_id_keys(
         self,
@@ -275,21 +303,22 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             dict[str, bool]: Keys are the site visit id values encountered
                 in the data, values are all 'True',
         """
-        # Construct schema
-        schema = self.regular_fields_schema()
-
-        # Construct resource
-        resource = frictionless.Resource(
-            source=data,
-            format="csv",
-            schema=schema,
-            encoding="utf-8",
-        )
+        return self.extract_keys(data, self.site_visit_id_key)
+
+    def site_visit_id_key(
+        self,
+        row: frictionless.Row,
+    ) -> tuple[str, bool] | None:
+        """Extracts the site visit id of a row, for `extract_site_visit_id_keys()`.
+
+        Args:
+            row: Row of the data.
 
-        # Iterate over rows to extract values
-        with resource.open() as r:
-            # Construct dictionary and return
-            return {row["siteVisitID"]: True for row in r.row_stream if row["siteVisitID"]}
+        Returns:
+            The siteVisitID, or None if the row has none.
+        """
+        site_visit_id: str | None = row["siteVisitID"]
+        return (site_visit_id, True) if site_visit_id else None
 
     def apply_mapping_row(
         self,
@@ -1429,7 +1458,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
 
         # Add to Graph
         graph.add((uri, a, rdflib.PROV.Agent))
-        graph.add((uri, rdflib.SDO.name, rdflib.Literal(row["identifiedBy"])))
+        graph.add((uri, rdflib.SDO.name, utils.rdf.literal(row["identifiedBy"])))
 
     def add_provider_recorded(
         self,
@@ -1450,7 +1479,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
 
         # Add to Graph
         graph.add((uri, a, rdflib.PROV.Agent))
-        graph.add((uri, rdflib.SDO.name, rdflib.Literal(row["recordedBy"])))
+        graph.add((uri, rdflib.SDO.name, utils.rdf.literal(row["recordedBy"])))
 
     def add_default_temporal_entity(
         self,
@@ -1480,6 +1509,8 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
 
         # Create graph from supplied rdf
         temp_graph = rdflib.Graph().parse(data=site_visit_id_temporal_map[row["siteVisitID"]])
+        # Parsing creates random blank node IDs, relabel them if mapping deterministically
+        temp_graph = utils.bnodes.relabel(temp_graph, "site_visit_temporal_entity")
 
         # Obtain reference to subject node
         # First look for time: TemporalEntity, then fallback to time:Instant
@@ -1544,17 +1575,17 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("scientificName-observation")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_SCIENTIFIC_NAME_OBSERVATION))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, provider_record_id_occurrence))
         graph.add((uri, rdflib.SOSA.hasResult, scientific_name))
-        graph.add((uri, rdflib.SOSA.hasSimpleResult, rdflib.Literal(row["scientificName"])))
+        graph.add((uri, rdflib.SOSA.hasSimpleResult, utils.rdf.literal(row["scientificName"])))
         graph.add((uri, rdflib.SOSA.observedProperty, CONCEPT_SCIENTIFIC_NAME))
 
         # Check for date provided within given template
         # Declare temporal entity
         temporal_entity: rdflib.term.Node | None = None
         if date_identified is not None:
-            temporal_entity = rdflib.BNode()
+            temporal_entity = utils.bnodes.bnode("temporal_entity")
             graph.add((uri, rdflib.SDO.temporal, temporal_entity))
             graph.add((temporal_entity, a, rdflib.TIME.Instant))
             graph.add((temporal_entity, date_identified.rdf_in_xsd, date_identified.to_rdf_literal()))
@@ -1562,8 +1593,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             # Check for which date provided
             if not row["dateIdentified"] and row["eventDateStart"]:
                 # Add comment to temporal entity
-                comment = "Date unknown, template eventDateStart used as proxy"
-                graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+                graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_EVENT_DATE_START_PROXY))
         else:
             # Add default temporal entity from map
             temporal_entity = self.add_default_temporal_entity(
@@ -1574,8 +1604,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             )
             # Add comment to temporal entity
             if temporal_entity is not None:
-                comment = "Date unknown, site visit dates used as proxy."
-                graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+                graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_SITE_VISIT_DATES_PROXY))
 
         # Check for identifiedBy
         if provider:
@@ -1636,17 +1665,17 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("verbatimID-observation")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_VERBATIM_ID_OBSERVATION))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, foi))
         graph.add((uri, rdflib.SOSA.hasResult, verbatim_id))
-        graph.add((uri, rdflib.SOSA.hasSimpleResult, rdflib.Literal(row["verbatimIdentification"])))
+        graph.add((uri, rdflib.SOSA.hasSimpleResult, utils.rdf.literal(row["verbatimIdentification"])))
         graph.add((uri, rdflib.SOSA.observedProperty, CONCEPT_TAXON))
 
         # Declare temporal entity allowing for correct type assignments
         temporal_entity: rdflib.term.Node | None = None
         # Check to see if date provided from own template
         if date_identified is not None:
-            temporal_entity = rdflib.BNode()
+            temporal_entity = utils.bnodes.bnode("temporal_entity")
             graph.add((uri, rdflib.SDO.temporal, temporal_entity))
             graph.add((temporal_entity, a, rdflib.TIME.Instant))
             graph.add((temporal_entity, date_identified.rdf_in_xsd, date_identified.to_rdf_literal()))
@@ -1654,8 +1683,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             # Check for dateIdentified
             if not row["dateIdentified"]:
                 # Add comment to temporal entity
-                comment = "Date unknown, template eventDateStart used as proxy"
-                graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+                graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_EVENT_DATE_START_PROXY))
         else:
             # Add default temporal entity from map
             temporal_entity = self.add_default_temporal_entity(
@@ -1666,8 +1694,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             )
             # Add comment to temporal entity
             if temporal_entity is not None:
-                comment = "Date unknown, site visit dates used as proxy."
-                graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+                graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_SITE_VISIT_DATES_PROXY))
 
         # Check for identifiedBy
         if provider:
@@ -1694,7 +1721,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((uri, a, rdflib.PROV.Agent))
 
         # Add name
-        graph.add((uri, rdflib.SDO.name, rdflib.Literal(row["recordedBy"])))
+        graph.add((uri, rdflib.SDO.name, utils.rdf.literal(row["recordedBy"])))
 
     def add_record_id_datatype(
         self,
@@ -1715,12 +1742,16 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_record_id_datatype", uri, attribution, value):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.RDFS.Datatype))
 
         # Add label
-        graph.add((uri, rdflib.SKOS.prefLabel, rdflib.Literal(f"{value} recordID")))
-        graph.add((uri, rdflib.SKOS.definition, rdflib.Literal("An identifier for the record")))
+        graph.add((uri, rdflib.SKOS.prefLabel, utils.rdf.literal(f"{value} recordID")))
+        graph.add((uri, rdflib.SKOS.definition, LITERAL_RECORD_ID_DEFINITION))
 
         # Add attribution
         if attribution is not None:
@@ -1745,6 +1776,10 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_attribution", uri, provider, provider_role_type):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.PROV.Attribution))
 
@@ -1769,11 +1804,15 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_owner_record_id_provider", uri, row["ownerRecordIDSource"]):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.PROV.Agent))
 
         # Add name
-        graph.add((uri, rdflib.SDO.name, rdflib.Literal(row["ownerRecordIDSource"])))
+        graph.add((uri, rdflib.SDO.name, utils.rdf.literal(row["ownerRecordIDSource"])))
 
     def add_provider_record_id_agent(
         self,
@@ -1787,11 +1826,15 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             row (frictionless.Row): Raw data.
             graph (rdflib.Graph): Graph to be modified.
         """
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_provider_record_id_agent", uri, row["providerRecordIDSource"]):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.PROV.Agent))
 
         # Add name
-        graph.add((uri, rdflib.SDO.name, rdflib.Literal(row["providerRecordIDSource"])))
+        graph.add((uri, rdflib.SDO.name, utils.rdf.literal(row["providerRecordIDSource"])))
 
     def add_id_qualifier_attribute(
         self,
@@ -1816,6 +1859,10 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_id_qualifier_attribute", uri, id_qualifier, id_qualifier_value):
+            return
+
         # Identification Qualifier Attribute
         graph.add((uri, a, utils.namespaces.TERN.Attribute))
         if submission_iri:
@@ -1824,7 +1871,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
         graph.add((uri, utils.namespaces.TERN.attribute, CONCEPT_IDENTIFICATION_QUALIFIER))
         if id_qualifier:
-            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(id_qualifier)))
+            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(id_qualifier)))
         if id_qualifier_value:
             graph.add((uri, utils.namespaces.TERN.hasValue, id_qualifier_value))
 
@@ -1850,12 +1897,16 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_id_qualifier_value", uri, id_qualifier):
+            return
+
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
 
         if id_qualifier:
             # Add label
-            graph.add((uri, rdflib.RDFS.label, rdflib.Literal(id_qualifier)))
+            graph.add((uri, rdflib.RDFS.label, utils.rdf.literal(id_qualifier)))
 
             # Retrieve vocab for field
             vocab = self.fields()["identificationQualifier"].get_flexible_vocab()
@@ -1889,6 +1940,13 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Add link to the scientific name observation node
+        graph.add((uri, rdflib.SDO.hasPart, observation_scientific_name))
+
+        # The rest of the Collection is shared by every row, so only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_id_qualifier_collection", uri, id_qualifier, id_qualifier_attribute):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.SDO.Collection))
         if submission_iri:
@@ -1900,13 +1958,11 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
                 (
                     uri,
                     rdflib.SDO.name,
-                    rdflib.Literal(f"Occurrence Collection - Identification Qualifier - {id_qualifier}"),
+                    utils.rdf.literal(f"Occurrence Collection - Identification Qualifier - {id_qualifier}"),
                 )
             )
         # Add link to dataset
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        # add link to the scientific name observation node
-        graph.add((uri, rdflib.SDO.hasPart, observation_scientific_name))
         # Add link to attribute
         if id_qualifier_attribute:
             graph.add((uri, utils.namespaces.TERN.hasAttribute, id_qualifier_attribute))
@@ -1934,6 +1990,10 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_id_remarks_attribute", uri, id_remarks, id_remarks_value):
+            return
+
         # Identification Remarks Attribute
         graph.add((uri, a, utils.namespaces.TERN.Attribute))
         if submission_iri:
@@ -1942,7 +2002,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
         graph.add((uri, utils.namespaces.TERN.attribute, CONCEPT_ID_REMARKS))
         if id_remarks:
-            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(id_remarks)))
+            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(id_remarks)))
         if id_remarks_value:
             graph.add((uri, utils.namespaces.TERN.hasValue, id_remarks_value))
 
@@ -1964,10 +2024,14 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_id_remarks_value", uri, id_remarks):
+            return
+
         # Identification Remarks Value
         graph.add((uri, a, utils.namespaces.TERN.Text))
         graph.add((uri, a, utils.namespaces.TERN.Value))
-        graph.add((uri, rdflib.RDF.value, rdflib.Literal(id_remarks)))
+        graph.add((uri, rdflib.RDF.value, utils.rdf.literal(id_remarks)))
 
     def add_id_remarks_collection(
         self,
@@ -1993,6 +2057,13 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Add link to the scientific name observation node
+        graph.add((uri, rdflib.SDO.hasPart, observation_scientific_name))
+
+        # The rest of the Collection is shared by every row, so only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_id_remarks_collection", uri, id_remarks, id_remarks_attribute):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.SDO.Collection))
         if submission_iri:
@@ -2004,13 +2075,11 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
                 (
                     uri,
                     rdflib.SDO.name,
-                    rdflib.Literal(f"Occurrence Collection - Identification Remarks - {id_remarks}"),
+                    utils.rdf.literal(f"Occurrence Collection - Identification Remarks - {id_remarks}"),
                 )
             )
         # Add link to dataset
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        # add link to the scientific name observation node
-        graph.add((uri, rdflib.SDO.hasPart, observation_scientific_name))
         # Add link to attribute
         if id_remarks_attribute:
             graph.add((uri, utils.namespaces.TERN.hasAttribute, id_remarks_attribute))
@@ -2039,9 +2108,9 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if submission_iri:
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal("scientificName")))
+        graph.add((uri, rdflib.RDFS.label, LITERAL_SCIENTIFIC_NAME))
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDF.value, rdflib.Literal(row["scientificName"])))
+        graph.add((uri, rdflib.RDF.value, utils.rdf.literal(row["scientificName"])))
         graph.add((uri, utils.namespaces.TERN.featureType, CONCEPT_SCIENTIFIC_NAME))
 
     def add_catalog_number_datatype(
@@ -2062,15 +2131,19 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_catalog_number_datatype", uri, provider, value):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.RDFS.Datatype))
 
         # Add label
         if value is not None:
-            graph.add((uri, rdflib.SKOS.prefLabel, rdflib.Literal(f"{value} catalogNumber")))
+            graph.add((uri, rdflib.SKOS.prefLabel, utils.rdf.literal(f"{value} catalogNumber")))
 
         # Add definition
-        graph.add((uri, rdflib.SKOS.definition, rdflib.Literal("A catalog number for the sample")))
+        graph.add((uri, rdflib.SKOS.definition, LITERAL_CATALOG_NUMBER_DEFINITION))
 
         # Add attribution
         if provider is not None:
@@ -2092,11 +2165,15 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_catalog_number_provider", uri, row["catalogNumberSource"]):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.PROV.Agent))
 
         # Add name
-        graph.add((uri, rdflib.SDO.name, rdflib.Literal(row["catalogNumberSource"])))
+        graph.add((uri, rdflib.SDO.name, utils.rdf.literal(row["catalogNumberSource"])))
 
     def add_other_catalog_numbers_provider(
         self,
@@ -2114,11 +2191,15 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_other_catalog_numbers_provider", uri, row["otherCatalogNumbersSource"]):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.PROV.Agent))
 
         # Add name
-        graph.add((uri, rdflib.SDO.name, rdflib.Literal(row["otherCatalogNumbersSource"])))
+        graph.add((uri, rdflib.SDO.name, utils.rdf.literal(row["otherCatalogNumbersSource"])))
 
     def add_sampling_specimen(
         self,
@@ -2161,7 +2242,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("specimen-sampling")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_SPECIMEN_SAMPLING))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, provider_record_id_occurrence))
         graph.add((uri, rdflib.SOSA.hasResult, sample_specimen))
         graph.add((uri, rdflib.SOSA.usedProcedure, CONCEPT_UNSPECIFIED_METHOD))
@@ -2170,15 +2251,14 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         temporal_entity: rdflib.term.Node | None = None
         # Check to see date already found
         if timestamp is not None:
-            temporal_entity = rdflib.BNode()
+            temporal_entity = utils.bnodes.bnode("temporal_entity")
             graph.add((uri, rdflib.SDO.temporal, temporal_entity))
             graph.add((temporal_entity, a, rdflib.TIME.Instant))
             graph.add((temporal_entity, timestamp.rdf_in_xsd, timestamp.to_rdf_literal()))
             # Check for preparedDate
             if not row["preparedDate"]:
                 # Add comment to temporal entity
-                temporal_comment = "Date unknown, template eventDateStart used as proxy"
-                graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(temporal_comment)))
+                graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_EVENT_DATE_START_PROXY))
         else:
             # Use default rdf from site visit as temporal entity
             temporal_entity = self.add_default_temporal_entity(
@@ -2189,12 +2269,11 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             )
             # Add comment to temporal entity
             if temporal_entity is not None:
-                comment = "Date unknown, site visit dates used as proxy."
-                graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+                graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_SITE_VISIT_DATES_PROXY))
 
         # Add geometry
         if geometry:
-            geometry_node = rdflib.BNode()
+            geometry_node = utils.bnodes.bnode("geometry_node")
             graph.add((uri, rdflib.SDO.spatial, geometry_node))
             graph.add((geometry_node, a, utils.namespaces.GEO.Geometry))
             graph.add((geometry_node, utils.namespaces.GEO.asWKT, geometry.to_transformed_crs_rdf_literal()))
@@ -2208,8 +2287,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             )
 
             # Add comment to geometry
-            spatial_comment = "Location unknown, location of field sampling used as proxy"
-            graph.add((geometry_node, rdflib.RDFS.comment, rdflib.Literal(spatial_comment)))
+            graph.add((geometry_node, rdflib.RDFS.comment, LITERAL_FIELD_SAMPLING_LOCATION_PROXY))
 
         # Check for coordinateUncertaintyInMeters
         if row["coordinateUncertaintyInMeters"]:
@@ -2237,7 +2315,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         # Add to Graph
         graph.add((uri, a, utils.namespaces.TERN.Text))
         graph.add((uri, a, utils.namespaces.TERN.Value))
-        graph.add((uri, rdflib.RDF.value, rdflib.Literal(row["verbatimIdentification"])))
+        graph.add((uri, rdflib.RDF.value, utils.rdf.literal(row["verbatimIdentification"])))
 
     def add_record_number_datatype(
         self,
@@ -2268,16 +2346,14 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
 
         # Add label
         if recorded_by := row["recordedBy"]:
-            graph.add((uri, rdflib.SKOS.prefLabel, rdflib.Literal(f"{recorded_by} recordNumber")))
+            graph.add((uri, rdflib.SKOS.prefLabel, utils.rdf.literal(f"{recorded_by} recordNumber")))
 
         # Add definition
         graph.add(
             (
                 uri,
                 rdflib.SKOS.definition,
-                rdflib.Literal(
-                    "The record number of the original observation from the original observer of the organism"
-                ),
+                LITERAL_RECORD_NUMBER_DEFINITION,
             )
         )
 
@@ -2326,7 +2402,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
 
         graph.add((uri, a, utils.namespaces.TERN.Sample))
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("specimen-sample")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_SPECIMEN_SAMPLE))
         graph.add((uri, rdflib.SOSA.isResultOf, sampling_specimen))
         graph.add((uri, rdflib.SOSA.isSampleOf, provider_record_id_occurrence))
         graph.add((uri, utils.namespaces.TERN.featureType, term))
@@ -2353,6 +2429,16 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(
+            graph,
+            "add_data_generalizations_attribute",
+            uri,
+            data_generalizations,
+            data_generalizations_value,
+        ):
+            return
+
         # Data Generalizations Attribute
         graph.add((uri, a, utils.namespaces.TERN.Attribute))
         if submission_iri:
@@ -2361,7 +2447,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
         graph.add((uri, utils.namespaces.TERN.attribute, CONCEPT_DATA_GENERALIZATIONS))
         if data_generalizations:
-            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(data_generalizations)))
+            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(data_generalizations)))
         if data_generalizations_value is not None:
             graph.add((uri, utils.namespaces.TERN.hasValue, data_generalizations_value))
 
@@ -2382,10 +2468,14 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_data_generalizations_value", uri, data_generalizations):
+            return
+
         # Data Generalizations Value
         graph.add((uri, a, utils.namespaces.TERN.Text))
         graph.add((uri, a, utils.namespaces.TERN.Value))
-        graph.add((uri, rdflib.RDF.value, rdflib.Literal(data_generalizations)))
+        graph.add((uri, rdflib.RDF.value, utils.rdf.literal(data_generalizations)))
 
     def add_data_generalizations_collection(
         self,
@@ -2412,6 +2502,19 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Add link to the sample field
+        graph.add((uri, rdflib.SDO.hasPart, provider_record_id_occurrence))
+
+        # The rest of the Collection is shared by every row, so only needs adding once per chunk
+        if self.added_in_chunk(
+            graph,
+            "add_data_generalizations_collection",
+            uri,
+            data_generalizations,
+            data_generalizations_attribute,
+        ):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.SDO.Collection))
         if submission_iri:
@@ -2423,15 +2526,13 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
                 (
                     uri,
                     rdflib.SDO.name,
-                    rdflib.Literal(
+                    utils.rdf.literal(
                         f"Occurrence Collection - Data Generalizations - {data_generalizations}",
                     ),
                 )
             )
         # Add link to dataset
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        # add link to the sample field
-        graph.add((uri, rdflib.SDO.hasPart, provider_record_id_occurrence))
         # Add link to attribute
         if data_generalizations_attribute:
             graph.add((uri, utils.namespaces.TERN.hasAttribute, data_generalizations_attribute))
@@ -2459,6 +2560,10 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_taxon_rank_attribute", uri, taxon_rank, taxon_rank_value):
+            return
+
         # Taxon Rank Attribute
         graph.add((uri, a, utils.namespaces.TERN.Attribute))
         if submission_iri:
@@ -2467,7 +2572,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
         graph.add((uri, utils.namespaces.TERN.attribute, CONCEPT_TAXON_RANK))
         if taxon_rank:
-            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(taxon_rank)))
+            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(taxon_rank)))
         if taxon_rank_value:
             graph.add((uri, utils.namespaces.TERN.hasValue, taxon_rank_value))
 
@@ -2493,12 +2598,16 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_taxon_rank_value", uri, taxon_rank):
+            return
+
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
 
         if taxon_rank:
             # Add label
-            graph.add((uri, rdflib.RDFS.label, rdflib.Literal(taxon_rank)))
+            graph.add((uri, rdflib.RDFS.label, utils.rdf.literal(taxon_rank)))
 
             # Retrieve vocab for field
             vocab = self.fields()["taxonRank"].get_flexible_vocab()
@@ -2532,6 +2641,13 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Add link to the scientific name observation node
+        graph.add((uri, rdflib.SDO.hasPart, observation_scientific_name))
+
+        # The rest of the Collection is shared by every row, so only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_taxon_rank_collection", uri, taxon_rank, taxon_rank_attribute):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.SDO.Collection))
         if submission_iri:
@@ -2543,13 +2659,11 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
                 (
                     uri,
                     rdflib.SDO.name,
-                    rdflib.Literal(f"Occurrence Collection - Taxon Rank - {taxon_rank}"),
+                    utils.rdf.literal(f"Occurrence Collection - Taxon Rank - {taxon_rank}"),
                 )
             )
         # Add link to dataset
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        # add link to the scientific name observation node
-        graph.add((uri, rdflib.SDO.hasPart, observation_scientific_name))
         # Add link to attribute
         if taxon_rank_attribute:
             graph.add((uri, utils.namespaces.TERN.hasAttribute, taxon_rank_attribute))
@@ -2592,10 +2706,10 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("individualCount-observation")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_INDIVIDUAL_COUNT_OBSERVATION))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, provider_record_id_occurrence))
         graph.add((uri, rdflib.SOSA.hasResult, individual_count_value))
-        graph.add((uri, rdflib.SOSA.hasSimpleResult, rdflib.Literal(row["individualCount"])))
+        graph.add((uri, rdflib.SOSA.hasSimpleResult, utils.rdf.literal(row["individualCount"])))
         graph.add((uri, rdflib.SOSA.observedProperty, CONCEPT_INDIVIDUAL_COUNT))
         graph.add((uri, rdflib.SOSA.usedProcedure, CONCEPT_UNSPECIFIED_METHOD))
 
@@ -2603,12 +2717,12 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         temporal_entity: rdflib.term.Node | None = None
         # Check event date supplied
         if event_date is not None:
-            temporal_entity = rdflib.BNode()
+            temporal_entity = utils.bnodes.bnode("temporal_entity")
             graph.add((uri, rdflib.SDO.temporal, temporal_entity))
             graph.add((temporal_entity, a, rdflib.TIME.Instant))
             graph.add((temporal_entity, event_date.rdf_in_xsd, event_date.to_rdf_literal()))
             # Add comment
-            comment = "Date unknown, template eventDateStart used as proxy"
+            comment = LITERAL_EVENT_DATE_START_PROXY
         else:
             # Use default rdf from site visit as temporal entity
             temporal_entity = self.add_default_temporal_entity(
@@ -2618,11 +2732,11 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
                 graph=graph,
             )
             # Add comment to temporal entity
-            comment = "Date unknown, site visit dates used as proxy."
+            comment = LITERAL_SITE_VISIT_DATES_PROXY
 
         # ASsert temporal_entity type and add
         if temporal_entity is not None:
-            graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+            graph.add((temporal_entity, rdflib.RDFS.comment, comment))
 
     def add_individual_count_value(
         self,
@@ -2644,8 +2758,8 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         # Individual Count Value
         graph.add((uri, a, utils.namespaces.TERN.Integer))
         graph.add((uri, a, utils.namespaces.TERN.Value))
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal("individual-count")))
-        graph.add((uri, rdflib.RDF.value, rdflib.Literal(row["individualCount"])))
+        graph.add((uri, rdflib.RDFS.label, LITERAL_INDIVIDUAL_COUNT))
+        graph.add((uri, rdflib.RDF.value, utils.rdf.literal(row["individualCount"])))
 
     def add_organism_remarks_observation(
         self,
@@ -2685,10 +2799,10 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("organismRemarks-observation")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_ORGANISM_REMARKS_OBSERVATION))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, provider_record_id_occurrence))
         graph.add((uri, rdflib.SOSA.hasResult, organism_remarks_value))
-        graph.add((uri, rdflib.SOSA.hasSimpleResult, rdflib.Literal(row["organismRemarks"])))
+        graph.add((uri, rdflib.SOSA.hasSimpleResult, utils.rdf.literal(row["organismRemarks"])))
         graph.add((uri, rdflib.SOSA.observedProperty, CONCEPT_ORGANISM_REMARKS))
         graph.add((uri, rdflib.SOSA.usedProcedure, CONCEPT_UNSPECIFIED_METHOD))
 
@@ -2696,13 +2810,12 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         temporal_entity: rdflib.term.Node | None = None
         # Check for eventDateStart
         if event_date is not None:
-            temporal_entity = rdflib.BNode()
+            temporal_entity = utils.bnodes.bnode("temporal_entity")
             graph.add((uri, rdflib.SDO.temporal, temporal_entity))
             graph.add((temporal_entity, a, rdflib.TIME.Instant))
             graph.add((temporal_entity, event_date.rdf_in_xsd, event_date.to_rdf_literal()))
             # Add comment to temporal entity
-            comment = "Date unknown, template eventDateStart used as proxy"
-            graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+            graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_EVENT_DATE_START_PROXY))
         else:
             # Use default rdf from site visit as temporal entity
             temporal_entity = self.add_default_temporal_entity(
@@ -2713,8 +2826,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             )
             # Add comment to temporal entity
             if temporal_entity is not None:
-                comment = "Date unknown, site visit dates used as proxy."
-                graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+                graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_SITE_VISIT_DATES_PROXY))
 
     def add_organism_remarks_value(
         self,
@@ -2736,8 +2848,8 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         # Organism Remarks Value
         graph.add((uri, a, utils.namespaces.TERN.Text))
         graph.add((uri, a, utils.namespaces.TERN.Value))
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal("organism-remarks")))
-        graph.add((uri, rdflib.RDF.value, rdflib.Literal(row["organismRemarks"])))
+        graph.add((uri, rdflib.RDFS.label, LITERAL_ORGANISM_REMARKS))
+        graph.add((uri, rdflib.RDF.value, utils.rdf.literal(row["organismRemarks"])))
 
     def add_habitat_attribute(
         self,
@@ -2761,6 +2873,10 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_habitat_attribute", uri, habitat, habitat_value):
+            return
+
         # Habitat Attribute
         graph.add((uri, a, utils.namespaces.TERN.Attribute))
         if submission_iri:
@@ -2769,7 +2885,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
         graph.add((uri, utils.namespaces.TERN.attribute, CONCEPT_HABITAT))
         if habitat:
-            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(habitat)))
+            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(habitat)))
         if habitat_value is not None:
             graph.add((uri, utils.namespaces.TERN.hasValue, habitat_value))
 
@@ -2794,12 +2910,16 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_habitat_value", uri, habitat):
+            return
+
         # Habitat Value
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
         if habitat:
             # Add label
-            graph.add((uri, rdflib.RDFS.label, rdflib.Literal(habitat)))
+            graph.add((uri, rdflib.RDFS.label, utils.rdf.literal(habitat)))
 
             # Retrieve vocab for field
             vocab = self.fields()["habitat"].get_flexible_vocab()
@@ -2833,6 +2953,13 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Add link to the sample field
+        graph.add((uri, rdflib.SDO.hasPart, provider_record_id_occurrence))
+
+        # The rest of the Collection is shared by every row, so only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_habitat_collection", uri, habitat, habitat_attribute):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.SDO.Collection))
         if submission_iri:
@@ -2840,11 +2967,9 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
 
         # Add identifier
         if habitat:
-            graph.add((uri, rdflib.SDO.name, rdflib.Literal(f"Occurrence Collection - Habitat - {habitat}")))
+            graph.add((uri, rdflib.SDO.name, utils.rdf.literal(f"Occurrence Collection - Habitat - {habitat}")))
         # Add link to dataset
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        # add link to the sample field
-        graph.add((uri, rdflib.SDO.hasPart, provider_record_id_occurrence))
         # Add link to attribute
         if habitat_attribute:
             graph.add((uri, utils.namespaces.TERN.hasAttribute, habitat_attribute))
@@ -2871,6 +2996,10 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_basis_attribute", uri, basis_of_record, basis_value):
+            return
+
         # Basis of Record Attribute
         graph.add((uri, a, utils.namespaces.TERN.Attribute))
         if submission_iri:
@@ -2879,7 +3008,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
         graph.add((uri, utils.namespaces.TERN.attribute, CONCEPT_BASIS_OF_RECORD))
         if basis_of_record:
-            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(basis_of_record)))
+            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(basis_of_record)))
         if basis_value:
             graph.add((uri, utils.namespaces.TERN.hasValue, basis_value))
 
@@ -2904,12 +3033,16 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_basis_value", uri, basis_of_record):
+            return
+
         # Basis of Record Value
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
         if basis_of_record:
             # Add label
-            graph.add((uri, rdflib.RDFS.label, rdflib.Literal(basis_of_record)))
+            graph.add((uri, rdflib.RDFS.label, utils.rdf.literal(basis_of_record)))
 
             # Retrieve vocab for field
             vocab = self.fields()["basisOfRecord"].get_flexible_vocab()
@@ -2950,6 +3083,16 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Add link to the appropriate sample node
+        if has_specimen(row):
+            graph.add((uri, rdflib.SDO.hasPart, sample_specimen))
+        else:
+            graph.add((uri, rdflib.SDO.hasPart, provider_record_id_occurrence))
+
+        # The rest of the Collection is shared by every row, so only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_basis_collection", uri, basis_of_record, basis_attribute):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.SDO.Collection))
         if submission_iri:
@@ -2961,16 +3104,11 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
                 (
                     uri,
                     rdflib.SDO.name,
-                    rdflib.Literal(f"Occurrence Collection - Basis Of Record - {basis_of_record}"),
+                    utils.rdf.literal(f"Occurrence Collection - Basis Of Record - {basis_of_record}"),
                 )
             )
         # Add link to dataset
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        # add link to the appropriate sample node
-        if has_specimen(row):
-            graph.add((uri, rdflib.SDO.hasPart, sample_specimen))
-        else:
-            graph.add((uri, rdflib.SDO.hasPart, provider_record_id_occurrence))
         # Add link to attribute
         if basis_attribute:
             graph.add((uri, utils.namespaces.TERN.hasAttribute, basis_attribute))
@@ -2995,7 +3133,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
 
         # Owner Institution Provider
         graph.add((uri, a, rdflib.PROV.Agent))
-        graph.add((uri, rdflib.SDO.name, rdflib.Literal(row["ownerRecordIDSource"])))
+        graph.add((uri, rdflib.SDO.name, utils.rdf.literal(row["ownerRecordIDSource"])))
 
     def add_occurrence_status_observation(
         self,
@@ -3035,10 +3173,10 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("occurrenceStatus-observation")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_OCCURRENCE_STATUS_OBSERVATION))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, provider_record_id_occurrence))
         graph.add((uri, rdflib.SOSA.hasResult, occurrence_status_value))
-        graph.add((uri, rdflib.SOSA.hasSimpleResult, rdflib.Literal(row["occurrenceStatus"])))
+        graph.add((uri, rdflib.SOSA.hasSimpleResult, utils.rdf.literal(row["occurrenceStatus"])))
         graph.add((uri, rdflib.SOSA.observedProperty, CONCEPT_OCCURRENCE_STATUS))
         graph.add((uri, rdflib.SOSA.usedProcedure, CONCEPT_UNSPECIFIED_METHOD))
 
@@ -3046,7 +3184,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         temporal_entity: rdflib.term.Node | None = None
         # Check event date supplied
         if event_date is not None:
-            temporal_entity = rdflib.BNode()
+            temporal_entity = utils.bnodes.bnode("temporal_entity")
             graph.add((uri, rdflib.SDO.temporal, temporal_entity))
             graph.add((temporal_entity, a, rdflib.TIME.Instant))
             graph.add((temporal_entity, event_date.rdf_in_xsd, event_date.to_rdf_literal()))
@@ -3060,8 +3198,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             )
             # Add comment to temporal entity
             if temporal_entity is not None:
-                comment = "Date unknown, site visit dates used as proxy."
-                graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+                graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_SITE_VISIT_DATES_PROXY))
 
     def add_occurrence_status_value(
         self,
@@ -3093,7 +3230,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         # Occurrence Status Value
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal(f"occurrenceStatus = {row['occurrenceStatus']}")))
+        graph.add((uri, rdflib.RDFS.label, utils.rdf.literal(f"occurrenceStatus = {row['occurrenceStatus']}")))
         graph.add((uri, rdflib.RDF.value, term))
 
     def add_preparations_attribute(
@@ -3118,6 +3255,10 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_preparations_attribute", uri, preparations, preparations_value):
+            return
+
         # Preparations Attribute
         graph.add((uri, a, utils.namespaces.TERN.Attribute))
         if submission_iri:
@@ -3126,7 +3267,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
         graph.add((uri, utils.namespaces.TERN.attribute, CONCEPT_PREPARATIONS))
         if preparations:
-            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(preparations)))
+            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(preparations)))
         if preparations_value:
             graph.add((uri, utils.namespaces.TERN.hasValue, preparations_value))
 
@@ -3151,12 +3292,16 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_preparations_value", uri, preparations):
+            return
+
         # Preparations Value
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
         if preparations:
             # Add label
-            graph.add((uri, rdflib.RDFS.label, rdflib.Literal(preparations)))
+            graph.add((uri, rdflib.RDFS.label, utils.rdf.literal(preparations)))
 
             # Retrieve vocab for field
             vocab = self.fields()["preparations"].get_flexible_vocab()
@@ -3189,6 +3334,13 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Add link to the sample_specimen node
+        graph.add((uri, rdflib.SDO.hasPart, sample_specimen))
+
+        # The rest of the Collection is shared by every row, so only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_preparations_collection", uri, preparations, preparations_attribute):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.SDO.Collection))
         if submission_iri:
@@ -3200,13 +3352,11 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
                 (
                     uri,
                     rdflib.SDO.name,
-                    rdflib.Literal(f"Occurrence Collection - Preparations - {preparations}"),
+                    utils.rdf.literal(f"Occurrence Collection - Preparations - {preparations}"),
                 )
             )
         # Add link to dataset
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        # add link to the sample_specimen node
-        graph.add((uri, rdflib.SDO.hasPart, sample_specimen))
         # Add link to attribute
         if preparations_attribute:
             graph.add((uri, utils.namespaces.TERN.hasAttribute, preparations_attribute))
@@ -3249,10 +3399,10 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("establishmentMeans-observation")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_ESTABLISHMENT_MEANS_OBSERVATION))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, provider_record_id_occurrence))
         graph.add((uri, rdflib.SOSA.hasResult, establishment_means_value))
-        graph.add((uri, rdflib.SOSA.hasSimpleResult, rdflib.Literal(row["establishmentMeans"])))
+        graph.add((uri, rdflib.SOSA.hasSimpleResult, utils.rdf.literal(row["establishmentMeans"])))
         graph.add((uri, rdflib.SOSA.observedProperty, CONCEPT_ESTABLISHMENT_MEANS))
         graph.add((uri, rdflib.SOSA.usedProcedure, CONCEPT_UNSPECIFIED_METHOD))
 
@@ -3260,13 +3410,12 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         temporal_entity: rdflib.term.Node | None = None
         # Check eventDateStart supplied
         if event_date is not None:
-            temporal_entity = rdflib.BNode()
+            temporal_entity = utils.bnodes.bnode("temporal_entity")
             graph.add((uri, rdflib.SDO.temporal, temporal_entity))
             graph.add((temporal_entity, a, rdflib.TIME.Instant))
             graph.add((temporal_entity, event_date.rdf_in_xsd, event_date.to_rdf_literal()))
             # Add comment to temporal entity
-            comment = "Date unknown, template eventDateStart used as proxy"
-            graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+            graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_EVENT_DATE_START_PROXY))
         else:
             # Use default rdf from site visit as temporal entity
             temporal_entity = self.add_default_temporal_entity(
@@ -3277,8 +3426,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             )
             # Add comment to temporal entity
             if temporal_entity is not None:
-                comment = "Date unknown, site visit dates used as proxy."
-                graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+                graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_SITE_VISIT_DATES_PROXY))
 
     def add_establishment_means_value(
         self,
@@ -3310,7 +3458,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         # Establishment Means Value
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal("establishmentMeans-value")))
+        graph.add((uri, rdflib.RDFS.label, LITERAL_ESTABLISHMENT_MEANS_VALUE))
         graph.add((uri, rdflib.RDF.value, term))
 
     def add_life_stage_observation(
@@ -3359,10 +3507,10 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("lifeStage-observation")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_LIFE_STAGE_OBSERVATION))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, foi))
         graph.add((uri, rdflib.SOSA.hasResult, life_stage_value))
-        graph.add((uri, rdflib.SOSA.hasSimpleResult, rdflib.Literal(row["lifeStage"])))
+        graph.add((uri, rdflib.SOSA.hasSimpleResult, utils.rdf.literal(row["lifeStage"])))
         graph.add((uri, rdflib.SOSA.observedProperty, CONCEPT_LIFE_STAGE))
         graph.add((uri, rdflib.SOSA.usedProcedure, CONCEPT_UNSPECIFIED_METHOD))
 
@@ -3370,14 +3518,13 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         temporal_entity: rdflib.term.Node | None = None
         # Check eventDateStart supplied
         if event_date is not None:
-            temporal_entity = rdflib.BNode()
+            temporal_entity = utils.bnodes.bnode("temporal_entity")
             graph.add((uri, rdflib.SDO.temporal, temporal_entity))
             graph.add((temporal_entity, a, rdflib.TIME.Instant))
             graph.add((temporal_entity, event_date.rdf_in_xsd, event_date.to_rdf_literal()))
 
             # Add comment to temporal entity
-            comment = "Date unknown, template eventDateStart used as proxy"
-            graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+            graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_EVENT_DATE_START_PROXY))
         else:
             # Use default rdf from site visit as temporal entity
             temporal_entity = self.add_default_temporal_entity(
@@ -3388,8 +3535,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             )
             # Add comment to temporal entity
             if temporal_entity is not None:
-                comment = "Date unknown, site visit dates used as proxy."
-                graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+                graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_SITE_VISIT_DATES_PROXY))
 
     def add_life_stage_value(
         self,
@@ -3421,7 +3567,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         # Life Stage Value
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal("lifeStage-value")))
+        graph.add((uri, rdflib.RDFS.label, LITERAL_LIFE_STAGE_VALUE))
         graph.add((uri, rdflib.RDF.value, term))
 
     def add_sex_observation(
@@ -3469,10 +3615,10 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("sex-observation")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_SEX_OBSERVATION))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, foi))
         graph.add((uri, rdflib.SOSA.hasResult, sex_value))
-        graph.add((uri, rdflib.SOSA.hasSimpleResult, rdflib.Literal(row["sex"])))
+        graph.add((uri, rdflib.SOSA.hasSimpleResult, utils.rdf.literal(row["sex"])))
         graph.add((uri, rdflib.SOSA.observedProperty, CONCEPT_SEX))
         graph.add((uri, rdflib.SOSA.usedProcedure, CONCEPT_UNSPECIFIED_METHOD))
 
@@ -3480,13 +3626,12 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         temporal_entity: rdflib.term.Node | None = None
         # Check eventDateStart provided
         if event_date is not None:
-            temporal_entity = rdflib.BNode()
+            temporal_entity = utils.bnodes.bnode("temporal_entity")
             graph.add((uri, rdflib.SDO.temporal, temporal_entity))
             graph.add((temporal_entity, a, rdflib.TIME.Instant))
             graph.add((temporal_entity, event_date.rdf_in_xsd, event_date.to_rdf_literal()))
             # Add comment to temporal entity
-            comment = "Date unknown, template eventDateStart used as proxy"
-            graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+            graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_EVENT_DATE_START_PROXY))
         else:
             # Use default rdf from site visit as temporal entity
             temporal_entity = self.add_default_temporal_entity(
@@ -3497,8 +3642,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             )
             # Add comment to temporal entity
             if temporal_entity is not None:
-                comment = "Date unknown, site visit dates used as proxy."
-                graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+                graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_SITE_VISIT_DATES_PROXY))
 
     def add_sex_value(
         self,
@@ -3530,7 +3674,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         # Sex Value
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal("sex-value")))
+        graph.add((uri, rdflib.RDFS.label, LITERAL_SEX_VALUE))
         graph.add((uri, rdflib.RDF.value, term))
 
     def add_reproductive_condition_observation(
@@ -3579,10 +3723,10 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("reproductiveCondition-observation")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_REPRODUCTIVE_CONDITION_OBSERVATION))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, foi))
         graph.add((uri, rdflib.SOSA.hasResult, reproductive_condition_value))
-        graph.add((uri, rdflib.SOSA.hasSimpleResult, rdflib.Literal(row["reproductiveCondition"])))
+        graph.add((uri, rdflib.SOSA.hasSimpleResult, utils.rdf.literal(row["reproductiveCondition"])))
         graph.add((uri, rdflib.SOSA.observedProperty, CONCEPT_REPRODUCTIVE_CONDITION))
         graph.add((uri, rdflib.SOSA.usedProcedure, CONCEPT_UNSPECIFIED_METHOD))
 
@@ -3590,13 +3734,12 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         temporal_entity: rdflib.term.Node | None = None
         # Check eventDateStart provided
         if event_date is not None:
-            temporal_entity = rdflib.BNode()
+            temporal_entity = utils.bnodes.bnode("temporal_entity")
             graph.add((uri, rdflib.SDO.temporal, temporal_entity))
             graph.add((temporal_entity, a, rdflib.TIME.Instant))
             graph.add((temporal_entity, event_date.rdf_in_xsd, event_date.to_rdf_literal()))
             # Add comment to temporal entity
-            comment = "Date unknown, template eventDateStart used as proxy"
-            graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+            graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_EVENT_DATE_START_PROXY))
         else:
             # Use default rdf from site visit as temporal entity
             temporal_entity = self.add_default_temporal_entity(
@@ -3607,8 +3750,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             )
             # Add comment to temporal entity
             if temporal_entity is not None:
-                comment = "Date unknown, site visit dates used as proxy."
-                graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+                graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_SITE_VISIT_DATES_PROXY))
 
     def add_reproductive_condition_value(
         self,
@@ -3640,7 +3782,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         # Reproductive Condition Value
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal("reproductiveCondition-value")))
+        graph.add((uri, rdflib.RDFS.label, LITERAL_REPRODUCTIVE_CONDITION_VALUE))
         graph.add((uri, rdflib.RDF.value, term))
 
     def add_accepted_name_usage_observation(
@@ -3681,10 +3823,10 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("acceptedNameUsage-observation")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_ACCEPTED_NAME_USAGE_OBSERVATION))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, scientific_name))
         graph.add((uri, rdflib.SOSA.hasResult, accepted_name_usage_value))
-        graph.add((uri, rdflib.SOSA.hasSimpleResult, rdflib.Literal(row["acceptedNameUsage"])))
+        graph.add((uri, rdflib.SOSA.hasSimpleResult, utils.rdf.literal(row["acceptedNameUsage"])))
         graph.add((uri, rdflib.SOSA.observedProperty, CONCEPT_ACCEPTED_NAME_USAGE))
         graph.add((uri, rdflib.SOSA.usedProcedure, CONCEPT_NAME_CHECK_METHOD))
 
@@ -3692,7 +3834,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         temporal_entity: rdflib.term.Node | None = None
         # Check date supplied within template
         if date_identified is not None:
-            temporal_entity = rdflib.BNode()
+            temporal_entity = utils.bnodes.bnode("temporal_entity")
             graph.add((uri, rdflib.SDO.temporal, temporal_entity))
             graph.add((temporal_entity, a, rdflib.TIME.Instant))
             graph.add((temporal_entity, date_identified.rdf_in_xsd, date_identified.to_rdf_literal()))
@@ -3700,8 +3842,8 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             timestamp_used = (
                 "dateIdentified" if row["dateIdentified"] else "eventDateStart"
             )  # Determine which field was used
-            comment = f"Date unknown, template {timestamp_used} used as proxy"
-            graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+            comment = utils.rdf.literal(f"Date unknown, template {timestamp_used} used as proxy")
+            graph.add((temporal_entity, rdflib.RDFS.comment, comment))
         else:
             # Use default rdf from site visit as temporal entity
             temporal_entity = self.add_default_temporal_entity(
@@ -3712,8 +3854,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             )
             # Add comment to temporal entity
             if temporal_entity is not None:
-                comment = "Date unknown, site visit dates used as proxy."
-                graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+                graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_SITE_VISIT_DATES_PROXY))
 
     def add_accepted_name_usage_value(
         self,
@@ -3743,9 +3884,9 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if submission_iri:
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal("acceptedNameUsage-value")))
+        graph.add((uri, rdflib.RDFS.label, LITERAL_ACCEPTED_NAME_USAGE_VALUE))
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDF.value, rdflib.Literal(row["acceptedNameUsage"])))
+        graph.add((uri, rdflib.RDF.value, utils.rdf.literal(row["acceptedNameUsage"])))
         graph.add((uri, utils.namespaces.TERN.featureType, CONCEPT_ACCEPTED_NAME_USAGE))
 
     def add_sampling_sequencing(
@@ -3797,7 +3938,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("sequencing-sampling")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_SEQUENCING_SAMPLING))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, feature_of_interest))
         graph.add((uri, rdflib.SOSA.hasResult, result_sequence))
 
@@ -3805,14 +3946,13 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         temporal_entity: rdflib.term.Node | None = None
         # Determine eventDateStart supplied
         if event_date is not None:
-            temporal_entity = rdflib.BNode()
+            temporal_entity = utils.bnodes.bnode("temporal_entity")
             graph.add((uri, rdflib.SDO.temporal, temporal_entity))
             graph.add((temporal_entity, a, rdflib.TIME.Instant))
             graph.add((temporal_entity, event_date.rdf_in_xsd, event_date.to_rdf_literal()))
             graph.add((uri, rdflib.SOSA.usedProcedure, term))
             # Add comment to temporal entity
-            comment = "Date unknown, template eventDateStart used as proxy"
-            graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+            graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_EVENT_DATE_START_PROXY))
         else:
             # Use default rdf from site visit as temporal entity
             temporal_entity = self.add_default_temporal_entity(
@@ -3823,12 +3963,11 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             )
             # Add comment to temporal entity
             if temporal_entity is not None:
-                comment = "Date unknown, site visit dates used as proxy."
-                graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+                graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_SITE_VISIT_DATES_PROXY))
 
         # Add geometry
         if geometry:
-            geometry_node = rdflib.BNode()
+            geometry_node = utils.bnodes.bnode("geometry_node")
             graph.add((uri, rdflib.SDO.spatial, geometry_node))
             graph.add((geometry_node, a, utils.namespaces.GEO.Geometry))
             graph.add((geometry_node, utils.namespaces.GEO.asWKT, geometry.to_transformed_crs_rdf_literal()))
@@ -3842,8 +3981,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             )
 
             # Add comment to geometry
-            spatial_comment = "Location unknown, location of field sampling used as proxy"
-            graph.add((geometry_node, rdflib.RDFS.comment, rdflib.Literal(spatial_comment)))
+            graph.add((geometry_node, rdflib.RDFS.comment, LITERAL_FIELD_SAMPLING_LOCATION_PROXY))
 
         # Check for coordinateUncertaintyInMeters
         if row["coordinateUncertaintyInMeters"]:
@@ -3872,12 +4010,12 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((uri, a, utils.namespaces.TERN.Result))
 
         # Add Label
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal("sequence-result")))
+        graph.add((uri, rdflib.RDFS.label, LITERAL_SEQUENCE_RESULT))
 
         # Loop Through Associated Sequences
         for identifier in row["associatedSequences"]:
             # Add Identifier
-            graph.add((uri, rdflib.SDO.identifier, rdflib.Literal(identifier)))
+            graph.add((uri, rdflib.SDO.identifier, utils.rdf.literal(identifier)))
 
     def add_provider_determined_by(
         self,
@@ -3898,7 +4036,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
 
         # Add to Graph
         graph.add((uri, a, rdflib.PROV.Agent))
-        graph.add((uri, rdflib.SDO.name, rdflib.Literal(row["threatStatusDeterminedBy"])))
+        graph.add((uri, rdflib.SDO.name, utils.rdf.literal(row["threatStatusDeterminedBy"])))
 
     def add_threat_status_observation(
         self,
@@ -3953,10 +4091,10 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("threatStatus-observation")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_THREAT_STATUS_OBSERVATION))
         graph.add((uri, rdflib.SOSA.hasFeatureOfInterest, provider_record_id_occurrence))
         graph.add((uri, rdflib.SOSA.hasResult, threat_status_value))
-        graph.add((uri, rdflib.SOSA.hasSimpleResult, rdflib.Literal(row["threatStatus"])))
+        graph.add((uri, rdflib.SOSA.hasSimpleResult, utils.rdf.literal(row["threatStatus"])))
         graph.add((uri, rdflib.SOSA.observedProperty, CONCEPT_CONSERVATION_STATUS))
         graph.add((uri, rdflib.SOSA.usedProcedure, term))
 
@@ -3964,7 +4102,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         temporal_entity: rdflib.term.Node | None = None
         # Check date provided within template
         if date_determined is not None:
-            temporal_entity = rdflib.BNode()
+            temporal_entity = utils.bnodes.bnode("temporal_entity")
             graph.add((uri, rdflib.SDO.temporal, temporal_entity))
             graph.add((temporal_entity, a, rdflib.TIME.Instant))
             graph.add((temporal_entity, date_determined.rdf_in_xsd, date_determined.to_rdf_literal()))
@@ -3983,8 +4121,8 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
                     else "eventDateStart"
                 )
                 # Add comment to temporal entity
-                comment = f"Date unknown, template {date_used} used as proxy"
-                graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+                comment = utils.rdf.literal(f"Date unknown, template {date_used} used as proxy")
+                graph.add((temporal_entity, rdflib.RDFS.comment, comment))
         else:
             # Use default rdf from site visit as temporal entity
             temporal_entity = self.add_default_temporal_entity(
@@ -3995,8 +4133,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             )
             # Add comment to temporal entity
             if temporal_entity is not None:
-                comment = "Date unknown, site visit dates used as proxy."
-                graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+                graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_SITE_VISIT_DATES_PROXY))
 
     def add_threat_status_value(
         self,
@@ -4032,7 +4169,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         # Threat Status Value
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal(f"Conservation status = {row['threatStatus']}")))
+        graph.add((uri, rdflib.RDFS.label, utils.rdf.literal(f"Conservation status = {row['threatStatus']}")))
         graph.add((uri, rdflib.RDF.value, term))
 
     def add_conservation_authority_attribute(
@@ -4058,6 +4195,16 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(
+            graph,
+            "add_conservation_authority_attribute",
+            uri,
+            conservation_authority,
+            conservation_authority_value,
+        ):
+            return
+
         # Conservation Authority Attribute
         graph.add((uri, a, utils.namespaces.TERN.Attribute))
         if submission_iri:
@@ -4066,7 +4213,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
         graph.add((uri, utils.namespaces.TERN.attribute, CONCEPT_CONSERVATION_AUTHORITY))
         if conservation_authority:
-            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(conservation_authority)))
+            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(conservation_authority)))
         if conservation_authority_value:
             graph.add((uri, utils.namespaces.TERN.hasValue, conservation_authority_value))
 
@@ -4088,12 +4235,16 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_conservation_authority_value", uri, conservation_authority):
+            return
+
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
 
         if conservation_authority:
             # Construct Label
-            graph.add((uri, rdflib.RDFS.label, rdflib.Literal(conservation_authority)))
+            graph.add((uri, rdflib.RDFS.label, utils.rdf.literal(conservation_authority)))
 
             # Retrieve vocab for field
             vocab = self.fields()["conservationAuthority"].get_vocab()
@@ -4127,6 +4278,19 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Add link to the threat status observation node
+        graph.add((uri, rdflib.SDO.hasPart, threat_status_observation))
+
+        # The rest of the Collection is shared by every row, so only needs adding once per chunk
+        if self.added_in_chunk(
+            graph,
+            "add_conservation_authority_collection",
+            uri,
+            conservation_authority,
+            conservation_authority_attribute,
+        ):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.SDO.Collection))
         if submission_iri:
@@ -4138,13 +4302,11 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
                 (
                     uri,
                     rdflib.SDO.name,
-                    rdflib.Literal(f"Occurrence Collection - Conservation Authority - {conservation_authority}"),
+                    utils.rdf.literal(f"Occurrence Collection - Conservation Authority - {conservation_authority}"),
                 )
             )
         # Add link to dataset
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        # add link to the threat status observation node
-        graph.add((uri, rdflib.SDO.hasPart, threat_status_observation))
         # Add link to attribute
         if conservation_authority_attribute:
             graph.add((uri, utils.namespaces.TERN.hasAttribute, conservation_authority_attribute))
@@ -4190,14 +4352,14 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if submission_iri:
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
-        graph.add((uri, rdflib.RDFS.comment, rdflib.Literal("organismQuantity-observation")))
+        graph.add((uri, rdflib.RDFS.comment, LITERAL_ORGANISM_QUANTITY_OBSERVATION))
         graph.add((uri, rdflib.SOSA.observedProperty, CONCEPT_ORGANISM_QUANTITY))
 
         # Declare temporal entity to allow correct assignment typechecks
         temporal_entity: rdflib.term.Node | None = None
         # Check eventDateStart provided
         if event_date is not None:
-            temporal_entity = rdflib.BNode()
+            temporal_entity = utils.bnodes.bnode("temporal_entity")
             graph.add((uri, rdflib.SDO.temporal, temporal_entity))
             graph.add((temporal_entity, a, rdflib.TIME.Instant))
             graph.add((temporal_entity, event_date.rdf_in_xsd, event_date.to_rdf_literal()))
@@ -4206,7 +4368,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
                 (
                     temporal_entity,
                     rdflib.RDFS.comment,
-                    rdflib.Literal("Date unknown, template eventDateStart used as proxy"),
+                    LITERAL_EVENT_DATE_START_PROXY,
                 )
             )
         else:
@@ -4219,14 +4381,13 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             )
             # Add comment to temporal entity
             if temporal_entity is not None:
-                comment = "Date unknown, site visit dates used as proxy."
-                graph.add((temporal_entity, rdflib.RDFS.comment, rdflib.Literal(comment)))
+                graph.add((temporal_entity, rdflib.RDFS.comment, LITERAL_SITE_VISIT_DATES_PROXY))
 
         # Add usedProcedure - unspecified
         graph.add((uri, rdflib.SOSA.usedProcedure, CONCEPT_UNSPECIFIED_METHOD))
 
         # Add organism quantity and type values
-        graph.add((uri, rdflib.SOSA.hasSimpleResult, rdflib.Literal(f"{organism_qty} {organism_qty_type}")))
+        graph.add((uri, rdflib.SOSA.hasSimpleResult, utils.rdf.literal(f"{organism_qty} {organism_qty_type}")))
 
     def add_organism_quantity_value(
         self,
@@ -4265,7 +4426,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         graph.add((organism_qty_observation, rdflib.SOSA.hasResult, uri))
         graph.add((uri, a, utils.namespaces.TERN.Value))
         graph.add((uri, a, utils.namespaces.TERN.Float))
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal("organism-quantity")))
+        graph.add((uri, rdflib.RDFS.label, LITERAL_ORGANISM_QUANTITY))
         graph.add((uri, utils.namespaces.TERN.unit, term))
         graph.add((uri, rdflib.RDF.value, rdflib.Literal(organism_qty, datatype=rdflib.XSD.float)))
 
@@ -4293,6 +4454,10 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_site", uri, site_id, site_id_datatype, existing_site_iri):
+            return
+
         # Add site information to graph
         graph.add((uri, a, utils.namespaces.TERN.Site))
 
@@ -4325,13 +4490,18 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         # Check subject was provided
         if uri is None:
             return
+
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_site_id_datatype", uri, site_id_source, site_id_datatype_attribution):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.RDFS.Datatype))
         # Add definition
-        graph.add((uri, rdflib.SKOS.definition, rdflib.Literal("An identifier for the site")))
+        graph.add((uri, rdflib.SKOS.definition, LITERAL_SITE_ID_DEFINITION))
         # Add label
         if site_id_source:
-            graph.add((uri, rdflib.SKOS.prefLabel, rdflib.Literal(f"{site_id_source} Site ID")))
+            graph.add((uri, rdflib.SKOS.prefLabel, utils.rdf.literal(f"{site_id_source} Site ID")))
         # Add attribution link
         if site_id_datatype_attribution:
             graph.add((uri, rdflib.PROV.qualifiedAttribution, site_id_datatype_attribution))
@@ -4353,11 +4523,16 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         # Check subject provided
         if uri is None:
             return
+
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_site_id_datatype_agent", uri, site_id_source):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.PROV.Agent))
         # Add name
         if site_id_source:
-            graph.add((uri, rdflib.SDO.name, rdflib.Literal(site_id_source)))
+            graph.add((uri, rdflib.SDO.name, utils.rdf.literal(site_id_source)))
 
     def add_sensitivity_category_attribute(
         self,
@@ -4381,6 +4556,17 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(
+            graph,
+            "add_sensitivity_category_attribute",
+            uri,
+            row["sensitivityCategory"],
+            row["sensitivityAuthority"],
+            sensitivity_category_value,
+        ):
+            return
+
         simple_value = f"{row['sensitivityCategory']} - {row['sensitivityAuthority']}"
 
         # Sensitivity Category Attribute
@@ -4390,7 +4576,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
 
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
         graph.add((uri, utils.namespaces.TERN.attribute, CONCEPT_SENSITIVITY_CATEGORY))
-        graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(simple_value)))
+        graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(simple_value)))
         if sensitivity_category_value:
             graph.add((uri, utils.namespaces.TERN.hasValue, sensitivity_category_value))
 
@@ -4415,6 +4601,16 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(
+            graph,
+            "add_sensitivity_category_value",
+            uri,
+            row["sensitivityCategory"],
+            row["sensitivityAuthority"],
+        ):
+            return
+
         # Retrieve vocab for field
         vocab = self.fields()["sensitivityCategory"].get_flexible_vocab()
         vocab_instance = vocab(graph=graph, source=dataset, submitted_on_date=submitted_on_date)
@@ -4423,7 +4619,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         scope_note = f"Under the authority of {row['sensitivityAuthority']}"
         if not isinstance(vocab_instance, utils.vocabs.FlexibleVocabulary):
             raise RuntimeError("sensitiveCategory vocabulary is expected to be a FlexibleVocabulary")
-        vocab_instance.scope_note = rdflib.Literal(scope_note)
+        vocab_instance.scope_note = utils.rdf.literal(scope_note)
         # This has to be done here, instead of at the Vocabulary definition,
         # because the value is computed from another field (sensitivityAuthority).
 
@@ -4436,7 +4632,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         # Conservation Authority Value
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal(label)))
+        graph.add((uri, rdflib.RDFS.label, utils.rdf.literal(label)))
         graph.add((uri, rdflib.RDF.value, term))
 
     def add_sensitivity_category_collection(
@@ -4464,6 +4660,19 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Add link to the biodiversity record
+        graph.add((uri, rdflib.SDO.hasPart, provider_record_id_biodiversity_record))
+
+        # The rest of the Collection is shared by every row, so only needs adding once per chunk
+        if self.added_in_chunk(
+            graph,
+            "add_sensitivity_category_collection",
+            uri,
+            sensitivity_category,
+            sensitivity_category_attribute,
+        ):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.SDO.Collection))
         if submission_iri:
@@ -4475,7 +4684,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
                 (
                     uri,
                     rdflib.SDO.name,
-                    rdflib.Literal(f"Occurrence Collection - Sensitivity Category - {sensitivity_category}"),
+                    utils.rdf.literal(f"Occurrence Collection - Sensitivity Category - {sensitivity_category}"),
                 )
             )
         # Add link to dataset
@@ -4483,8 +4692,6 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         # Add link to attribute
         if sensitivity_category_attribute:
             graph.add((uri, utils.namespaces.TERN.hasAttribute, sensitivity_category_attribute))
-        # Add link to the biodiversity record
-        graph.add((uri, rdflib.SDO.hasPart, provider_record_id_biodiversity_record))
 
     def add_survey(
         self,
@@ -4505,6 +4712,10 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_survey", uri, submission_iri):
+            return
+
         # Add type
         graph.add((uri, a, utils.namespaces.TERN.Survey))
         if submission_iri:
@@ -4619,7 +4830,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
 
         # Add geometry
         if geometry:
-            geometry_node = rdflib.BNode()
+            geometry_node = utils.bnodes.bnode("geometry_node")
             graph.add((uri, rdflib.SDO.spatial, geometry_node))
             graph.add((geometry_node, a, utils.namespaces.GEO.Geometry))
             graph.add((geometry_node, utils.namespaces.GEO.asWKT, geometry.to_transformed_crs_rdf_literal()))
@@ -4646,18 +4857,18 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         event_date_end: models.temporal.Timestamp | None = row["eventDateEnd"]
         # Check if start date provided, if so use dates from this template.
         if event_date_start is not None:
-            temporal_node = rdflib.BNode()
+            temporal_node = utils.bnodes.bnode("temporal_node")
             graph.add((uri, rdflib.SDO.temporal, temporal_node))
             # When end date is provided, give temporal node a start/end
             if event_date_end is not None:
                 graph.add((temporal_node, a, rdflib.TIME.TemporalEntity))
                 # start instant
-                start_instant = rdflib.BNode()
+                start_instant = utils.bnodes.bnode("start_instant")
                 graph.add((start_instant, a, rdflib.TIME.Instant))
                 graph.add((start_instant, event_date_start.rdf_in_xsd, event_date_start.to_rdf_literal()))
                 graph.add((temporal_node, rdflib.TIME.hasBeginning, start_instant))
                 # end instant
-                end_instant = rdflib.BNode()
+                end_instant = utils.bnodes.bnode("end_instant")
                 graph.add((end_instant, a, rdflib.TIME.Instant))
                 graph.add((end_instant, event_date_end.rdf_in_xsd, event_date_end.to_rdf_literal()))
                 graph.add((temporal_node, rdflib.TIME.hasEnd, end_instant))
@@ -4676,8 +4887,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
             )
             # Add comment to temporal entity
             if default_temporal_node is not None:
-                comment = "Date unknown, site visit dates used as proxy."
-                graph.add((default_temporal_node, rdflib.RDFS.comment, rdflib.Literal(comment)))
+                graph.add((default_temporal_node, rdflib.RDFS.comment, LITERAL_SITE_VISIT_DATES_PROXY))
 
         # Add procedure from vocab
         protocol_vocab = self.fields()["samplingProtocol"].get_flexible_vocab()
@@ -4693,7 +4903,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
 
         # Add location description if provided
         if locality := row["locality"]:
-            graph.add((uri, utils.namespaces.TERN.locationDescription, rdflib.Literal(locality)))
+            graph.add((uri, utils.namespaces.TERN.locationDescription, utils.rdf.literal(locality)))
 
         # Add associated with agents if provided
         if provider_recorded_by is not None:
@@ -4713,7 +4923,7 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         # Check for collectionCode
         if row["collectionCode"]:
             # Add to Graph
-            graph.add((uri, utils.namespaces.DWC.collectionCode, rdflib.Literal(row["collectionCode"])))
+            graph.add((uri, utils.namespaces.DWC.collectionCode, utils.rdf.literal(row["collectionCode"])))
 
         # Add survey, if provided
         if survey:
@@ -4749,6 +4959,10 @@ class SurveyOccurrenceMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_site_visit", uri, submission_iri):
+            return
+
         # Add type
         graph.add((uri, a, utils.namespaces.TERN.SiteVisit))
         if submission_iri:
@@ -31,6 +31,9 @@ CONCEPT_DATA_GENERALIZATIONS = rdflib.URIRef(
 )
 DATA_ROLE_RESOURCE_PROVIDER = rdflib.URIRef("https://linked.data.gov.au/def/data-roles/resourceProvider")
 
+# Literals
+LITERAL_SITE_ID_DEFINITION = rdflib.Literal("An identifier for the site")
+
 
 # Dataclasses used in mapping
 @dataclasses.dataclass
@@ -83,18 +86,17 @@ class SurveySiteMapper(base.mapper.ABISMapper):
         )
 
         # Construct resource
-        resource = frictionless.Resource(
-            source=data,
-            format="csv",
-            schema=schema,
-            encoding="utf-8",
-        )
+        resource = base.resources.create_resource(data, schema=schema)
 
         # Extract SiteIdentifiers present in this template.
-        site_identifiers = self.extract_site_identifiers(data)
+        # A stream can only be read once, so they are then collected as the rows are validated.
+        site_identifiers = (
+            self.extract_site_identifiers(data) if not isinstance(data, base.stream.StreamSource) else None
+        )
 
         # Validate
-        report = resource.validate(
+        report = self.validate_resource(
+            resource,
             checklist=frictionless.Checklist(
                 checks=[
                     # Extra custom checks
@@ -127,7 +129,7 @@ class SurveySiteMapper(base.mapper.ABISMapper):
                         site_identifiers=site_identifiers,
                     ),
                 ],
-            )
+            ),
         )
 
         # Return validation report
@@ -142,23 +144,22 @@ class SurveySiteMapper(base.mapper.ABISMapper):
         Args:
             data: Raw data to be mapped
         """
-        # Construct schema
-        schema = self.regular_fields_schema()
-
-        # Construct resource
-        resource = frictionless.Resource(source=data, format="csv", schema=schema, encoding="utf-8")
+        return self.extract_keys(data, self.site_identifier_key)
 
-        with resource.open() as r:
-            # Create empty dictionary to hold mapping values
-            result: dict[models.identifier.SiteIdentifier, Literal[True]] = {}
-            for row in r.row_stream:
-                # Extract value
-                site_identifier = models.identifier.SiteIdentifier.from_row(row)
+    def site_identifier_key(
+        self,
+        row: frictionless.Row,
+    ) -> tuple[models.identifier.SiteIdentifier, Literal[True]] | None:
+        """Extracts the SiteIdentifier of a row, for `extract_site_identifiers()`.
 
-                if site_identifier:
-                    result[site_identifier] = True
+        Args:
+            row: Row of the data.
 
-            return result
+        Returns:
+            The SiteIdentifier, or None if the row has none.
+        """
+        site_identifier = models.identifier.SiteIdentifier.from_row(row)
+        return (site_identifier, True) if site_identifier else None
 
     def extract_geometry_defaults(
         self,
@@ -178,64 +179,63 @@ class SurveySiteMapper(base.mapper.ABISMapper):
             there is no siteID key created. Values include the geodetic
             datum uri.
         """
-        # Construct schema
-        schema = self.regular_fields_schema()
+        return self.extract_keys(data, self.geometry_default)
 
-        # Construct resource
-        resource = frictionless.Resource(
-            source=data,
-            format="csv",
-            schema=schema,
-            encoding="utf-8",
-        )
+    def geometry_default(
+        self,
+        row: frictionless.Row,
+    ) -> tuple[models.identifier.SiteIdentifier, str] | None:
+        """Extracts the default WKT of a row, for `extract_geometry_defaults()`.
+
+        Args:
+            row: Row of the data.
+
+        Returns:
+            The SiteIdentifier and its point WKT serialized string, or None
+                if the row has no default.
+        """
+        # Extract values
+        site_identifier = models.identifier.SiteIdentifier.from_row(row)
+
+        # Check there is an identifier, even though it is mandatory field, it can be missing here
+        # because this method is called for cross-validation, regardless of if this template is valid.
+        if not site_identifier:
+            return None
+
+        footprint_wkt: shapely.geometry.base.BaseGeometry | None = row["footprintWKT"]
+        longitude: decimal.Decimal | None = row["decimalLongitude"]
+        latitude: decimal.Decimal | None = row["decimalLatitude"]
+        datum: str | None = row["geodeticDatum"]
+
+        # if no valid datum for row then don't add to map.
+        if datum is None:
+            return None
+
+        try:
+            # Default to using the footprint wkt + geodetic datum
+            if footprint_wkt is not None:
+                # Create string for site id
+                return site_identifier, str(
+                    models.spatial.Geometry(
+                        raw=footprint_wkt.centroid,
+                        datum=datum,
+                    ).to_rdf_literal()
+                )
+
+            # If not footprint then we revert to using supplied longitude & latitude
+            if longitude is not None and latitude is not None:
+                # Create string for site id
+                return site_identifier, str(
+                    models.spatial.Geometry(
+                        raw=shapely.Point([float(longitude), float(latitude)]),
+                        datum=datum,
+                    ).to_rdf_literal()
+                )
+        except models.spatial.GeometryError:
+            return None
 
-        # Context manager for row streaming
-        with resource.open() as r:
-            # Create empty dictionary to hold mapping values
-            result: dict[models.identifier.SiteIdentifier, str] = {}
-            for row in r.row_stream:
-                # Extract values
-                site_identifier = models.identifier.SiteIdentifier.from_row(row)
-
-                # Check there is an identifier, even though it is mandatory field, it can be missing here
-                # because this method is called for cross-validation, regardless of if this template is valid.
-                if not site_identifier:
-                    continue
-
-                footprint_wkt: shapely.geometry.base.BaseGeometry | None = row["footprintWKT"]
-                longitude: decimal.Decimal | None = row["decimalLongitude"]
-                latitude: decimal.Decimal | None = row["decimalLatitude"]
-                datum: str | None = row["geodeticDatum"]
-
-                # if no valid datum for row then don't add to map.
-                if datum is None:
-                    continue
-
-                try:
-                    # Default to using the footprint wkt + geodetic datum
-                    if footprint_wkt is not None:
-                        # Create string and add to map for site id
-                        result[site_identifier] = str(
-                            models.spatial.Geometry(
-                                raw=footprint_wkt.centroid,
-                                datum=datum,
-                            ).to_rdf_literal()
-                        )
-                        continue
-
-                    # If not footprint then we revert to using supplied longitude & latitude
-                    if longitude is not None and latitude is not None:
-                        # Create string and add to map for site id
-                        result[site_identifier] = str(
-                            models.spatial.Geometry(
-                                raw=shapely.Point([float(longitude), float(latitude)]),
-                                datum=datum,
-                            ).to_rdf_literal()
-                        )
-                except models.spatial.GeometryError:
-                    continue
-
-            return result
+        # No geometry to default to
+        return None
 
     def apply_mapping_row(
         self,
@@ -511,15 +511,15 @@ class SurveySiteMapper(base.mapper.ABISMapper):
 
         # Add site name if available
         if site_name:
-            graph.add((uri, rdflib.SDO.name, rdflib.Literal(site_name)))
+            graph.add((uri, rdflib.SDO.name, utils.rdf.literal(site_name)))
 
         # Add site description if available
         if site_description:
-            graph.add((uri, rdflib.SDO.description, rdflib.Literal(site_description)))
+            graph.add((uri, rdflib.SDO.description, utils.rdf.literal(site_description)))
 
         # Add locality as location description
         if locality:
-            graph.add((uri, utils.namespaces.TERN.locationDescription, rdflib.Literal(locality)))
+            graph.add((uri, utils.namespaces.TERN.locationDescription, utils.rdf.literal(locality)))
 
     def add_site_id_datatype(
         self,
@@ -544,10 +544,10 @@ class SurveySiteMapper(base.mapper.ABISMapper):
         graph.add((uri, a, rdflib.RDFS.Datatype))
 
         # Add label
-        graph.add((uri, rdflib.SKOS.prefLabel, rdflib.Literal(f"{row['siteIDSource']} Site ID")))
+        graph.add((uri, rdflib.SKOS.prefLabel, utils.rdf.literal(f"{row['siteIDSource']} Site ID")))
 
         # Add definition
-        graph.add((uri, rdflib.SKOS.definition, rdflib.Literal("An identifier for the site")))
+        graph.add((uri, rdflib.SKOS.definition, LITERAL_SITE_ID_DEFINITION))
 
         # Add attribution
         if attribution is not None:
@@ -601,7 +601,7 @@ class SurveySiteMapper(base.mapper.ABISMapper):
         graph.add((uri, a, rdflib.PROV.Agent))
 
         # Add name
-        graph.add((uri, rdflib.SDO.name, rdflib.Literal(row["siteIDSource"])))
+        graph.add((uri, rdflib.SDO.name, utils.rdf.literal(row["siteIDSource"])))
 
     def add_habitat_attribute(
         self,
@@ -631,7 +631,7 @@ class SurveySiteMapper(base.mapper.ABISMapper):
 
         # Add tern values
         graph.add((uri, utils.namespaces.TERN.attribute, HABITAT))
-        graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(raw)))
+        graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(raw)))
         graph.add((uri, utils.namespaces.TERN.hasValue, value))
 
     def add_habitat_value(
@@ -656,7 +656,7 @@ class SurveySiteMapper(base.mapper.ABISMapper):
         graph.add((uri, a, utils.namespaces.TERN.Value))
 
         # Add label
-        graph.add((uri, rdflib.RDFS.label, rdflib.Literal(raw)))
+        graph.add((uri, rdflib.RDFS.label, utils.rdf.literal(raw)))
 
         # Retrieve vocab for field
         vocab = self.fields()["habitat"].get_flexible_vocab()
@@ -692,7 +692,7 @@ class SurveySiteMapper(base.mapper.ABISMapper):
             graph.add((uri, rdflib.VOID.inDataset, submission_iri))
 
         # Add identifier
-        graph.add((uri, rdflib.SDO.name, rdflib.Literal(f"Site Collection - Habitat - {raw_habitat_value}")))
+        graph.add((uri, rdflib.SDO.name, utils.rdf.literal(f"Site Collection - Habitat - {raw_habitat_value}")))
         # Add link to dataset
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
         # add link to this site
@@ -732,7 +732,7 @@ class SurveySiteMapper(base.mapper.ABISMapper):
 
         # Add tern values
         graph.add((uri, utils.namespaces.TERN.attribute, CONCEPT_DATA_GENERALIZATIONS))
-        graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(row["dataGeneralizations"])))
+        graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(row["dataGeneralizations"])))
         if value is not None:
             graph.add((uri, utils.namespaces.TERN.hasValue, value))
 
@@ -758,7 +758,7 @@ class SurveySiteMapper(base.mapper.ABISMapper):
         graph.add((uri, a, utils.namespaces.TERN.Value))
 
         # Add raw value
-        graph.add((uri, rdflib.RDF.value, rdflib.Literal(row["dataGeneralizations"])))
+        graph.add((uri, rdflib.RDF.value, utils.rdf.literal(row["dataGeneralizations"])))
 
     def add_data_generalizations_collection(
         self,
@@ -793,7 +793,7 @@ class SurveySiteMapper(base.mapper.ABISMapper):
                 (
                     uri,
                     rdflib.SDO.name,
-                    rdflib.Literal(f"Site Collection - Data Generalizations - {raw_data_generalizations_value}"),
+                    utils.rdf.literal(f"Site Collection - Data Generalizations - {raw_data_generalizations_value}"),
                 )
             )
         # Add link to dataset
@@ -831,7 +831,7 @@ class SurveySiteMapper(base.mapper.ABISMapper):
         )
 
         # Construct node
-        geometry_node = rdflib.BNode()
+        geometry_node = utils.bnodes.bnode("geometry_node")
         graph.add((geometry_node, a, utils.namespaces.GEO.Geometry))
         graph.add((geometry_node, utils.namespaces.GEO.asWKT, geometry.to_transformed_crs_rdf_literal()))
         graph.add((uri, rdflib.SDO.spatial, geometry_node))
@@ -882,7 +882,7 @@ class SurveySiteMapper(base.mapper.ABISMapper):
         )
 
         # Construct node
-        geometry_node = rdflib.BNode()
+        geometry_node = utils.bnodes.bnode("geometry_node")
         graph.add((geometry_node, a, utils.namespaces.GEO.Geometry))
         graph.add((geometry_node, utils.namespaces.GEO.asWKT, geometry.to_transformed_crs_rdf_literal()))
         graph.add((uri, rdflib.SDO.spatial, geometry_node))
@@ -26,6 +26,9 @@ CONCEPT_TARGET_TAXONOMIC_SCOPE = rdflib.URIRef(
 )
 CONCEPT_SAMPLING_EFFORT = rdflib.URIRef("http://linked.data.gov.au/def/tern-cv/489792e5-39ae-44b6-9a6f-d1ef895f9c19")
 
+# Literals
+LITERAL_SITE_ID_DEFINITION = rdflib.Literal("An identifier for the site")
+
 
 @dataclasses.dataclass
 class Agent:
@@ -59,12 +62,7 @@ class SurveySiteVisitMapper(base.mapper.ABISMapper):
         schema = self.extra_fields_schema(data=data, full_schema=True)
 
         # Construct resource
-        resource_site_visit_data = frictionless.Resource(
-            source=data,
-            format="csv",
-            schema=schema,
-            encoding="utf-8",
-        )
+        resource_site_visit_data = base.resources.create_resource(data, schema=schema)
 
         # Base extra custom checks
         checks = [
@@ -90,7 +88,8 @@ class SurveySiteVisitMapper(base.mapper.ABISMapper):
             )
 
         # Validate the site visit resource
-        report: frictionless.Report = resource_site_visit_data.validate(
+        report: frictionless.Report = self.validate_resource(
+            resource_site_visit_data,
             checklist=frictionless.Checklist(
                 checks=checks,
             ),
@@ -112,30 +111,28 @@ class SurveySiteVisitMapper(base.mapper.ABISMapper):
             Map with site visit id for keys and SiteIdentifier for values,
             or None for value if there is no identifier.
         """
-        # Construct schema
-        schema = self.regular_fields_schema()
+        return self.extract_keys(data, self.site_visit_id_site_id)
 
-        # Construct resource
-        resource = frictionless.Resource(source=data, format="csv", schema=schema, encoding="utf-8")
-
-        # Declare result reference
-        result: dict[str, models.identifier.SiteIdentifier | None] = {}
-
-        # Context manager for row streaming
-        with resource.open() as r:
-            for row in r.row_stream:
-                # Check that the cells have values and add to map
-                site_visit_id: str | None = row["siteVisitID"]
-                site_identifier = models.identifier.SiteIdentifier.from_row(row)
-                # Put siteVisitID in the map, even when site_identifier is None,
-                # So the other templates have access to all the provided siteVisitIDs.
-                # This lets other templates differentiate between 'a siteVisitID not in this template',
-                # and 'a siteVisitID in this template but with no Site identifier'.
-                if site_visit_id:
-                    result[site_visit_id] = site_identifier
-
-        # Return
-        return result
+    def site_visit_id_site_id(
+        self,
+        row: frictionless.Row,
+    ) -> tuple[str, models.identifier.SiteIdentifier | None] | None:
+        """Extracts the site visit id and SiteIdentifier of a row, for `extract_site_visit_id_to_site_id_map()`.
+
+        Args:
+            row: Row of the data.
+
+        Returns:
+            The siteVisitID and SiteIdentifier, or None if the row has no siteVisitID.
+        """
+        # Check that the cells have values and add to map
+        site_visit_id: str | None = row["siteVisitID"]
+        site_identifier = models.identifier.SiteIdentifier.from_row(row)
+        # Put siteVisitID in the map, even when site_identifier is None,
+        # So the other templates have access to all the provided siteVisitIDs.
+        # This lets other templates differentiate between 'a siteVisitID not in this template',
+        # and 'a siteVisitID in this template but with no Site identifier'.
+        return (site_visit_id, site_identifier) if site_visit_id else None
 
     def extract_temporal_defaults(
         self,
@@ -152,47 +149,48 @@ class SurveySiteVisitMapper(base.mapper.ABISMapper):
             dict[str, str]: Keys are the site visit id, values are the serialized
                 RDF (turtle) containing the default temporal entity.
         """
-        # Construct schema
-        schema = self.regular_fields_schema()
+        return self.extract_keys(data, self.temporal_default)
 
-        # Construct resource
-        resource = frictionless.Resource(source=data, format="csv", schema=schema, encoding="utf-8")
-
-        # Create empty dictionary to hold map
-        result: dict[str, str] = {}
-
-        # Context manager for row streaming
-        with resource.open() as r:
-            for row in r.row_stream:
-                # Extract values from row.
-                start_date: models.temporal.Timestamp | None = row["siteVisitStart"]
-                end_date: models.temporal.Timestamp | None = row["siteVisitEnd"]
-                site_visit_id: str | None = row["siteVisitID"]
-
-                # Check for siteVisitID, even though siteVisitID is a mandatory field, it can be missing here
-                # because this method is called for cross-validation, regardless of if this template is valid.
-                if not site_visit_id:
-                    continue
-
-                # Temporal flexibility is dependent upon a start_date being present only.
-                # Again, even though siteVisitStart is a mandatory field, it can be None here
-                # because this method is called for cross-validation, regardless of if this template is valid.
-                if not start_date:
-                    continue
-
-                # Create new graph
-                graph = rdflib.Graph()
-
-                self.add_temporal_coverage_bnode(
-                    graph=graph,
-                    start_date=start_date,
-                    end_date=end_date,
-                )
+    def temporal_default(
+        self,
+        row: frictionless.Row,
+    ) -> tuple[str, str] | None:
+        """Extracts the default temporal entity of a row, for `extract_temporal_defaults()`.
 
-                # Add serialize rdf as turtle to result map
-                result[site_visit_id] = graph.serialize(format="turtle")
+        Args:
+            row: Row of the data.
 
-        return result
+        Returns:
+            The siteVisitID and the serialized RDF (turtle) of its default
+                temporal entity, or None if the row has no default.
+        """
+        # Extract values from row.
+        start_date: models.temporal.Timestamp | None = row["siteVisitStart"]
+        end_date: models.temporal.Timestamp | None = row["siteVisitEnd"]
+        site_visit_id: str | None = row["siteVisitID"]
+
+        # Check for siteVisitID, even though siteVisitID is a mandatory field, it can be missing here
+        # because this method is called for cross-validation, regardless of if this template is valid.
+        if not site_visit_id:
+            return None
+
+        # Temporal flexibility is dependent upon a start_date being present only.
+        # Again, even though siteVisitStart is a mandatory field, it can be None here
+        # because this method is called for cross-validation, regardless of if this template is valid.
+        if not start_date:
+            return None
+
+        # Create new graph
+        graph = rdflib.Graph()
+
+        self.add_temporal_coverage_bnode(
+            graph=graph,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+        # Serialize rdf as turtle
+        return site_visit_id, graph.serialize(format="turtle")
 
     def add_temporal_coverage_bnode(
         self,
@@ -209,15 +207,15 @@ class SurveySiteVisitMapper(base.mapper.ABISMapper):
             graph: Graph to add to.
         """
         # Create temporal coverage node
-        temporal_coverage = rdflib.BNode()
+        temporal_coverage = utils.bnodes.bnode("temporal_coverage")
         # If end_date is provided, use an interval
         if end_date is not None:
             graph.add((temporal_coverage, a, rdflib.TIME.TemporalEntity))
-            begin = rdflib.BNode()
+            begin = utils.bnodes.bnode("begin")
             graph.add((temporal_coverage, rdflib.TIME.hasBeginning, begin))
             graph.add((begin, a, rdflib.TIME.Instant))
             graph.add((begin, start_date.rdf_in_xsd, start_date.to_rdf_literal()))
-            end = rdflib.BNode()
+            end = utils.bnodes.bnode("end")
             graph.add((temporal_coverage, rdflib.TIME.hasEnd, end))
             graph.add((end, a, rdflib.TIME.Instant))
             graph.add((end, end_date.rdf_in_xsd, end_date.to_rdf_literal()))
@@ -511,23 +509,23 @@ class SurveySiteVisitMapper(base.mapper.ABISMapper):
         graph.add((uri, utils.namespaces.TERN.hasSite, uri_site))
 
         # Add identifier
-        graph.add((uri, rdflib.SDO.identifier, rdflib.Literal(row_site_visit_id)))
+        graph.add((uri, rdflib.SDO.identifier, utils.rdf.literal(row_site_visit_id)))
 
         row_site_visit_start: models.temporal.Timestamp = row["siteVisitStart"]
         row_site_visit_end: models.temporal.Timestamp | None = row["siteVisitEnd"]
         # Add temporal node for start/end time
-        temporal_node = rdflib.BNode()
+        temporal_node = utils.bnodes.bnode("temporal_node")
         graph.add((uri, rdflib.SDO.temporal, temporal_node))
         # When siteVisitEnd is provided, give temporal node a start/end
         if row_site_visit_end:
             graph.add((temporal_node, a, rdflib.TIME.TemporalEntity))
             # Start instant
-            start_instant = rdflib.BNode()
+            start_instant = utils.bnodes.bnode("start_instant")
             graph.add((start_instant, a, rdflib.TIME.Instant))
             graph.add((start_instant, row_site_visit_start.rdf_in_xsd, row_site_visit_start.to_rdf_literal()))
             graph.add((temporal_node, rdflib.TIME.hasBeginning, start_instant))
             # End instant
-            end_instant = rdflib.BNode()
+            end_instant = utils.bnodes.bnode("end_instant")
             graph.add((end_instant, a, rdflib.TIME.Instant))
             graph.add((end_instant, row_site_visit_end.rdf_in_xsd, row_site_visit_end.to_rdf_literal()))
             graph.add((temporal_node, rdflib.TIME.hasEnd, end_instant))
@@ -547,12 +545,12 @@ class SurveySiteVisitMapper(base.mapper.ABISMapper):
         # Add condition
         row_condition: str | None = row["condition"]
         if row_condition:
-            graph.add((uri, utils.namespaces.TERN.siteDescription, rdflib.Literal(row_condition)))
+            graph.add((uri, utils.namespaces.TERN.siteDescription, utils.rdf.literal(row_condition)))
 
         # Add description
         row_protocol_description: str | None = row["protocolDescription"]
         if row_protocol_description:
-            graph.add((uri, rdflib.SDO.description, rdflib.Literal(row_protocol_description)))
+            graph.add((uri, rdflib.SDO.description, utils.rdf.literal(row_protocol_description)))
 
         # Add used procedure
         row_protocol_name: str | None = row["protocolName"]
@@ -576,6 +574,10 @@ class SurveySiteVisitMapper(base.mapper.ABISMapper):
             dataset: The dataset URI
             graph: The graph to update
         """
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_survey", uri, submission_iri):
+            return
+
         # Add type
         graph.add((uri, a, utils.namespaces.TERN.Survey))
         if submission_iri:
@@ -605,6 +607,10 @@ class SurveySiteVisitMapper(base.mapper.ABISMapper):
             row_existing_site_iri: existingBDRSiteIRI field from the template.
             graph: Graph to be modified.
         """
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_site", uri, uri_site_id_datatype, row_site_id, row_existing_site_iri):
+            return
+
         # Add class
         graph.add((uri, a, utils.namespaces.TERN.Site))
 
@@ -636,13 +642,24 @@ class SurveySiteVisitMapper(base.mapper.ABISMapper):
         # Check subject was provided
         if uri is None:
             return
+
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(
+            graph,
+            "add_site_id_datatype",
+            uri,
+            row_site_id_source,
+            uri_site_id_datatype_attribution,
+        ):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.RDFS.Datatype))
         # Add definition
-        graph.add((uri, rdflib.SKOS.definition, rdflib.Literal("An identifier for the site")))
+        graph.add((uri, rdflib.SKOS.definition, LITERAL_SITE_ID_DEFINITION))
         # Add label
         if row_site_id_source:
-            graph.add((uri, rdflib.SKOS.prefLabel, rdflib.Literal(f"{row_site_id_source} Site ID")))
+            graph.add((uri, rdflib.SKOS.prefLabel, utils.rdf.literal(f"{row_site_id_source} Site ID")))
         # Add attribution link
         if uri_site_id_datatype_attribution:
             graph.add((uri, rdflib.PROV.qualifiedAttribution, uri_site_id_datatype_attribution))
@@ -664,6 +681,11 @@ class SurveySiteVisitMapper(base.mapper.ABISMapper):
         # Check subject provided
         if uri is None:
             return
+
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_site_id_datatype_attribution", uri, uri_site_id_datatype_agent):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.PROV.Attribution))
         # Add role
@@ -689,11 +711,16 @@ class SurveySiteVisitMapper(base.mapper.ABISMapper):
         # Check subject provided
         if uri is None:
             return
+
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_site_id_datatype_agent", uri, row_site_id_source):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.PROV.Agent))
         # Add name
         if row_site_id_source:
-            graph.add((uri, rdflib.SDO.name, rdflib.Literal(row_site_id_source)))
+            graph.add((uri, rdflib.SDO.name, utils.rdf.literal(row_site_id_source)))
 
     def add_visit_org_agent(
         self,
@@ -713,7 +740,7 @@ class SurveySiteVisitMapper(base.mapper.ABISMapper):
         graph.add((uri, a, rdflib.PROV.Agent))
         graph.add((uri, a, rdflib.PROV.Organization))
         # Add name
-        graph.add((uri, rdflib.SDO.name, rdflib.Literal(row_visit_org)))
+        graph.add((uri, rdflib.SDO.name, utils.rdf.literal(row_visit_org)))
 
     def add_visit_observer_agent(
         self,
@@ -733,7 +760,7 @@ class SurveySiteVisitMapper(base.mapper.ABISMapper):
         graph.add((uri, a, rdflib.PROV.Agent))
         graph.add((uri, a, rdflib.PROV.Person))
         # Add name
-        graph.add((uri, rdflib.SDO.name, rdflib.Literal(row_visit_observer)))
+        graph.add((uri, rdflib.SDO.name, utils.rdf.literal(row_visit_observer)))
 
     def add_target_taxonomic_scope_attribute(
         self,
@@ -758,6 +785,16 @@ class SurveySiteVisitMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(
+            graph,
+            "add_target_taxonomic_scope_attribute",
+            uri,
+            row_target_taxonomic_scope,
+            uri_target_taxonomic_scope_value,
+        ):
+            return
+
         # Add type
         graph.add((uri, a, utils.namespaces.TERN.Attribute))
         if submission_iri:
@@ -771,7 +808,7 @@ class SurveySiteVisitMapper(base.mapper.ABISMapper):
 
         # Add values
         if row_target_taxonomic_scope:
-            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(row_target_taxonomic_scope)))
+            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(row_target_taxonomic_scope)))
         if uri_target_taxonomic_scope_value:
             graph.add((uri, utils.namespaces.TERN.hasValue, uri_target_taxonomic_scope_value))
 
@@ -797,6 +834,10 @@ class SurveySiteVisitMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(graph, "add_target_taxonomic_scope_value", uri, row_target_taxonomic_scope):
+            return
+
         # Add types
         graph.add((uri, a, utils.namespaces.TERN.IRI))
         graph.add((uri, a, utils.namespaces.TERN.Value))
@@ -835,6 +876,19 @@ class SurveySiteVisitMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Add link to the SiteVisit node
+        graph.add((uri, rdflib.SDO.hasPart, uri_site_visit_activity))
+
+        # The rest of the Collection is shared by every row, so only needs adding once per chunk
+        if self.added_in_chunk(
+            graph,
+            "add_target_taxonomic_scope_collection",
+            uri,
+            row_target_taxonomic_scope,
+            uri_target_taxonomic_scope_attribute,
+        ):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.SDO.Collection))
         if submission_iri:
@@ -846,13 +900,11 @@ class SurveySiteVisitMapper(base.mapper.ABISMapper):
                 (
                     uri,
                     rdflib.SDO.name,
-                    rdflib.Literal(f"Site Visit Collection - Target Taxonomic Scope - {row_target_taxonomic_scope}"),
+                    utils.rdf.literal(f"Site Visit Collection - Target Taxonomic Scope - {row_target_taxonomic_scope}"),
                 )
             )
         # Add link to dataset
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        # add link to the SiteVisit node
-        graph.add((uri, rdflib.SDO.hasPart, uri_site_visit_activity))
         # Add link to attribute
         if uri_target_taxonomic_scope_attribute is not None:
             graph.add((uri, utils.namespaces.TERN.hasAttribute, uri_target_taxonomic_scope_attribute))
@@ -880,6 +932,16 @@ class SurveySiteVisitMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(
+            graph,
+            "add_sampling_effort_attribute",
+            uri,
+            row_sampling_effort,
+            uri_sampling_effort_value,
+        ):
+            return
+
         # Add type
         graph.add((uri, a, utils.namespaces.TERN.Attribute))
         if submission_iri:
@@ -893,7 +955,7 @@ class SurveySiteVisitMapper(base.mapper.ABISMapper):
 
         # Add values
         if row_sampling_effort:
-            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, rdflib.Literal(row_sampling_effort)))
+            graph.add((uri, utils.namespaces.TERN.hasSimpleValue, utils.rdf.literal(row_sampling_effort)))
         if uri_sampling_effort_value:
             graph.add((uri, utils.namespaces.TERN.hasValue, uri_sampling_effort_value))
 
@@ -920,6 +982,16 @@ class SurveySiteVisitMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Shared node, only needs adding once per chunk
+        if self.added_in_chunk(
+            graph,
+            "add_sampling_effort_value",
+            uri,
+            row_sampling_effort_value,
+            row_sampling_effort_unit,
+        ):
+            return
+
         # Add types
         graph.add((uri, a, utils.namespaces.TERN.Float))
         graph.add((uri, a, utils.namespaces.TERN.Value))
@@ -960,6 +1032,19 @@ class SurveySiteVisitMapper(base.mapper.ABISMapper):
         if uri is None:
             return
 
+        # Add link to the SiteVisit node
+        graph.add((uri, rdflib.SDO.hasPart, uri_site_visit_activity))
+
+        # The rest of the Collection is shared by every row, so only needs adding once per chunk
+        if self.added_in_chunk(
+            graph,
+            "add_sampling_effort_collection",
+            uri,
+            row_sampling_effort,
+            uri_sampling_effort_attribute,
+        ):
+            return
+
         # Add type
         graph.add((uri, a, rdflib.SDO.Collection))
         if submission_iri:
@@ -971,13 +1056,11 @@ class SurveySiteVisitMapper(base.mapper.ABISMapper):
                 (
                     uri,
                     rdflib.SDO.name,
-                    rdflib.Literal(f"Site Visit Collection - Sampling Effort - {row_sampling_effort}"),
+                    utils.rdf.literal(f"Site Visit Collection - Sampling Effort - {row_sampling_effort}"),
                 )
             )
         # Add link to dataset
         graph.add((uri, rdflib.SDO.isPartOf, dataset))
-        # add link to the SiteVisit node
-        graph.add((uri, rdflib.SDO.hasPart, uri_site_visit_activity))
         # Add link to attribute
         if uri_sampling_effort_attribute is not None:
             graph.add((uri, utils.namespaces.TERN.hasAttribute, uri_sampling_effort_attribute))
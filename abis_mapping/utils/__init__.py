@@ -1,10 +1,14 @@
 """Exports sub-package interface"""
 
 # Local
+from . import bnodes
 from . import coords
 from . import iri_patterns
 from . import namespaces
 from . import rdf
+from . import serialization
+from . import stores
 from . import strings
 from . import terms
+from . import turtle
 from . import vocabs
@@ -11,10 +11,12 @@ import hashlib
 import rdflib
 
 # local
+from abis_mapping import settings
 from abis_mapping import utils
+from abis_mapping.utils import rdf
 
 # typing
-from typing import Literal
+from typing import Any, Literal
 
 
 def survey_iri(
@@ -219,7 +221,7 @@ def datatype_iri(
     )
 
 
-@functools.lru_cache()
+@functools.lru_cache(maxsize=settings.SETTINGS.IRI_CACHE_SIZE)
 def _hash_person_for_iri(agent: str, /) -> str:
     """Standard function for hashing an agent string to use in an IRI."""
     return hashlib.blake2b(agent.encode("utf-8"), digest_size=8, person=b"person_iri_hash").hexdigest()
@@ -280,7 +282,7 @@ def observation_iri(
     )
 
 
-@functools.lru_cache()
+@functools.lru_cache(maxsize=settings.SETTINGS.IRI_CACHE_SIZE)
 def _hash_observation_value_for_iri(value: str, /) -> str:
     """Standard function for hashing an Observation Value to use in an IRI."""
     return hashlib.blake2b(value.encode("utf-8"), digest_size=16, person=b"obs_val_iri_hash").hexdigest()
@@ -554,3 +556,15 @@ def delegation_iri(
         org=org,
         role=role,
     )
+
+
+# The bounded caches of slugified, quoted and hashed IRI parts, and of interned literals, by name.
+# Their size is the IRI_CACHE_SIZE setting, or the SLUGIFY_CACHE_SIZE and LITERAL_CACHE_SIZE
+# settings for slugify_for_uri and literal.
+IRI_CACHES: "dict[str, functools._lru_cache_wrapper[Any]]" = {
+    "slugify_for_uri": rdf.slugify_for_uri,
+    "quote_for_uri": rdf.quote_for_uri,
+    "hash_person_for_iri": _hash_person_for_iri,
+    "hash_observation_value_for_iri": _hash_observation_value_for_iri,
+    "literal": rdf._interned_literal,
+}
@@ -2,6 +2,8 @@
 
 # Standard
 import functools
+import re
+import string as string_
 import urllib.parse
 
 # Third-Party
@@ -10,6 +12,11 @@ import slugify
 
 # Local
 from . import namespaces
+from . import stores
+from abis_mapping import settings
+
+# Typing
+from typing import Any, Literal
 
 # The required set of namespaces for the create_graph utility function
 REQUIRED_NAMESPACES = [
@@ -30,16 +37,29 @@ REQUIRED_NAMESPACES = [
     ("abis", namespaces.ABIS),
 ]
 
+# Characters that are never changed by URL-quoting
+UNRESERVED_CHARS = string_.ascii_letters + string_.digits + "-._~"
+
+# Patterns of the fast path of slugify_for_uri(), for ASCII strings without HTML entities.
+# python-slugify removes commas between digits, and replaces runs of other characters
+# than letters and digits (including any dashes) with a single dash.
+SLUGIFY_THOUSANDS_SEPARATOR = re.compile(r"(?<=\d),(?=\d)")
+SLUGIFY_SEPARATORS = re.compile(r"[^a-zA-Z0-9]+")
+
 
-def create_graph() -> rdflib.Graph:
+def create_graph(store: Literal["default", "append"] = "default") -> rdflib.Graph:
     """Utility function that creates a base rdflib.Graph with the required
     namespaces bound with their expected prefix.
 
+    Args:
+        store: The rdflib store to back the graph with. "default" for rdflib's
+            Memory store, or "append" for the write-once `stores.AppendOnlyStore`.
+
     Returns:
         rdflib.Graph: Graph with expected namespaces bound.
     """
     # Create Graph
-    graph = rdflib.Graph()
+    graph = rdflib.Graph(store=stores.AppendOnlyStore()) if store == "append" else rdflib.Graph()
 
     # Bind Namespaces
     for ns in REQUIRED_NAMESPACES:
@@ -67,12 +87,18 @@ def uri(
     return namespace[internal_id]
 
 
-@functools.lru_cache()
+@functools.lru_cache(maxsize=settings.SETTINGS.SLUGIFY_CACHE_SIZE)
 def slugify_for_uri(string: str, /) -> str:
     """The standard way to slugify a string for use in an RDF URI.
 
     Slugify-ing is used when readability is more important than preserving the exact value.
+
+    ASCII strings without HTML entities (i.e. no "&") are slugified directly,
+    giving the same result as python-slugify, which is used for other strings
+    to transliterate them and decode their entities.
     """
+    if string.isascii() and "&" not in string:
+        return SLUGIFY_SEPARATORS.sub("-", SLUGIFY_THOUSANDS_SEPARATOR.sub("", string)).strip("-")
     return slugify.slugify(string, lowercase=False)
 
 
@@ -116,12 +142,15 @@ def uri_slugified(
     return namespace[path]
 
 
-@functools.lru_cache()
+@functools.lru_cache(maxsize=settings.SETTINGS.IRI_CACHE_SIZE)
 def quote_for_uri(string: str, /) -> str:
     """The standard way to URL-quote a string for use in an RDF URI.
 
     URL-quoting is used when preserving the exact value is important.
     """
+    # Most values only have unreserved characters, which are not changed by quoting
+    if not string.rstrip(UNRESERVED_CHARS):
+        return string
     return urllib.parse.quote(string, safe="")
 
 
@@ -188,3 +217,50 @@ def uri_or_string_literal(raw: str) -> rdflib.Literal:
         return rdflib.Literal(raw, datatype=rdflib.XSD.anyURI)
 
     return rdflib.Literal(raw)
+
+
+def literal(
+    value: Any,
+    /,
+    datatype: rdflib.URIRef | None = None,
+    lang: str | None = None,
+) -> rdflib.Literal:
+    """Gets an rdflib.Literal, interning literals of strings.
+
+    Literals of strings are shared from a bounded cache, so that values repeated
+    across rows (e.g. scientific names, dates and comments) are only created and
+    normalised once. rdflib literals are immutable, so can be shared.
+
+    Other values are not interned, since equal values can have different
+    lexical forms (e.g. `Decimal("1.0")` and `Decimal("1.00")`).
+
+    Args:
+        value: Value of the literal.
+        datatype: Optional datatype of the literal.
+        lang: Optional language of the literal.
+
+    Returns:
+        The literal.
+    """
+    if type(value) is str:
+        return _interned_literal(value, datatype, lang)
+    return rdflib.Literal(value, datatype=datatype, lang=lang)
+
+
+@functools.lru_cache(maxsize=settings.SETTINGS.LITERAL_CACHE_SIZE)
+def _interned_literal(
+    value: str,
+    datatype: rdflib.URIRef | None,
+    lang: str | None,
+) -> rdflib.Literal:
+    """Creates the literal of a string, for `literal()`.
+
+    Args:
+        value: Value of the literal.
+        datatype: Optional datatype of the literal.
+        lang: Optional language of the literal.
+
+    Returns:
+        The literal.
+    """
+    return rdflib.Literal(value, datatype=datatype, lang=lang)
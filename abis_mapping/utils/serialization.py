@@ -0,0 +1,136 @@
+"""Provides serialization of chunk graphs, optionally pipelined with mapping"""
+
+# Standard
+import collections
+import concurrent.futures
+import contextlib
+import io
+
+# Third-Party
+import rdflib
+
+# Local
+from . import stores
+from . import turtle
+
+# Typing
+from collections.abc import Iterable, Iterator
+
+
+def serialize(
+    graph: rdflib.Graph,
+    output_format: str,
+    graph_iri: rdflib.URIRef | None = None,
+) -> bytes:
+    """Serializes a chunk graph.
+
+    Each chunk is serialized as a complete document, concatenating these is
+    valid for line based formats and Turtle (which allows prefixes to be redeclared).
+    Turtle is written with the faster `turtle.write()` rather than rdflib.
+
+    Args:
+        graph: The chunk graph.
+        output_format: rdflib serialization format, e.g. "nt", "nquads" or "turtle".
+        graph_iri: Optional named graph to serialize the triples in, for
+            quad formats. Without one, "nquads" are the same as "nt".
+
+    Returns:
+        The serialized chunk, UTF-8 encoded.
+    """
+    if output_format == "nquads":
+        if graph_iri is None:
+            return graph.serialize(format="nt", encoding="utf-8")
+        dataset = rdflib.Dataset()
+        named_graph = dataset.graph(graph_iri)
+        named_graph += graph
+        return dataset.serialize(format=output_format, encoding="utf-8")
+    if output_format == "turtle":
+        output = io.BytesIO()
+        turtle.write(graph, output)
+        return output.getvalue()
+    return graph.serialize(format=output_format, encoding="utf-8")
+
+
+def serialize_chunks(
+    chunks: Iterable[rdflib.Graph],
+    *,
+    output_format: str,
+    graph_iri: rdflib.URIRef | None = None,
+    max_in_flight: int = 2,
+    executor: concurrent.futures.Executor | None = None,
+) -> Iterator[bytes]:
+    """Serializes chunk graphs in the background, while the next chunks are mapped.
+
+    Each chunk's triples are sent to the executor to be serialized, and the
+    chunk graph is released before the next one is requested. So with an
+    `apply_mapping()` generator as the chunks, mapping the next rows overlaps
+    with serializing the previous chunks. At most `max_in_flight` chunks are
+    waiting to be serialized, and the serialized chunks are yielded in order.
+
+    Sending the triples to another process costs about as much as serializing
+    them as N-Triples, so this mostly helps slower formats such as Turtle.
+
+    Args:
+        chunks: Chunk graphs to serialize, e.g. from `apply_mapping()`.
+        output_format: rdflib serialization format, e.g. "nt", "nquads" or "turtle".
+        graph_iri: Optional named graph to serialize the triples in, for
+            quad formats.
+        max_in_flight: Maximum number of chunks waiting to be serialized.
+        executor: Optional executor to serialize in. Defaults to a single
+            worker process, which is shut down when the iterator is closed.
+
+    Yields:
+        bytes: Each serialized chunk, UTF-8 encoded.
+
+    Raises:
+        ValueError: If max_in_flight is not greater than zero.
+    """
+    if max_in_flight <= 0:
+        raise ValueError("max_in_flight must be greater than zero")
+
+    with contextlib.ExitStack() as stack:
+        if executor is None:
+            executor = stack.enter_context(concurrent.futures.ProcessPoolExecutor(max_workers=1))
+        in_flight: collections.deque[concurrent.futures.Future[bytes]] = collections.deque()
+        try:
+            for graph in chunks:
+                if len(in_flight) >= max_in_flight:
+                    yield in_flight.popleft().result()
+                in_flight.append(
+                    executor.submit(_serialize_triples, list(graph), list(graph.namespaces()), output_format, graph_iri)
+                )
+                # Release the chunk before the next one is mapped
+                del graph
+            # Yield remaining chunks in order
+            while in_flight:
+                yield in_flight.popleft().result()
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+
+def _serialize_triples(
+    triples: list[tuple[rdflib.term.Node, rdflib.term.Node, rdflib.term.Node]],
+    namespaces: list[tuple[str, rdflib.URIRef]],
+    output_format: str,
+    graph_iri: rdflib.URIRef | None,
+) -> bytes:
+    """Serializes the triples of a chunk graph, in the executor.
+
+    Args:
+        triples: Triples of the chunk graph.
+        namespaces: Prefixes and namespaces bound in the chunk graph.
+        output_format: rdflib serialization format.
+        graph_iri: Optional named graph for quad formats.
+
+    Returns:
+        The serialized chunk, UTF-8 encoded.
+    """
+    # Rebuild the graph, with the same prefixes as the chunk.
+    # It is only serialized, so the cheaper to fill append only store is used.
+    graph = rdflib.Graph(store=stores.AppendOnlyStore(), bind_namespaces="none")
+    for prefix, namespace in namespaces:
+        graph.bind(prefix, namespace)
+    for triple in triples:
+        graph.add(triple)
+    return serialize(graph, output_format, graph_iri)
@@ -0,0 +1,131 @@
+"""Provides a fast streaming Turtle writer for chunk graphs"""
+
+# Standard
+import re
+
+# Third-Party
+import rdflib
+
+# Local
+from . import rdf
+
+# Typing
+from collections.abc import Callable, Iterable
+from typing import IO
+
+
+# Constants
+# Conservative pattern for local names that can be written as prefixed names
+_LOCAL_NAME = re.compile(r"(?:[A-Za-z_][A-Za-z0-9_-]*)?")
+# Characters that can not appear in an IRI written as <...>
+_INVALID_IRI_CHARS = re.compile(r'[\x00-\x20<>"{}|^`\\]')
+# Separators of the predicates of a subject, and objects of a predicate, one per line
+_PREDICATE_SEPARATOR = " ;\n    "
+_OBJECT_SEPARATOR = ",\n        "
+# Characters that must be escaped in a quoted string literal
+_STRING_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+
+
+def write(
+    graph: rdflib.Graph,
+    output: IO[bytes],
+    *,
+    namespaces: Iterable[tuple[str, object]] = rdf.REQUIRED_NAMESPACES,
+) -> None:
+    """Writes a graph as Turtle.
+
+    Unlike rdflib's Turtle serializer, subjects are not sorted and blank nodes
+    are not nested, and the prefixes are the given namespaces rather than being
+    computed from the graph. Each subject's triples are written as one block, in
+    the order the subjects are first seen in the graph (insertion order for the
+    `stores.AppendOnlyStore`). Each block is written to the output as it is
+    formatted, so the Turtle document is not held in memory.
+
+    Args:
+        graph: Graph to write.
+        output: Binary file object to write to.
+        namespaces: Prefixes and namespaces to use for prefixed names, the
+            namespace IRI of each is its str().
+
+    Raises:
+        ValueError: If a term can not be written as Turtle, e.g. an IRI with
+            spaces or angle brackets, which rdflib's serializer rejects too.
+    """
+    # Write the prefixes
+    prefixes: dict[str, str] = {}
+    header = []
+    for prefix, namespace in namespaces:
+        prefixes[str(namespace)] = prefix
+        header.append(f"@prefix {prefix}: <{namespace}> .\n")
+    header.append("\n")
+    output.write("".join(header).encode("utf-8"))
+
+    # Formatted terms, since IRIs are repeated across the triples
+    terms: dict[rdflib.term.Node, str] = {}
+
+    def term(node: rdflib.term.Node) -> str:
+        if (text := terms.get(node)) is not None:
+            return text
+        if isinstance(node, rdflib.URIRef):
+            text = _iri(node, prefixes)
+        elif isinstance(node, rdflib.Literal):
+            text = _literal(node, term)
+        elif isinstance(node, rdflib.BNode):
+            text = f"_:{node}"
+        else:
+            raise ValueError(f"Cannot write {node!r} as Turtle")
+        terms[node] = text
+        return text
+
+    # Group the triples by subject, and predicate within each subject
+    subjects: dict[rdflib.term.Node, dict[rdflib.term.Node, list[rdflib.term.Node]]] = {}
+    for s, p, o in graph:
+        subjects.setdefault(s, {}).setdefault(p, []).append(o)
+
+    # Write each subject's block
+    for subject, predicates in subjects.items():
+        lines = [
+            f"{'a' if predicate == rdflib.RDF.type else term(predicate)} {_OBJECT_SEPARATOR.join(map(term, objects))}"
+            for predicate, objects in predicates.items()
+        ]
+        output.write(f"{term(subject)} {_PREDICATE_SEPARATOR.join(lines)} .\n\n".encode("utf-8"))
+
+
+def _iri(iri: rdflib.URIRef, prefixes: dict[str, str]) -> str:
+    """Formats an IRI, as a prefixed name if possible.
+
+    Args:
+        iri: IRI to format.
+        prefixes: Prefixes by namespace.
+
+    Returns:
+        The formatted IRI.
+
+    Raises:
+        ValueError: If the IRI has characters that can not be written in Turtle.
+    """
+    split = max(iri.rfind("/"), iri.rfind("#")) + 1
+    prefix = prefixes.get(iri[:split])
+    if prefix is not None and _LOCAL_NAME.fullmatch(iri, split):
+        return f"{prefix}:{iri[split:]}"
+    if _INVALID_IRI_CHARS.search(iri):
+        raise ValueError(f"{iri!r} does not look like a valid IRI, it cannot be written as Turtle")
+    return f"<{iri}>"
+
+
+def _literal(literal: rdflib.Literal, term: Callable[[rdflib.term.Node], str]) -> str:
+    """Formats a literal, keeping its exact lexical form.
+
+    Args:
+        literal: Literal to format.
+        term: Function to format the datatype IRI.
+
+    Returns:
+        The formatted literal.
+    """
+    value = f'"{str(literal).translate(_STRING_ESCAPES)}"'
+    if literal.language:
+        return f"{value}@{literal.language}"
+    if literal.datatype is not None:
+        return f"{value}^^{term(literal.datatype)}"
+    return value
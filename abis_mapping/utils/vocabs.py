@@ -2,7 +2,11 @@
 
 # Standard
 import abc
+import contextlib
+import contextvars
 import datetime
+import functools
+import types
 
 # Third-Party
 import rdflib
@@ -13,6 +17,7 @@ from abis_mapping.utils import strings
 from abis_mapping.utils import namespaces
 
 # Typing
+from collections.abc import Callable, Iterator, Mapping
 from typing import Optional, Iterable, Final, Type
 
 
@@ -21,6 +26,11 @@ a = rdflib.RDF.type
 PENDING_SCHEME = rdf.uri("bdr-cv/pending", namespaces.BDR)
 STATUS_SUBMITTED = rdflib.URIRef("https://linked.data.gov.au/def/reg-statuses/submitted")
 
+# Callback for each term created by a flexible vocabulary in the current context
+_ON_CREATED: contextvars.ContextVar[Callable[[str, str], None] | None] = contextvars.ContextVar(
+    "on_created", default=None
+)
+
 
 class Term:
     def __init__(
@@ -100,10 +110,28 @@ class Vocabulary(abc.ABC):
     def __init__(self) -> None:
         """Vocabulary constructor."""
 
+        # Mapping from Terms, built once per vocabulary
+        self._mapping = self.index()
+
+    @classmethod
+    @functools.cache
+    def index(cls) -> Mapping[str | None, rdflib.URIRef]:
+        """Builds and Caches the Mapping from sanitised labels to IRIs.
+
+        Vocabularies are instantiated for every value that is mapped, so the
+        mapping is only built once and shared by all instances.
+
+        Returns:
+            Mapping[str | None, rdflib.URIRef]: Read-only mapping from
+                sanitised labels to IRIs.
+        """
         # Generate Dictionary Mapping from Terms
-        self._mapping: dict[str | None, rdflib.URIRef] = {}
-        for term in self.terms:
-            self._mapping.update(term.to_mapping().items())
+        mapping: dict[str | None, rdflib.URIRef] = {}
+        for term in cls.terms:
+            mapping.update(term.to_mapping().items())
+
+        # Return read-only mapping
+        return types.MappingProxyType(mapping)
 
     @abc.abstractmethod
     def get(self, value: str | None) -> rdflib.URIRef:
@@ -201,9 +229,23 @@ class FlexibleVocabulary(Vocabulary):
         self.source = source
         self.submitted_on_date = submitted_on_date
 
+    @classmethod
+    @functools.cache
+    def index(cls) -> Mapping[str | None, rdflib.URIRef]:
+        """Builds and Caches the Mapping from sanitised labels to IRIs.
+
+        Returns:
+            Mapping[str | None, rdflib.URIRef]: Read-only mapping from
+                sanitised labels to IRIs, including the default if applicable.
+        """
+        mapping = dict(super().index())
+
         # Add Default mapping if Applicable
-        if self.default:
-            self._mapping.update({None: self.default.iri})
+        if cls.default:
+            mapping[None] = cls.default.iri
+
+        # Return read-only mapping
+        return types.MappingProxyType(mapping)
 
     def _add_pref_label(
         self,
@@ -220,7 +262,7 @@ class FlexibleVocabulary(Vocabulary):
             value (str): Raw string value provided in supplied data.
         """
         # Add triple to graph.
-        self.graph.add((iri, rdflib.SKOS.prefLabel, rdflib.Literal(value)))
+        self.graph.add((iri, rdflib.SKOS.prefLabel, rdf.literal(value)))
 
     def get(
         self,
@@ -288,7 +330,7 @@ class FlexibleVocabulary(Vocabulary):
             (
                 iri,
                 rdflib.SKOS.scopeNote,
-                rdflib.Literal(f"This concept is proposed as a member of this scheme: {self.proposed_scheme}"),
+                rdf.literal(f"This concept is proposed as a member of this scheme: {self.proposed_scheme}"),
             )
         )
 
@@ -300,7 +342,7 @@ class FlexibleVocabulary(Vocabulary):
             self.graph.add((iri, rdflib.SKOS.broader, self.broader))
 
         # Construct Source URI Literal
-        source_literal = rdflib.Literal(self.source, datatype=rdflib.XSD.anyURI)
+        source_literal = rdf.literal(self.source, datatype=rdflib.XSD.anyURI)
         # Add Source
         self.graph.add((iri, rdflib.SDO.citation, source_literal))
 
@@ -312,12 +354,34 @@ class FlexibleVocabulary(Vocabulary):
             (
                 iri,
                 rdflib.SKOS.historyNote,
-                rdflib.Literal(
+                rdf.literal(
                     f"This concept was used in data submitted to the BDR on {self.submitted_on_date.isoformat()}"
                 ),
             )
         )
 
+        # Notify of the new term once it is complete, if in an `on_created()` block
+        if (on_created_callback := _ON_CREATED.get()) is not None:
+            on_created_callback(self.vocab_id, preferred_label)
+
+
+@contextlib.contextmanager
+def on_created(callback: Callable[[str, str], None] | None) -> Iterator[None]:
+    """Calls a callback for each term created by flexible vocabularies in the block.
+
+    Args:
+        callback: Callback, called with the vocabulary ID and the preferred
+            label of each created term. None for no callback.
+
+    Yields:
+        None.
+    """
+    token = _ON_CREATED.set(callback)
+    try:
+        yield
+    finally:
+        _ON_CREATED.reset(token)
+
 
 class VocabularyError(Exception):
     """Error Raised in Vocabulary Handling"""
@@ -378,3 +442,13 @@ def get_flexible_vocab(key: str) -> Type[FlexibleVocabulary]:
     if not issubclass(vocab_class, FlexibleVocabulary):
         raise ValueError(f"Key {key} is not a subclass of FlexibleVocabulary.")
     return vocab_class
+
+
+def registered_vocabs() -> Iterable[Type[Vocabulary]]:
+    """Retrieves all the registered vocabularies.
+
+    Returns:
+        The registered vocabulary classes.
+    """
+    # Do not return the _id_registry dict itself to reduce chance it is mutated outside this module.
+    return _id_registry.values()
@@ -74,7 +74,7 @@ class KingdomOccurrence(utils.vocabs.FlexibleVocabulary):
             value (str): Raw value provided within the supplied data.
         """
         # Add triple to graph
-        self.graph.add((iri, rdflib.SKOS.prefLabel, rdflib.Literal(f"{value} occurrence")))
+        self.graph.add((iri, rdflib.SKOS.prefLabel, utils.rdf.literal(f"{value} occurrence")))
 
 
 class KingdomSpecimen(utils.vocabs.FlexibleVocabulary):
@@ -98,7 +98,7 @@ class KingdomSpecimen(utils.vocabs.FlexibleVocabulary):
             value (str): Raw value provided within the supplied data.
         """
         # Add triple to graph
-        self.graph.add((iri, rdflib.SKOS.prefLabel, rdflib.Literal(f"{value} specimen")))
+        self.graph.add((iri, rdflib.SKOS.prefLabel, utils.rdf.literal(f"{value} specimen")))
 
 
 # Register
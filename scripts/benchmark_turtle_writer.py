@@ -0,0 +1,115 @@
+"""Script to benchmark the streaming Turtle writer against rdflib's Turtle serializer.
+
+Maps the incidental occurrence example, repeated with unique providerRecordIDs
+to the given number of rows, into one chunk graph for each store, and then
+times writing it with `abis_mapping.utils.turtle.write()` and with rdflib."""
+
+# standard library
+import argparse
+import io
+import pathlib
+import time
+
+# third party
+import rdflib
+
+# local
+import abis_mapping
+import tests.helpers
+
+# typing
+from collections.abc import Callable
+
+
+# Constants
+TEMPLATE_ID = "incidental_occurrence_data-v3.0.0.csv"
+DATA = pathlib.Path(
+    "abis_mapping/templates/incidental_occurrence_data_v3/examples/margaret_river_flora/margaret_river_flora.csv"
+)
+
+
+def scaled_data(rows: int) -> bytes:
+    """Repeats the example rows, with unique providerRecordIDs.
+
+    Args:
+        rows: Number of rows.
+
+    Returns:
+        Raw CSV data.
+    """
+    header, *example = DATA.read_text().splitlines(keepends=True)
+    lines = [header]
+    for number in range(rows):
+        # providerRecordID is the first column
+        lines.append(f"{number}-{example[number % len(example)]}")
+    return "".join(lines).encode("utf-8")
+
+
+def best_time(function: Callable[[], object], repeat: int) -> float:
+    """Times a function, taking the best of several runs.
+
+    Args:
+        function: Function to time.
+        repeat: Number of runs.
+
+    Returns:
+        The best time, in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def time_writers(graph: rdflib.Graph, repeat: int) -> tuple[float, float]:
+    """Times writing a graph as Turtle with the streaming writer and with rdflib.
+
+    Args:
+        graph: Graph to write.
+        repeat: Number of runs of each writer.
+
+    Returns:
+        The best times of the streaming writer and of rdflib, in seconds.
+    """
+    writer = best_time(lambda: abis_mapping.utils.turtle.write(graph, io.BytesIO()), repeat)
+    serializer = best_time(lambda: graph.serialize(format="turtle"), repeat)
+    return writer, serializer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1600, help="Number of rows to map (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs of each writer (default: %(default)s)")
+    args = parser.parse_args()
+
+    mapper = abis_mapping.get_mapper(TEMPLATE_ID)
+    if mapper is None:
+        raise RuntimeError(f"Mapper not found for {TEMPLATE_ID}")
+    data = scaled_data(args.rows)
+
+    for store in ["default", "append"]:
+        # Map to one chunk graph
+        (graph,) = mapper().apply_mapping(
+            data=data,
+            chunk_size=None,
+            dataset_iri=tests.helpers.TEST_DATASET_IRI,
+            base_iri=tests.helpers.TEST_BASE_NAMESPACE,
+            submission_iri=tests.helpers.TEST_SUBMISSION_IRI,
+            project_iri=tests.helpers.TEST_PROJECT_IRI,
+            submitted_on_date=tests.helpers.TEST_SUBMITTED_ON_DATE,
+            store=store,
+        )
+
+        # Time the writers
+        writer, serializer = time_writers(graph, args.repeat)
+        print(
+            f"{store} store, {len(graph)} triples: "
+            f"turtle.write() {writer:.2f}s, rdflib {serializer:.2f}s ({serializer / writer:.1f}x)"
+        )
+        del graph
+
+
+if __name__ == "__main__":
+    main()
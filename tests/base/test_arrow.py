@@ -0,0 +1,151 @@
+"""Provides Unit Tests for the `abis_mapping.base.arrow` module"""
+
+# Standard
+import datetime
+import decimal
+import pathlib
+
+# Third-party
+import frictionless
+import pytest
+
+# Local
+from abis_mapping import base
+from abis_mapping import models
+import abis_mapping
+import tests.helpers
+
+# Typing
+from typing import Any
+
+
+# Optional Third-party
+pyarrow = pytest.importorskip("pyarrow")
+pyarrow_csv = pytest.importorskip("pyarrow.csv")
+pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+
+# Constants
+TEMPLATE_ID = "incidental_occurrence_data-v3.0.0.csv"
+DATA = pathlib.Path(
+    "abis_mapping/templates/incidental_occurrence_data_v3/examples/margaret_river_flora/margaret_river_flora.csv"
+)
+
+
+@pytest.fixture
+def parquet_path(tmp_path: pathlib.Path) -> pathlib.Path:
+    """Writes the example data as Parquet, with its columns reversed and small row groups.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+
+    Returns:
+        Path of the Parquet file.
+    """
+    table = pyarrow_csv.read_csv(DATA)
+    path = tmp_path / "data.parquet"
+    pyarrow_parquet.write_table(table.select(table.column_names[::-1]), path, row_group_size=4)
+    return path
+
+
+def test_arrow_source_maps_as_csv(parquet_path: pathlib.Path) -> None:
+    """Tests Arrow tables and Parquet files are validated and mapped the same as the CSV.
+
+    Args:
+        parquet_path: Path of the example data as Parquet.
+    """
+    mapper = abis_mapping.get_mapper(TEMPLATE_ID)
+    assert mapper
+    kwargs: dict[str, Any] = dict(
+        chunk_size=None,
+        dataset_iri=tests.helpers.TEST_DATASET_IRI,
+        base_iri=tests.helpers.TEST_BASE_NAMESPACE,
+        submission_iri=tests.helpers.TEST_SUBMISSION_IRI,
+        project_iri=None,
+        submitted_on_date=tests.helpers.TEST_SUBMITTED_ON_DATE,
+    )
+    (expected,) = mapper().apply_mapping(data=DATA.read_bytes(), **kwargs)
+
+    for source in [
+        base.arrow.ArrowSource(pyarrow_csv.read_csv(DATA), batch_size=5),
+        base.arrow.ArrowSource(parquet_path, batch_size=5),
+    ]:
+        # Validate and map
+        report = mapper().apply_validation(source)
+        (graph,) = mapper().apply_mapping(data=source, **kwargs)
+
+        # Assert
+        assert report.valid
+        assert tests.helpers.compare_graphs(graph, expected)
+
+
+def test_rows_converts_values() -> None:
+    """Tests columns are ordered and converted for the fields matched to them by name."""
+    schema = frictionless.Schema.from_descriptor(
+        {
+            "fields": [
+                {"name": "id", "type": "string"},
+                {"name": "start", "type": "timestamp"},
+                {"name": "end", "type": "timestamp"},
+                {"name": "tags", "type": "list"},
+                {"name": "count", "type": "number"},
+                {"name": "extra", "type": "string"},
+            ]
+        }
+    )
+    table = pyarrow.table(
+        {
+            "extra": ["x", None],
+            "count": [1.5, None],
+            "tags": [["a", " b ", ""], []],
+            "end": [datetime.date(2024, 5, 6), None],
+            "start": pyarrow.array(
+                [datetime.datetime(2024, 5, 6, 7, 8), None],
+                type=pyarrow.timestamp("s", tz="UTC"),
+            ),
+            "id": [1, 2],
+        }
+    )
+
+    # Read the rows, and the resource
+    header, *rows = base.arrow.ArrowSource(table).rows(schema)
+    with base.arrow.ArrowSource(table).resource(schema).open() as resource:
+        resource_rows = list(resource.row_stream)
+
+    # Assert
+    assert header == ["id", "start", "end", "tags", "count", "extra"]
+    assert rows == [
+        [
+            "1",
+            models.temporal.Datetime(2024, 5, 6, 7, 8, tzinfo=datetime.timezone.utc),
+            models.temporal.Date(2024, 5, 6),
+            ["a", "b"],
+            1.5,
+            "x",
+        ],
+        ["2", None, None, None, None, None],
+    ]
+    assert type(rows[0][1]) is models.temporal.Datetime
+    assert type(rows[0][2]) is models.temporal.Date
+    assert [row.valid for row in resource_rows] == [True, True]
+    assert resource_rows[0]["count"] == decimal.Decimal("1.5")
+
+
+def test_preflight_samples_parquet(parquet_path: pathlib.Path) -> None:
+    """Tests preflight validation of Parquet data takes the head rows and a sample of the rest.
+
+    Args:
+        parquet_path: Path of the example data as Parquet.
+    """
+    mapper = abis_mapping.get_mapper(TEMPLATE_ID)
+    assert mapper
+
+    # Preflight
+    report = mapper().preflight(base.arrow.ArrowSource(parquet_path), head_rows=3, sample_rows=5)
+
+    # Assert
+    assert report.valid
+    assert report.head_rows == 3
+    assert report.sampled_rows == 5
+    assert base.arrow.is_parquet(parquet_path)
+    assert not base.arrow.is_parquet(DATA)
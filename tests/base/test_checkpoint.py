@@ -0,0 +1,108 @@
+"""Provides Unit Tests for the `abis_mapping.base.checkpoint` module"""
+
+# Standard
+import pathlib
+
+# Third-party
+import pytest
+
+# Local
+from abis_mapping import base
+
+
+def test_checkpoint_check_resumable() -> None:
+    """Tests a checkpoint only resumes an equivalent mapping run."""
+    checkpoint = base.checkpoint.Checkpoint(template_id="a", dataset_iri="https://example.com/", chunk_size=2)
+
+    # Same run, no error
+    checkpoint.check_resumable(template_id="a", dataset_iri="https://example.com/", chunk_size=2)
+
+    # Different chunk size would misalign chunk boundaries
+    with pytest.raises(ValueError, match="cannot be used to resume"):
+        checkpoint.check_resumable(template_id="a", dataset_iri="https://example.com/", chunk_size=3)
+
+    # As would a different chunk budget
+    with pytest.raises(ValueError, match="cannot be used to resume"):
+        checkpoint.check_resumable(
+            template_id="a",
+            dataset_iri="https://example.com/",
+            chunk_size=2,
+            max_triples_per_chunk=100,
+        )
+
+
+def test_memory_checkpoint_store() -> None:
+    """Tests the memory checkpoint store keeps a copy of the last saved checkpoint."""
+    store = base.checkpoint.MemoryCheckpointStore()
+    assert store.load() is None
+
+    checkpoint = base.checkpoint.Checkpoint(template_id="a", dataset_iri="b", chunk_size=2, row_number=4)
+    store.save(checkpoint)
+    # Mutating after save does not change the stored checkpoint
+    checkpoint.row_number = 6
+
+    loaded = store.load()
+    assert loaded is not None
+    assert loaded.row_number == 4
+
+
+def test_file_checkpoint_store(tmp_path: pathlib.Path) -> None:
+    """Tests the file checkpoint store round trips a checkpoint.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+    """
+    path = tmp_path / "checkpoint.json"
+    store = base.checkpoint.FileCheckpointStore(path)
+    assert store.load() is None
+
+    checkpoint = base.checkpoint.Checkpoint(
+        template_id="a",
+        dataset_iri="b",
+        chunk_size=2,
+        row_number=4,
+        chunk_number=2,
+        state={"key": [1, 2]},
+    )
+    store.save(checkpoint)
+
+    # A fresh store (e.g. in a restarted worker) loads the same checkpoint
+    assert base.checkpoint.FileCheckpointStore(path).load() == checkpoint
+    # No temporary files left behind
+    assert [p.name for p in tmp_path.iterdir()] == ["checkpoint.json"]
+
+
+@pytest.mark.parametrize("store_type", ["memory", "file"])
+def test_checkpoint_store_entries(store_type: str, tmp_path: pathlib.Path) -> None:
+    """Tests the append-only logs of checkpoint stores, discarding uncommitted batches.
+
+    Args:
+        store_type: Type of checkpoint store.
+        tmp_path: Pytest temporary directory fixture.
+    """
+    path = tmp_path / "checkpoint.json"
+    store: base.checkpoint.CheckpointStore
+    if store_type == "memory":
+        store = base.checkpoint.MemoryCheckpointStore()
+    else:
+        store = base.checkpoint.FileCheckpointStore(path)
+    assert store.load_entries("key", 0) == []
+
+    # Append batches, the last one is not committed
+    assert store.append_entries("key", [1, 2]) == 1
+    assert store.append_entries("key", [3]) == 2
+    assert store.append_entries("key", [4]) == 3
+    if store_type == "file":
+        # A fresh store (e.g. in a restarted worker) reads the same log
+        store = base.checkpoint.FileCheckpointStore(path)
+
+    # Loading the committed batches discards the uncommitted one
+    assert store.load_entries("key", 2) == [1, 2, 3]
+    assert store.append_entries("key", [5]) == 3
+    assert store.load_entries("key", 3) == [1, 2, 3, 5]
+
+    # A log missing committed batches
+    with pytest.raises(ValueError, match="fewer than the 4 committed"):
+        store.load_entries("key", 4)
+    with pytest.raises(ValueError, match="fewer than the 1 committed"):
+        store.load_entries("other", 1)
@@ -0,0 +1,78 @@
+"""Provides Unit Tests for the `abis_mapping.base.chunking` module"""
+
+# Third-party
+import pytest
+import rdflib
+
+# Local
+from abis_mapping import base
+
+
+def add_triples(graph: rdflib.Graph, count: int) -> None:
+    """Adds distinct triples to the graph.
+
+    Args:
+        graph: Graph to add to.
+        count: Number of triples to add.
+    """
+    start = len(graph)
+    for i in range(start, start + count):
+        graph.add((rdflib.URIRef(f"https://example.com/{i}"), rdflib.RDF.value, rdflib.Literal(i)))
+
+
+def test_chunk_budget_invalid() -> None:
+    """Tests the chunk budget limits must be greater than zero."""
+    with pytest.raises(ValueError, match="max_triples_per_chunk must be greater than zero"):
+        base.chunking.ChunkBudget(max_triples=0)
+
+
+def test_chunk_budget_unbounded() -> None:
+    """Tests a chunk budget without limits is never full."""
+    budget = base.chunking.ChunkBudget()
+    graph = rdflib.Graph()
+    add_triples(graph, 100)
+
+    assert budget.unbounded
+    assert not budget.add_row(graph)
+
+
+def test_chunk_budget_rows() -> None:
+    """Tests the chunk budget is full after chunk_size rows."""
+    budget = base.chunking.ChunkBudget(chunk_size=2)
+    graph = rdflib.Graph()
+
+    assert not budget.add_row(graph)
+    assert budget.add_row(graph)
+
+    # Reset for the next chunk
+    budget.start()
+    assert not budget.add_row(graph)
+
+
+def test_chunk_budget_triples() -> None:
+    """Tests the chunk budget is full once the graph reaches max_triples."""
+    budget = base.chunking.ChunkBudget(max_triples=10)
+    graph = rdflib.Graph()
+
+    add_triples(graph, 6)
+    assert not budget.add_row(graph)
+    add_triples(graph, 6)
+    assert budget.add_row(graph)
+
+    stats = budget.stats(graph, chunk_number=1, last_row=2)
+    assert stats.rows == 2
+    assert stats.first_row == 1
+    assert stats.triples == 12
+
+
+def test_chunk_budget_bytes() -> None:
+    """Tests the chunk budget is full once the graph's estimated size reaches max_bytes."""
+    graph = rdflib.Graph()
+    add_triples(graph, 10)
+    estimate = base.chunking.ChunkBudget().estimated_bytes(graph)
+    assert estimate > 0
+
+    budget = base.chunking.ChunkBudget(max_bytes=estimate * 2)
+    assert not budget.add_row(graph)
+    add_triples(graph, 10)
+    assert budget.add_row(graph)
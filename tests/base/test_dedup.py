@@ -0,0 +1,53 @@
+"""Provides Unit Tests for the `abis_mapping.base.dedup` module"""
+
+# Third-party
+import rdflib
+
+# Local
+from abis_mapping import base
+from abis_mapping import utils
+
+
+def test_shared_node_registry_deduplicate() -> None:
+    """Tests shared node triples are only kept the first time they are seen."""
+    concept = utils.namespaces.EXAMPLE.concept
+    occurrence = utils.namespaces.EXAMPLE.occurrence
+    registry = base.dedup.SharedNodeRegistry()
+
+    # First chunk
+    chunk1 = rdflib.Graph()
+    chunk1.add((concept, rdflib.RDF.type, rdflib.SKOS.Concept))
+    chunk1.add((concept, rdflib.SKOS.prefLabel, rdflib.Literal("foo")))
+    chunk1.add((occurrence, rdflib.RDF.type, utils.namespaces.DWC.Occurrence))
+    assert registry.deduplicate(chunk1) == 0
+    assert len(chunk1) == 3
+
+    # Second chunk re-emits the concept, with one new triple
+    chunk2 = rdflib.Graph()
+    chunk2.add((concept, rdflib.RDF.type, rdflib.SKOS.Concept))
+    chunk2.add((concept, rdflib.SKOS.prefLabel, rdflib.Literal("foo")))
+    chunk2.add((concept, rdflib.SKOS.prefLabel, rdflib.Literal("foo", lang="en")))
+    chunk2.add((occurrence, rdflib.RDF.type, utils.namespaces.DWC.Occurrence))
+    assert registry.deduplicate(chunk2) == 2
+    assert set(chunk2) == {
+        (concept, rdflib.SKOS.prefLabel, rdflib.Literal("foo", lang="en")),
+        # Not a shared node type, so it is left alone
+        (occurrence, rdflib.RDF.type, utils.namespaces.DWC.Occurrence),
+    }
+
+
+def test_shared_node_registry_bounded() -> None:
+    """Tests the registry stops recording once full, and can be restored."""
+    registry = base.dedup.SharedNodeRegistry(max_entries=1)
+
+    graph = rdflib.Graph()
+    graph.add((utils.namespaces.EXAMPLE.a, rdflib.RDF.type, rdflib.PROV.Agent))
+    graph.add((utils.namespaces.EXAMPLE.b, rdflib.RDF.type, rdflib.PROV.Agent))
+    registry.deduplicate(graph)
+    assert len(registry) == 1
+    assert registry.full
+
+    # Restore from saved state
+    restored = base.dedup.SharedNodeRegistry()
+    restored.restore(registry.state())
+    assert restored.state() == registry.state()
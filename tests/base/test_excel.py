@@ -0,0 +1,137 @@
+"""Provides Unit Tests for the `abis_mapping.base.excel` module"""
+
+# Standard
+import csv
+import datetime
+import io
+import pathlib
+
+# Third-party
+import openpyxl
+import pytest
+
+# Local
+from abis_mapping import base
+import abis_mapping
+import tests.helpers
+
+# Typing
+from collections.abc import Iterable
+from typing import Any
+
+
+# Constants
+TEMPLATE_ID = "incidental_occurrence_data-v3.0.0.csv"
+DATA = pathlib.Path(
+    "abis_mapping/templates/incidental_occurrence_data_v3/examples/margaret_river_flora/margaret_river_flora.csv"
+)
+
+
+def workbook(rows: Iterable[Iterable[Any]], title: str = "Data") -> bytes:
+    """Writes rows to a workbook, after an empty first sheet.
+
+    Args:
+        rows: Values of the cells of each row.
+        title: Title of the sheet of the rows, which is the active sheet.
+
+    Returns:
+        The XLSX workbook.
+    """
+    book = openpyxl.Workbook(write_only=True)
+    book.create_sheet("Instructions")
+    sheet = book.create_sheet(title)
+    for row in rows:
+        sheet.append(list(row))
+    book.active = 1
+    output = io.BytesIO()
+    book.save(output)
+    return output.getvalue()
+
+
+def test_as_csv_maps_as_csv() -> None:
+    """Tests a workbook of the example data is validated and mapped the same as the CSV."""
+    mapper = abis_mapping.get_mapper(TEMPLATE_ID)
+    assert mapper
+    rows = list(csv.reader(io.StringIO(DATA.read_text())))
+    data = workbook(rows)
+    kwargs: dict[str, Any] = dict(
+        chunk_size=None,
+        dataset_iri=tests.helpers.TEST_DATASET_IRI,
+        base_iri=tests.helpers.TEST_BASE_NAMESPACE,
+        submission_iri=tests.helpers.TEST_SUBMISSION_IRI,
+        project_iri=None,
+        submitted_on_date=tests.helpers.TEST_SUBMITTED_ON_DATE,
+    )
+
+    # Convert, validate and map
+    assert base.excel.is_xlsx(data)
+    assert not base.excel.is_xlsx(DATA)
+    with base.excel.as_csv(data) as converted:
+        assert isinstance(converted, io.BufferedReader)
+        path = pathlib.Path(converted.name)
+        converted_rows = list(csv.reader(io.StringIO(path.read_text())))
+        # Each pass reads its own file object, since frictionless closes it
+        with path.open("rb") as f:
+            report = mapper().apply_validation(f)
+        with path.open("rb") as f:
+            (graph,) = mapper().apply_mapping(data=f, **kwargs)
+    (expected,) = mapper().apply_mapping(data=DATA.read_bytes(), **kwargs)
+
+    # Assert
+    assert converted_rows == rows
+    assert report.valid
+    assert tests.helpers.compare_graphs(graph, expected)
+    with base.excel.as_csv(DATA) as unchanged:
+        assert unchanged is DATA
+
+
+def test_write_csv_shapes_rows() -> None:
+    """Tests rows are padded to the header, keeping extra and blank rows but not trailing blank rows."""
+    data = workbook(
+        [
+            ["a", "b", "c", None],
+            ["1"],
+            [],
+            [None, None, None, None, None],
+            ["2", None, None, None, "extra"],
+            [],
+            [None, ""],
+        ]
+    )
+    output = io.StringIO()
+
+    # Convert the active sheet, and a named sheet
+    assert base.excel.write_csv(data, output) == 4
+    assert base.excel.write_csv(data, io.StringIO(), sheet="Instructions") == 0
+
+    # Assert
+    assert output.getvalue() == "a,b,c\n1,,\n,,\n,,\n2,,,,extra\n"
+    with pytest.raises(ValueError, match="no sheet 'Missing'"):
+        base.excel.write_csv(data, io.StringIO(), sheet="Missing")
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, ""),
+        ("text", "text"),
+        (True, "TRUE"),
+        (12, "12"),
+        (12.0, "12"),
+        (-33.123456789, "-33.123456789"),
+        (0.1 + 0.2, "0.3"),
+        (1e20, "1e+20"),
+        (datetime.datetime(2024, 5, 6), "2024-05-06"),
+        (datetime.datetime(2024, 5, 6, 7, 8, 9), "2024-05-06T07:08:09"),
+        (datetime.date(2024, 5, 6), "2024-05-06"),
+        (datetime.time(7, 8), "07:08:00"),
+    ],
+)
+def test_cell_to_text(value: object, expected: str) -> None:
+    """Tests cell values are written as they would be typed in CSV.
+
+    Args:
+        value: Value of the cell.
+        expected: Expected text.
+    """
+    assert base.excel.cell_to_text(value) == expected
@@ -558,3 +558,21 @@ def test_fields(
 
     # Assert
     assert list(mapper.fields().keys()) == ["fieldA", "fieldB"]
+
+
+def test_added_in_chunk() -> None:
+    """Tests the per-chunk memo of shared nodes already added."""
+    mapper = StubMapper()
+    graph = rdflib.Graph()
+    uri = rdflib.URIRef("https://example.com/site")
+
+    # First time for a key, then recorded
+    assert not mapper.added_in_chunk(graph, "add_site", uri, "A")
+    assert mapper.added_in_chunk(graph, "add_site", uri, "A")
+    # Different values for the same node are distinct keys
+    assert not mapper.added_in_chunk(graph, "add_site", uri, "a")
+
+    # Memo is reset for the next chunk's graph
+    next_graph = rdflib.Graph()
+    assert not mapper.added_in_chunk(next_graph, "add_site", uri, "A")
+    assert mapper.added_in_chunk(next_graph, "add_site", uri, "A")
@@ -0,0 +1,65 @@
+"""Provides Unit Tests for the `abis_mapping.base.memory` module"""
+
+# Standard
+import pathlib
+import tracemalloc
+
+# Local
+from abis_mapping import base
+from abis_mapping import utils
+import abis_mapping
+import tests.helpers
+
+
+# Constants
+TEMPLATE_ID = "incidental_occurrence_data-v3.0.0.csv"
+DATA = pathlib.Path(
+    "abis_mapping/templates/incidental_occurrence_data_v3/examples/margaret_river_flora/margaret_river_flora.csv"
+)
+
+
+def test_diagnose_memory() -> None:
+    """Tests a memory report is recorded for each chunk."""
+    mapper = abis_mapping.get_mapper(TEMPLATE_ID)
+    assert mapper
+    assert not tracemalloc.is_tracing()
+
+    chunk_stats: list[base.chunking.ChunkStats] = []
+    with base.memory.diagnose_memory() as diagnostics:
+        assert tracemalloc.is_tracing()
+        for chunk in mapper().apply_mapping(
+            data=DATA.read_bytes(),
+            chunk_size=5,
+            dataset_iri=tests.helpers.TEST_DATASET_IRI,
+            base_iri=tests.helpers.TEST_BASE_NAMESPACE,
+            submission_iri=tests.helpers.TEST_SUBMISSION_IRI,
+            project_iri=tests.helpers.TEST_PROJECT_IRI,
+            submitted_on_date=tests.helpers.TEST_SUBMITTED_ON_DATE,
+            on_chunk=chunk_stats.append,
+        ):
+            del chunk
+
+    # Assert
+    assert not tracemalloc.is_tracing()
+    assert [report.stats for report in diagnostics.reports] == chunk_stats
+    for report in diagnostics.reports:
+        assert report.traced_bytes == sum(report.subsystem_bytes.values())
+        assert report.growth_bytes == sum(report.subsystem_growth_bytes.values())
+    assert diagnostics.reports[0].subsystem_growth_bytes["rdflib"] > 0
+    assert diagnostics.reports[0].subsystem_growth_bytes["frictionless"] > 0
+    lines = diagnostics.format().splitlines()
+    assert len(lines) == len(chunk_stats) + 1
+    assert lines[0].split()[-1] == "other"
+
+
+def test_frame_subsystem() -> None:
+    """Tests frames are attributed to the subsystems."""
+    diagnostics = base.memory.MemoryDiagnostics()
+    slugify = utils.rdf.slugify_for_uri.__wrapped__.__code__
+
+    # Assert
+    assert diagnostics._frame_subsystem(slugify.co_filename, slugify.co_firstlineno + 1) == "iri-caches"
+    assert diagnostics._frame_subsystem(slugify.co_filename, 1) is None
+    assert diagnostics._frame_subsystem("/venv/lib/rdflib/term.py", 1) == "rdflib"
+    assert diagnostics._frame_subsystem("C:\\venv\\lib\\frictionless\\table\\row.py", 1) == "frictionless"
+    assert diagnostics._frame_subsystem("/src/abis_mapping/vocabs/sex.py", 1) == "vocabularies"
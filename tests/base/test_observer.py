@@ -0,0 +1,137 @@
+"""Provides Unit Tests for the `abis_mapping.base.observer` module"""
+
+# Standard
+import pathlib
+
+# Third-Party
+import pytest
+
+# Local
+from abis_mapping import base
+from abis_mapping import utils
+import abis_mapping
+import tests.helpers
+
+# Typing
+from typing import Any
+
+
+# Constants
+TEMPLATE_ID = "incidental_occurrence_data-v3.0.0.csv"
+DATA = pathlib.Path(
+    "abis_mapping/templates/incidental_occurrence_data_v3/examples/margaret_river_flora/margaret_river_flora.csv"
+)
+MAPPING_KWARGS: dict[str, Any] = {
+    "dataset_iri": tests.helpers.TEST_DATASET_IRI,
+    "base_iri": tests.helpers.TEST_BASE_NAMESPACE,
+    "submission_iri": tests.helpers.TEST_SUBMISSION_IRI,
+    "project_iri": tests.helpers.TEST_PROJECT_IRI,
+    "submitted_on_date": tests.helpers.TEST_SUBMITTED_ON_DATE,
+}
+
+
+class RecordingObserver(base.observer.MappingObserver):
+    """Observer recording the calls of its hooks."""
+
+    rows_interval = 3
+
+    def __init__(self) -> None:
+        """RecordingObserver constructor."""
+        self.rows: list[int] = []
+        self.chunks: list[tuple[base.chunking.ChunkStats, float, int | None]] = []
+        self.created: list[tuple[str, str]] = []
+        self.cache_stats: list[dict[str, Any]] = []
+        self.errors: list[base.validation.ValidationIssue | Exception] = []
+
+    def on_rows(self, rows: int) -> None:
+        """Records the rows."""
+        self.rows.append(rows)
+
+    def on_chunk(self, stats: base.chunking.ChunkStats, seconds: float, rss_bytes: int | None) -> None:
+        """Records the chunk."""
+        self.chunks.append((stats, seconds, rss_bytes))
+
+    def on_vocab_created(self, vocab_id: str, value: str) -> None:
+        """Records the created term."""
+        self.created.append((vocab_id, value))
+
+    def on_cache_stats(self, stats: Any) -> None:
+        """Records the cache statistics."""
+        self.cache_stats.append(dict(stats))
+
+    def on_error(self, error: base.validation.ValidationIssue | Exception) -> None:
+        """Records the error."""
+        self.errors.append(error)
+
+
+def test_observe_mapping() -> None:
+    """Tests the hooks called while mapping."""
+    mapper = abis_mapping.get_mapper(TEMPLATE_ID)
+    assert mapper
+    rows = len(DATA.read_text().splitlines()) - 1
+    observer = RecordingObserver()
+
+    chunk_stats: list[base.chunking.ChunkStats] = []
+    for chunk in mapper().apply_mapping(
+        data=DATA.read_bytes(),
+        chunk_size=5,
+        on_chunk=chunk_stats.append,
+        observer=observer,
+        **MAPPING_KWARGS,
+    ):
+        del chunk
+
+    # Assert
+    assert sum(observer.rows) == rows
+    assert max(observer.rows) == 3
+    assert [stats for stats, _, _ in observer.chunks] == chunk_stats
+    assert all(seconds > 0 and rss_bytes for _, seconds, rss_bytes in observer.chunks)
+    assert len(observer.cache_stats) == len(chunk_stats)
+    assert set(observer.cache_stats[-1]) == set(utils.iri_patterns.IRI_CACHES)
+    assert ("TAXON_RANK", "new taxon rank") in observer.created
+    assert not observer.errors
+
+
+def test_observe_mapping_error() -> None:
+    """Tests an exception raised while mapping is reported."""
+    mapper = abis_mapping.get_mapper(TEMPLATE_ID)
+    assert mapper
+    instance = mapper()
+    observer = RecordingObserver()
+
+    def apply_mapping_row(**kwargs: Any) -> None:
+        raise RuntimeError("bad row")
+
+    instance.apply_mapping_row = apply_mapping_row  # type: ignore[method-assign]
+
+    # Map within an observe() block
+    with base.observer.observe(observer), pytest.raises(RuntimeError):
+        for chunk in instance.apply_mapping(data=DATA.read_bytes(), chunk_size=5, **MAPPING_KWARGS):
+            del chunk
+
+    # Assert
+    assert [str(error) for error in observer.errors] == ["bad row"]
+
+
+def test_observe_validation() -> None:
+    """Tests the hooks called while validating, including while streaming errors."""
+    mapper = abis_mapping.get_mapper(TEMPLATE_ID)
+    assert mapper
+    header, *rows = DATA.read_text().splitlines(keepends=True)
+    data = "".join([header, *rows, rows[0]]).encode("utf-8")
+    observer = RecordingObserver()
+    stream_observer = RecordingObserver()
+
+    with base.observer.observe(observer):
+        report = mapper().apply_validation(data)
+    with base.observer.observe(stream_observer):
+        mapper().stream_validation(data, on_error=lambda issue: None)
+
+    # Assert
+    assert not report.valid
+    assert sum(observer.rows) == len(rows) + 1
+    assert [error.message for error in observer.errors] == [  # type: ignore[union-attr]
+        error.message for error in report.tasks[0].errors
+    ]
+    assert observer.errors[0].type == "unique-error"  # type: ignore[union-attr]
+    assert stream_observer.errors == observer.errors
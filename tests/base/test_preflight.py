@@ -0,0 +1,126 @@
+"""Provides Unit Tests for the `abis_mapping.base.preflight` module"""
+
+# Standard
+import io
+import pathlib
+
+# Third-party
+import pytest
+
+# Local
+import abis_mapping
+
+
+# Constants
+TEMPLATE_ID = "incidental_occurrence_data-v3.0.0.csv"
+DATA = pathlib.Path(
+    "abis_mapping/templates/incidental_occurrence_data_v3/examples/margaret_river_flora/margaret_river_flora.csv"
+)
+# A valid example of each registered template
+EXAMPLES = {
+    "incidental_occurrence_data-v3.0.0.csv": DATA,
+    "incidental_occurrence_delete-v1.0.0.csv": pathlib.Path(
+        "abis_mapping/templates/incidental_occurrence_delete_v1/examples/example.csv"
+    ),
+    "survey_metadata-v3.0.0.csv": pathlib.Path("abis_mapping/templates/survey_metadata_v3/examples/minimal.csv"),
+    "survey_occurrence_data-v3.0.0.csv": pathlib.Path(
+        "abis_mapping/templates/survey_occurrence_data_v3/examples/margaret_river_flora/margaret_river_flora.csv"
+    ),
+    "survey_site_data-v3.0.0.csv": pathlib.Path("abis_mapping/templates/survey_site_data_v3/examples/minimal.csv"),
+    "survey_site_visit_data-v3.0.0.csv": pathlib.Path(
+        "abis_mapping/templates/survey_site_visit_data_v3/examples/minimal.csv"
+    ),
+}
+
+
+def test_preflight_valid() -> None:
+    """Tests preflight validation of valid data, from a path and a file object."""
+    mapper = abis_mapping.get_mapper(TEMPLATE_ID)
+    assert mapper
+    stream = io.BytesIO(DATA.read_bytes())
+
+    # Preflight
+    report = mapper().preflight(DATA, head_rows=5, sample_rows=10)
+    stream_report = mapper().preflight(stream, head_rows=5, sample_rows=10)
+
+    # Assert
+    assert report.valid
+    assert report.template_id == TEMPLATE_ID
+    assert report.head_rows == 5
+    assert 0 < report.sampled_rows <= 10
+    assert stream_report.issues == report.issues
+    assert stream_report.sampled_rows == report.sampled_rows
+    assert stream.tell() == 0
+
+
+def test_preflight_examples_cover_all_templates() -> None:
+    """Tests there is an example to preflight for every registered template."""
+    assert set(EXAMPLES) == abis_mapping.registered_ids()
+
+
+@pytest.mark.parametrize("template_id", sorted(EXAMPLES))
+def test_preflight_template_example(template_id: str) -> None:
+    """Tests preflight validation of the example of each template.
+
+    Args:
+        template_id: ID of the template.
+    """
+    mapper = abis_mapping.get_mapper(template_id)
+    assert mapper
+
+    # Preflight
+    report = mapper().preflight(EXAMPLES[template_id])
+
+    # Assert
+    assert report.valid, report.issues
+
+
+def test_preflight_sampled_rows() -> None:
+    """Tests errors are found in rows sampled from beyond the head rows."""
+    mapper = abis_mapping.get_mapper(TEMPLATE_ID)
+    assert mapper
+    header, *rows = DATA.read_text().splitlines(keepends=True)
+    invalid = rows[-1].replace(",-33.", ",north", 1)
+    assert invalid != rows[-1]
+    data = "".join([header, *rows[:-1], invalid]).encode("utf-8")
+
+    # Preflight
+    head_report = mapper().preflight(data, head_rows=len(rows) - 1, sample_rows=0)
+    report = mapper().preflight(data, head_rows=2, sample_rows=200)
+    full_report = mapper().preflight(data, head_rows=len(rows), sample_rows=0)
+
+    # Assert
+    assert head_report.valid
+    assert [(issue.type, issue.field_name, issue.row_number) for issue in report.issues] == [
+        ("type-error", "decimalLatitude", None)
+    ]
+    assert report.issues[0].message.endswith("(in a sampled row)")
+    assert [(issue.type, issue.row_number) for issue in full_report.issues] == [("type-error", len(rows) + 1)]
+
+
+def test_preflight_wrong_template() -> None:
+    """Tests preflight validation of data for another template."""
+    mapper = abis_mapping.get_mapper("survey_metadata-v3.0.0.csv")
+    assert mapper
+
+    # Preflight
+    report = mapper().preflight(DATA)
+
+    # Assert
+    assert not report.valid
+    assert {issue.type for issue in report.issues} >= {"incorrect-label"}
+
+
+def test_preflight_encoding() -> None:
+    """Tests preflight validation of data that is not UTF-8 or is empty."""
+    mapper = abis_mapping.get_mapper(TEMPLATE_ID)
+    assert mapper
+    data = DATA.read_text().replace("Lat", "Låt").encode("latin-1")
+
+    # Preflight
+    report = mapper().preflight(data)
+    empty_report = mapper().preflight(b"")
+
+    # Assert
+    assert [issue.type for issue in report.issues] == ["encoding-error"]
+    assert not empty_report.valid
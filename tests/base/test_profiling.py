@@ -0,0 +1,103 @@
+"""Provides Unit Tests for the `abis_mapping.base.profiling` module"""
+
+# Standard
+import pathlib
+
+# Local
+from abis_mapping import base
+from abis_mapping import utils
+import abis_mapping
+import tests.helpers
+
+# Typing
+from typing import Any
+
+
+# Constants
+TEMPLATE_ID = "incidental_occurrence_data-v3.0.0.csv"
+DATA = pathlib.Path(
+    "abis_mapping/templates/incidental_occurrence_data_v3/examples/margaret_river_flora/margaret_river_flora.csv"
+)
+
+
+def map_data(mapper: base.mapper.ABISMapper) -> int:
+    """Maps the example data.
+
+    Args:
+        mapper: Mapper to map with.
+
+    Returns:
+        Number of triples mapped.
+    """
+    kwargs: dict[str, Any] = {
+        "data": DATA.read_bytes(),
+        "chunk_size": 5,
+        "dataset_iri": tests.helpers.TEST_DATASET_IRI,
+        "base_iri": tests.helpers.TEST_BASE_NAMESPACE,
+        "submission_iri": tests.helpers.TEST_SUBMISSION_IRI,
+        "project_iri": tests.helpers.TEST_PROJECT_IRI,
+        "submitted_on_date": tests.helpers.TEST_SUBMITTED_ON_DATE,
+    }
+    triples = 0
+    for chunk in mapper.apply_mapping(**kwargs):
+        triples += len(chunk)
+        del chunk
+    return triples
+
+
+def test_profile_mapping(tmp_path: pathlib.Path) -> None:
+    """Tests the profile of a mapping, and that the profiled functions are restored.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+    """
+    mapper = abis_mapping.get_mapper(TEMPLATE_ID)
+    assert mapper
+    original_iri = utils.iri_patterns.observation_iri
+    original_attributes = set(vars(mapper))
+    rows = len(DATA.read_text().splitlines()) - 1
+
+    with base.profiling.profile_mapping(output_dir=tmp_path) as profile:
+        triples = map_data(mapper())
+
+    # Assert the totals by call stack
+    totals = profile.self_totals()
+    assert totals[("apply_mapping_row",)][0] == rows
+    assert totals[("apply_mapping_row", "add_occurrence")][0] == rows
+    assert ("apply_mapping_row", "iri:observation_iri") in totals
+    assert any(path[-1] == "vocab:BASIS_OF_RECORD" for path in totals)
+    row_triples = sum(self_triples for _, _, self_triples, _ in totals.values())
+    assert 0 < row_triples <= triples
+    assert all(self_ns <= total_ns for _, self_ns, _, total_ns in totals.values())
+
+    # Assert the files written
+    (summary,) = tmp_path.glob("incidental_occurrence_data-v3.0.0.csv-*.txt")
+    lines = summary.read_text().splitlines()
+    assert lines[0].split()[-1] == "name"
+    assert {line.split()[-1] for line in lines[1:]} >= {"apply_mapping_row", "add_occurrence", "iri:observation_iri"}
+    (collapsed,) = tmp_path.glob("*.collapsed")
+    stacks = dict(line.rsplit(" ", 1) for line in collapsed.read_text().splitlines())
+    assert set(stacks) == {";".join(path) for path in totals}
+    assert all(value.isdigit() for value in stacks.values())
+
+    # Assert the profiled functions are restored
+    assert utils.iri_patterns.observation_iri is original_iri
+    assert set(vars(mapper)) == original_attributes
+
+
+def test_profile_mapping_setting(tmp_path: pathlib.Path) -> None:
+    """Tests profiling is enabled by the setting, and not otherwise.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+    """
+    mapper = abis_mapping.get_mapper(TEMPLATE_ID)
+    assert mapper
+
+    map_data(mapper())
+    with tests.helpers.override_settings(MAPPING_PROFILE_DIR=tmp_path / "profiles"):
+        map_data(mapper())
+
+    # Assert
+    assert len(list((tmp_path / "profiles").glob("*.txt"))) == 1
+    assert len(list((tmp_path / "profiles").glob("*.collapsed"))) == 1
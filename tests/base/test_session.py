@@ -0,0 +1,151 @@
+"""Provides Unit Tests for the `abis_mapping.base.session` module"""
+
+# Standard
+import concurrent.futures
+import pathlib
+
+# Third-party
+import pytest
+import rdflib
+
+# Local
+from abis_mapping import base
+from abis_mapping import models
+import tests.helpers
+
+
+# Constants
+TEMPLATE_ID = "incidental_occurrence_data-v3.0.0.csv"
+DATA = pathlib.Path(
+    "abis_mapping/templates/incidental_occurrence_data_v3/examples/margaret_river_flora/margaret_river_flora.csv"
+)
+
+
+def test_mapping_session() -> None:
+    """Tests validating and mapping several submissions with a session."""
+    session = base.session.MappingSession(template_ids=[TEMPLATE_ID])
+    data = DATA.read_bytes()
+
+    # The mapper is created once, and reused
+    assert session.mapper(TEMPLATE_ID) is session.mapper(TEMPLATE_ID)
+
+    graphs: list[rdflib.Graph] = []
+    for _ in range(2):
+        assert session.validate(TEMPLATE_ID, data).valid
+        for chunk in session.map(
+            TEMPLATE_ID,
+            data=data,
+            chunk_size=None,
+            dataset_iri=tests.helpers.TEST_DATASET_IRI,
+            base_iri=tests.helpers.TEST_BASE_NAMESPACE,
+            submission_iri=tests.helpers.TEST_SUBMISSION_IRI,
+            project_iri=None,
+            submitted_on_date=tests.helpers.TEST_SUBMITTED_ON_DATE,
+        ):
+            graphs.append(chunk)
+            del chunk
+
+    # Assert
+    assert len(graphs) == 2
+    assert tests.helpers.compare_graphs(graphs[0], graphs[1])
+    stats = session.stats()
+    assert stats.validations == 2
+    assert stats.mappings == 2
+    assert stats.validation_seconds > 0
+    assert stats.mapping_seconds > 0
+    assert stats.mappers == [TEMPLATE_ID]
+    assert stats.cache_hits["quote_for_uri"] > 0
+
+
+def test_mapping_session_cache_cap() -> None:
+    """Tests the session clears the IRI caches when they exceed the cap."""
+    session = base.session.MappingSession(template_ids=[], max_cache_entries=1)
+    session.validate(TEMPLATE_ID, DATA.read_bytes())
+
+    # Validation does not fill the caches, so they are only cleared once filled by mapping
+    clears = session.stats().cache_clears
+    for chunk in session.map(
+        TEMPLATE_ID,
+        data=DATA.read_bytes(),
+        chunk_size=None,
+        dataset_iri=tests.helpers.TEST_DATASET_IRI,
+        base_iri=tests.helpers.TEST_BASE_NAMESPACE,
+        submission_iri=None,
+        project_iri=None,
+        submitted_on_date=tests.helpers.TEST_SUBMITTED_ON_DATE,
+    ):
+        del chunk
+
+    # Assert
+    stats = session.stats()
+    assert stats.cache_clears == clears + 1
+    assert sum(stats.cache_entries.values()) == 0
+
+
+def test_mapping_session_invalid() -> None:
+    """Tests the session rejects unknown templates and invalid caps."""
+    with pytest.raises(ValueError, match="not found"):
+        base.session.MappingSession(template_ids=["unknown"])
+    with pytest.raises(ValueError, match="greater than zero"):
+        base.session.MappingSession(max_cache_entries=0)
+
+
+def test_mapping_session_concurrent() -> None:
+    """Tests mapping submissions concurrently from several threads with a shared session."""
+    session = base.session.MappingSession(template_ids=[TEMPLATE_ID])
+    data = DATA.read_bytes()
+
+    def map_submission(number: int) -> rdflib.Graph:
+        result = rdflib.Graph()
+        for chunk in session.map(
+            TEMPLATE_ID,
+            data=data,
+            chunk_size=3,
+            dataset_iri=tests.helpers.TEST_DATASET_IRI,
+            base_iri=tests.helpers.TEST_BASE_NAMESPACE,
+            submission_iri=tests.helpers.TEST_SUBMISSION_IRI,
+            project_iri=None,
+            submitted_on_date=tests.helpers.TEST_SUBMITTED_ON_DATE,
+            bnode_seed=f"submission-{number % 2}",
+        ):
+            result += chunk
+            del chunk
+        return result
+
+    # Map sequentially, and then concurrently
+    expected = [map_submission(number) for number in range(2)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(map_submission, range(8)))
+
+    # Assert
+    for number, result in enumerate(results):
+        assert set(result) == set(expected[number % 2])
+    assert session.stats().mappings == 10
+
+
+def test_mapping_session_warms_threads() -> None:
+    """Tests the CRS transformers cached per thread are warmed for each thread mapping with the session."""
+    session = base.session.MappingSession(template_ids=[TEMPLATE_ID])
+    warmed = len(models.spatial._thread_local.transformers)
+
+    def map_submission() -> int:
+        for chunk in session.map(
+            TEMPLATE_ID,
+            data=b"",
+            chunk_size=None,
+            dataset_iri=tests.helpers.TEST_DATASET_IRI,
+            base_iri=tests.helpers.TEST_BASE_NAMESPACE,
+            submission_iri=tests.helpers.TEST_SUBMISSION_IRI,
+            project_iri=None,
+            submitted_on_date=tests.helpers.TEST_SUBMITTED_ON_DATE,
+        ):
+            del chunk
+        return len(models.spatial._thread_local.transformers)
+
+    # Map empty data in a new thread
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        thread_transformers = executor.submit(map_submission).result()
+
+    # Assert
+    assert warmed > 0
+    assert thread_transformers == warmed
@@ -0,0 +1,121 @@
+"""Provides Unit Tests for the `abis_mapping.base.source` module"""
+
+# Standard
+import pathlib
+
+# Third-party
+import pytest
+import pytest_mock
+
+# Local
+from abis_mapping import base
+import abis_mapping
+import tests.helpers
+
+# Typing
+from typing import Any
+
+
+# Constants
+TEMPLATE_ID = "incidental_occurrence_data-v3.0.0.csv"
+DATA = pathlib.Path(
+    "abis_mapping/templates/incidental_occurrence_data_v3/examples/margaret_river_flora/margaret_river_flora.csv"
+)
+
+
+def test_source_handle_maps_as_bytes(tmp_path: pathlib.Path) -> None:
+    """Tests handles of bytes and of memory mapped files are validated and mapped the same as bytes.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+    """
+    mapper = abis_mapping.get_mapper(TEMPLATE_ID)
+    assert mapper
+    kwargs: dict[str, Any] = dict(
+        chunk_size=None,
+        dataset_iri=tests.helpers.TEST_DATASET_IRI,
+        base_iri=tests.helpers.TEST_BASE_NAMESPACE,
+        submission_iri=tests.helpers.TEST_SUBMISSION_IRI,
+        project_iri=None,
+        submitted_on_date=tests.helpers.TEST_SUBMITTED_ON_DATE,
+    )
+    (expected,) = mapper().apply_mapping(data=DATA.read_bytes(), **kwargs)
+    path = tmp_path / "data.csv"
+    path.write_bytes(DATA.read_bytes())
+
+    for handle in [base.source.SourceHandle(DATA.read_bytes()), base.source.SourceHandle.from_path(path)]:
+        with handle:
+            # Validate and map
+            report = mapper().apply_validation(handle)
+            (graph,) = mapper().apply_mapping(data=handle, **kwargs)
+
+            # Assert
+            assert report.valid
+            assert tests.helpers.compare_graphs(graph, expected)
+            del graph
+
+
+def test_row_offsets_and_fragments() -> None:
+    """Tests rows are indexed and split by CSV rows, not by lines."""
+    data = b'a,b\n1,"x\ny"\n2,z\n3,"""q"""'
+    handle = base.source.SourceHandle(data)
+
+    # Assert
+    assert list(handle.row_offsets()) == [0, 4, 12, 16, len(data)]
+    assert list(handle.fragments(2)) == [b'a,b\n1,"x\ny"\n2,z\n', b'a,b\n3,"""q"""']
+    assert list(base.source.SourceHandle(b"a,b\n").fragments(2)) == []
+    handle.close()
+
+
+def test_open_reads_and_seeks() -> None:
+    """Tests each pass reads the data from the start, independently of other passes."""
+    handle = base.source.SourceHandle(b"a,b\n1,2\n")
+
+    # Open two passes
+    with handle.open() as first, handle.open() as second:
+        assert first.read(4) == b"a,b\n"
+        assert second.read() == b"a,b\n1,2\n"
+        first.seek(-2, 2)
+        assert first.read() == b"2\n"
+        assert first.tell() == 8
+
+    # Views are released once the passes are closed
+    handle.close()
+
+
+def test_field_names_cached(mocker: pytest_mock.MockerFixture) -> None:
+    """Tests the field names of a handle are only inferred once.
+
+    Args:
+        mocker: The mocker fixture.
+    """
+    mapper = abis_mapping.get_mapper(TEMPLATE_ID)
+    assert mapper
+    handle = base.source.SourceHandle(DATA.read_bytes())
+    spy = mocker.spy(abis_mapping.base.mapper, "_infer_field_names")
+
+    # Get the extra fields twice
+    first = mapper.extra_fields_schema(handle)
+    second = mapper.extra_fields_schema(handle)
+
+    # Assert
+    assert first.field_names == second.field_names
+    assert spy.call_count == 1
+
+
+def test_close_with_open_pass(tmp_path: pathlib.Path) -> None:
+    """Tests a memory mapped file can not be unmapped while a pass is open.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+    """
+    path = tmp_path / "data.csv"
+    path.write_bytes(b"a,b\n")
+    handle = base.source.SourceHandle.from_path(path)
+    stream = handle.open()
+
+    # Assert
+    with pytest.raises(BufferError):
+        handle.close()
+    stream.close()
+    handle.close()
@@ -0,0 +1,158 @@
+"""Provides Unit Tests for the `abis_mapping.base.stream` module"""
+
+# Standard
+import io
+import pathlib
+
+# Third-party
+import pytest
+import rdflib
+
+# Local
+from abis_mapping import base
+import abis_mapping
+import tests.helpers
+
+# Typing
+from collections.abc import Iterator
+from typing import Any
+
+
+# Constants
+TEMPLATE_ID = "survey_site_data-v3.0.0.csv"
+DATA = pathlib.Path("abis_mapping/templates/survey_site_data_v3/examples/minimal.csv")
+INVALID_DATA = pathlib.Path("abis_mapping/templates/survey_site_data_v3/examples/minimal-error-duplicate-site-ids.csv")
+MAPPING_KWARGS: dict[str, Any] = dict(
+    chunk_size=2,
+    dataset_iri=tests.helpers.TEST_DATASET_IRI,
+    base_iri=tests.helpers.TEST_BASE_NAMESPACE,
+    submission_iri=tests.helpers.TEST_SUBMISSION_IRI,
+    project_iri=None,
+    submitted_on_date=tests.helpers.TEST_SUBMITTED_ON_DATE,
+)
+
+
+class SlowStream(io.RawIOBase):
+    """Non-seekable stream, returning a few bytes at a time like a network upload."""
+
+    def __init__(self, data: bytes) -> None:
+        """SlowStream constructor.
+
+        Args:
+            data: Data of the stream.
+        """
+        super().__init__()
+        self._data = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        """Whether the stream can be read from, which it can."""
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """Reads up to 100 bytes into a buffer.
+
+        Args:
+            buffer: Writable buffer to read into.
+
+        Returns:
+            Number of bytes read.
+        """
+        data = self._data.read(min(len(buffer), 100))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def merge_chunks(chunks: Iterator[rdflib.Graph]) -> rdflib.Graph:
+    """Merges the chunks of a mapping into one graph.
+
+    Args:
+        chunks: The chunks.
+
+    Returns:
+        The merged graph.
+    """
+    merged = rdflib.Graph()
+    for chunk in chunks:
+        merged += chunk
+        del chunk
+    return merged
+
+
+def test_single_pass_maps_as_multiple_passes() -> None:
+    """Tests a single pass over a stream validates, extracts keys and maps the same as separate passes."""
+    mapper = abis_mapping.templates.survey_site_data_v3.mapping.SurveySiteMapper
+    expected = merge_chunks(mapper().apply_mapping(data=DATA.read_bytes(), **MAPPING_KWARGS))
+    expected_keys = mapper().extract_site_identifiers(DATA.read_bytes())
+
+    # Map in a single pass
+    instance = mapper()
+    result = base.stream.SinglePassResult()
+    graphs = instance.apply_single_pass(
+        data=base.stream.StreamSource(SlowStream(DATA.read_bytes())),
+        result=result,
+        extractors={"site_identifiers": instance.site_identifier_key},
+        **MAPPING_KWARGS,
+    )
+    actual = merge_chunks(graphs)
+
+    # Assert
+    assert result.report is not None
+    assert result.report.valid
+    assert tests.helpers.compare_graphs(actual, expected)
+    assert result.keys["site_identifiers"] == expected_keys
+    assert result.rows == result.mapped_rows > 0
+
+
+def test_single_pass_stops_mapping_at_first_error() -> None:
+    """Tests a single pass stops mapping at the first error, and reports the errors of separate validation."""
+    mapper = abis_mapping.get_mapper(TEMPLATE_ID)
+    assert mapper
+    expected = mapper().apply_validation(INVALID_DATA.read_bytes())
+
+    # Map in a single pass
+    result = base.stream.SinglePassResult()
+    for chunk in mapper().apply_single_pass(
+        data=base.stream.StreamSource(io.BytesIO(INVALID_DATA.read_bytes())),
+        result=result,
+        **MAPPING_KWARGS,
+    ):
+        del chunk
+
+    # Assert
+    assert result.report is not None
+    assert not result.report.valid
+    assert result.report.flatten(["type", "note"]) == expected.flatten(["type", "note"])
+    assert result.mapped_rows < result.rows
+
+
+def test_stream_source_is_read_once() -> None:
+    """Tests a stream source can seek back within its first bytes, and is only read once."""
+    data = b"a,b\n" + b"1,2\n" * base.stream.PREFIX_SIZE
+    source = base.stream.StreamSource(SlowStream(data))
+
+    # Assert
+    assert source.header == b"a,b\n"
+    assert len(source.head) % 4 == 0
+    stream = source.open()
+    assert stream.read(4) == b"a,b\n"
+    stream.seek(0)
+    assert stream.read() == data
+    with pytest.raises(io.UnsupportedOperation):
+        stream.seek(0)
+    with pytest.raises(RuntimeError):
+        source.open()
+
+
+def test_preflight_does_not_read_stream() -> None:
+    """Tests preflight checks of a stream source leave the stream to be validated."""
+    mapper = abis_mapping.get_mapper(TEMPLATE_ID)
+    assert mapper
+    source = base.stream.StreamSource(io.BytesIO(DATA.read_bytes()))
+
+    # Preflight and validate
+    preflight = mapper().preflight(source)
+    report = mapper().apply_validation(source)
+
+    # Assert
+    assert preflight.valid
+    assert report.valid
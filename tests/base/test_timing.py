@@ -0,0 +1,104 @@
+"""Provides Unit Tests for the `abis_mapping.base.timing` module"""
+
+# Standard
+import pathlib
+
+# Third-Party
+import pytest
+
+# Local
+from abis_mapping import base
+import abis_mapping
+
+
+# Constants
+TEMPLATE_ID = "incidental_occurrence_data-v3.0.0.csv"
+DATA = pathlib.Path(
+    "abis_mapping/templates/incidental_occurrence_data_v3/examples/margaret_river_flora/margaret_river_flora.csv"
+)
+# A valid example of each registered template
+EXAMPLES = {
+    "incidental_occurrence_data-v3.0.0.csv": DATA,
+    "incidental_occurrence_delete-v1.0.0.csv": pathlib.Path(
+        "abis_mapping/templates/incidental_occurrence_delete_v1/examples/example.csv"
+    ),
+    "survey_metadata-v3.0.0.csv": pathlib.Path("abis_mapping/templates/survey_metadata_v3/examples/minimal.csv"),
+    "survey_occurrence_data-v3.0.0.csv": pathlib.Path(
+        "abis_mapping/templates/survey_occurrence_data_v3/examples/margaret_river_flora/margaret_river_flora.csv"
+    ),
+    "survey_site_data-v3.0.0.csv": pathlib.Path("abis_mapping/templates/survey_site_data_v3/examples/minimal.csv"),
+    "survey_site_visit_data-v3.0.0.csv": pathlib.Path(
+        "abis_mapping/templates/survey_site_visit_data_v3/examples/minimal.csv"
+    ),
+}
+
+
+def test_timed_validation() -> None:
+    """Tests the checks and field parsers are timed, and restored afterwards."""
+    mapper = abis_mapping.get_mapper(TEMPLATE_ID)
+    assert mapper
+    rows = len(DATA.read_text().splitlines()) - 1
+
+    stats: list[base.timing.TimingStats] = []
+    report = mapper().timed_validation(DATA.read_bytes(), on_stats=stats.extend)
+
+    # Assert
+    assert report.valid
+    assert report.stats["timings"] == [stat.__dict__ for stat in stats]  # type: ignore[typeddict-item]
+    checks = {stat.name: stat for stat in stats if stat.kind == "check"}
+    fields = {stat.name: stat for stat in stats if stat.kind == "field"}
+    assert {"is-tabular", "not-empty", "chronological-order(eventDateStart,eventDateEnd)"} <= set(checks)
+    assert {"providerRecordID", "decimalLatitude", "eventDateStart"} <= set(fields)
+    assert {stat.calls for stat in stats} == {rows}
+    assert all(0 < stat.p99_seconds and stat.total_seconds > 0 for stat in stats)
+    assert [stat.total_seconds for stat in stats] == sorted((stat.total_seconds for stat in stats), reverse=True)
+
+    # Validating again is not timed
+    assert "timings" not in mapper().apply_validation(DATA.read_bytes()).stats
+
+
+def test_timed_validation_examples_cover_all_templates() -> None:
+    """Tests there is an example to time the validation of for every registered template."""
+    assert set(EXAMPLES) == abis_mapping.registered_ids()
+
+
+@pytest.mark.parametrize("template_id", sorted(EXAMPLES))
+def test_timed_validation_template_example(template_id: str) -> None:
+    """Tests the validation of the example of each template is timed, with every check named.
+
+    Args:
+        template_id: ID of the template.
+    """
+    mapper = abis_mapping.get_mapper(template_id)
+    assert mapper
+
+    stats: list[base.timing.TimingStats] = []
+    report = mapper().timed_validation(EXAMPLES[template_id].read_bytes(), on_stats=stats.extend)
+
+    # Assert
+    assert report.valid
+    assert {stat.kind for stat in stats} == {"check", "field"}
+    assert all(stat.name for stat in stats)
+
+
+@pytest.mark.parametrize(
+    "durations,expected",
+    [
+        ([5], 6),
+        ([100] * 99 + [10_000], 104),
+        ([100] * 98 + [10_000] * 2, 10_240),
+    ],
+)
+def test_histogram_percentile(durations: list[int], expected: int) -> None:
+    """Tests the 99th percentile is the upper bound of its bucket.
+
+    Args:
+        durations: Durations in nanoseconds.
+        expected: Expected 99th percentile.
+    """
+    histogram = base.timing._Histogram()
+    for duration in durations:
+        histogram.add(duration)
+    assert histogram.calls == len(durations)
+    assert histogram.total_ns == sum(durations)
+    assert histogram.percentile_ns(99) == expected
@@ -0,0 +1,85 @@
+"""Provides Unit Tests for the `abis_mapping.base.validation` module"""
+
+# Standard
+import csv
+import io
+import json
+import pathlib
+
+# Local
+from abis_mapping import base
+import abis_mapping
+
+
+# Constants
+TEMPLATE_ID = "incidental_occurrence_data-v3.0.0.csv"
+DATA = pathlib.Path(
+    "abis_mapping/templates/incidental_occurrence_data_v3/examples/margaret_river_flora/margaret_river_flora.csv"
+)
+
+
+def invalid_data() -> bytes:
+    """Creates invalid data from the example data.
+
+    Returns:
+        The example data, with invalid latitudes and a missing required value.
+    """
+    rows = list(csv.DictReader(io.StringIO(DATA.read_text())))
+    for row in rows:
+        row["decimalLatitude"] = "north"
+    rows[-1]["scientificName"] = ""
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=list(rows[0]), lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(rows)
+    return output.getvalue().encode("utf-8")
+
+
+def test_stream_validation() -> None:
+    """Tests streamed errors are the same as those in the validation report."""
+    mapper = abis_mapping.get_mapper(TEMPLATE_ID)
+    assert mapper
+    data = invalid_data()
+
+    issues: list[base.validation.ValidationIssue] = []
+    report = mapper().stream_validation(data, on_error=issues.append)
+    expected = mapper().apply_validation(data)
+
+    # Assert
+    assert not report.valid
+    assert len(report.flatten()) == 1
+    assert [issue.message for issue in issues] == [error.message for error in expected.tasks[0].errors]
+    assert {issue.template_id for issue in issues} == {TEMPLATE_ID}
+    assert issues[0].type == "type-error"
+    assert issues[0].row_number == 2
+    assert issues[0].field_name == "decimalLatitude"
+    assert any(issue.type == "constraint-error" and issue.field_name == "scientificName" for issue in issues)
+
+
+def test_stream_validation_valid() -> None:
+    """Tests streaming validation of valid data."""
+    mapper = abis_mapping.get_mapper(TEMPLATE_ID)
+    assert mapper
+
+    issues: list[base.validation.ValidationIssue] = []
+    report = mapper().stream_validation(DATA.read_bytes(), on_error=issues.append)
+
+    # Assert
+    assert report.valid
+    assert issues == []
+
+
+def test_write_validation_jsonl() -> None:
+    """Tests errors are written as JSON lines."""
+    mapper = abis_mapping.get_mapper(TEMPLATE_ID)
+    assert mapper
+    output = io.BytesIO()
+
+    report = mapper().write_validation_jsonl(invalid_data(), output)
+
+    # Assert
+    assert not report.valid
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert len(lines) > 1
+    assert set(lines[0]) == {"template_id", "type", "message", "note", "row_number", "field_name"}
+    assert lines[0]["row_number"] == 2
@@ -152,3 +152,64 @@ def test_related_site_validation_with_invalid_data() -> None:
         "The row at position 6 has an error: When relatedSiteID and relatedSiteIDSource are provided, "
         "relationshipToRelatedSite must also be provided to specify the type of relationship."
     )
+
+
+def test_related_site_validation_collecting_site_identifiers() -> None:
+    """Tests the RelatedSiteValidation Checker collects the SiteIdentifiers from the rows"""
+    # Construct Fake Resource
+    resource = frictionless.Resource(
+        source=[
+            # Related site in a later row
+            {
+                "siteID": "S1",
+                "siteIDSource": "TEST",
+                "existingBDRSiteIRI": None,
+                "relatedSiteID": "S2",
+                "relatedSiteIDSource": "TEST",
+                "relatedSiteIRI": None,
+                "relationshipToRelatedSite": "PART OF",
+            },
+            # Related site in an earlier row
+            {
+                "siteID": "S2",
+                "siteIDSource": "TEST",
+                "existingBDRSiteIRI": None,
+                "relatedSiteID": "S1",
+                "relatedSiteIDSource": "TEST",
+                "relatedSiteIRI": None,
+                "relationshipToRelatedSite": "PART OF",
+            },
+            # Related site does not appear in template
+            {
+                "siteID": "S3",
+                "siteIDSource": "TEST",
+                "existingBDRSiteIRI": None,
+                "relatedSiteID": "S4",
+                "relatedSiteIDSource": "TEST",
+                "relatedSiteIRI": None,
+                "relationshipToRelatedSite": "PART OF",
+            },
+        ],
+    )
+
+    # Validate
+    report: frictionless.Report = resource.validate(
+        checklist=frictionless.Checklist(
+            checks=[
+                plugins.related_site_validation.RelatedSiteValidation(),
+            ],
+        ),
+    )
+
+    # Check
+    assert not report.valid
+    assert len(report.tasks[0].errors) == 1
+    assert report.tasks[0].errors[0].message == (
+        "The row at position 4 has an error: relatedSiteID and relatedSiteIDSource "
+        "must match the siteID and siteIDSource of a site in this template."
+    )
+    # Only the related site of the row is kept for the deferred check
+    error = report.tasks[0].errors[0]
+    assert isinstance(error, frictionless.errors.RowConstraintError)
+    assert error.cells == ["S4", "TEST"]
+    assert error.row_number == 4
@@ -0,0 +1,139 @@
+"""Tests for the incidental_occurrence_delete v1 template not common to other templates."""
+
+# Standard
+import io
+import pathlib
+
+# Third-party
+import pytest
+import rdflib
+
+# Local
+from abis_mapping.templates.incidental_occurrence_delete_v1 import mapping
+import tests.helpers
+
+
+# Constants
+EXAMPLE = pathlib.Path("abis_mapping/templates/incidental_occurrence_delete_v1/examples/example.csv")
+
+
+def test_stream_deletions_nt() -> None:
+    """Tests streaming deletions as N-Triples gives the same graph as apply_mapping."""
+    mapper = mapping.IncidentalOccurrenceDeleteMapper()
+    data = EXAMPLE.read_bytes()
+    (expected,) = mapper.apply_mapping(
+        data=data,
+        chunk_size=None,
+        dataset_iri=tests.helpers.TEST_DATASET_IRI,
+        base_iri=tests.helpers.TEST_BASE_NAMESPACE,
+        submission_iri=None,
+        project_iri=None,
+        submitted_on_date=tests.helpers.TEST_SUBMITTED_ON_DATE,
+    )
+
+    output = io.BytesIO()
+    report = mapper.stream_deletions(
+        data=data,
+        output=output,
+        dataset_iri=tests.helpers.TEST_DATASET_IRI,
+        base_iri=tests.helpers.TEST_BASE_NAMESPACE,
+    )
+
+    assert report == mapping.DeletionReport(records=4)
+    assert report.valid
+    actual = rdflib.Graph().parse(data=output.getvalue(), format="nt")
+    assert tests.helpers.compare_graphs(actual, expected)
+
+
+def test_stream_deletions_blank_and_duplicate_ids() -> None:
+    """Tests blank and duplicate IDs are reported and not written."""
+    data = b"providerRecordIDSource,providerRecordID\nS,a b\nS,\n,\nS,c\nS,a b\n"
+    output = io.BytesIO()
+
+    report = mapping.IncidentalOccurrenceDeleteMapper().stream_deletions(
+        data=io.BytesIO(data),
+        output=output,
+        dataset_iri=tests.helpers.TEST_DATASET_IRI,
+        base_iri=tests.helpers.TEST_BASE_NAMESPACE,
+    )
+
+    assert report == mapping.DeletionReport(records=2, blank_rows=[3, 4], duplicate_rows=[6])
+    assert not report.valid
+    actual = rdflib.Graph().parse(data=output.getvalue(), format="nt")
+    assert set(actual.subjects(rdflib.RDFS.comment, None)) == {
+        tests.helpers.TEST_BASE_NAMESPACE["biodiversityRecord/a%20b"],
+        tests.helpers.TEST_BASE_NAMESPACE["biodiversityRecord/c"],
+    }
+
+
+def test_stream_deletions_blank_rows_match_validation() -> None:
+    """Tests completely blank rows make the report invalid, as they make validation fail."""
+    data = b"providerRecordID,providerRecordIDSource\na,S\n\nb,S\n\n"
+    mapper = mapping.IncidentalOccurrenceDeleteMapper()
+
+    report = mapper.stream_deletions(
+        data=io.BytesIO(data),
+        output=io.BytesIO(),
+        dataset_iri=tests.helpers.TEST_DATASET_IRI,
+        base_iri=tests.helpers.TEST_BASE_NAMESPACE,
+    )
+    validation = mapper.apply_validation(data)
+
+    assert report == mapping.DeletionReport(records=2, blank_rows=[3, 5])
+    assert not report.valid
+    assert not validation.valid
+    assert validation.flatten(["rowNumber", "type"]) == [[3, "blank-row"], [5, "blank-row"]]
+
+
+# rdflib's SPARQL parser uses pyparsing names that are deprecated in newer pyparsing releases
+@pytest.mark.filterwarnings("ignore:.*deprecated:DeprecationWarning")
+def test_stream_deletions_sparql(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests streaming deletions as SPARQL Update operations.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(mapping, "SPARQL_BATCH_SIZE", 3)
+    mapper = mapping.IncidentalOccurrenceDeleteMapper()
+    base_iri = tests.helpers.TEST_BASE_NAMESPACE
+    dataset_iri = tests.helpers.TEST_DATASET_IRI
+
+    # Records in the dataset, and one in another dataset with the same IRI pattern
+    graph = rdflib.Graph()
+    for record_id in ["8022FSJMJ079c5cf", "8022FSJM0000aabb", "kept"]:
+        graph.add((base_iri[f"biodiversityRecord/{record_id}"], rdflib.SDO.isPartOf, dataset_iri))
+        graph.add((base_iri[f"biodiversityRecord/{record_id}"], rdflib.SDO.name, rdflib.Literal(record_id)))
+    other_dataset = rdflib.URIRef("https://example.com/other")
+    graph.add((base_iri["biodiversityRecord/8022FSJMJ0790011"], rdflib.SDO.isPartOf, other_dataset))
+
+    output = io.BytesIO()
+    report = mapper.stream_deletions(
+        data=EXAMPLE.read_bytes(),
+        output=output,
+        dataset_iri=dataset_iri,
+        base_iri=base_iri,
+        output_format="sparql",
+    )
+
+    # Batches of 3 records
+    update = output.getvalue().decode("utf-8")
+    assert report.records == 4
+    assert update.count("DELETE") == 2
+
+    # Only the records in the dataset are deleted
+    graph.update(update)
+    assert set(graph.subjects()) == {
+        base_iri["biodiversityRecord/kept"],
+        base_iri["biodiversityRecord/8022FSJMJ0790011"],
+    }
+
+
+def test_stream_deletions_missing_column() -> None:
+    """Tests streaming deletions requires the providerRecordID column."""
+    with pytest.raises(ValueError, match="providerRecordID"):
+        mapping.IncidentalOccurrenceDeleteMapper().stream_deletions(
+            data=b"recordID\na\n",
+            output=io.BytesIO(),
+            dataset_iri=tests.helpers.TEST_DATASET_IRI,
+            base_iri=tests.helpers.TEST_BASE_NAMESPACE,
+        )
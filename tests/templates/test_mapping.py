@@ -1,5 +1,11 @@
 """Provides all relevant mapping tests."""
 
+# Standard
+import asyncio
+import collections
+import pathlib
+import threading
+
 # Third-party
 import pyshacl
 import pytest
@@ -10,19 +16,24 @@ from tests.templates import conftest
 import abis_mapping
 import tests.helpers
 
+# Typing
+from typing import Any
+
 
 @pytest.mark.parametrize(
     argnames="template_id,test_params",
     argvalues=[(id_, params) for (_, id_, params) in conftest.mapping_test_args() if params.expected is not None],
     ids=[id_ for (id_, _, params) in conftest.mapping_test_args() if params.expected is not None],
 )
-def test_apply_mapping(template_id: str, test_params: conftest.MappingParameters) -> None:
+@pytest.mark.parametrize("store", ["default", "append"])
+def test_apply_mapping(template_id: str, test_params: conftest.MappingParameters, store: str) -> None:
     """Tests the mapping for the template.
 
     Args:
         template_id (str): The id of the template.
         test_params (conftest.MappingParameters): Datastructure
             holding parameters used commonly in tests.
+        store (str): The store to back the chunk graphs with.
     """
     # Load Data and Expected Output
     data = test_params.data.read_bytes()
@@ -34,17 +45,18 @@ def test_apply_mapping(template_id: str, test_params: conftest.MappingParameters
     assert mapper
 
     # Map
-    graphs = list(
-        mapper().apply_mapping(
-            data=data,
-            chunk_size=None,
-            dataset_iri=tests.helpers.TEST_DATASET_IRI,
-            base_iri=tests.helpers.TEST_BASE_NAMESPACE,
-            submission_iri=tests.helpers.TEST_SUBMISSION_IRI,
-            project_iri=tests.helpers.TEST_PROJECT_IRI,
-            submitted_on_date=tests.helpers.TEST_SUBMITTED_ON_DATE,
+    with tests.helpers.override_settings(CHUNK_GRAPH_STORE=store):
+        graphs = list(
+            mapper().apply_mapping(
+                data=data,
+                chunk_size=None,
+                dataset_iri=tests.helpers.TEST_DATASET_IRI,
+                base_iri=tests.helpers.TEST_BASE_NAMESPACE,
+                submission_iri=tests.helpers.TEST_SUBMISSION_IRI,
+                project_iri=tests.helpers.TEST_PROJECT_IRI,
+                submitted_on_date=tests.helpers.TEST_SUBMITTED_ON_DATE,
+            )
         )
-    )
 
     # Assert
     assert len(graphs) == 1
@@ -155,3 +167,396 @@ def test_apply_mapping_chunking(template_id: str, test_params: conftest.Chunking
 
     # Assert
     assert num_chunks == test_params.yield_count
+
+
+@pytest.mark.parametrize(
+    argnames="template_id,test_params",
+    argvalues=[(id_, params) for (_, id_, params) in conftest.chunking_test_args()],
+    ids=[id_ for (id_, _, params) in conftest.chunking_test_args()],
+)
+def test_apply_mapping_async(template_id: str, test_params: conftest.ChunkingParameters) -> None:
+    """Tests the async mapping gives the same chunks as apply_mapping."""
+    # Load data
+    data = test_params.data.read_bytes()
+
+    # Get mapper
+    mapper = abis_mapping.get_mapper(template_id)
+    assert mapper
+    kwargs: dict[str, Any] = {
+        "data": data,
+        "chunk_size": test_params.chunk_size,
+        "dataset_iri": tests.helpers.TEST_DATASET_IRI,
+        "base_iri": tests.helpers.TEST_BASE_NAMESPACE,
+        "submission_iri": tests.helpers.TEST_SUBMISSION_IRI,
+        "project_iri": tests.helpers.TEST_PROJECT_IRI,
+        "submitted_on_date": tests.helpers.TEST_SUBMITTED_ON_DATE,
+        "bnode_seed": "seed",
+    }
+    expected: list[bytes] = []
+    for chunk in mapper().apply_mapping(**kwargs):
+        expected.append(chunk.serialize(format="nt", encoding="utf-8"))
+        del chunk
+
+    async def map_async() -> tuple[list[rdflib.Graph | bytes], list[rdflib.Graph | bytes]]:
+        # Slow consumer of graphs, so the worker fills the queue
+        graphs: list[rdflib.Graph | bytes] = []
+        async for graph in mapper().apply_mapping_async(max_queued_chunks=1, **kwargs):
+            await asyncio.sleep(0.01)
+            graphs.append(graph)
+        serialized = [item async for item in mapper().apply_mapping_async(serialize_format="nt", **kwargs)]
+        return graphs, serialized
+
+    graphs, serialized = asyncio.run(map_async())
+
+    # Assert
+    assert len(graphs) == len(serialized) == test_params.yield_count
+    for graph, serialized_chunk, expected_chunk in zip(graphs, serialized, expected, strict=True):
+        assert isinstance(graph, rdflib.Graph)
+        assert isinstance(serialized_chunk, bytes)
+        assert set(graph.serialize(format="nt", encoding="utf-8").splitlines()) == set(expected_chunk.splitlines())
+        assert set(serialized_chunk.splitlines()) == set(expected_chunk.splitlines())
+
+
+def test_apply_mapping_async_stop_early() -> None:
+    """Tests the async mapping worker stops when the consumer stops early."""
+    mapper = abis_mapping.get_mapper("incidental_occurrence_data-v3.0.0.csv")
+    assert mapper
+    data = pathlib.Path(
+        "abis_mapping/templates/incidental_occurrence_data_v3/examples/margaret_river_flora/margaret_river_flora.csv"
+    ).read_bytes()
+
+    async def first_chunk() -> bytes | rdflib.Graph:
+        chunks = mapper().apply_mapping_async(
+            serialize_format="nt",
+            data=data,
+            chunk_size=1,
+            dataset_iri=tests.helpers.TEST_DATASET_IRI,
+            base_iri=tests.helpers.TEST_BASE_NAMESPACE,
+            submission_iri=None,
+            project_iri=None,
+            submitted_on_date=tests.helpers.TEST_SUBMITTED_ON_DATE,
+        )
+        try:
+            async for chunk in chunks:
+                return chunk
+        finally:
+            await chunks.aclose()  # type: ignore[attr-defined]
+        raise AssertionError("No chunks")
+
+    # Assert the worker has finished when the iterator is closed
+    threads = threading.active_count()
+    assert isinstance(asyncio.run(first_chunk()), bytes)
+    assert threading.active_count() <= threads
+
+    # Invalid queue size
+    with pytest.raises(ValueError, match="greater than zero"):
+        asyncio.run(anext(mapper().apply_mapping_async(max_queued_chunks=0)))  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    argnames="template_id,test_params",
+    argvalues=[(id_, params) for (_, id_, params) in conftest.chunking_test_args()],
+    ids=[id_ for (id_, _, params) in conftest.chunking_test_args()],
+)
+def test_apply_mapping_resume_from_checkpoint(template_id: str, test_params: conftest.ChunkingParameters) -> None:
+    """Tests apply_mapping resumes after the last committed chunk from a checkpoint store."""
+    # Load data
+    data = test_params.data.read_bytes()
+
+    # Get mapper
+    mapper = abis_mapping.get_mapper(template_id)
+    assert mapper
+
+    kwargs: dict[str, Any] = dict(
+        data=data,
+        chunk_size=test_params.chunk_size,
+        dataset_iri=tests.helpers.TEST_DATASET_IRI,
+        base_iri=tests.helpers.TEST_BASE_NAMESPACE,
+        submission_iri=tests.helpers.TEST_SUBMISSION_IRI,
+        project_iri=tests.helpers.TEST_PROJECT_IRI,
+        submitted_on_date=tests.helpers.TEST_SUBMITTED_ON_DATE,
+    )
+
+    # Map without interruption
+    expected = rdflib.Graph()
+    for chunk in mapper().apply_mapping(**kwargs):
+        expected += chunk
+        del chunk
+
+    # Map the first chunk, request the second chunk to commit the first, then "crash".
+    # A shared node registry is also used, and restored from the checkpoint when resuming.
+    store = abis_mapping.base.checkpoint.MemoryCheckpointStore()
+    actual = rdflib.Graph()
+    registry = abis_mapping.base.dedup.SharedNodeRegistry()
+    chunks = mapper().apply_mapping(checkpoint_store=store, shared_node_registry=registry, **kwargs)
+    actual += next(chunks)
+    next(chunks)
+    del chunks
+    checkpoint = store.load()
+    assert checkpoint is not None
+    assert checkpoint.row_number == test_params.chunk_size
+    assert checkpoint.chunk_number == 1
+    assert not checkpoint.complete
+
+    # Resume in a "new worker", the uncommitted second chunk is mapped again.
+    num_chunks = 1
+    registry = abis_mapping.base.dedup.SharedNodeRegistry()
+    for chunk in mapper().apply_mapping(checkpoint_store=store, shared_node_registry=registry, **kwargs):
+        num_chunks += 1
+        actual += chunk
+        del chunk
+
+    # Assert
+    assert num_chunks == test_params.yield_count
+    checkpoint = store.load()
+    assert checkpoint is not None
+    assert checkpoint.complete
+    assert checkpoint.chunk_number == test_params.yield_count
+    assert tests.helpers.compare_graphs(actual, expected)
+
+    # Resuming a complete mapping yields nothing
+    assert list(mapper().apply_mapping(checkpoint_store=store, **kwargs)) == []
+
+
+@pytest.mark.parametrize(
+    argnames="template_id,test_params",
+    argvalues=[(id_, params) for (_, id_, params) in conftest.chunking_test_args()],
+    ids=[id_ for (id_, _, params) in conftest.chunking_test_args()],
+)
+def test_apply_mapping_shared_node_registry(template_id: str, test_params: conftest.ChunkingParameters) -> None:
+    """Tests chunked output with a shared node registry is equivalent, with no repeated shared triples."""
+    # Load data
+    data = test_params.data.read_bytes()
+
+    # Get mapper
+    mapper = abis_mapping.get_mapper(template_id)
+    assert mapper
+
+    kwargs: dict[str, Any] = dict(
+        data=data,
+        dataset_iri=tests.helpers.TEST_DATASET_IRI,
+        base_iri=tests.helpers.TEST_BASE_NAMESPACE,
+        submission_iri=tests.helpers.TEST_SUBMISSION_IRI,
+        project_iri=tests.helpers.TEST_PROJECT_IRI,
+        submitted_on_date=tests.helpers.TEST_SUBMITTED_ON_DATE,
+    )
+
+    # Map unchunked
+    (expected,) = mapper().apply_mapping(chunk_size=None, **kwargs)
+
+    # Map chunked with registry, counting the chunks each shared node triple is emitted in
+    registry = abis_mapping.base.dedup.SharedNodeRegistry()
+    actual = rdflib.Graph()
+    emitted: collections.Counter[tuple[rdflib.term.Node, ...]] = collections.Counter()
+    chunks = 0
+    for chunk in mapper().apply_mapping(chunk_size=test_params.chunk_size, shared_node_registry=registry, **kwargs):
+        actual += chunk
+        chunks += 1
+        emitted.update(shared_triples(chunk, registry))
+        del chunk
+
+    # Assert
+    assert chunks > 1
+    assert {triple: count for triple, count in emitted.items() if count > 1} == {}
+    assert tests.helpers.compare_graphs(actual, expected)
+
+
+@pytest.mark.parametrize(
+    argnames="template_id,test_params",
+    argvalues=[(id_, params) for (_, id_, params) in conftest.chunking_test_args()],
+    ids=[id_ for (id_, _, params) in conftest.chunking_test_args()],
+)
+def test_apply_mapping_resume_shared_node_registry(
+    template_id: str,
+    test_params: conftest.ChunkingParameters,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Tests a shared node registry is restored from a file checkpoint store when resuming."""
+    # Load data
+    data = test_params.data.read_bytes()
+
+    # Get mapper
+    mapper = abis_mapping.get_mapper(template_id)
+    assert mapper
+
+    kwargs: dict[str, Any] = dict(
+        data=data,
+        dataset_iri=tests.helpers.TEST_DATASET_IRI,
+        base_iri=tests.helpers.TEST_BASE_NAMESPACE,
+        submission_iri=tests.helpers.TEST_SUBMISSION_IRI,
+        project_iri=tests.helpers.TEST_PROJECT_IRI,
+        submitted_on_date=tests.helpers.TEST_SUBMITTED_ON_DATE,
+    )
+
+    # Map unchunked
+    (expected,) = mapper().apply_mapping(chunk_size=None, **kwargs)
+
+    # Map the first chunk, request the second chunk to commit the first, then "crash".
+    path = tmp_path / "checkpoint.json"
+    registry = abis_mapping.base.dedup.SharedNodeRegistry()
+    chunks = mapper().apply_mapping(
+        chunk_size=test_params.chunk_size,
+        checkpoint_store=abis_mapping.base.checkpoint.FileCheckpointStore(path),
+        shared_node_registry=registry,
+        **kwargs,
+    )
+    chunk = next(chunks)
+    actual = rdflib.Graph() + chunk
+    emitted = collections.Counter(shared_triples(chunk, registry))
+    del chunk
+    next(chunks)
+    del chunks
+
+    # Resume in a "new worker", with a new store and registry
+    registry = abis_mapping.base.dedup.SharedNodeRegistry()
+    store = abis_mapping.base.checkpoint.FileCheckpointStore(path)
+    for chunk in mapper().apply_mapping(
+        chunk_size=test_params.chunk_size,
+        checkpoint_store=store,
+        shared_node_registry=registry,
+        **kwargs,
+    ):
+        actual += chunk
+        emitted.update(shared_triples(chunk, registry))
+        del chunk
+
+    # Assert
+    checkpoint = store.load()
+    assert checkpoint is not None
+    assert checkpoint.complete
+    # The registry is kept in the log, with a line per committed chunk adding to it, not in the checkpoint
+    batches = checkpoint.state.get("shared_node_registry", 0)
+    assert checkpoint.state == ({"shared_node_registry": batches} if batches else {})
+    assert batches <= checkpoint.chunk_number
+    assert len(store.load_entries("shared_node_registry", batches)) == len(registry)
+    assert {triple: count for triple, count in emitted.items() if count > 1} == {}
+    assert tests.helpers.compare_graphs(actual, expected)
+
+
+@pytest.mark.parametrize(
+    argnames="template_id,test_params",
+    argvalues=[(id_, params) for (_, id_, params) in conftest.chunking_test_args()],
+    ids=[id_ for (id_, _, params) in conftest.chunking_test_args()],
+)
+@pytest.mark.parametrize(argnames="budget_kwarg", argvalues=["max_triples_per_chunk", "max_chunk_bytes"])
+def test_apply_mapping_chunk_budget(
+    template_id: str,
+    test_params: conftest.ChunkingParameters,
+    budget_kwarg: str,
+) -> None:
+    """Tests apply_mapping yields chunks when a triple or byte budget is reached."""
+    # Load data
+    data = test_params.data.read_bytes()
+
+    # Get mapper
+    mapper = abis_mapping.get_mapper(template_id)
+    assert mapper
+
+    kwargs: dict[str, Any] = dict(
+        data=data,
+        dataset_iri=tests.helpers.TEST_DATASET_IRI,
+        base_iri=tests.helpers.TEST_BASE_NAMESPACE,
+        submission_iri=tests.helpers.TEST_SUBMISSION_IRI,
+        project_iri=tests.helpers.TEST_PROJECT_IRI,
+        submitted_on_date=tests.helpers.TEST_SUBMITTED_ON_DATE,
+    )
+
+    # Map without chunking, and set a budget of about a third of the whole graph
+    (expected,) = mapper().apply_mapping(chunk_size=None, **kwargs)
+    if budget_kwarg == "max_triples_per_chunk":
+        budget = len(expected) // 3
+    else:
+        budget = abis_mapping.base.chunking.ChunkBudget().estimated_bytes(expected) // 3
+
+    # Map with budget
+    kwargs[budget_kwarg] = budget
+    stats: list[abis_mapping.base.chunking.ChunkStats] = []
+    actual = rdflib.Graph()
+    for chunk in mapper().apply_mapping(chunk_size=None, on_chunk=stats.append, **kwargs):
+        assert len(chunk) == stats[-1].triples
+        actual += chunk
+        del chunk
+
+    # Assert every chunk but the last reached the budget
+    assert len(stats) > 1
+    for chunk_stats in stats[:-1]:
+        if budget_kwarg == "max_triples_per_chunk":
+            assert chunk_stats.triples >= budget
+        else:
+            assert chunk_stats.estimated_bytes >= budget
+    # Rows are numbered consecutively across chunks
+    assert [s.chunk_number for s in stats] == list(range(1, len(stats) + 1))
+    assert [s.first_row for s in stats[1:]] == [s.last_row + 1 for s in stats[:-1]]
+    assert sum(s.rows for s in stats) == stats[-1].last_row
+    assert tests.helpers.compare_graphs(actual, expected)
+
+
+@pytest.mark.parametrize(
+    argnames="template_id,test_params",
+    argvalues=[(id_, params) for (_, id_, params) in conftest.mapping_test_args() if params.expected is not None],
+    ids=[id_ for (id_, _, params) in conftest.mapping_test_args() if params.expected is not None],
+)
+def test_apply_mapping_bnode_seed(template_id: str, test_params: conftest.MappingParameters) -> None:
+    """Tests seeded blank node identifiers give the same output on every run.
+
+    Args:
+        template_id (str): The id of the template.
+        test_params (conftest.MappingParameters): Datastructure
+            holding parameters used commonly in tests.
+    """
+    # Load Data and Expected Output
+    data = test_params.data.read_bytes()
+    expected = test_params.expected.read_text()  # type: ignore[union-attr]
+
+    # Get Mapper
+    mapper = abis_mapping.get_mapper(template_id)
+    assert mapper
+
+    def map_to_ntriples(chunk_size: int | None) -> set[str]:
+        lines: set[str] = set()
+        for chunk in mapper().apply_mapping(
+            data=data,
+            chunk_size=chunk_size,
+            dataset_iri=tests.helpers.TEST_DATASET_IRI,
+            base_iri=tests.helpers.TEST_BASE_NAMESPACE,
+            submission_iri=tests.helpers.TEST_SUBMISSION_IRI,
+            project_iri=tests.helpers.TEST_PROJECT_IRI,
+            submitted_on_date=tests.helpers.TEST_SUBMITTED_ON_DATE,
+            bnode_seed=str(tests.helpers.TEST_SUBMISSION_IRI),
+        ):
+            lines.update(chunk.serialize(format="nt").splitlines())
+            del chunk
+        return lines
+
+    # Map twice, and once more with chunking
+    first = map_to_ntriples(None)
+    second = map_to_ntriples(None)
+    chunked = map_to_ntriples(2)
+
+    # Assert the same triples, including blank node identifiers
+    assert first == second
+    assert chunked == first
+    assert tests.helpers.compare_graphs(rdflib.Graph().parse(data="\n".join(first), format="nt"), expected)
+
+
+def shared_triples(
+    chunk: rdflib.Graph,
+    registry: abis_mapping.base.dedup.SharedNodeRegistry,
+) -> list[tuple[rdflib.term.Node, rdflib.term.Node, rdflib.term.Node]]:
+    """Gets the triples of the shared nodes of a chunk, other than to blank nodes.
+
+    Args:
+        chunk: Chunk graph.
+        registry: Registry of the shared node types.
+
+    Returns:
+        The shared node triples of the chunk.
+    """
+    shared_nodes = {s for node_type in registry.node_types for s in chunk.subjects(rdflib.RDF.type, node_type)}
+    return [
+        triple
+        for s in shared_nodes
+        if isinstance(s, rdflib.URIRef)
+        for triple in chunk.triples((s, None, None))
+        if not isinstance(triple[2], rdflib.BNode)
+    ]
@@ -0,0 +1,286 @@
+"""Provides Unit Tests for the `abis_mapping.cli` module"""
+
+# Standard
+import csv
+import io
+import json
+import pathlib
+import sys
+
+# Third-party
+import openpyxl
+import pytest
+import rdflib
+
+# Local
+from abis_mapping import cli
+import abis_mapping
+import tests.helpers
+
+
+# Constants
+TEMPLATE_ID = "incidental_occurrence_data-v3.0.0.csv"
+DATA = pathlib.Path(
+    "abis_mapping/templates/incidental_occurrence_data_v3/examples/margaret_river_flora/margaret_river_flora.csv"
+)
+MAP_ARGS = [
+    "--dataset-iri",
+    str(tests.helpers.TEST_DATASET_IRI),
+    "--base-iri",
+    str(tests.helpers.TEST_BASE_NAMESPACE),
+    "--submission-iri",
+    str(tests.helpers.TEST_SUBMISSION_IRI),
+    "--submitted-on",
+    tests.helpers.TEST_SUBMITTED_ON_DATE.isoformat(),
+]
+
+
+@pytest.fixture
+def expected() -> rdflib.Graph:
+    """Maps the example data without chunking, for comparison with the CLI output.
+
+    Returns:
+        The mapped graph.
+    """
+    mapper = abis_mapping.get_mapper(TEMPLATE_ID)
+    assert mapper
+    (graph,) = mapper().apply_mapping(
+        data=DATA.read_bytes(),
+        chunk_size=None,
+        dataset_iri=tests.helpers.TEST_DATASET_IRI,
+        base_iri=tests.helpers.TEST_BASE_NAMESPACE,
+        submission_iri=tests.helpers.TEST_SUBMISSION_IRI,
+        project_iri=None,
+        submitted_on_date=tests.helpers.TEST_SUBMITTED_ON_DATE,
+    )
+    return graph
+
+
+def test_validate_valid(capsys: pytest.CaptureFixture[str]) -> None:
+    """Tests the validate subcommand with valid data.
+
+    Args:
+        capsys: Pytest capture fixture.
+    """
+    assert cli.main(["validate", TEMPLATE_ID, str(DATA)]) == 0
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == "Valid\n"
+
+
+def test_validate_invalid_from_stdin(
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests the validate subcommand with invalid data read from stdin.
+
+    Args:
+        capsys: Pytest capture fixture.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(b"providerRecordID\nA\n")))
+
+    assert cli.main(["validate", TEMPLATE_ID, "--max-errors", "2"]) == 1
+    captured = capsys.readouterr()
+    # Only the maximum number of errors are reported, but all are counted
+    assert len(captured.out.splitlines()) == 2
+    assert captured.err.startswith("Invalid:")
+
+
+def test_validate_jsonl(
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests the validate subcommand printing errors as JSON lines.
+
+    Args:
+        capsys: Pytest capture fixture.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(b"providerRecordID\nA\n")))
+
+    assert cli.main(["validate", TEMPLATE_ID, "--jsonl", "--max-errors", "2"]) == 1
+    captured = capsys.readouterr()
+    lines = [json.loads(line) for line in captured.out.splitlines()]
+    assert len(lines) == 2
+    assert lines[0]["template_id"] == TEMPLATE_ID
+    # All errors are counted
+    assert int(captured.err.split()[1]) > 2
+
+
+def test_validate_preflight(capsys: pytest.CaptureFixture[str]) -> None:
+    """Tests the validate subcommand only checking a sample of the data.
+
+    Args:
+        capsys: Pytest capture fixture.
+    """
+    assert cli.main(["validate", TEMPLATE_ID, str(DATA), "--preflight"]) == 0
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err.startswith("Valid sample:")
+
+    assert cli.main(["validate", "survey_metadata-v3.0.0.csv", str(DATA), "--preflight", "--max-errors", "1"]) == 1
+    captured = capsys.readouterr()
+    assert len(captured.out.splitlines()) == 1
+    assert captured.err.startswith("Invalid:")
+
+
+def test_validate_timings(capsys: pytest.CaptureFixture[str]) -> None:
+    """Tests the validate subcommand printing timing statistics.
+
+    Args:
+        capsys: Pytest capture fixture.
+    """
+    assert cli.main(["validate", TEMPLATE_ID, str(DATA), "--timings"]) == 0
+    captured = capsys.readouterr()
+    lines = captured.err.splitlines()
+    assert lines[0].split()[-1] == "name"
+    assert any(line.endswith("check is-tabular") for line in lines)
+    assert any(line.endswith("field providerRecordID") for line in lines)
+    assert lines[-1] == "Valid"
+
+
+def test_map_to_file(tmp_path: pathlib.Path, expected: rdflib.Graph) -> None:
+    """Tests the map subcommand writes chunks to a file in the inferred format.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+        expected: The expected graph.
+    """
+    output = tmp_path / "output.ttl"
+
+    assert cli.main(["map", TEMPLATE_ID, str(DATA), "-o", str(output), "--chunk-size", "3", *MAP_ARGS]) == 0
+
+    # Concatenated Turtle chunks parse to the whole graph
+    actual = rdflib.Graph().parse(output, format="turtle")
+    assert tests.helpers.compare_graphs(actual, expected)
+
+
+def test_map_xlsx(tmp_path: pathlib.Path, expected: rdflib.Graph) -> None:
+    """Tests the map subcommand converts XLSX input.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+        expected: The expected graph.
+    """
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet("Data")
+    for row in csv.reader(io.StringIO(DATA.read_text())):
+        sheet.append(row)
+    data = tmp_path / "data.xlsx"
+    workbook.save(data)
+    output = tmp_path / "output.nt"
+
+    assert cli.main(["map", TEMPLATE_ID, str(data), "--sheet", "Data", "-o", str(output), *MAP_ARGS]) == 0
+
+    actual = rdflib.Graph().parse(output, format="nt")
+    assert tests.helpers.compare_graphs(actual, expected)
+
+
+def test_map_parquet_workers(tmp_path: pathlib.Path, expected: rdflib.Graph) -> None:
+    """Tests the map subcommand reads Parquet input, in fragments for worker processes.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+        expected: The expected graph.
+    """
+    pyarrow_csv = pytest.importorskip("pyarrow.csv")
+    pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+    data = tmp_path / "data.parquet"
+    pyarrow_parquet.write_table(pyarrow_csv.read_csv(DATA), data)
+    output = tmp_path / "output.nt"
+
+    args = ["map", TEMPLATE_ID, str(data), "-o", str(output), "--chunk-size", "5", "--workers", "2", *MAP_ARGS]
+    assert cli.main(args) == 0
+
+    actual = rdflib.Graph().parse(output, format="nt")
+    assert tests.helpers.compare_graphs(actual, expected)
+
+
+def test_map_single_pass_from_stdin(
+    capsysbinary: pytest.CaptureFixture[bytes],
+    monkeypatch: pytest.MonkeyPatch,
+    expected: rdflib.Graph,
+) -> None:
+    """Tests the map subcommand in a single pass validates and maps stdin.
+
+    Args:
+        capsysbinary: Pytest binary stdout capture fixture.
+        monkeypatch: Pytest monkeypatch fixture.
+        expected: The expected graph.
+    """
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(DATA.read_bytes())))
+
+    assert cli.main(["map", TEMPLATE_ID, "--single-pass", "--chunk-size", "4", *MAP_ARGS]) == 0
+
+    captured = capsysbinary.readouterr()
+    actual = rdflib.Graph().parse(data=captured.out, format="nt")
+    assert tests.helpers.compare_graphs(actual, expected)
+    assert captured.err == b"Valid\n"
+
+
+def test_map_single_pass_invalid(
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests the map subcommand in a single pass prints errors and fails for invalid data.
+
+    Args:
+        capsys: Pytest stdout capture fixture.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(b"providerRecordID\nA\n")))
+
+    assert cli.main(["map", TEMPLATE_ID, "--single-pass", *MAP_ARGS]) == 1
+    assert cli.main(["map", TEMPLATE_ID, "--single-pass", "--workers", "2", *MAP_ARGS]) == 2
+
+    err = capsys.readouterr().err
+    assert "missing-label" in err
+    assert "the output must be discarded" in err
+
+
+def test_map_workers_to_stdout(capsysbinary: pytest.CaptureFixture[bytes], expected: rdflib.Graph) -> None:
+    """Tests the map subcommand with worker processes writes nq to stdout.
+
+    Args:
+        capsysbinary: Pytest binary capture fixture.
+        expected: The expected graph.
+    """
+    graph_iri = "https://example.com/graph"
+    args = ["map", TEMPLATE_ID, str(DATA), "-f", "nq", "--graph-iri", graph_iri, "--chunk-size", "3", "--workers", "2"]
+
+    assert cli.main([*args, *MAP_ARGS]) == 0
+
+    dataset = rdflib.Dataset()
+    dataset.parse(data=capsysbinary.readouterr().out, format="nquads")
+    actual = rdflib.Graph()
+    actual += dataset.graph(rdflib.URIRef(graph_iri))
+    assert tests.helpers.compare_graphs(actual, expected)
+
+
+def test_map_serialize_in_background(tmp_path: pathlib.Path, expected: rdflib.Graph) -> None:
+    """Tests the map subcommand serializing chunks in a background process.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+        expected: The expected graph.
+    """
+    output = tmp_path / "output.ttl"
+    args = ["map", TEMPLATE_ID, str(DATA), "-o", str(output), "--chunk-size", "3", "--serialize-in-background"]
+
+    assert cli.main([*args, *MAP_ARGS]) == 0
+
+    actual = rdflib.Graph().parse(output, format="turtle")
+    assert tests.helpers.compare_graphs(actual, expected)
+
+
+def test_map_invalid_arguments(capsys: pytest.CaptureFixture[str]) -> None:
+    """Tests the map subcommand rejects invalid arguments.
+
+    Args:
+        capsys: Pytest capture fixture.
+    """
+    with pytest.raises(SystemExit):
+        cli.main(["map", TEMPLATE_ID, str(DATA), "--chunk-size", "0", *MAP_ARGS])
+    assert "must be greater than zero" in capsys.readouterr().err
@@ -0,0 +1,62 @@
+"""Provides Unit Tests for the `abis_mapping.utils.bnodes` module"""
+
+# Third-party
+import rdflib
+
+# Local
+from abis_mapping import utils
+
+
+# Constants
+EX = rdflib.Namespace("https://example.com/")
+
+
+def test_bnode_random() -> None:
+    """Tests blank nodes are random outside of a deterministic block."""
+    assert utils.bnodes.bnode("tag") != utils.bnodes.bnode("tag")
+
+    with utils.bnodes.deterministic(None):
+        assert utils.bnodes.bnode("tag") != utils.bnodes.bnode("tag")
+
+
+def test_bnode_deterministic() -> None:
+    """Tests deterministic blank node identifiers."""
+
+    def create(seed: str, row_number: int, tags: list[str]) -> list[rdflib.BNode]:
+        ids = utils.bnodes.DeterministicIds(seed)
+        ids.start_row(row_number)
+        with utils.bnodes.deterministic(ids):
+            return [utils.bnodes.bnode(tag) for tag in tags]
+
+    # Same seed, row and tags give the same identifiers
+    first = create("seed", 1, ["a", "a", "b"])
+    assert first == create("seed", 1, ["a", "a", "b"])
+    assert len(set(first)) == 3
+    assert all(len(node) == 33 and node.startswith("N") for node in first)
+    # Counters are per tag, so other call sites do not shift the identifiers
+    assert create("seed", 1, ["b", "a"]) == [first[2], first[0]]
+    # Different seeds and rows give different identifiers
+    assert not set(first) & set(create("other", 1, ["a", "a", "b"]))
+    assert not set(first) & set(create("seed", 2, ["a", "a", "b"]))
+
+    # Random again after the block
+    assert not isinstance(utils.bnodes._IDS.get(), utils.bnodes.DeterministicIds)
+
+
+def test_relabel() -> None:
+    """Tests relabeling the blank nodes of a parsed graph."""
+    data = "<https://example.com/a> <https://example.com/p> [ <https://example.com/q> [ <https://example.com/r> 1 ] ] ."
+
+    # Not relabeled when identifiers are random
+    graph = rdflib.Graph().parse(data=data, format="turtle")
+    assert utils.bnodes.relabel(graph, "tag") is graph
+
+    # Relabeled the same way every time
+    def relabeled() -> rdflib.Graph:
+        ids = utils.bnodes.DeterministicIds("seed")
+        with utils.bnodes.deterministic(ids):
+            return utils.bnodes.relabel(rdflib.Graph().parse(data=data, format="turtle"), "tag")
+
+    first = relabeled()
+    assert set(first) == set(relabeled())
+    assert first.isomorphic(graph)
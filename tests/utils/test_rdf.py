@@ -1,8 +1,15 @@
 """Provides Unit Tests for the `abis_mapping.utils.rdf` module"""
 
+# Standard
+import decimal
+import itertools
+import random
+import string
+
 # Third-Party
 import rdflib
 import pytest
+import slugify
 
 # Local
 from abis_mapping import utils
@@ -23,6 +30,16 @@ def test_rdf_create_graph() -> None:
         assert ns in namespaces
 
 
+def test_rdf_create_graph_append_store() -> None:
+    """Tests the create_graph() Function with the append only store"""
+    # Create Graph
+    graph = utils.rdf.create_graph(store="append")
+
+    # Check store and namespaces
+    assert isinstance(graph.store, utils.stores.AppendOnlyStore)
+    assert ("tern", rdflib.URIRef(str(utils.namespaces.TERN))) in list(graph.namespaces())
+
+
 def test_rdf_uri() -> None:
     """Tests the uri() Function"""
     # Create Fake Namespace
@@ -190,8 +207,73 @@ def test_slugify_for_uri() -> None:
     assert utils.rdf.slugify_for_uri("hello> .\n <evil-iri> a <hello> .\n") == "hello-evil-iri-a-hello"
 
 
+@pytest.mark.parametrize(
+    "strings",
+    [
+        # Every ASCII string of up to two characters
+        pytest.param(
+            [
+                "".join(chars)
+                for length in (0, 1, 2)
+                for chars in itertools.product(map(chr, range(128)), repeat=length)
+            ],
+            id="exhaustive",
+        ),
+        # Every string of up to four of the characters handled specially
+        pytest.param(
+            ["".join(chars) for length in (3, 4) for chars in itertools.product("a1,'- &#;", repeat=length)],
+            id="special",
+        ),
+        # Random strings of ASCII and non-ASCII characters, numbers and entities
+        pytest.param(
+            [
+                "".join(
+                    random.Random(seed).choices(  # noqa: S311
+                        [*string.printable, "1,000", "''", "--", "&amp;", "&#65;", "&#x41;", "é", "ß", "👋", "\u0301"],
+                        k=random.Random(-seed).randrange(40),  # noqa: S311
+                    )
+                )
+                for seed in range(5000)
+            ],
+            id="random",
+        ),
+    ],
+)
+def test_slugify_for_uri_equivalence(strings: list[str]) -> None:
+    """Tests the slugify_for_uri function gives the same slugs as python-slugify"""
+    for value in strings:
+        assert utils.rdf.slugify_for_uri.__wrapped__(value) == slugify.slugify(value, lowercase=False), repr(value)
+
+
 def test_quote_for_uri() -> None:
     """Tests the quote_for_uri function"""
     assert utils.rdf.quote_for_uri("hello world") == "hello%20world"
     # test quotes slashes
     assert utils.rdf.quote_for_uri("hello/world") == "hello%2Fworld"
+
+
+def test_literal_interns_strings() -> None:
+    """Tests the literal function interns literals of strings"""
+    # Assert the same literal is returned for the same string, datatype and language
+    literal = utils.rdf.literal("Eucalyptus marginata")
+    assert literal == rdflib.Literal("Eucalyptus marginata")
+    assert utils.rdf.literal("Eucalyptus marginata") is literal
+    assert utils.rdf.literal("2020-01-02", datatype=rdflib.XSD.date) is utils.rdf.literal(
+        "2020-01-02", datatype=rdflib.XSD.date
+    )
+
+    # Assert literals with another datatype or language are distinct
+    assert utils.rdf.literal("2020", datatype=rdflib.XSD.gYear) == rdflib.Literal("2020", datatype=rdflib.XSD.gYear)
+    assert utils.rdf.literal("Jarrah", lang="en") == rdflib.Literal("Jarrah", lang="en")
+    assert utils.rdf.literal("Jarrah", lang="en") != utils.rdf.literal("Jarrah")
+
+    # Assert the cache is one of the bounded IRI caches
+    assert utils.iri_patterns.IRI_CACHES["literal"].cache_info().maxsize == 4096
+
+
+def test_literal_other_values() -> None:
+    """Tests the literal function does not intern equal values with different lexical forms"""
+    assert str(utils.rdf.literal(decimal.Decimal("1.0"))) == "1.0"
+    assert str(utils.rdf.literal(decimal.Decimal("1.00"))) == "1.00"
+    assert utils.rdf.literal(1) == rdflib.Literal(1)
+    assert utils.rdf.literal(True) == rdflib.Literal(True)
@@ -0,0 +1,74 @@
+"""Provides Unit Tests for the `abis_mapping.utils.serialization` module"""
+
+# Standard
+import concurrent.futures
+
+# Third-party
+import pytest
+import rdflib
+
+# Local
+from abis_mapping import utils
+import tests.helpers
+
+
+# Constants
+EX = rdflib.Namespace("https://example.com/")
+
+
+def chunk_graphs() -> list[rdflib.Graph]:
+    """Creates chunk graphs for the tests.
+
+    Returns:
+        The chunk graphs.
+    """
+    graphs = []
+    for number in range(5):
+        graph = utils.rdf.create_graph()
+        graph.add((EX[f"record{number}"], rdflib.RDF.type, EX.Record))
+        graph.add((EX[f"record{number}"], EX.value, rdflib.Literal(number)))
+        graph.add((EX[f"record{number}"], EX.geometry, rdflib.BNode(f"b{number}")))
+        graphs.append(graph)
+    return graphs
+
+
+@pytest.mark.parametrize("output_format", ["nt", "turtle"])
+def test_serialize_chunks(output_format: str) -> None:
+    """Tests chunks are serialized in order, the same as in the current process."""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        serialized = list(
+            utils.serialization.serialize_chunks(
+                chunk_graphs(), output_format=output_format, max_in_flight=2, executor=executor
+            )
+        )
+
+    # Assert
+    assert len(serialized) == 5
+    for chunk, graph in zip(serialized, chunk_graphs(), strict=True):
+        assert tests.helpers.compare_graphs(rdflib.Graph().parse(data=chunk, format=output_format), graph)
+
+
+def test_serialize_chunks_process() -> None:
+    """Tests chunks are serialized in the default background process, in a named graph."""
+    graph_iri = EX.graph
+    serialized = b"".join(
+        utils.serialization.serialize_chunks(
+            chunk_graphs(), output_format="nquads", graph_iri=graph_iri, max_in_flight=1
+        )
+    )
+
+    # Assert
+    dataset = rdflib.Dataset()
+    dataset.parse(data=serialized, format="nquads")
+    actual = rdflib.Graph()
+    actual += dataset.graph(graph_iri)
+    expected = rdflib.Graph()
+    for graph in chunk_graphs():
+        expected += graph
+    assert tests.helpers.compare_graphs(actual, expected)
+
+
+def test_serialize_chunks_invalid() -> None:
+    """Tests the maximum number of chunks in flight must be positive."""
+    with pytest.raises(ValueError, match="greater than zero"):
+        next(utils.serialization.serialize_chunks([], output_format="nt", max_in_flight=0))
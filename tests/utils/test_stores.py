@@ -0,0 +1,95 @@
+"""Provides Unit Tests for the `abis_mapping.utils.stores` module"""
+
+# Third-party
+import rdflib
+
+# Local
+from abis_mapping import utils
+import tests.helpers
+
+
+# Constants
+EX = rdflib.Namespace("https://example.com/")
+
+
+def test_append_only_store_add_and_len() -> None:
+    """Tests triples are added once each, in insertion order."""
+    graph = rdflib.Graph(store=utils.stores.AppendOnlyStore())
+    graph.add((EX.b, EX.p, rdflib.Literal(1)))
+    graph.add((EX.a, EX.p, rdflib.Literal(2)))
+    graph.add((EX.b, EX.p, rdflib.Literal(1)))
+
+    assert len(graph) == 2
+    assert list(graph) == [(EX.b, EX.p, rdflib.Literal(1)), (EX.a, EX.p, rdflib.Literal(2))]
+
+
+def test_append_only_store_patterns() -> None:
+    """Tests triple pattern lookups, with and without the subject index."""
+    graph = rdflib.Graph(store=utils.stores.AppendOnlyStore())
+    graph.add((EX.a, rdflib.RDF.type, EX.Thing))
+    graph.add((EX.a, EX.p, EX.b))
+    graph.add((EX.b, rdflib.RDF.type, EX.Thing))
+
+    # Patterns without a subject scan all triples
+    assert list(graph.subjects(rdflib.RDF.type, EX.Thing)) == [EX.a, EX.b]
+    assert list(graph.subjects(None, EX.b)) == [EX.a]
+    assert (EX.a, EX.p, EX.b) in graph
+    assert (EX.a, EX.p, EX.a) not in graph
+
+    # Patterns with a subject build the index, which is then kept up to date
+    assert list(graph.predicate_objects(EX.a)) == [(rdflib.RDF.type, EX.Thing), (EX.p, EX.b)]
+    graph.add((EX.a, EX.q, EX.c))
+    assert graph.value(EX.a, EX.q) == EX.c
+    assert list(graph.objects(EX.c, EX.p)) == []
+
+
+def test_append_only_store_remove() -> None:
+    """Tests removing triples matching a pattern."""
+    graph = rdflib.Graph(store=utils.stores.AppendOnlyStore())
+    graph.add((EX.a, EX.p, EX.b))
+    graph.add((EX.a, EX.q, EX.b))
+    graph.add((EX.b, EX.p, EX.c))
+    # Build the subject index
+    assert graph.value(EX.a, EX.p) == EX.b
+
+    graph.remove((None, EX.p, None))
+
+    assert list(graph) == [(EX.a, EX.q, EX.b)]
+    assert graph.value(EX.a, EX.p) is None
+    assert graph.value(EX.a, EX.q) == EX.b
+    assert list(graph.predicate_objects(EX.b)) == []
+
+
+def test_append_only_store_namespaces() -> None:
+    """Tests namespace bindings behave the same as the Memory store."""
+    append_graph = rdflib.Graph(store=utils.stores.AppendOnlyStore(), bind_namespaces="none")
+    memory_graph = rdflib.Graph(bind_namespaces="none")
+
+    for graph in (append_graph, memory_graph):
+        graph.bind("ex", EX)
+        graph.bind("ex", rdflib.Namespace("https://example.org/"), override=False)
+        graph.bind("other", EX)
+
+    assert sorted(append_graph.namespaces()) == sorted(memory_graph.namespaces())
+    assert append_graph.store.namespace("other") == rdflib.URIRef(EX)
+    assert append_graph.store.prefix(rdflib.URIRef(EX)) == "other"
+
+
+def test_append_only_store_serialize() -> None:
+    """Tests graphs serialize and merge the same as with the Memory store."""
+    source = rdflib.Graph().parse(
+        format="turtle",
+        data="""
+            @prefix ex: <https://example.com/> .
+            ex:a a ex:Thing ;
+                ex:p [ ex:q "x" ; ex:r ( 1 2 ) ] .
+        """,
+    )
+
+    graph = utils.rdf.create_graph(store="append")
+    graph += source
+
+    assert isinstance(graph.store, utils.stores.AppendOnlyStore)
+    for fmt in ("turtle", "nt"):
+        actual = rdflib.Graph().parse(data=graph.serialize(format=fmt), format=fmt)
+        assert tests.helpers.compare_graphs(actual, source)
@@ -0,0 +1,84 @@
+"""Provides Unit Tests for the `abis_mapping.utils.turtle` module"""
+
+# Standard
+import io
+
+# Third-party
+import pytest
+import rdflib
+
+# Local
+from abis_mapping import utils
+import tests.helpers
+
+
+# Constants
+EX = rdflib.Namespace("https://example.com/")
+
+
+def write_turtle(graph: rdflib.Graph) -> str:
+    """Writes a graph as Turtle.
+
+    Args:
+        graph: Graph to write.
+
+    Returns:
+        The Turtle document.
+    """
+    output = io.BytesIO()
+    utils.turtle.write(graph, output)
+    return output.getvalue().decode("utf-8")
+
+
+def test_write_round_trip() -> None:
+    """Tests the Turtle parses back to the same graph, including awkward terms."""
+    graph = utils.rdf.create_graph(store="append")
+    node = rdflib.BNode()
+    graph.add((EX.thing, rdflib.RDF.type, EX.Thing))
+    graph.add((EX.thing, rdflib.RDFS.comment, rdflib.Literal('Quote " backslash \\ new\nline\r\ttab')))
+    graph.add((EX.thing, rdflib.RDFS.label, rdflib.Literal("thing", lang="en-AU")))
+    graph.add((EX.thing, rdflib.RDFS.label, rdflib.Literal("thing", datatype=rdflib.XSD.string)))
+    graph.add((EX.thing, rdflib.SDO.value, rdflib.Literal("1.50", datatype=rdflib.XSD.decimal)))
+    graph.add((EX.thing, rdflib.SDO.about, node))
+    graph.add((node, rdflib.SDO.name, rdflib.Literal("ünïcödé")))
+    graph.add((rdflib.URIRef("https://schema.org/1st.value"), rdflib.RDF.type, rdflib.RDF.Property))
+    graph.add((EX.thing, rdflib.SDO.isPartOf, rdflib.RDF.type))
+
+    turtle = write_turtle(graph)
+
+    # Assert
+    assert tests.helpers.compare_graphs(rdflib.Graph().parse(data=turtle, format="turtle"), graph)
+    assert "@prefix schema: <https://schema.org/> ." in turtle
+    assert "ex:" not in turtle
+    assert "<https://example.com/thing> a <https://example.com/Thing> ;" in turtle
+    assert '"1.50"^^xsd:decimal' in turtle
+    assert "<https://schema.org/1st.value> a rdf:Property ." in turtle
+    assert "schema:isPartOf rdf:type" in turtle
+    # Subjects are written in insertion order
+    assert turtle.index("<https://example.com/thing>") < turtle.index("<https://schema.org/1st.value>")
+
+
+@pytest.mark.parametrize("iri", ["http://example.com/a b>c", "http://example.com/{x}", 'http://example.com/"q"'])
+def test_write_invalid_iri(iri: str) -> None:
+    """Tests IRIs that rdflib can not serialize as Turtle are rejected, rather than written unparseable.
+
+    Args:
+        iri: The invalid IRI.
+    """
+    graph = rdflib.Graph()
+    graph.add((EX.thing, rdflib.SDO.url, rdflib.URIRef(iri)))
+
+    # Assert
+    with pytest.raises(Exception, match="does not look like a valid URI"):
+        graph.serialize(format="turtle")
+    with pytest.raises(ValueError, match="does not look like a valid IRI"):
+        write_turtle(graph)
+
+
+def test_write_empty() -> None:
+    """Tests an empty graph is written as just the prefixes."""
+    turtle = write_turtle(rdflib.Graph())
+
+    # Assert
+    assert len(rdflib.Graph().parse(data=turtle, format="turtle")) == 0
+    assert turtle.count("@prefix") == len(utils.rdf.REQUIRED_NAMESPACES)
@@ -192,3 +192,59 @@ def test_get_flexible_vocab_with_unknown_vocab() -> None:
         match=r"Key UNKNOWN not found in registry.",
     ):
         abis_mapping.utils.vocabs.get_flexible_vocab("UNKNOWN")
+
+
+def test_vocabs_index() -> None:
+    """Tests the vocabulary index is built once and shared by instances."""
+
+    # Create Vocab
+    class Vocab(abis_mapping.utils.vocabs.FlexibleVocabulary):
+        vocab_id = "TEST_INDEX"
+        definition = rdflib.Literal("definition")
+        base = "base/"
+        proposed_scheme = rdflib.URIRef("http://proposed_scheme")
+        broader = None
+        default = abis_mapping.utils.vocabs.Term(labels=("A",), iri=rdflib.URIRef("A"), description="A")
+        terms = (default,)
+
+    # Create instances
+    graph = abis_mapping.utils.rdf.create_graph()
+    vocabs = [
+        Vocab(graph=graph, source=helpers.TEST_DATASET_IRI, submitted_on_date=helpers.TEST_SUBMITTED_ON_DATE)
+        for _ in range(2)
+    ]
+
+    # Assert shared, read-only index including the default
+    assert vocabs[0]._mapping is vocabs[1]._mapping is Vocab.index()
+    assert dict(Vocab.index()) == {"A": rdflib.URIRef("A"), None: rdflib.URIRef("A")}
+    with pytest.raises(TypeError):
+        Vocab.index()["B"] = rdflib.URIRef("B")  # type: ignore[index]
+
+
+def test_vocabs_on_created() -> None:
+    """Tests the on_created callback is called once the created term is complete."""
+
+    # Create Vocab
+    class Vocab(abis_mapping.utils.vocabs.FlexibleVocabulary):
+        vocab_id = "TEST_ON_CREATED"
+        definition = rdflib.Literal("definition")
+        base = "base/"
+        proposed_scheme = rdflib.URIRef("http://proposed_scheme")
+        broader = None
+        default = None
+        terms = ()
+
+    graph = abis_mapping.utils.rdf.create_graph()
+    vocab = Vocab(graph=graph, source=helpers.TEST_DATASET_IRI, submitted_on_date=helpers.TEST_SUBMITTED_ON_DATE)
+    created: list[tuple[str, str, int]] = []
+
+    def callback(vocab_id: str, value: str) -> None:
+        created.append((vocab_id, value, len(graph)))
+
+    # Create a term
+    with abis_mapping.utils.vocabs.on_created(callback):
+        iri = vocab.get("New")
+
+    # Assert the term's triples, including its history note, were all added before the callback
+    assert created == [("TEST_ON_CREATED", "New", len(graph))]
+    assert (iri, rdflib.SKOS.historyNote, None) in graph